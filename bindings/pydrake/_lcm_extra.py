@@ -3,6 +3,15 @@
 
 # ruff: noqa: F821 (undefined-name). This file is only a fragment.
 
+import functools as _functools
+import importlib as _importlib
+import itertools as _itertools
+import json as _json
+import pathlib as _pathlib
+
+import numpy as _np
+
+
 # This is a python reimplementation of drake::lcm::Subscriber.  We reimplement
 # (rather than bind) the C++ class because we want message() to be a python LCM
 # message, not a C++ object.
@@ -35,3 +44,211 @@ class Subscriber:
         self.count += 1
         self.raw = raw
         self.message = self.lcm_type.decode(raw)
+
+
+# The LCM primitive types, as spelled in lcm-gen's `__typenames__` metadata.
+_LCM_PRIMITIVE_TYPES = (
+    "int8_t",
+    "int16_t",
+    "int32_t",
+    "int64_t",
+    "float",
+    "double",
+    "boolean",
+    "byte",
+    "string",
+)
+
+
+def _resolve_lcm_type(parent, typename):
+    """Returns the lcm-gen class named by `typename` (e.g.,
+    "drake.lcmt_point_pair_contact_info_for_viz"), which is a nested type of
+    the lcm-gen class `parent`.
+    """
+    package, _, name = typename.rpartition(".")
+    if not package:
+        package = parent.__module__.rpartition(".")[0]
+    result = getattr(_importlib.import_module(package), name)
+    # Depending on the lcm-gen options, the package attribute might be the
+    # module that holds the class, rather than the class itself.
+    return getattr(result, name, result)
+
+
+def _make_lcm_message_schema(lcm_type):
+    """Returns the LcmMessageSchema for the given lcm-gen Python class, using
+    the `__slots__`, `__typenames__`, and `__dimensions__` metadata that
+    lcm-gen generates.
+    """
+    structs = []
+    visited = set()
+
+    def visit(cls):
+        package = cls.__module__.rpartition(".")[0]
+        key = f"{package}.{cls.__name__}" if package else cls.__name__
+        if key in visited:
+            return key
+        visited.add(key)
+        struct = LcmStructSchema(name=key)
+        structs.append(struct)
+        fields = []
+        for name, typename, dimensions in zip(
+            cls.__slots__, cls.__typenames__, cls.__dimensions__
+        ):
+            if typename not in _LCM_PRIMITIVE_TYPES:
+                typename = visit(_resolve_lcm_type(cls, typename))
+            fields.append(
+                LcmFieldSchema(
+                    name=name,
+                    type=typename,
+                    dimensions=[str(x) for x in (dimensions or [])],
+                )
+            )
+        struct.fields = fields
+        return key
+
+    visit(lcm_type)
+    return LcmMessageSchema(
+        structs=structs,
+        fingerprint=int.from_bytes(
+            lcm_type._get_packed_fingerprint(), byteorder="big"
+        ),
+    )
+
+
+class LcmLogColumns:
+    """The messages of one LCM channel, decoded into columnar NumPy arrays.
+
+    Use ``extract_lcm_log_columns()`` to create one from a log, or ``load()``
+    to read one back from disk. Each message field is an array, named by its
+    dotted path; see the C++ function ``drake::lcm::ExtractLcmLogColumns`` for
+    the layout, including the ``.offsets`` arrays of variable-size fields.
+    This class acts as a read-only mapping from array name to array.
+
+    Attributes:
+        times: The time (in seconds) of each message.
+    """
+
+    def __init__(self, *, times, arrays):
+        """(Internal use only.) The ``arrays`` are either NumPy arrays or
+        callables that load them on first use."""
+        self._times = times
+        self._arrays = dict(arrays)
+
+    @property
+    def times(self):
+        if callable(self._times):
+            self._times = self._times()
+        return self._times
+
+    def __len__(self):
+        return len(self._arrays)
+
+    def __iter__(self):
+        return iter(self._arrays)
+
+    def __contains__(self, name):
+        return name in self._arrays
+
+    def keys(self):
+        return self._arrays.keys()
+
+    def __getitem__(self, name):
+        array = self._arrays[name]
+        if callable(array):
+            array = array()
+            self._arrays[name] = array
+        return array
+
+    def get_message_values(self, name, i):
+        """Returns the elements of the variable-size, top-level field `name`
+        that belong to the `i`th message, as a view into ``self[name]``.
+        """
+        offsets = self[f"{name}.offsets"]
+        return self[name][offsets[i] : offsets[i + 1]]
+
+    def get_strings(self, name):
+        """Returns the strings of the string field `name`, decoded as UTF-8,
+        in a list.
+        """
+        chars = self[name].tobytes()
+        offsets = self[f"{name}.string_offsets"]
+        return [
+            chars[start:end].decode("utf-8")
+            for start, end in _itertools.pairwise(offsets)
+        ]
+
+    def save(self, directory):
+        """Writes these arrays into `directory` (which is created if needed),
+        as one ``.npy`` file per array, so that ``load()`` can read each array
+        lazily.
+        """
+        directory = _pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        _np.save(directory / "times.npy", self.times)
+        names = sorted(self.keys())
+        for i, name in enumerate(names):
+            _np.save(directory / f"array_{i}.npy", self[name])
+        (directory / "columns.json").write_text(
+            _json.dumps({"arrays": names}, indent=1), encoding="utf-8"
+        )
+
+    @staticmethod
+    def load(directory):
+        """Reads arrays written by ``save()``. Each array is memory-mapped
+        (read-only) the first time it is accessed, so reading a few columns of
+        a large log touches only those columns' files.
+        """
+        directory = _pathlib.Path(directory)
+        manifest = _json.loads(
+            (directory / "columns.json").read_text(encoding="utf-8")
+        )
+
+        def loader(filename):
+            return _functools.partial(
+                _np.load, directory / filename, mmap_mode="r"
+            )
+
+        return LcmLogColumns(
+            times=loader("times.npy"),
+            arrays={
+                name: loader(f"array_{i}.npy")
+                for i, name in enumerate(manifest["arrays"])
+            },
+        )
+
+
+def extract_lcm_log_columns(
+    log,
+    *,
+    channel,
+    lcm_type,
+    start_time=-float("inf"),
+    end_time=float("inf"),
+):
+    """Decodes every message on `channel` of an LCM log into columnar NumPy
+    arrays, in C++, without creating a Python object per message.
+
+    Args:
+        log: The log, as either a filename or an LcmLogIndex.
+        channel: The LCM channel name.
+        lcm_type: The message's Python class generated by lcm-gen, e.g.,
+            ``drake.lcmt_robot_state``. Nested message types are supported.
+        start_time: Messages before this time (in seconds) are skipped.
+        end_time: Messages at or after this time (in seconds) are skipped.
+
+    Returns:
+        An LcmLogColumns.
+    """
+    index = log if isinstance(log, LcmLogIndex) else LcmLogIndex(filename=log)
+    times, packed = _ExtractLcmLogColumns(
+        index=index,
+        channel=channel,
+        schema=_make_lcm_message_schema(lcm_type),
+        start_time=start_time,
+        end_time=end_time,
+    )
+    arrays = {
+        name: _np.frombuffer(data, dtype=dtype).reshape(shape)
+        for name, (dtype, shape, data) in packed.items()
+    }
+    return LcmLogColumns(times=times, arrays=arrays)
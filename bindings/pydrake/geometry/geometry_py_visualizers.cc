@@ -221,6 +221,15 @@ void DefineMeshcatParams(py::module_ m) {
     DefReprUsingSerialize(&cls);
     DefCopyAndDeepCopy(&cls);
   }
+  {
+    using Class = MeshcatStreamingRecordingParams;
+    constexpr auto& cls_doc = doc.MeshcatStreamingRecordingParams;
+    class_<Class> cls(m, "MeshcatStreamingRecordingParams", cls_doc.doc);
+    cls.def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, cls_doc);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
 }
 
 void DefineMeshcat(py::module_ m) {
@@ -360,6 +369,20 @@ void DefineMeshcat(py::module_ m) {
             py::overload_cast<std::string_view,
                 const Eigen::Ref<const Eigen::Matrix4d>&>(&Class::SetTransform),
             py::arg("path"), py::arg("matrix"), cls_doc.SetTransform.doc_matrix)
+        .def("SetTransforms",
+            py::overload_cast<const std::vector<std::string>&,
+                const std::vector<math::RigidTransformd>&,
+                std::optional<double>>(&Class::SetTransforms),
+            py::arg("paths"), py::arg("X_ParentPaths"),
+            py::arg("time_in_recording") = std::nullopt,
+            cls_doc.SetTransforms.doc_RigidTransform)
+        .def("SetTransforms",
+            py::overload_cast<const std::vector<std::string>&,
+                const std::vector<Eigen::Matrix4d>&, std::optional<double>>(
+                &Class::SetTransforms),
+            py::arg("paths"), py::arg("matrices"),
+            py::arg("time_in_recording") = std::nullopt,
+            cls_doc.SetTransforms.doc_matrix)
         .def("Delete", &Class::Delete, py::arg("path") = "", cls_doc.Delete.doc)
         .def("SetSimulationTime", &Class::SetSimulationTime,
             py::arg("sim_time"), cls_doc.SetSimulationTime.doc)
@@ -435,6 +458,10 @@ void DefineMeshcat(py::module_ m) {
             py::arg("frames_per_second") = 64.0,
             py::arg("set_visualizations_while_recording") = true,
             cls_doc.StartRecording.doc)
+        .def("StartStreamingRecording", &Class::StartStreamingRecording,
+            py::arg("params"),
+            py::arg("set_visualizations_while_recording") = true,
+            cls_doc.StartStreamingRecording.doc)
         .def("StopRecording", &Class::StopRecording, cls_doc.StopRecording.doc)
         .def("PublishRecording", &Class::PublishRecording,
             cls_doc.PublishRecording.doc)
@@ -209,9 +209,11 @@ class TestGeometryRender(unittest.TestCase):
         params = mut.RenderEngineGltfClientParams(
             base_url=base_url,
             render_endpoint=render_endpoint,
+            reuse_uploaded_assets=True,
         )
         self.assertEqual(params.render_endpoint, render_endpoint)
         self.assertEqual(params.base_url, base_url)
+        self.assertTrue(params.reuse_uploaded_assets)
 
         self.assertIn("render_endpoint", repr(params))
         copy.copy(params)
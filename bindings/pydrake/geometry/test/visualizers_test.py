@@ -4,16 +4,19 @@ import copy
 import gc
 import io
 import itertools
+import json
 import unittest
 import urllib.request
 import weakref
 import zipfile
+import zlib
 
 import numpy as np
 import umsgpack
 
 from drake import lcmt_viewer_draw, lcmt_viewer_load_robot
 from pydrake.autodiffutils import AutoDiffXd
+from pydrake.common import temp_directory
 from pydrake.common.test_utilities import numpy_compare
 from pydrake.lcm import DrakeLcm, Subscriber
 from pydrake.math import RigidTransform
@@ -248,6 +251,21 @@ class TestGeometryVisualizers(unittest.TestCase):
         )
         meshcat.SetTransform(path="/test/box", matrix=np.eye(4))
         self.assertTrue(meshcat.HasPath("/test/box"))
+        meshcat.SetTransforms(
+            paths=["/test/box", "/test/box2"],
+            X_ParentPaths=[RigidTransform(), RigidTransform([1, 2, 3])],
+            time_in_recording=0.2,
+        )
+        meshcat.SetTransforms(
+            paths=["/test/box", "/test/box2"],
+            matrices=np.stack([np.eye(4), np.eye(4)]),
+            time_in_recording=0.2,
+        )
+        self.assertTrue(meshcat.HasPath("/test/box2"))
+        with self.assertRaises(RuntimeError):
+            meshcat.SetTransforms(
+                paths=["/test/box"], matrices=[np.eye(4), np.eye(4)]
+            )
         cloud = PointCloud(4)
         cloud.mutable_xyzs()[:] = np.zeros((3, 4))
         meshcat.SetObject(
@@ -470,6 +488,39 @@ class TestGeometryVisualizers(unittest.TestCase):
             with urllib.request.urlopen(bad_url) as response:
                 response.read(1)
 
+    def test_meshcat_streaming_recording(self):
+        meshcat = mut.Meshcat()
+        params = mut.MeshcatStreamingRecordingParams(
+            directory=f"{temp_directory()}/recording",
+            frames_per_second=32.0,
+            frames_per_chunk=16,
+            translation_tolerance=1e-3,
+        )
+        self.assertIn("frames_per_chunk", repr(params))
+        meshcat.StartStreamingRecording(
+            params=params, set_visualizations_while_recording=False
+        )
+        for i in range(100):
+            meshcat.SetTransform(
+                path="box",
+                X_ParentPath=RigidTransform([0.01 * i, 0, 0]),
+                time_in_recording=i / 32.0,
+            )
+        meshcat.StopRecording()
+        meshcat.PublishRecording()
+
+        # The index and chunks are served over http.
+        url = meshcat.web_url() + "/recording/index.json"
+        with urllib.request.urlopen(url) as response:
+            index = json.loads(response.read())
+        self.assertEqual(index["num_frames"], 100)
+        self.assertEqual(len(index["chunks"]), 7)
+        url = meshcat.web_url() + "/recording/" + index["chunks"][0]["file"]
+        with urllib.request.urlopen(url) as response:
+            chunk = umsgpack.unpackb(zlib.decompress(response.read()))
+        self.assertEqual(chunk["type"], "set_animation")
+        meshcat.DeleteRecording()
+
     def test_meshcat_animation(self):
         animation = mut.MeshcatAnimation(frames_per_second=64)
         self.assertEqual(animation.frames_per_second(), 64)
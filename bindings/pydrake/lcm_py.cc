@@ -1,4 +1,7 @@
 #include <cstring>
+#include <filesystem>
+#include <limits>
+#include <optional>
 #include <string>
 
 #include "drake/bindings/generated_docstrings/lcm.h"
@@ -6,6 +9,9 @@
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/lcm/drake_lcm.h"
 #include "drake/lcm/drake_lcm_interface.h"
+#include "drake/lcm/drake_lcm_log.h"
+#include "drake/lcm/lcm_log_columns.h"
+#include "drake/lcm/lcm_log_index.h"
 
 namespace drake {
 namespace pydrake {
@@ -111,6 +117,133 @@ PYDRAKE_MODULE(lcm, m) {
         .def_static("available", &Class::available, cls_doc.available.doc);
   }
 
+  {
+    using Class = DrakeLcmLog;
+    constexpr auto& cls_doc = doc.DrakeLcmLog;
+    class_<Class, DrakeLcmInterface> cls(m, "DrakeLcmLog", cls_doc.doc);
+    cls  // BR
+        .def(py::init<const std::string&, bool, bool>(), py::arg("file_name"),
+            py::arg("is_write"),
+            py::arg("overwrite_publish_time_with_system_clock") = false,
+            cls_doc.ctor.doc)
+        .def("GetNextMessageTime", &Class::GetNextMessageTime,
+            cls_doc.GetNextMessageTime.doc)
+        .def("DispatchMessageAndAdvanceLog",
+            &Class::DispatchMessageAndAdvanceLog, py::arg("current_time"),
+            cls_doc.DispatchMessageAndAdvanceLog.doc)
+        .def("SeekToTime", &Class::SeekToTime, py::arg("time_sec"),
+            cls_doc.SeekToTime.doc)
+        .def("is_write", &Class::is_write, cls_doc.is_write.doc)
+        .def_static("available", &Class::available, cls_doc.available.doc);
+  }
+
+  {
+    using Class = LcmLogIndex;
+    constexpr auto& cls_doc = doc.LcmLogIndex;
+    class_<Class> cls(m, "LcmLogIndex", cls_doc.doc);
+    cls  // BR
+        .def(py::init<const std::filesystem::path&,
+                 std::optional<std::filesystem::path>>(),
+            py::arg("filename"), py::arg("cache_filename") = std::nullopt,
+            cls_doc.ctor.doc)
+        .def("filename", &Class::filename, cls_doc.filename.doc)
+        .def("cache_filename", &Class::cache_filename,
+            cls_doc.cache_filename.doc)
+        .def("num_messages", &Class::num_messages, cls_doc.num_messages.doc)
+        .def("channels", &Class::channels, cls_doc.channels.doc)
+        .def("GetTime", &Class::GetTime, py::arg("i"), cls_doc.GetTime.doc)
+        .def(
+            "GetChannel",
+            [](const Class& self, int i) {
+              return std::string(self.GetChannel(i));
+            },
+            py::arg("i"), cls_doc.GetChannel.doc)
+        .def("GetFileOffset", &Class::GetFileOffset, py::arg("i"),
+            cls_doc.GetFileOffset.doc)
+        .def(
+            "GetPayload",
+            [](py::object self, int i) {
+              // Return a read-only memoryview of the mapped log instead of a
+              // copy. The view's underlying array keeps `self` (and therefore
+              // the mapping) alive for as long as the view exists.
+              const std::string_view payload =
+                  py::cast<const Class&>(self).GetPayload(i);
+              const Eigen::Map<const VectorX<uint8_t>> array(
+                  reinterpret_cast<const uint8_t*>(payload.data()),
+                  payload.size());
+              return py::module_::import_("builtins")
+                  .attr("memoryview")(
+                      py::cast(array, py_rvp::reference_internal, self));
+            },
+            py::arg("i"), cls_doc.GetPayload.doc)
+        .def("FindMessage", &Class::FindMessage, py::arg("time_sec"),
+            cls_doc.FindMessage.doc)
+        .def(
+            "FindMessages",
+            [](const Class& self, const std::string& channel, double start_time,
+                double end_time) {
+              return self.FindMessages(channel, start_time, end_time);
+            },
+            py::arg("channel"),
+            py::arg("start_time") = -std::numeric_limits<double>::infinity(),
+            py::arg("end_time") = std::numeric_limits<double>::infinity(),
+            cls_doc.FindMessages.doc);
+  }
+
+  {
+    using Class = LcmFieldSchema;
+    constexpr auto& cls_doc = doc.LcmFieldSchema;
+    class_<Class> cls(m, "LcmFieldSchema", cls_doc.doc);
+    cls  // BR
+        .def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, cls_doc);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = LcmStructSchema;
+    constexpr auto& cls_doc = doc.LcmStructSchema;
+    class_<Class> cls(m, "LcmStructSchema", cls_doc.doc);
+    cls  // BR
+        .def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, cls_doc);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = LcmMessageSchema;
+    constexpr auto& cls_doc = doc.LcmMessageSchema;
+    class_<Class> cls(m, "LcmMessageSchema", cls_doc.doc);
+    cls  // BR
+        .def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, cls_doc);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  // The public entry point is `extract_lcm_log_columns` (see _lcm_extra.py),
+  // which converts this function's packed arrays into NumPy arrays. Here we
+  // return each array as a (dtype, shape, bytes) tuple, so that the data is
+  // copied exactly once and the binding is agnostic to the array library.
+  m.def(
+      "_ExtractLcmLogColumns",
+      [](const LcmLogIndex& index, const std::string& channel,
+          const LcmMessageSchema& schema, double start_time, double end_time) {
+        LcmLogColumns columns =
+            ExtractLcmLogColumns(index, channel, schema, start_time, end_time);
+        py::dict arrays;
+        for (auto& [name, array] : columns.arrays) {
+          arrays[name.c_str()] = py::make_tuple(array.dtype, array.shape,
+              py::bytes(array.data.data(), array.data.size()));
+          array.data = {};
+        }
+        return py::make_tuple(columns.times, arrays);
+      },
+      py::arg("index"), py::arg("channel"), py::arg("schema"),
+      py::arg("start_time"), py::arg("end_time"), doc.ExtractLcmLogColumns.doc);
+
   ExecuteExtraPythonCode(m);
 }
 
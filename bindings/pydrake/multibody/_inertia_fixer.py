@@ -17,14 +17,18 @@ from __future__ import annotations
 
 import abc
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+import dataclasses
 from dataclasses import dataclass, field
+import hashlib
+import os
 from pathlib import Path
 from xml.parsers import expat
 
 import numpy as np
 
-from pydrake.geometry import Role, SceneGraph
-from pydrake.multibody.parsing import Parser
+from pydrake.geometry import Convex, Mesh, Role, SceneGraph
+from pydrake.multibody.parsing import PackageMap, Parser
 from pydrake.multibody.plant import MultibodyPlant
 from pydrake.multibody.tree import (
     BodyIndex,
@@ -602,6 +606,57 @@ GEOM_INERTIA_ROLE_AVAILABLE = [
 GEOM_INERTIA_ROLE_ORDER_DEFAULT = GEOM_INERTIA_ROLE_AVAILABLE
 
 
+class MeshInertiaCache:
+    """Caches the unit-density spatial inertias of Mesh and Convex shapes, so
+    that a mesh used by many bodies (or many model files) is only integrated
+    once.
+
+    Meshes are keyed by the content hash of their file (along with the shape
+    type and scale), so that copies of the same mesh file also share a result.
+    Formats that refer to other files (e.g., glTF) are additionally keyed by
+    their path. Other shapes are cheap to compute, and are not cached.
+    """
+
+    def __init__(self):
+        self._inertias = {}
+        # The content hash of each mesh file, keyed by its path.
+        self._file_digests = {}
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def calc_unit_density_inertia(self, shape) -> SpatialInertia:
+        """Returns CalcSpatialInertia(shape, 1.0), reusing prior results."""
+        key = self._make_key(shape)
+        if key is None:
+            return CalcSpatialInertia(shape, 1.0)
+        result = self._inertias.get(key)
+        if result is None:
+            self.num_misses += 1
+            result = CalcSpatialInertia(shape, 1.0)
+            self._inertias[key] = result
+        else:
+            self.num_hits += 1
+        return result
+
+    def _make_key(self, shape) -> tuple | None:
+        if not isinstance(shape, (Mesh, Convex)):
+            return None
+        source = shape.source()
+        if not source.is_path():
+            return None
+        path = str(source.path())
+        digest = self._file_digests.get(path)
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self._file_digests[path] = digest
+        extension = source.extension()
+        key = (type(shape).__name__, extension, digest, tuple(shape.scale3()))
+        if extension not in (".obj", ".vtk"):
+            key += (path,)
+        return key
+
+
 class InertiaProcessor:
     """Handles selection, repair, and replacement of inertial properties,
     in model files pre-processed by drake parsing and XmlInertiaMapper.
@@ -613,11 +668,14 @@ class InertiaProcessor:
         scene_graph: SceneGraph,
         mapper: XmlInertiaMapper,
         geom_inertia_role_order: list[Role],
+        mesh_inertia_cache: MeshInertiaCache | None = None,
     ):
         self._plant = plant
         self._scene_graph = scene_graph
         self._mapper = mapper
         self._geom_inertia_role_order = geom_inertia_role_order
+        self._mesh_inertia_cache = mesh_inertia_cache
+        self._changed_bodies = []
 
     def _maybe_fix_inertia(self, body_index: BodyIndex) -> [
         SpatialInertia,
@@ -651,7 +709,13 @@ class InertiaProcessor:
         #   rotated.
         M_BBo_B_one = SpatialInertia(0, np.zeros(3), UnitInertia(0, 0, 0))
         for geom in geoms:
-            M_GG_G_one = CalcSpatialInertia(inspector.GetShape(geom), 1.0)
+            shape = inspector.GetShape(geom)
+            if self._mesh_inertia_cache is not None:
+                M_GG_G_one = self._mesh_inertia_cache.calc_unit_density_inertia(
+                    shape
+                )
+            else:
+                M_GG_G_one = CalcSpatialInertia(shape, 1.0)
             X_BG = inspector.GetPoseInFrame(geom)
             M_GBo_B_one = M_GG_G_one.ReExpress(X_BG.rotation()).Shift(
                 -X_BG.translation()
@@ -677,12 +741,35 @@ class InertiaProcessor:
         """
         mapping = self._mapper.mapping()
         new_inertias_mapping = {}
+        self._changed_bodies = []
         for body_index in sorted(mapping.keys()):
             maybe_inertia = self._maybe_fix_inertia(body_index)
             if maybe_inertia is not None:
                 new_inertias_mapping[body_index] = maybe_inertia
+                if self._is_changed(body_index, *maybe_inertia):
+                    body = self._plant.get_body(body_index)
+                    self._changed_bodies.append(str(body.scoped_name()))
         return self._mapper.build_output(new_inertias_mapping)
 
+    def changed_bodies(self) -> list[str]:
+        """Returns the scoped names of the bodies whose inertias were changed
+        (beyond formatting round-off) by the most recent call to process().
+        """
+        return list(self._changed_bodies)
+
+    def _is_changed(
+        self, body_index: BodyIndex, M_BBcm_B: SpatialInertia, pose: list
+    ) -> bool:
+        old_M_BBo_B = self._plant.get_body(body_index).default_spatial_inertia()
+        new_M_BBo_B = M_BBcm_B.Shift(-np.array(pose[:3]))
+        # The output is written with 5 significant digits; see gfmt().
+        return not np.allclose(
+            old_M_BBo_B.CopyToFullMatrix6(),
+            new_M_BBo_B.CopyToFullMatrix6(),
+            rtol=1e-4,
+            atol=1e-9,
+        )
+
 
 def fix_inertia_from_string(
     input_text: str,
@@ -769,32 +856,10 @@ class InertiaFixer:
         """Executes the inertia fixing processing and write the output as
         specified by the initialization arguments.
         """
-        # Parse with drake to build mbp and confirm sanity.
-        plant = MultibodyPlant(time_step=0.0)
-        scene_graph = SceneGraph()
-        plant.RegisterAsSourceForSceneGraph(scene_graph)
-
-        parser = Parser(plant)
-        parser.package_map().PopulateFromRosPackagePath()
-
-        # Read from the disk file here, to get more lenient processing of URIs,
-        # better error messages, etc.
-        parser.AddModels(str(self.input_file))
-
-        # Slurp input file for indexing and editing.
-        with open(self.input_file, encoding="utf-8") as fo:
-            input_text = fo.read()
-
-        # Parse with expat to build index.
-        mapper = XmlInertiaMapper(input_text)
-        mapper.parse()
-        mapper.build_plant_models_association(plant)
-
-        # Fix indicated inertias.
-        processor = InertiaProcessor(
-            plant, scene_graph, mapper, self.geom_inertia_role_order
+        output_text, _ = _fix_inertia_file(
+            input_file=self.input_file,
+            geom_inertia_role_order=self.geom_inertia_role_order,
         )
-        output_text = processor.process()
 
         # Write output.
         if self.output_file:
@@ -805,3 +870,228 @@ class InertiaFixer:
             output_file = self.input_file
         with open(output_file, "w", encoding="utf-8") as fo:
             fo.write(output_text)
+
+
+def _fix_inertia_file(
+    *,
+    input_file: Path,
+    geom_inertia_role_order: list[Role],
+    package_map: PackageMap | None = None,
+    mesh_inertia_cache: MeshInertiaCache | None = None,
+) -> tuple[str, list[str]]:
+    """Returns the fixed text of the given file, and the scoped names of the
+    bodies whose inertias changed. When given, the `package_map` is used
+    instead of populating a new one from ROS_PACKAGE_PATH.
+    """
+    # Parse with drake to build mbp and confirm sanity.
+    plant = MultibodyPlant(time_step=0.0)
+    scene_graph = SceneGraph()
+    plant.RegisterAsSourceForSceneGraph(scene_graph)
+
+    parser = Parser(plant)
+    if package_map is None:
+        parser.package_map().PopulateFromRosPackagePath()
+    else:
+        parser.package_map().AddMap(package_map)
+
+    # Read from the disk file here, to get more lenient processing of URIs,
+    # better error messages, etc.
+    parser.AddModels(str(input_file))
+
+    # Slurp input file for indexing and editing.
+    with open(input_file, encoding="utf-8") as fo:
+        input_text = fo.read()
+
+    # Parse with expat to build index.
+    mapper = XmlInertiaMapper(input_text)
+    mapper.parse()
+    mapper.build_plant_models_association(plant)
+
+    # Fix indicated inertias.
+    processor = InertiaProcessor(
+        plant,
+        scene_graph,
+        mapper,
+        geom_inertia_role_order,
+        mesh_inertia_cache=mesh_inertia_cache,
+    )
+    output_text = processor.process()
+    return output_text, processor.changed_bodies()
+
+
+MODEL_FILE_SUFFIXES = (".urdf", ".sdf")
+"""The suffixes of the model files found by find_model_files()."""
+
+
+def find_model_files(paths: list[Path]) -> list[Path]:
+    """Returns the model files named by `paths`, in a stable order.
+
+    Each path may be a model file (see MODEL_FILE_SUFFIXES), a directory (which
+    is searched recursively for model files), or a manifest: a text file
+    listing one model file per line. In a manifest, blank lines and lines
+    starting with '#' are ignored, and relative paths are relative to the
+    manifest's directory.
+    """
+    result = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            result.extend(
+                sorted(
+                    x
+                    for x in path.rglob("*")
+                    if x.suffix in MODEL_FILE_SUFFIXES and x.is_file()
+                )
+            )
+        elif path.suffix in MODEL_FILE_SUFFIXES:
+            result.append(path)
+        else:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    result.append(path.parent / line)
+    return result
+
+
+@dataclass
+class BatchFixResult:
+    """The outcome of fixing one model file with fix_inertia_batch()."""
+
+    input_file: str
+    "The model file that was processed."
+
+    output_file: str | None = None
+    "The file that was written, or None if nothing was written."
+
+    changed_bodies: list[str] = field(default_factory=list)
+    "The scoped names of the bodies whose inertias changed."
+
+    error: str | None = None
+    "The error message if the file could not be processed, or else None."
+
+
+class _BatchWorker:
+    """The per-process state of fix_inertia_batch(), which is reused across
+    all of the files that a process handles.
+    """
+
+    def __init__(self, geom_inertia_role_order_str: list[str]):
+        self._geom_inertia_role_order = str_list_to_role_list(
+            geom_inertia_role_order_str
+        )
+        # Searching ROS_PACKAGE_PATH can be slow, so is only done once.
+        self._package_map = PackageMap()
+        self._package_map.PopulateFromRosPackagePath()
+        self._mesh_inertia_cache = MeshInertiaCache()
+
+    def fix(self, input_file: Path, output_file: Path | None) -> BatchFixResult:
+        result = BatchFixResult(input_file=str(input_file))
+        try:
+            output_text, result.changed_bodies = _fix_inertia_file(
+                input_file=input_file,
+                geom_inertia_role_order=self._geom_inertia_role_order,
+                package_map=self._package_map,
+                mesh_inertia_cache=self._mesh_inertia_cache,
+            )
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+            return result
+        # Leave unchanged files untouched when editing in place.
+        if output_file is not None and not (
+            output_file == input_file and not result.changed_bodies
+        ):
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, "w", encoding="utf-8") as fo:
+                fo.write(output_text)
+            result.output_file = str(output_file)
+        return result
+
+
+# The _BatchWorker of a fix_inertia_batch() worker process.
+_batch_worker = None
+
+
+def _init_batch_worker(geom_inertia_role_order_str: list[str]):
+    global _batch_worker
+    _batch_worker = _BatchWorker(geom_inertia_role_order_str)
+
+
+def _batch_worker_fix(job: tuple[Path, Path | None]) -> BatchFixResult:
+    return _batch_worker.fix(*job)
+
+
+def fix_inertia_batch(
+    *,
+    input_files: list[Path],
+    in_place: bool = False,
+    output_dir: Path | None = None,
+    geom_inertia_role_order: list[Role] = GEOM_INERTIA_ROLE_ORDER_DEFAULT,
+    num_workers: int | None = None,
+) -> list[BatchFixResult]:
+    """Fixes the inertias of many model files, using a pool of worker
+    processes.
+
+    Each worker process parses ROS_PACKAGE_PATH once, and caches the inertias
+    of the meshes it encounters (see MeshInertiaCache), for all of the files
+    it handles. A file that fails to process is reported in its result,
+    without stopping the batch.
+
+    Args:
+        input_files: the files to fix (e.g., from find_model_files()).
+        in_place: if True, write output back to each input file whose
+                  inertias changed.
+        output_dir: if given (and not in_place), write every output file to
+                    this directory, at the same path relative to the inputs'
+                    common directory. If neither this nor in_place is given,
+                    no files are written.
+        geom_inertia_role_order: Specifies what order of geometries to try
+                                 and infer geometry from for each body.
+        num_workers: the number of worker processes; None means one per CPU.
+                     When 1, the files are processed in the calling process.
+
+    Returns:
+        one result per input file, in the same order.
+    """
+    if not _is_unique(geom_inertia_role_order):
+        raise RuntimeError("geom_inertia_role_order must have unique elements")
+    input_files = [Path(x) for x in input_files]
+    if not input_files:
+        return []
+    if in_place:
+        output_files = input_files
+    elif output_dir is not None:
+        root = Path(
+            os.path.commonpath([x.parent.absolute() for x in input_files])
+        )
+        output_files = [
+            Path(output_dir) / x.absolute().relative_to(root)
+            for x in input_files
+        ]
+    else:
+        output_files = [None] * len(input_files)
+    jobs = list(zip(input_files, output_files))
+    role_order_str = role_list_to_str_list(geom_inertia_role_order)
+
+    if num_workers == 1:
+        worker = _BatchWorker(role_order_str)
+        return [worker.fix(*job) for job in jobs]
+    with ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=_init_batch_worker,
+        initargs=(role_order_str,),
+    ) as executor:
+        # Use chunks of files, so that each worker's caches see many files.
+        num_chunks = 4 * (num_workers or os.cpu_count() or 1)
+        chunksize = max(1, len(jobs) // num_chunks)
+        return list(executor.map(_batch_worker_fix, jobs, chunksize=chunksize))
+
+
+def batch_summary(results: list[BatchFixResult]) -> dict:
+    """Returns a JSON-compatible summary of the results of
+    fix_inertia_batch().
+    """
+    return dict(
+        num_files=len(results),
+        num_changed_files=sum(1 for x in results if x.changed_bodies),
+        num_errors=sum(1 for x in results if x.error is not None),
+        files=[dataclasses.asdict(x) for x in results],
+    )
@@ -1,4 +1,8 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
 import logging
+import os
 from pathlib import Path
 import xml.etree.ElementTree
 
@@ -75,6 +79,59 @@ _SDF_TEMPLATE = """<?xml version='1.0'?>
 """
 
 
+@dataclass
+class MeshAnalysis:
+    """The properties of a mesh (at some scale) used to make its model."""
+
+    p_GoMin: np.ndarray
+    "The minimum corner of the mesh's bounding box, in the geometry frame."
+
+    p_GoMax: np.ndarray
+    "The maximum corner of the mesh's bounding box, in the geometry frame."
+
+    M_GGo_G_unit: SpatialInertia
+    "The mesh's spatial inertia for a density of 1 kg/m³."
+
+
+class MeshAnalysisCache:
+    """Caches the MeshAnalysis of mesh files, so that each distinct mesh is
+    only read and integrated once, no matter how many models are made from it.
+
+    Meshes are keyed by the content hash of their file and the scale, so that
+    copies of the same mesh file also share a result.
+    """
+
+    def __init__(self):
+        self._analyses = {}
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def analyze(self, mesh_path: Path, scale: float) -> MeshAnalysis:
+        """Returns the analysis of the given mesh file at the given scale."""
+        with open(mesh_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        key = (digest, Path(mesh_path).suffix.lower(), scale)
+        result = self._analyses.get(key)
+        if result is None:
+            self.num_misses += 1
+            result = _analyze_mesh(mesh_path, scale)
+            self._analyses[key] = result
+        else:
+            self.num_hits += 1
+        return result
+
+
+def _analyze_mesh(mesh_path: Path, scale: float) -> MeshAnalysis:
+    """Reads the given mesh once, and computes its MeshAnalysis."""
+    mesh_G = ReadObjToTriangleSurfaceMesh(filename=str(mesh_path), scale=scale)
+    p_GoMin, p_GoMax = mesh_G.CalcBoundingBox()
+    return MeshAnalysis(
+        p_GoMin=p_GoMin,
+        p_GoMax=p_GoMax,
+        M_GGo_G_unit=CalcSpatialInertia(mesh=mesh_G, density=1.0),
+    )
+
+
 class MeshModelMaker:
     """Converts a mesh file into a model, documenting the work as it goes."""
 
@@ -135,14 +192,19 @@ class MeshModelMaker:
         self.p_GoBo = p_GoBo
         self.encoded_package = encoded_package
 
-    def make_model(self):
+    def make_model(
+        self, *, analysis_cache: MeshAnalysisCache | None = None
+    ) -> Path:
         """
         Creates a model from the mesh given at mesh_path and writes the
         corresponding model to the file at model_path based on the maker's
-        configurations.
+        configurations. Returns the path of the written model file.
 
         See the documentation for mesh_to_model.py for a discussion of the
         configuration parameters.
+
+        If ``analysis_cache`` is given, it is used to reuse the analysis of
+        meshes that were already seen (e.g., when making many models).
         """
         _logger.info(f"Creating a model from: {self.mesh_path}")
 
@@ -156,11 +218,11 @@ class MeshModelMaker:
                 f"Scale value must be positive, given {self.scale}."
             )
 
-        mesh_G = ReadObjToTriangleSurfaceMesh(
-            filename=str(self.mesh_path), scale=self.scale
-        )
-        p_GoMin, p_GoMax = mesh_G.CalcBoundingBox()
-        size = p_GoMax - p_GoMin
+        if analysis_cache is not None:
+            analysis = analysis_cache.analyze(self.mesh_path, self.scale)
+        else:
+            analysis = _analyze_mesh(self.mesh_path, self.scale)
+        size = analysis.p_GoMax - analysis.p_GoMin
         _logger.info("Mesh-model summary:")
         _logger.info(
             f"    Bounding box (in geometry frame): {size[0]} x "
@@ -169,27 +231,24 @@ class MeshModelMaker:
 
         # TODO(SeanCurtis-TRI): Confirm that the mesh is watertight.
 
+        # Neither the unit inertia nor the center of mass depend on the
+        # density. So, we use the quantities computed for unit density, and
+        # reconfigure the SpatialInertia with the desired mass.
+        M_GGo_G_unit = analysis.M_GGo_G_unit
+        volume = M_GGo_G_unit.get_mass()
         if self.mass is not None:
             # If mass is defined, it wins.
-            # Neither the unit inertia nor the center of mass depend on the
-            # density. So, we can compute those quantities for an arbitrary
-            # density and then reconfigure the SpatialInertia with the desired
-            # mass.
-            density = 1.0
-            M_GGo_G = CalcSpatialInertia(mesh=mesh_G, density=density)
-            volume = M_GGo_G.get_mass() / density
-            M_GGo_G = SpatialInertia(
-                mass=self.mass,
-                p_PScm_E=M_GGo_G.get_com(),
-                G_SP_E=M_GGo_G.get_unit_inertia(),
-            )
+            mass = self.mass
         else:
-            M_GGo_G = CalcSpatialInertia(mesh=mesh_G, density=self.density)
-            volume = M_GGo_G.get_mass() / self.density
+            mass = self.density * volume
+        M_GGo_G = SpatialInertia(
+            mass=mass,
+            p_PScm_E=M_GGo_G_unit.get_com(),
+            G_SP_E=M_GGo_G_unit.get_unit_inertia(),
+        )
 
         p_GoGcm = M_GGo_G.get_com()
         M_GGcm_G = M_GGo_G.Shift(p_GoGcm)
-        mass = M_GGo_G.get_mass()
 
         _logger.info(f"    Mass: {mass} kg")
 
@@ -256,6 +315,7 @@ class MeshModelMaker:
         output_path = self.output_dir / f"{self.mesh_path.stem}.sdf"
         with open(output_path, "w") as f:
             f.write(_SDF_TEMPLATE.format(**subs))
+        return output_path
 
     @staticmethod
     def _make_mesh_uri(package_spec: str, mesh_path: Path):
@@ -342,3 +402,76 @@ class MeshModelMaker:
                 f"element: {package_path}."
             )
         return name_element.text.strip()
+
+
+@dataclass
+class BatchModelResult:
+    """The outcome of making one model with make_models()."""
+
+    mesh_path: Path
+    "The mesh file that was converted."
+
+    model_path: Path | None = None
+    "The model file that was written, or None on error."
+
+    error: str | None = None
+    "The error message if the model could not be made, or else None."
+
+
+# The MeshAnalysisCache of a make_models() worker process.
+_worker_analysis_cache = None
+
+
+def _init_worker():
+    global _worker_analysis_cache
+    _worker_analysis_cache = MeshAnalysisCache()
+
+
+def _make_one_model(maker: MeshModelMaker) -> BatchModelResult:
+    result = BatchModelResult(mesh_path=maker.mesh_path)
+    try:
+        result.model_path = maker.make_model(
+            analysis_cache=_worker_analysis_cache
+        )
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def make_models(
+    makers: list[MeshModelMaker], *, num_workers: int | None = None
+) -> list[BatchModelResult]:
+    """
+    Makes the models of many MeshModelMakers, using a pool of worker
+    processes that each write their models as they go. Each worker caches the
+    analysis of the meshes it reads (see MeshAnalysisCache). A model that
+    cannot be made is reported in its result, without stopping the batch.
+
+    Args:
+        makers: the configured makers; their output paths should be distinct.
+        num_workers: the number of worker processes; None means one per CPU.
+            When 1, the models are made in the calling process.
+
+    Returns:
+        one result per maker, in the same order.
+    """
+    # Any package.xml files that --package=auto needs are created up front,
+    # so that concurrent workers never race to write the same one. (Missing
+    # meshes are reported by their makers, below.)
+    auto_dirs = {}
+    for maker in makers:
+        if maker.encoded_package == "auto" and maker.mesh_path.exists():
+            auto_dirs.setdefault(maker.mesh_path.resolve().parent, maker)
+    for maker in auto_dirs.values():
+        MeshModelMaker._make_mesh_uri("auto", maker.mesh_path)
+
+    if num_workers == 1:
+        _init_worker()
+        return [_make_one_model(maker) for maker in makers]
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_init_worker
+    ) as executor:
+        # Use chunks of meshes, so that each worker's cache sees many meshes.
+        num_chunks = 4 * (num_workers or os.cpu_count() or 1)
+        chunksize = max(1, len(makers) // num_chunks)
+        return list(executor.map(_make_one_model, makers, chunksize=chunksize))
@@ -36,6 +36,18 @@ tags.
 
             bazel run //tools:fix_inertia -- --in_place path/to/some_model.urdf
 
+    Run over a whole tree of models in parallel, overwriting only the files
+    whose inertias changed, and writing a JSON summary of the changed bodies
+    (and any errors) to a file::
+
+            bazel run //tools:fix_inertia -- --batch --in_place \
+                --summary summary.json path/to/models/
+
+    In batch mode, the input may be a directory (searched recursively for
+    `*.urdf` and `*.sdf` files), a model file, or a manifest file listing one
+    model file per line. Use --output_dir instead of --in_place to write the
+    results to a separate tree, or neither for a dry run.
+
     This program respects the ROS_PACKAGE_PATH; if your model uses external
     resources then you will need to set that environment variable.
 
@@ -55,7 +67,9 @@ tags.
 """
 
 import argparse
+import json
 import os
+import sys
 
 from pydrake.common import configure_logging as _configure_logging
 from pydrake.multibody import _inertia_fixer
@@ -77,7 +91,8 @@ def _main():
     parser.add_argument(
         "input_file",
         type=str,
-        help="Filesystem path to an SDFormat or URDF file.",
+        help="Filesystem path to an SDFormat or URDF file. With --batch,"
+        " this may also be a directory or a manifest file.",
     )
     parser.add_argument(
         "output_file",
@@ -99,7 +114,37 @@ def _main():
         choices=geom_role_choices_str,
         default=geom_inertia_role_order_str_default,
     )
+    batch_group = parser.add_argument_group("batch mode")
+    batch_group.add_argument(
+        "--batch",
+        action="store_true",
+        help="Process all of the model files named by input_file, using"
+        " a pool of worker processes.",
+    )
+    batch_group.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="[Optional] The number of worker processes for --batch."
+        " Defaults to the number of CPUs.",
+    )
+    batch_group.add_argument(
+        "--output_dir",
+        type=str,
+        help="[Optional] With --batch, the directory to write the output"
+        " files to, mirroring the layout of the input files.",
+    )
+    batch_group.add_argument(
+        "--summary",
+        type=str,
+        help="[Optional] With --batch, the filesystem path to write the JSON"
+        " summary to. If missing, the summary will go to stdout.",
+    )
     args = parser.parse_args()
+    if args.batch and args.output_file:
+        parser.error("output_file cannot be used with --batch")
+    if not args.batch and (args.output_dir or args.summary or args.jobs):
+        parser.error("--jobs, --output_dir and --summary require --batch")
 
     if "BUILD_WORKSPACE_DIRECTORY" in os.environ:
         os.chdir(os.environ["BUILD_WORKING_DIRECTORY"])
@@ -107,6 +152,22 @@ def _main():
     geom_inertia_role_order = _inertia_fixer.str_list_to_role_list(
         args.geom_inertia_role_order
     )
+    if args.batch:
+        results = _inertia_fixer.fix_inertia_batch(
+            input_files=_inertia_fixer.find_model_files([args.input_file]),
+            in_place=args.in_place,
+            output_dir=args.output_dir,
+            geom_inertia_role_order=geom_inertia_role_order,
+            num_workers=args.jobs,
+        )
+        summary = _inertia_fixer.batch_summary(results)
+        with open(args.summary or "/dev/stdout", "w", encoding="utf-8") as fo:
+            json.dump(summary, fo, indent=2)
+            fo.write("\n")
+        if summary["num_errors"]:
+            sys.exit(1)
+        return
+
     fixer = _inertia_fixer.InertiaFixer(
         input_file=args.input_file,
         output_file=args.output_file,
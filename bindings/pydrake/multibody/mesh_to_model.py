@@ -29,6 +29,18 @@ Properties of the resulting SDFormat file:
 
             python3 -m pydrake.multibody.mesh_to_model path/to/mesh.obj
 
+**Converting many meshes**:
+
+    Any number of meshes (or directories, which are searched recursively for
+    OBJ files) may be given at once. They are converted by a pool of worker
+    processes (see --jobs), which each read and analyze a given mesh file at
+    most once, even when it appears under several names. A model is written
+    next to each mesh (or into --output-dir); the program reports any meshes
+    that could not be converted and then exits with an error::
+
+            python3 -m pydrake.multibody.mesh_to_model --jobs=8 \
+                path/to/my_models/
+
 **Model scale**:
 
     Drake uses meters as the unit of length. Modelling packages may frequently
@@ -113,8 +125,10 @@ Properties of the resulting SDFormat file:
 """
 
 import argparse
+import logging
 import os
 from pathlib import Path
+import sys
 
 import numpy as np
 
@@ -122,6 +136,11 @@ from pydrake.common import configure_logging as _configure_logging
 from pydrake.multibody._mesh_model_maker import (
     MeshModelMaker as _MeshModelMaker,
 )
+from pydrake.multibody._mesh_model_maker import (
+    make_models as _make_models,
+)
+
+_logger = logging.getLogger("drake")
 
 
 def _CommaSeparatedXYZ(arg: str):
@@ -135,6 +154,19 @@ def _CommaSeparatedXYZ(arg: str):
 _CommaSeparatedXYZ.__name__ = "comma-separated triple"
 
 
+def _find_meshes(paths: list[Path]) -> list[Path]:
+    """Returns the given mesh paths, with each directory replaced by the OBJ
+    files found (recursively) within it.
+    """
+    result = []
+    for path in paths:
+        if path.is_dir():
+            result.extend(sorted(path.rglob("*.obj")))
+        else:
+            result.append(path)
+    return result
+
+
 def _main():
     _configure_logging()
 
@@ -238,7 +270,23 @@ def _main():
     )
 
     parser.add_argument(
-        "mesh_path", type=Path, help="The path to the mesh file to process."
+        "--jobs",
+        type=int,
+        metavar="N",
+        help=(
+            "The number of worker processes used when converting more than "
+            "one mesh. If not given, one per CPU is used."
+        ),
+    )
+
+    parser.add_argument(
+        "mesh_path",
+        type=Path,
+        nargs="+",
+        help=(
+            "The path to the mesh file to process. Multiple meshes (or "
+            "directories of meshes) may be given."
+        ),
     )
 
     args = parser.parse_args()
@@ -246,8 +294,27 @@ def _main():
     if "BUILD_WORKSPACE_DIRECTORY" in os.environ:
         os.chdir(os.environ["BUILD_WORKING_DIRECTORY"])
 
-    maker = _MeshModelMaker(**vars(args))
-    maker.make_model()
+    maker_args = vars(args)
+    num_workers = maker_args.pop("jobs")
+    mesh_paths = maker_args.pop("mesh_path")
+    if len(mesh_paths) == 1 and not mesh_paths[0].is_dir():
+        maker = _MeshModelMaker(mesh_path=mesh_paths[0], **maker_args)
+        maker.make_model()
+        return
+
+    if args.model_name:
+        parser.error("--model-name cannot be used with multiple meshes")
+    makers = [
+        _MeshModelMaker(mesh_path=mesh_path, **maker_args)
+        for mesh_path in _find_meshes(mesh_paths)
+    ]
+    results = _make_models(makers, num_workers=num_workers)
+    errors = [x for x in results if x.error is not None]
+    for result in errors:
+        _logger.error(f"Failed to convert {result.mesh_path}: {result.error}")
+    _logger.info(f"Converted {len(results) - len(errors)} meshes.")
+    if errors:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
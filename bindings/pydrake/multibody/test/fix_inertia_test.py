@@ -1,5 +1,6 @@
 """Unit tests for fix_inertia."""
 
+import json
 import os
 from pathlib import Path
 import shutil
@@ -11,10 +12,14 @@ from pydrake.common import (
     temp_directory,
 )
 from pydrake.common.test_utilities import numpy_compare
-from pydrake.geometry import Role, SceneGraph
+from pydrake.geometry import Box, Mesh, Role, SceneGraph
 from pydrake.multibody._inertia_fixer import (
     GEOM_INERTIA_ROLE_ORDER_DEFAULT,
     InertiaFixer,
+    MeshInertiaCache,
+    batch_summary,
+    find_model_files,
+    fix_inertia_batch,
     fix_inertia_from_string,
 )
 from pydrake.multibody.parsing import Parser
@@ -487,6 +492,114 @@ class TestInertiaFixer(FileHandlingFixture):
             self.assertNotEqual(orig.read(), edited.read())
 
 
+class TestMeshInertiaCache(FileHandlingFixture):
+    def test_cache(self):
+        mesh_file = FindResourceOrThrow(
+            "drake/multibody/parsing/test/box_package/meshes/box.obj"
+        )
+        copied = self._temp_dir / "copied.obj"
+        shutil.copyfile(mesh_file, copied)
+        dut = MeshInertiaCache()
+        expected = dut.calc_unit_density_inertia(Mesh(mesh_file))
+        self.assertEqual((dut.num_hits, dut.num_misses), (0, 1))
+        # Copies of the mesh file share the result.
+        actual = dut.calc_unit_density_inertia(Mesh(str(copied)))
+        self.assertEqual((dut.num_hits, dut.num_misses), (1, 1))
+        numpy_compare.assert_float_equal(
+            actual.CopyToFullMatrix6(), expected.CopyToFullMatrix6()
+        )
+        # A different scale is a different result.
+        dut.calc_unit_density_inertia(Mesh(mesh_file, scale=2.0))
+        self.assertEqual((dut.num_hits, dut.num_misses), (1, 2))
+        # Primitives are not cached.
+        dut.calc_unit_density_inertia(Box(1, 2, 3))
+        self.assertEqual((dut.num_hits, dut.num_misses), (1, 2))
+
+
+class TestFixInertiaBatch(FileHandlingFixture):
+    def setUp(self):
+        super().setUp()
+        # A tree of models: two copies of box.urdf, and one broken model.
+        self._models_dir = self._temp_dir / "models"
+        (self._models_dir / "sub").mkdir(parents=True)
+        shutil.copyfile(self._box_urdf, self._models_dir / "a.urdf")
+        shutil.copyfile(self._box_urdf, self._models_dir / "sub" / "b.urdf")
+        (self._models_dir / "sub" / "broken.sdf").write_text("<sdf")
+        (self._models_dir / "readme.txt").write_text("Not a model.")
+
+    def test_find_model_files(self):
+        expected = [
+            self._models_dir / "a.urdf",
+            self._models_dir / "sub" / "b.urdf",
+            self._models_dir / "sub" / "broken.sdf",
+        ]
+        self.assertEqual(find_model_files([self._models_dir]), expected)
+        manifest = self._models_dir / "manifest.txt"
+        manifest.write_text("# Some models.\na.urdf\n\nsub/b.urdf\n")
+        self.assertEqual(find_model_files([manifest, expected[2]]), expected)
+
+    def check_results(self, results, output_files):
+        summary = batch_summary(results)
+        self.assertEqual(summary["num_files"], 3)
+        self.assertEqual(summary["num_changed_files"], 2)
+        self.assertEqual(summary["num_errors"], 1)
+        files = summary["files"]
+        for i in range(3):
+            self.assertEqual(files[i]["output_file"], output_files[i])
+        self.assertEqual(files[0]["changed_bodies"], ["box::box"])
+        self.assertEqual(files[1]["changed_bodies"], ["box::box"])
+        self.assertIsNone(files[0]["error"])
+        self.assertEqual(files[2]["changed_bodies"], [])
+        self.assertIsNotNone(files[2]["error"])
+        # The summary is JSON-compatible.
+        json.dumps(summary)
+
+    def test_output_dir(self):
+        input_files = find_model_files([self._models_dir])
+        output_dir = self._temp_dir / "output"
+        for num_workers in [1, 2]:
+            results = fix_inertia_batch(
+                input_files=input_files,
+                output_dir=output_dir,
+                num_workers=num_workers,
+            )
+            self.check_results(
+                results,
+                [
+                    str(output_dir / "a.urdf"),
+                    str(output_dir / "sub" / "b.urdf"),
+                    None,
+                ],
+            )
+            # The output matches the single-file tool.
+            expected = self._temp_dir / "expected.urdf"
+            InertiaFixer(
+                input_file=self._box_urdf, output_file=expected
+            ).fix_inertia()
+            self.assert_files_equal(output_dir / "sub" / "b.urdf", expected)
+
+    def test_in_place(self):
+        input_files = find_model_files([self._models_dir])
+        results = fix_inertia_batch(
+            input_files=input_files, in_place=True, num_workers=2
+        )
+        self.check_results(
+            results, [str(input_files[0]), str(input_files[1]), None]
+        )
+        # Once fixed, nothing changes and nothing is written.
+        results = fix_inertia_batch(
+            input_files=input_files[:2], in_place=True, num_workers=1
+        )
+        self.assertEqual(batch_summary(results)["num_changed_files"], 0)
+        self.assertIsNone(results[0].output_file)
+
+    def test_dry_run(self):
+        input_files = find_model_files([self._models_dir])
+        results = fix_inertia_batch(input_files=input_files, num_workers=1)
+        self.check_results(results, [None, None, None])
+        self.assert_files_equal(input_files[0], self._box_urdf)
+
+
 class TestFixInertiaProcess(FileHandlingFixture):
     """
     Tests the command-line tool fix_inertia by invoking the process
@@ -620,3 +733,28 @@ class TestFixInertiaProcess(FileHandlingFixture):
             geom_inertia_role_order=[Role.kIllustration],
             geom_inertia_role_order_args=["illustration"],
         )
+
+    def test_batch(self):
+        models_dir = self._temp_dir / "models"
+        models_dir.mkdir()
+        shutil.copyfile(self._box_urdf, models_dir / "box.urdf")
+        summary_file = self._temp_dir / "summary.json"
+        subprocess.run(
+            [
+                self._dut,
+                "--batch",
+                "--in_place",
+                "--jobs=2",
+                f"--summary={summary_file}",
+                models_dir,
+            ],
+            check=True,
+        )
+        summary = json.loads(summary_file.read_text())
+        self.assertEqual(summary["num_changed_files"], 1)
+        self.assertEqual(summary["files"][0]["changed_bodies"], ["box::box"])
+        expected = self._temp_dir / "expected.urdf"
+        InertiaFixer(
+            input_file=self._box_urdf, output_file=expected
+        ).fix_inertia()
+        self.assert_files_equal(models_dir / "box.urdf", expected)
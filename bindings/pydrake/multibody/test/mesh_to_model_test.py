@@ -18,7 +18,9 @@ from pydrake.geometry import (
     ReadObjToTriangleSurfaceMesh,
 )
 from pydrake.multibody._mesh_model_maker import (
+    MeshAnalysisCache,
     MeshModelMaker,
+    make_models,
 )
 from pydrake.multibody.parsing import (
     Parser,
@@ -508,6 +510,91 @@ class TestModelMaker(unittest.TestCase):
             dut.make_model()
 
 
+class TestMakeModels(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = Path(temp_directory())
+        self._obj_source_path = FindResourceOrThrow(
+            "drake/geometry/render/test/meshes/box.obj"
+        )
+        # Two copies of the same mesh (with different names), and a third
+        # mesh that differs.
+        self._mesh_paths = [
+            self._temp_dir / "box.obj",
+            self._temp_dir / "box_copy.obj",
+            self._temp_dir / "offset_box.obj",
+        ]
+        shutil.copy(self._obj_source_path, self._mesh_paths[0])
+        shutil.copy(self._obj_source_path, self._mesh_paths[1])
+        _make_offset_obj(self._mesh_paths[2], (1, 2, 3))
+
+    def test_analysis_cache(self):
+        dut = MeshAnalysisCache()
+        expected = dut.analyze(self._mesh_paths[0], 2.0)
+        self.assertEqual((dut.num_hits, dut.num_misses), (0, 1))
+        # The copy shares the result.
+        self.assertIs(dut.analyze(self._mesh_paths[1], 2.0), expected)
+        self.assertEqual((dut.num_hits, dut.num_misses), (1, 1))
+        # A different scale or mesh is a different result.
+        dut.analyze(self._mesh_paths[0], 1.0)
+        dut.analyze(self._mesh_paths[2], 2.0)
+        self.assertEqual((dut.num_hits, dut.num_misses), (1, 3))
+        np.testing.assert_equal(expected.p_GoMax - expected.p_GoMin, [4] * 3)
+        self.assertEqual(expected.M_GGo_G_unit.get_mass(), 64.0)
+
+        # Making a model with the cache matches making it without.
+        ref_dir = self._temp_dir / "reference"
+        ref_dir.mkdir()
+        maker = MeshModelMaker(
+            mesh_path=self._mesh_paths[0], output_dir=ref_dir, scale=2.0
+        )
+        reference = maker.make_model()
+        self.assertEqual(reference, ref_dir / "box.sdf")
+        maker.output_dir = self._temp_dir
+        actual = maker.make_model(analysis_cache=dut)
+        self.assertEqual((dut.num_hits, dut.num_misses), (2, 3))
+        self.assertEqual(_file_contents(actual), _file_contents(reference))
+
+    def test_make_models(self):
+        ref_dir = self._temp_dir / "reference"
+        ref_dir.mkdir()
+        out_dir = self._temp_dir / "output"
+        out_dir.mkdir()
+        for num_workers in [1, 2]:
+            makers = [
+                MeshModelMaker(mesh_path=x, output_dir=out_dir, mass=2.0)
+                for x in self._mesh_paths + [Path("invalid_path.obj")]
+            ]
+            results = make_models(makers, num_workers=num_workers)
+            self.assertEqual(len(results), 4)
+            for mesh_path, result in zip(self._mesh_paths, results):
+                self.assertEqual(result.mesh_path, mesh_path)
+                self.assertIsNone(result.error)
+                expected = MeshModelMaker(
+                    mesh_path=mesh_path, output_dir=ref_dir, mass=2.0
+                ).make_model()
+                self.assertEqual(result.model_path, out_dir / expected.name)
+                self.assertEqual(
+                    _file_contents(result.model_path),
+                    _file_contents(expected),
+                )
+                _parse_model_no_throw(result.model_path)
+            self.assertIsNone(results[3].model_path)
+            self.assertRegex(results[3].error, "cannot read the file")
+
+    def test_make_models_package_auto(self):
+        makers = [
+            MeshModelMaker(mesh_path=x, encoded_package="auto")
+            for x in self._mesh_paths
+        ]
+        results = make_models(makers, num_workers=2)
+        self.assertTrue((self._temp_dir / "package.xml").exists())
+        for result in results:
+            self.assertIsNone(result.error)
+            _parse_model_no_throw(
+                result.model_path, self._temp_dir / "package.xml"
+            )
+
+
 class TestMeshToModelProcess(unittest.TestCase):
     """
     Tests the command-line tool mesh_to_model by invoking the process
@@ -575,6 +662,35 @@ class TestMeshToModelProcess(unittest.TestCase):
 
         self.assert_files_equal(dut_sdf, reference_sdf)
 
+    def test_multiple_meshes(self):
+        # Given more than one mesh (or a directory), each mesh is converted
+        # just as it would be on its own.
+        mesh_dir = self._temp_dir / "meshes"
+        (mesh_dir / "sub").mkdir(parents=True)
+        mesh_paths = [mesh_dir / "a.obj", mesh_dir / "sub" / "b.obj"]
+        for mesh_path in mesh_paths:
+            shutil.copy(self._obj_path, mesh_path)
+        ref_dir = self._temp_dir / "reference"
+        ref_dir.mkdir()
+        reference_sdf = MeshModelMaker(
+            mesh_path=mesh_paths[0], output_dir=ref_dir, scale=1.5
+        ).make_model()
+
+        subprocess.check_call(
+            [self._dut, "--scale", "1.5", "--jobs", "2", mesh_dir]
+        )
+        self.assert_files_equal(mesh_dir / "a.sdf", reference_sdf)
+        self.assertTrue((mesh_dir / "sub" / "b.sdf").exists())
+
+        # A mesh that cannot be converted fails the process.
+        with self.assertRaises(subprocess.CalledProcessError):
+            subprocess.check_call(
+                [self._dut, self._obj_path, self._temp_dir / "missing.obj"]
+            )
+        # Model names would collide.
+        with self.assertRaises(subprocess.CalledProcessError):
+            subprocess.check_call([self._dut, "--model-name", "box", mesh_dir])
+
     def test_reject_setting_both_mass_and_density(self):
         """
         Checks that we can't pass both mass and density.
@@ -2,10 +2,13 @@
 
 #include "drake/bindings/generated_docstrings/perception.h"
 #include "drake/bindings/pydrake/common/cpp_param_pybind.h"
+#include "drake/bindings/pydrake/common/serialize_pybind.h"
 #include "drake/bindings/pydrake/common/value_pybind.h"
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/perception/depth_image_to_point_cloud.h"
 #include "drake/perception/point_cloud.h"
+#include "drake/perception/point_cloud_kd_tree.h"
+#include "drake/perception/point_cloud_pipeline.h"
 #include "drake/perception/point_cloud_to_lcm.h"
 
 namespace drake {
@@ -56,6 +59,8 @@ void init_perception(py::module_ m) {
 
   using systems::LeafSystem;
   using systems::sensors::CameraInfo;
+  using systems::sensors::ImageDepth32F;
+  using systems::sensors::ImageRgba8U;
   using systems::sensors::PixelType;
 
   py::module_::import_("pydrake.systems.framework");
@@ -139,6 +144,38 @@ void init_perception(py::module_ m) {
 
   m.def("Concatenate", &Concatenate, py::arg("clouds"), doc.Concatenate.doc);
 
+  {
+    using Class = PointCloudKdTree;
+    constexpr auto& cls_doc = doc.PointCloudKdTree;
+    class_<Class>(m, "PointCloudKdTree", cls_doc.doc)
+        .def(py::init<const PointCloud&>(), py::arg("cloud"),
+            cls_doc.ctor.doc_1args_cloud)
+        .def(py::init<const Eigen::Ref<const Matrix3X<float>>&>(),
+            py::arg("xyzs"), cls_doc.ctor.doc_1args_xyzs)
+        .def("size", &Class::size, cls_doc.size.doc)
+        .def("num_updated_points", &Class::num_updated_points,
+            cls_doc.num_updated_points.doc)
+        .def("num_builds", &Class::num_builds, cls_doc.num_builds.doc)
+        .def("Update",
+            overload_cast_explicit<void, const PointCloud&, double>(
+                &Class::Update),
+            py::arg("cloud"), py::arg("max_updated_fraction") = 0.1,
+            cls_doc.Update.doc_2args_cloud_max_updated_fraction)
+        .def("Update",
+            overload_cast_explicit<void,
+                const Eigen::Ref<const Matrix3X<float>>&, double>(
+                &Class::Update),
+            py::arg("xyzs"), py::arg("max_updated_fraction") = 0.1,
+            cls_doc.Update.doc_2args_xyzs_max_updated_fraction)
+        .def("FindNearest", &Class::FindNearest, py::arg("queries"),
+            py::arg("k"), py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(), cls_doc.FindNearest.doc)
+        .def("FindWithinRadius", &Class::FindWithinRadius, py::arg("queries"),
+            py::arg("radius"), py::arg("parallelize") = false,
+            py::call_guard<py::gil_scoped_release>(),
+            cls_doc.FindWithinRadius.doc);
+  }
+
   {
     using Class = DepthImageToPointCloud;
     constexpr auto& cls_doc = doc.DepthImageToPointCloud;
@@ -159,6 +196,60 @@ void init_perception(py::module_ m) {
             py_rvp::reference_internal, cls_doc.point_cloud_output_port.doc);
   }
 
+  {
+    using Class = PointCloudPipelineParams;
+    constexpr auto& cls_doc = doc.PointCloudPipelineParams;
+    class_<Class> cls(m, "PointCloudPipelineParams", cls_doc.doc);
+    cls.def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, cls_doc);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = PointCloudPipeline;
+    constexpr auto& cls_doc = doc.PointCloudPipeline;
+    class_<Class> cls(m, "PointCloudPipeline", cls_doc.doc);
+    cls  // BR
+        .def(py::init<std::vector<CameraInfo>, const PointCloudPipelineParams&,
+                 pc_flags::BaseFieldT>(),
+            py::arg("camera_infos"), py::arg("params"),
+            py::arg("fields") = pc_flags::kXYZs, cls_doc.ctor.doc)
+        .def("num_cameras", &Class::num_cameras, cls_doc.num_cameras.doc)
+        .def("camera_infos", &Class::camera_infos, cls_doc.camera_infos.doc)
+        .def("params", &Class::params, cls_doc.params.doc)
+        .def("fields", &Class::fields, cls_doc.fields.doc)
+        .def("Process", &Class::Process, py::arg("depth_images"),
+            py::arg("color_images"), py::arg("camera_poses"), py::arg("output"),
+            py::arg("parallelize") = true,
+            py::call_guard<py::gil_scoped_release>(), cls_doc.Process.doc);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = PointCloudPipelineSystem;
+    constexpr auto& cls_doc = doc.PointCloudPipelineSystem;
+    class_<Class, LeafSystem<double>>(
+        m, "PointCloudPipelineSystem", cls_doc.doc)
+        .def(py::init<std::vector<CameraInfo>, const PointCloudPipelineParams&,
+                 pc_flags::BaseFieldT, Parallelism>(),
+            py::arg("camera_infos"), py::arg("params"),
+            py::arg("fields") = pc_flags::kXYZs, py::arg("parallelize") = true,
+            cls_doc.ctor.doc)
+        .def("num_cameras", &Class::num_cameras, cls_doc.num_cameras.doc)
+        .def("depth_image_input_port", &Class::depth_image_input_port,
+            py::arg("i"), py_rvp::reference_internal,
+            cls_doc.depth_image_input_port.doc)
+        .def("color_image_input_port", &Class::color_image_input_port,
+            py::arg("i"), py_rvp::reference_internal,
+            cls_doc.color_image_input_port.doc)
+        .def("camera_pose_input_port", &Class::camera_pose_input_port,
+            py::arg("i"), py_rvp::reference_internal,
+            cls_doc.camera_pose_input_port.doc)
+        .def("point_cloud_output_port", &Class::point_cloud_output_port,
+            py_rvp::reference_internal, cls_doc.point_cloud_output_port.doc);
+  }
+
   {
     using Class = PointCloudToLcm;
     constexpr auto& cls_doc = doc.PointCloudToLcm;
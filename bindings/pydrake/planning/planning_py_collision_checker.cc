@@ -269,6 +269,13 @@ void DefinePlanningCollisionChecker(py::module_ m) {
             py::arg("model_context"), py::arg("q"),
             py::arg("influence_distance"),
             cls_doc.CalcContextRobotClearance.doc)
+        .def("CalcConfigsRobotClearance", &Class::CalcConfigsRobotClearance,
+            py::arg("configs"), py::arg("influence_distance"),
+            py::arg("compute_jacobians") = false,
+            py::arg("compute_witness_points") = false,
+            py::arg("parallelize") = true,
+            py::call_guard<py::gil_scoped_release>(),
+            cls_doc.CalcConfigsRobotClearance.doc)
         .def("MaxNumDistances", &Class::MaxNumDistances,
             py::arg("context_number") = std::nullopt,
             cls_doc.MaxNumDistances.doc)
@@ -223,12 +223,71 @@ void DefinePlanningCollisionCheckerInterfaceTypes(py::module_ m) {
             cls_doc.distances.doc)
         .def("jacobians", &Class::jacobians, py_rvp::reference_internal,
             cls_doc.jacobians.doc)
+        .def("has_witness_points", &Class::has_witness_points,
+            cls_doc.has_witness_points.doc)
+        .def("robot_witness_points", &Class::robot_witness_points,
+            py_rvp::reference_internal, cls_doc.robot_witness_points.doc)
+        .def("other_witness_points", &Class::other_witness_points,
+            py_rvp::reference_internal, cls_doc.other_witness_points.doc)
         .def("mutable_jacobians", &Class::mutable_jacobians,
             py_rvp::reference_internal, cls_doc.mutable_jacobians.doc)
         .def("Reserve", &Class::Reserve, py::arg("size"), cls_doc.Reserve.doc)
-        .def("Append", &Class::Append, py::arg("robot_index"),
-            py::arg("other_index"), py::arg("collision_type"),
-            py::arg("distance"), py::arg("jacobian"), cls_doc.Append.doc);
+        .def("Append",
+            py::overload_cast<multibody::BodyIndex, multibody::BodyIndex,
+                RobotCollisionType, double,
+                const Eigen::Ref<const Eigen::RowVectorXd>&>(&Class::Append),
+            py::arg("robot_index"), py::arg("other_index"),
+            py::arg("collision_type"), py::arg("distance"), py::arg("jacobian"),
+            cls_doc.Append.doc_5args)
+        .def("Append",
+            py::overload_cast<multibody::BodyIndex, multibody::BodyIndex,
+                RobotCollisionType, double,
+                const Eigen::Ref<const Eigen::RowVectorXd>&,
+                const Eigen::Vector3d&, const Eigen::Vector3d&>(&Class::Append),
+            py::arg("robot_index"), py::arg("other_index"),
+            py::arg("collision_type"), py::arg("distance"), py::arg("jacobian"),
+            py::arg("p_WCr"), py::arg("p_WCo"), cls_doc.Append.doc_7args);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = RobotClearanceBatch;
+    constexpr auto& cls_doc = doc.RobotClearanceBatch;
+    class_<Class> cls(m, "RobotClearanceBatch", cls_doc.doc);
+    // The results are read-only; each array property returns a copy.
+    cls  // BR
+        .def(py::init<>())
+        .def("num_configs", &Class::num_configs, cls_doc.num_configs.doc)
+        .def("size", &Class::size, cls_doc.size.doc)
+        .def_prop_ro(
+            "offsets", [](const Class& self) { return self.offsets; },
+            cls_doc.offsets.doc)
+        .def_prop_ro(
+            "robot_indices",
+            [](const Class& self) { return self.robot_indices; },
+            cls_doc.robot_indices.doc)
+        .def_prop_ro(
+            "other_indices",
+            [](const Class& self) { return self.other_indices; },
+            cls_doc.other_indices.doc)
+        .def_prop_ro(
+            "collision_types",
+            [](const Class& self) { return self.collision_types; },
+            cls_doc.collision_types.doc)
+        .def_prop_ro(
+            "distances", [](const Class& self) { return self.distances; },
+            cls_doc.distances.doc)
+        .def_prop_ro(
+            "jacobians", [](const Class& self) { return self.jacobians; },
+            cls_doc.jacobians.doc)
+        .def_prop_ro(
+            "robot_witness_points",
+            [](const Class& self) { return self.robot_witness_points; },
+            cls_doc.robot_witness_points.doc)
+        .def_prop_ro(
+            "other_witness_points",
+            [](const Class& self) { return self.other_witness_points; },
+            cls_doc.other_witness_points.doc);
     DefCopyAndDeepCopy(&cls);
   }
 }
@@ -3,6 +3,7 @@
 #include "drake/bindings/pydrake/planning/planning_py.h"
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/bindings/pydrake/symbolic_types_pybind.h"
+#include "drake/planning/iris/iris_region_library.h"
 #include "drake/planning/iris/iris_zo.h"
 
 namespace drake {
@@ -38,6 +39,40 @@ void DefinePlanningIrisZo(py::module_ m) {
   m.def("IrisZo", &IrisZo, py::arg("checker"), py::arg("starting_ellipsoid"),
       py::arg("domain"), py::arg("options") = IrisZoOptions(),
       py::call_guard<py::gil_scoped_release>(), doc.IrisZo.doc);
+
+  // IrisRegionLibrary
+  {
+    using Class = IrisRegionLibrary;
+    constexpr auto& cls_doc = doc.IrisRegionLibrary;
+    class_<Class>(m, "IrisRegionLibrary", cls_doc.doc)
+        .def(py::init<>())
+        .def_rw("regions", &Class::regions, cls_doc.regions.doc)
+        .def_rw("coverage", &Class::coverage, cls_doc.coverage.doc);
+  }
+
+  // IrisRegionLibraryOptions
+  {
+    using Class = IrisRegionLibraryOptions;
+    constexpr auto& cls_doc = doc.IrisRegionLibraryOptions;
+    class_<Class>(m, "IrisRegionLibraryOptions", cls_doc.doc)
+        .def(py::init<>())
+        .def_rw("iris_zo_options", &Class::iris_zo_options,
+            cls_doc.iris_zo_options.doc)
+        .def_rw("parallelism", &Class::parallelism, cls_doc.parallelism.doc)
+        .def_rw(
+            "duplicate_tol", &Class::duplicate_tol, cls_doc.duplicate_tol.doc)
+        .def_rw("num_points_per_coverage_check",
+            &Class::num_points_per_coverage_check,
+            cls_doc.num_points_per_coverage_check.doc)
+        .def_rw("point_in_set_tol", &Class::point_in_set_tol,
+            cls_doc.point_in_set_tol.doc);
+  }
+
+  // Region growing runs on worker threads; we must release the GIL.
+  m.def("GrowIrisRegionLibrary", &GrowIrisRegionLibrary, py::arg("checker"),
+      py::arg("seeds"), py::arg("domain"), py::arg("options"),
+      py::arg("generator"), py::arg("library"),
+      py::call_guard<py::gil_scoped_release>(), doc.GrowIrisRegionLibrary.doc);
 }
 
 }  // namespace internal
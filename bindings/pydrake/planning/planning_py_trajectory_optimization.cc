@@ -757,6 +757,19 @@ void DefinePlanningTrajectoryOptimization(py::module_ m) {
             cls_doc.SolvePath.doc,
             // Parallelism may be used when solving, so we must release the GIL.
             py::call_guard<py::gil_scoped_release>())
+        .def("SolvePathWithCache", &Class::SolvePathWithCache,
+            py::arg("source"), py::arg("target"),
+            py::arg("options") =
+                geometry::optimization::GraphOfConvexSetsOptions(),
+            cls_doc.SolvePathWithCache.doc,
+            // Parallelism may be used when solving, so we must release the GIL.
+            py::call_guard<py::gil_scoped_release>())
+        .def("ClearPathCache", &Class::ClearPathCache,
+            cls_doc.ClearPathCache.doc)
+        .def("num_cached_paths", &Class::num_cached_paths,
+            cls_doc.num_cached_paths.doc)
+        .def("num_path_cache_hits", &Class::num_path_cache_hits,
+            cls_doc.num_path_cache_hits.doc)
         .def("SolveConvexRestriction", &Class::SolveConvexRestriction,
             py::arg("active_vertices"),
             py::arg("options") =
@@ -227,6 +227,36 @@ class TestCollisionChecker(unittest.TestCase):
         copy.copy(dut)
         mut.RobotClearance(other=dut)
 
+        # Witness points.
+        self.assertFalse(dut.has_witness_points())
+        dut = mut.RobotClearance(num_positions=3)
+        dut.Append(
+            robot_index=BodyIndex(10),
+            other_index=BodyIndex(11),
+            collision_type=type_self,
+            distance=0.1,
+            jacobian=np.array([0.0, 0.0, 0.01]),
+            p_WCr=[1.0, 2.0, 3.0],
+            p_WCo=[4.0, 5.0, 6.0],
+        )
+        self.assertTrue(dut.has_witness_points())
+        numpy_compare.assert_equal(dut.robot_witness_points(), [[1], [2], [3]])
+        numpy_compare.assert_equal(dut.other_witness_points(), [[4], [5], [6]])
+
+    def test_robot_clearance_batch(self):
+        dut = mut.RobotClearanceBatch()
+        self.assertEqual(dut.num_configs(), 0)
+        self.assertEqual(dut.size(), 0)
+        numpy_compare.assert_equal(dut.offsets, [0])
+        numpy_compare.assert_equal(dut.robot_indices, [])
+        numpy_compare.assert_equal(dut.other_indices, [])
+        numpy_compare.assert_equal(dut.collision_types, [])
+        numpy_compare.assert_equal(dut.distances, [])
+        self.assertIsNone(dut.jacobians)
+        self.assertIsNone(dut.robot_witness_points)
+        self.assertIsNone(dut.other_witness_points)
+        copy.copy(dut)
+
     def test_robot_collision_type(self):
         # Check that all values are bound.
         dut = mut.RobotCollisionType
@@ -458,6 +488,24 @@ class TestCollisionChecker(unittest.TestCase):
             model_context=ccc, q=q, influence_distance=10
         )
         self.assertIsInstance(clearance, mut.RobotClearance)
+        batch = dut.CalcConfigsRobotClearance(
+            configs=[q] * 4,
+            influence_distance=10,
+            compute_jacobians=True,
+            compute_witness_points=True,
+            parallelize=True,
+        )
+        self.assertIsInstance(batch, mut.RobotClearanceBatch)
+        self.assertEqual(batch.num_configs(), 4)
+        self.assertEqual(batch.offsets.shape, (5,))
+        self.assertEqual(batch.distances.shape, (batch.size(),))
+        self.assertEqual(batch.robot_indices.shape, (batch.size(),))
+        self.assertEqual(batch.jacobians.shape, (batch.size(), len(q)))
+        self.assertEqual(batch.robot_witness_points.shape, (batch.size(), 3))
+        # Omit the defaulted args; the Jacobians and witness points are opt-in.
+        batch = dut.CalcConfigsRobotClearance([q], influence_distance=10)
+        self.assertIsNone(batch.jacobians)
+        self.assertIsNone(batch.other_witness_points)
 
         dut.MaxNumDistances()
         dut.MaxNumDistances(context_number=1)
@@ -5,7 +5,7 @@ import unittest
 import numpy as np
 
 from pydrake.autodiffutils import AutoDiffXd
-from pydrake.common import Parallelism
+from pydrake.common import Parallelism, RandomGenerator
 from pydrake.geometry.optimization import HPolyhedron, Hyperellipsoid
 from pydrake.multibody.inverse_kinematics import InverseKinematics
 from pydrake.multibody.rational import RationalForwardKinematics
@@ -118,6 +118,26 @@ class TestIrisZo(unittest.TestCase):
         test_point2 = np.array([0.0, 1])
         self.assertTrue(region.PointInSet(test_point2))
 
+        library_options = mut.IrisRegionLibraryOptions()
+        library_options.iris_zo_options = mut.IrisZoOptions()
+        SetSampledIrisOptions(library_options.iris_zo_options)
+        library_options.parallelism = Parallelism(2)
+        library_options.duplicate_tol = 1e-6
+        library_options.num_points_per_coverage_check = 100
+        library_options.point_in_set_tol = 1e-6
+        library = mut.IrisRegionLibrary()
+        num_added = mut.GrowIrisRegionLibrary(
+            checker=checker,
+            seeds=[starting_ellipsoid] * 2,
+            domain=domain,
+            options=library_options,
+            generator=RandomGenerator(0),
+            library=library,
+        )
+        self.assertEqual(num_added, len(library.regions))
+        self.assertIn("region_0", library.regions)
+        self.assertGreater(library.coverage, 0.0)
+
         kin = RationalForwardKinematics(plant)
         q_star = np.zeros(2)
         options.parameterization = mut.IrisParameterizationFunction(
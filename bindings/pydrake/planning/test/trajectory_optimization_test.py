@@ -436,6 +436,19 @@ class TestTrajectoryOptimization(unittest.TestCase):
         np.testing.assert_allclose(normalized_traj_start, start, atol=1e-6)
         np.testing.assert_allclose(normalized_traj_end, end, atol=1e-6)
 
+        # Repeated queries can reuse the rounded path.
+        self.assertEqual(gcs.num_cached_paths(), 0)
+        for _ in range(2):
+            traj, result = gcs.SolvePathWithCache(source=source, target=target)
+            self.assertTrue(result.is_success())
+            np.testing.assert_allclose(
+                traj.value(traj.end_time()).squeeze(), end, atol=1e-6
+            )
+        self.assertEqual(gcs.num_cached_paths(), 1)
+        self.assertEqual(gcs.num_path_cache_hits(), 1)
+        gcs.ClearPathCache()
+        self.assertEqual(gcs.num_cached_paths(), 0)
+
         # We can also solve the convex restriction, by manually defining
         # through which regions the path should go.
         active_vertices = (
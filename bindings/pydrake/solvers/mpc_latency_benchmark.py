@@ -0,0 +1,153 @@
+"""Measures the per-tick latency of a linear MPC controller running at 100 Hz
+with a 20-step horizon, comparing three ways to re-solve its program.
+
+- "rebuild" constructs a new program and solver every control tick.
+- "update" updates the initial-state bounds of one program in place, and
+  solves it with a new solver every tick.
+- "reuse" updates the program in place, and solves it with one OsqpSolver that
+  keeps its setup (including its KKT factorization) across ticks, warm
+  starting from the previous tick's solution.
+
+Each strategy simulates the same closed loop, and reports the mean, 99th
+percentile, and worst latency per tick, and the number of ticks that missed
+the control period.
+
+    bazel run //bindings/pydrake/solvers:mpc_latency_benchmark
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pydrake.solvers import MathematicalProgram, OsqpSolver
+
+# The sizes of the state and input of the (discretized) dynamics.
+_NUM_STATES = 12
+_NUM_INPUTS = 4
+_PERIOD = 0.01
+
+
+def _make_problem():
+    rng = np.random.default_rng(seed=0)
+    A = np.eye(_NUM_STATES) + 0.01 * rng.standard_normal(
+        (_NUM_STATES, _NUM_STATES)
+    )
+    B = 0.1 * rng.standard_normal((_NUM_STATES, _NUM_INPUTS))
+    Q = np.eye(_NUM_STATES)
+    R = 0.1 * np.eye(_NUM_INPUTS)
+    x0 = rng.standard_normal(_NUM_STATES)
+    return A, B, Q, R, x0
+
+
+class _Controller:
+    """A linear MPC program, whose initial state is its only parameter."""
+
+    def __init__(self, horizon, A, B, Q, R):
+        self.prog = MathematicalProgram()
+        x = self.prog.NewContinuousVariables(horizon + 1, _NUM_STATES, "x")
+        self.u = self.prog.NewContinuousVariables(horizon, _NUM_INPUTS, "u")
+        self.initial_state = self.prog.AddBoundingBoxConstraint(
+            np.zeros(_NUM_STATES), np.zeros(_NUM_STATES), x[0]
+        )
+        # The dynamics x[k + 1] = A x[k] + B u[k], as [A B -I] [x; u; x'] = 0.
+        Aeq = np.hstack([A, B, -np.eye(_NUM_STATES)])
+        for k in range(horizon):
+            self.prog.AddLinearEqualityConstraint(
+                Aeq=Aeq,
+                beq=np.zeros(_NUM_STATES),
+                vars=np.concatenate([x[k], self.u[k], x[k + 1]]),
+            )
+            self.prog.AddBoundingBoxConstraint(-1.0, 1.0, self.u[k])
+            self.prog.AddQuadraticCost(
+                2 * R, np.zeros(_NUM_INPUTS), self.u[k], is_convex=True
+            )
+        for k in range(horizon + 1):
+            self.prog.AddQuadraticCost(
+                2 * Q, np.zeros(_NUM_STATES), x[k], is_convex=True
+            )
+
+    def set_initial_state(self, x0):
+        self.initial_state.evaluator().set_bounds(x0, x0)
+
+    def solve(self, solver):
+        result = solver.Solve(self.prog, None, None)
+        if not result.is_success():
+            raise RuntimeError("The MPC program failed to solve.")
+        return result.GetSolution(self.u[0])
+
+
+def _run(strategy, horizon, ticks, problem):
+    """Runs the closed loop for `ticks` control ticks, and returns the
+    latencies (in seconds) and the applied inputs.
+    """
+    A, B, Q, R, x0 = problem
+    controller = _Controller(horizon, A, B, Q, R)
+    solver = OsqpSolver()
+    if strategy == "reuse":
+        solver.set_reuse_setup(True)
+    x = x0.copy()
+    latencies = []
+    inputs = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        if strategy == "rebuild":
+            controller = _Controller(horizon, A, B, Q, R)
+            solver = OsqpSolver()
+        elif strategy == "update":
+            solver = OsqpSolver()
+        controller.set_initial_state(x)
+        u = controller.solve(solver)
+        latencies.append(time.perf_counter() - start)
+        inputs.append(u)
+        x = A @ x + B @ u
+    return np.array(latencies), np.array(inputs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        default=20,
+        help="The number of knot points of the MPC problem.",
+    )
+    parser.add_argument(
+        "--ticks",
+        type=int,
+        default=200,
+        help="The number of control ticks to simulate.",
+    )
+    args = parser.parse_args()
+    if not OsqpSolver().available():
+        print("OSQP is not available in this build of Drake.")
+        return
+
+    problem = _make_problem()
+    print(
+        f"Latency per tick (ms) of a {1 / _PERIOD:g} Hz MPC controller with "
+        f"horizon {args.horizon}, over {args.ticks} ticks:"
+    )
+    print(
+        f"{'':<10}{'mean':>10}{'p99':>10}{'max':>10}{'missed':>10}"
+        f"{'max |Δu|':>12}"
+    )
+    reference_inputs = None
+    for strategy in ("rebuild", "update", "reuse"):
+        latencies, inputs = _run(strategy, args.horizon, args.ticks, problem)
+        if reference_inputs is None:
+            reference_inputs = inputs
+        mean, p99, worst = 1e3 * np.array(
+            [np.mean(latencies), np.percentile(latencies, 99), latencies.max()]
+        )
+        missed = np.count_nonzero(latencies > _PERIOD)
+        # The closed loops should match, up to the solver's tolerances.
+        difference = np.max(np.abs(inputs - reference_inputs))
+        print(
+            f"{strategy:<10}{mean:>10.3f}{p99:>10.3f}{worst:>10.3f}"
+            f"{missed:>10}{difference:>12.2e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Measures the time to build a linear MPC quadratic program from Python,
+comparing symbolic expressions against sparse matrices.
+
+The symbolic path adds the dynamics, input limits, and costs for each knot
+point as symbolic formulas and expressions, which MathematicalProgram then
+decomposes term by term. The direct path passes the same program as a few
+scipy.sparse matrices and NumPy vectors over all of the decision variables,
+without creating any symbolic expressions.
+
+    bazel run //bindings/pydrake/solvers:program_builder_benchmark
+"""
+
+import argparse
+import time
+
+import numpy as np
+import scipy.sparse
+
+from pydrake.math import eq, ge, le
+from pydrake.solvers import MathematicalProgram, Solve
+
+# The sizes of the state and input of the (discretized) dynamics.
+_NUM_STATES = 12
+_NUM_INPUTS = 4
+
+
+def _make_problem():
+    rng = np.random.default_rng(seed=0)
+    A = np.eye(_NUM_STATES) + 0.01 * rng.standard_normal(
+        (_NUM_STATES, _NUM_STATES)
+    )
+    B = 0.01 * rng.standard_normal((_NUM_STATES, _NUM_INPUTS))
+    Q = np.eye(_NUM_STATES)
+    R = 0.1 * np.eye(_NUM_INPUTS)
+    x0 = rng.standard_normal(_NUM_STATES)
+    return A, B, Q, R, x0
+
+
+def build_symbolic(horizon, A, B, Q, R, x0):
+    """Builds the program from symbolic formulas and expressions, one knot
+    point at a time.
+    """
+    prog = MathematicalProgram()
+    x = prog.NewContinuousVariables(horizon + 1, _NUM_STATES, "x")
+    u = prog.NewContinuousVariables(horizon, _NUM_INPUTS, "u")
+    prog.AddLinearEqualityConstraint(eq(x[0], x0))
+    for k in range(horizon):
+        prog.AddLinearEqualityConstraint(eq(x[k + 1], A @ x[k] + B @ u[k]))
+        prog.AddLinearConstraint(ge(u[k], -1.0))
+        prog.AddLinearConstraint(le(u[k], 1.0))
+        prog.AddQuadraticCost(u[k] @ R @ u[k], is_convex=True)
+    for k in range(horizon + 1):
+        prog.AddQuadraticCost(x[k] @ Q @ x[k], is_convex=True)
+    return prog
+
+
+def build_direct(horizon, A, B, Q, R, x0):
+    """Builds the same program as build_symbolic(), from sparse matrices over
+    all of the decision variables at once.
+    """
+    prog = MathematicalProgram()
+    x = prog.NewContinuousVariables(horizon + 1, _NUM_STATES, "x")
+    u = prog.NewContinuousVariables(horizon, _NUM_INPUTS, "u")
+    # The decision variables are z = [x₀, ..., x_N, u₀, ..., u_N₋₁].
+    z = np.concatenate([x.flatten(), u.flatten()])
+    prog.AddBoundingBoxConstraint(x0, x0, x[0])
+    prog.AddBoundingBoxConstraint(-1.0, 1.0, u.flatten())
+
+    # The dynamics x[k + 1] - A x[k] - B u[k] = 0, for all k.
+    shift = scipy.sparse.eye(horizon, horizon + 1, k=1)
+    Aeq = scipy.sparse.hstack(
+        [
+            scipy.sparse.kron(shift, np.eye(_NUM_STATES))
+            - scipy.sparse.kron(scipy.sparse.eye(horizon, horizon + 1), A),
+            -scipy.sparse.kron(scipy.sparse.eye(horizon), B),
+        ],
+        format="csc",
+    )
+    prog.AddLinearEqualityConstraint(
+        Aeq=Aeq, beq=np.zeros(Aeq.shape[0]), vars=z
+    )
+
+    # The cost is 0.5 zᵀHz, with a block-diagonal H.
+    H = 2 * scipy.sparse.block_diag(
+        [scipy.sparse.kron(scipy.sparse.eye(horizon + 1), Q)]
+        + [scipy.sparse.kron(scipy.sparse.eye(horizon), R)],
+        format="csc",
+    )
+    prog.AddSparseQuadraticCost(
+        Q=H, b=np.zeros(z.size), c=0.0, vars=z, is_convex=True
+    )
+    return prog
+
+
+def _time_build(build, horizon, problem, iterations):
+    """Returns the program from `build`, and the mean build time in ms."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        prog = build(horizon, *problem)
+    return prog, (time.perf_counter() - start) / iterations * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--horizon",
+        type=int,
+        default=500,
+        help="The number of knot points of the MPC problem.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=3,
+        help="The number of builds to time for each path.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Solves both programs, and checks that their solutions match.",
+    )
+    args = parser.parse_args()
+
+    problem = _make_problem()
+    num_vars = (args.horizon + 1) * _NUM_STATES + args.horizon * _NUM_INPUTS
+    print(
+        f"Mean build time (ms) for horizon {args.horizon} "
+        f"({num_vars} variables), over {args.iterations} builds:"
+    )
+    programs = dict()
+    for name, build in (
+        ("symbolic", build_symbolic),
+        ("direct", build_direct),
+    ):
+        programs[name], build_time = _time_build(
+            build, args.horizon, problem, args.iterations
+        )
+        print(f"{name:<10}{build_time:>12.2f}")
+
+    if args.check:
+        results = {name: Solve(prog) for name, prog in programs.items()}
+        for name, result in results.items():
+            if not result.is_success():
+                raise RuntimeError(f"The {name} program failed to solve.")
+        costs = [result.get_optimal_cost() for result in results.values()]
+        if not np.isclose(costs[0], costs[1], rtol=1e-4, atol=1e-6):
+            raise RuntimeError(f"The optimal costs differ: {costs}")
+        print(f"Both programs have the optimal cost {costs[0]:.6g}.")
+
+
+if __name__ == "__main__":
+    main()
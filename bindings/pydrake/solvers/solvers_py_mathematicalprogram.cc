@@ -13,11 +13,14 @@
 #include "drake/bindings/pydrake/pydrake_pybind.h"
 #include "drake/bindings/pydrake/solvers/solvers_py.h"
 #include "drake/bindings/pydrake/symbolic_types_pybind.h"
+#include "drake/math/autodiff_gradient.h"
 #include "drake/solvers/choose_best_solver.h"
 #include "drake/solvers/common_solver_option.h"
 #include "drake/solvers/get_program_type.h"
 #include "drake/solvers/mathematical_program.h"
 #include "drake/solvers/solve.h"
+#include "drake/solvers/solver_portfolio.h"
+#include "drake/solvers/solver_setup_cache.h"
 #include "drake/solvers/solver_type_converter.h"
 
 using Eigen::Dynamic;
@@ -59,6 +62,9 @@ using solvers::SolutionResult;
 using solvers::SolverId;
 using solvers::SolverInterface;
 using solvers::SolverOptions;
+using solvers::SolverPortfolio;
+using solvers::SolverPortfolioEntry;
+using solvers::SolverSetupCache;
 using solvers::SolverType;
 using solvers::SolverTypeConverter;
 using solvers::VectorXDecisionVariable;
@@ -177,6 +183,237 @@ class PyFunctionConstraint : public Constraint {
   const AutoDiffFunc autodiff_func_;
 };
 
+// Evaluates a user's batched Python function, which is applied to all of the
+// rows of a (num_rows, num_row_vars) matrix of decision variables in a single
+// call. The decision variables are stacked row by row into the evaluator's x.
+//
+// The function is called with a (num_rows, num_row_vars) array, and returns
+// the rows' values as a (num_rows, num_row_outputs) array (or, when
+// num_row_outputs is 1, a (num_rows,) array). When `with_gradient` is true, it
+// is only ever called with a float array, and returns a tuple of the values
+// and the rows' Jacobians as a (num_rows, num_row_outputs, num_row_vars)
+// array. Otherwise, for AutoDiffXd evaluations it is called with an
+// AutoDiffXd array, in which each row carries the derivatives with respect to
+// its own num_row_vars variables.
+class PyBatchedFunction {
+ public:
+  PyBatchedFunction(const char* cls_name, py::callable func, int num_rows,
+      int num_row_vars, int num_row_outputs, bool with_gradient)
+      : cls_name_(cls_name),
+        func_(std::move(func)),
+        num_rows_(num_rows),
+        num_row_vars_(num_row_vars),
+        num_row_outputs_(num_row_outputs),
+        with_gradient_(with_gradient) {
+    DRAKE_THROW_UNLESS(num_rows >= 1);
+    DRAKE_THROW_UNLESS(num_row_vars >= 1);
+    DRAKE_THROW_UNLESS(num_row_outputs >= 1);
+  }
+
+  ~PyBatchedFunction() {
+    py::gil_scoped_acquire guard;
+    func_.release().dec_ref();
+  }
+
+  int num_rows() const { return num_rows_; }
+  int num_row_vars() const { return num_row_vars_; }
+  int num_row_outputs() const { return num_row_outputs_; }
+
+  // Returns the stacked values of all rows, of size num_rows * num_row_outputs.
+  Eigen::VectorXd Eval(const Eigen::Ref<const Eigen::VectorXd>& x) const {
+    py::gil_scoped_acquire guard;
+    py::object result = func_(ToRows(x));
+    if (with_gradient_) {
+      result = GetTupleItem(result, 0);
+    }
+    return Flatten<double>(result, "values", num_rows_ * num_row_outputs_);
+  }
+
+  // Returns the stacked values of all rows, with derivatives via the chain
+  // rule through each row's Jacobian.
+  AutoDiffVecXd Eval(const Eigen::Ref<const AutoDiffVecXd>& x) const {
+    const int num_outputs = num_rows_ * num_row_outputs_;
+    Eigen::VectorXd values(num_outputs);
+    // The rows' Jacobians, stacked: row i of the batch has its Jacobian at
+    // middleRows(i * num_row_outputs, num_row_outputs).
+    Eigen::MatrixXd jacobians(num_outputs, num_row_vars_);
+    {
+      py::gil_scoped_acquire guard;
+      if (with_gradient_) {
+        py::object result = func_(ToRows(math::ExtractValue(x)));
+        values = Flatten<double>(
+            GetTupleItem(result, 0), "values", num_rows_ * num_row_outputs_);
+        jacobians = Flatten<double>(
+            GetTupleItem(result, 1), "Jacobians", num_outputs * num_row_vars_)
+                        .reshaped<Eigen::RowMajor>(num_outputs, num_row_vars_);
+      } else {
+        MatrixX<AutoDiffXd> rows(num_rows_, num_row_vars_);
+        for (int i = 0; i < num_rows_; ++i) {
+          for (int j = 0; j < num_row_vars_; ++j) {
+            rows(i, j) = AutoDiffXd(x(i * num_row_vars_ + j).value(),
+                Eigen::VectorXd::Unit(num_row_vars_, j));
+          }
+        }
+        const VectorX<AutoDiffXd> y =
+            Flatten<AutoDiffXd>(func_(rows), "values", num_outputs);
+        values = math::ExtractValue(y);
+        jacobians.setZero();
+        for (int k = 0; k < num_outputs; ++k) {
+          const Eigen::VectorXd& derivatives = y(k).derivatives();
+          if (derivatives.size() == num_row_vars_) {
+            jacobians.row(k) = derivatives.transpose();
+          } else if (derivatives.size() != 0) {
+            throw std::runtime_error(
+                fmt::format("{} returned derivatives of size {}; expected {}.",
+                    cls_name_, derivatives.size(), num_row_vars_));
+          }
+        }
+      }
+    }
+    // Apply the chain rule to each row.
+    const Eigen::MatrixXd x_gradient = math::ExtractGradient(x);
+    Eigen::MatrixXd gradient(num_outputs, x_gradient.cols());
+    if (x_gradient.cols() > 0) {
+      for (int i = 0; i < num_rows_; ++i) {
+        gradient.middleRows(i * num_row_outputs_, num_row_outputs_) =
+            jacobians.middleRows(i * num_row_outputs_, num_row_outputs_) *
+            x_gradient.middleRows(i * num_row_vars_, num_row_vars_);
+      }
+    }
+    return math::InitializeAutoDiff(values, gradient);
+  }
+
+  // Returns the pattern of the block-diagonal gradient of the stacked values.
+  std::vector<std::pair<int, int>> GetGradientSparsityPattern() const {
+    std::vector<std::pair<int, int>> result;
+    result.reserve(num_rows_ * num_row_outputs_ * num_row_vars_);
+    for (int i = 0; i < num_rows_; ++i) {
+      for (int k = 0; k < num_row_outputs_; ++k) {
+        for (int j = 0; j < num_row_vars_; ++j) {
+          result.emplace_back(i * num_row_outputs_ + k, i * num_row_vars_ + j);
+        }
+      }
+    }
+    return result;
+  }
+
+ private:
+  // Returns the stacked `x` as a (num_rows, num_row_vars) matrix.
+  Eigen::MatrixXd ToRows(const Eigen::Ref<const Eigen::VectorXd>& x) const {
+    return x.reshaped<Eigen::RowMajor>(num_rows_, num_row_vars_);
+  }
+
+  py::object GetTupleItem(py::handle result, int index) const {
+    if (!py::isinstance<py::tuple>(result) || py::len(result) != 2) {
+      throw std::runtime_error(fmt::format(
+          "{} with with_gradient=True must return a tuple of the values and "
+          "the Jacobians.",
+          cls_name_));
+    }
+    return result.attr("__getitem__")(index);
+  }
+
+  // Returns the given array-like `result` flattened in row-major order, after
+  // checking its size.
+  template <typename T>
+  VectorX<T> Flatten(py::handle result, const char* what, int size) const {
+    py::object flat = py::module_::import_("numpy").attr("ravel")(result);
+    const int actual_size = py::cast<int>(flat.attr("size"));
+    if (actual_size != size) {
+      throw std::runtime_error(
+          fmt::format("{} returned {} of size {}; expected {} (for {} rows).",
+              cls_name_, what, actual_size, size, num_rows_));
+    }
+    return py::cast<VectorX<T>>(flat);
+  }
+
+  const char* const cls_name_;
+  py::object func_;
+  const int num_rows_;
+  const int num_row_vars_;
+  const int num_row_outputs_;
+  const bool with_gradient_;
+};
+
+// A cost that sums a user's batched Python function over many rows of
+// decision variables; see PyBatchedFunction.
+class PyBatchedFunctionCost : public Cost {
+ public:
+  // Note that we do not allow Python implementations of Cost to be declared as
+  // thread safe.
+  PyBatchedFunctionCost(py::callable func, int num_rows, int num_row_vars,
+      bool with_gradient, const std::string& description)
+      : Cost(num_rows * num_row_vars, description),
+        func_("PyBatchedFunctionCost", std::move(func), num_rows, num_row_vars,
+            /* num_row_outputs = */ 1, with_gradient) {}
+
+ protected:
+  void DoEval(const Eigen::Ref<const Eigen::VectorXd>& x,
+      Eigen::VectorXd* y) const override {
+    y->resize(1);
+    (*y)[0] = func_.Eval(x).sum();
+  }
+
+  void DoEval(const Eigen::Ref<const AutoDiffVecXd>& x,
+      AutoDiffVecXd* y) const override {
+    y->resize(1);
+    (*y)[0] = func_.Eval(x).sum();
+  }
+
+  void DoEval(const Eigen::Ref<const VectorX<symbolic::Variable>>&,
+      VectorX<symbolic::Expression>*) const override {
+    throw std::logic_error(
+        "PyBatchedFunctionCost does not support symbolic evaluation.");
+  }
+
+ private:
+  const PyBatchedFunction func_;
+};
+
+// A constraint that applies a user's batched Python function to many rows of
+// decision variables, with the same bounds for each row; see
+// PyBatchedFunction.
+class PyBatchedFunctionConstraint : public Constraint {
+ public:
+  // Note that we do not allow Python implementations of Constraint to be
+  // declared as thread safe.
+  PyBatchedFunctionConstraint(py::callable func, int num_rows, int num_row_vars,
+      const Eigen::VectorXd& row_lb, const Eigen::VectorXd& row_ub,
+      bool with_gradient, const std::string& description)
+      : Constraint(num_rows * row_lb.size(), num_rows * num_row_vars,
+            row_lb.replicate(num_rows, 1), row_ub.replicate(num_rows, 1),
+            description),
+        func_("PyBatchedFunctionConstraint", std::move(func), num_rows,
+            num_row_vars, row_lb.size(), with_gradient) {
+    SetGradientSparsityPattern(func_.GetGradientSparsityPattern());
+  }
+
+ protected:
+  void DoEval(const Eigen::Ref<const Eigen::VectorXd>& x,
+      Eigen::VectorXd* y) const override {
+    *y = func_.Eval(x);
+  }
+
+  void DoEval(const Eigen::Ref<const AutoDiffVecXd>& x,
+      AutoDiffVecXd* y) const override {
+    *y = func_.Eval(x);
+  }
+
+  void DoEval(const Eigen::Ref<const VectorX<symbolic::Variable>>&,
+      VectorX<symbolic::Expression>*) const override {
+    throw std::logic_error(
+        "PyBatchedFunctionConstraint does not support symbolic evaluation.");
+  }
+
+ private:
+  const PyBatchedFunction func_;
+};
+
+// Returns the rows of `vars`, stacked into a vector.
+VectorXDecisionVariable StackRows(const MatrixXDecisionVariable& vars) {
+  return vars.reshaped<Eigen::RowMajor>();
+}
+
 /// Helper to adapt SolverType to SolverId.
 template <typename Value>
 void SetSolverOptionBySolverType(MathematicalProgram* self,
@@ -595,6 +832,35 @@ void BindMathematicalProgram(py::module_ m) {
           // N.B. There is no corresponding C++ method, so the docstring here
           // is a literal, not a reference to generated_docstrings.
           "Adds a cost function.")
+      .def(
+          "AddBatchedCost",
+          [](MathematicalProgram* self, py::callable func,
+              const MatrixXDecisionVariable& vars, bool with_gradient,
+              const std::string& description) {
+            return self->AddCost(
+                std::make_shared<PyBatchedFunctionCost>(std::move(func),
+                    vars.rows(), vars.cols(), with_gradient, description),
+                StackRows(vars));
+          },
+          py::arg("func"), py::arg("vars"), py::kw_only(),
+          py::arg("with_gradient") = false, py::arg("description") = "",
+          // N.B. There is no corresponding C++ method, so the docstring here
+          // is a literal, not a reference to generated_docstrings.
+          R"""(
+Adds a single cost that sums a batched Python function over the rows of
+``vars``, so that solvers make one Python call per evaluation instead of
+one per row (e.g., per knot point of a trajectory).
+
+``func`` is called with an (N, M) array of the values of ``vars``, and
+returns the (N,) array of the costs of each row. When ``with_gradient``
+is False, ``func`` must also accept an (N, M) array of AutoDiffXd, in
+which each row's derivatives are with respect to that row's M
+variables. When ``with_gradient`` is True, ``func`` is only called with
+float arrays, and instead returns a tuple of the (N,) costs and the
+(N, M) gradients of each row's cost with respect to its own variables.
+
+Returns the binding of the cost, whose variables are the rows of
+``vars`` stacked.)""")
       .def(
           "AddCost",
           [](MathematicalProgram* self, const Binding<Cost>& binding) {
@@ -659,6 +925,11 @@ void BindMathematicalProgram(py::module_ m) {
           py::arg("Q"), py::arg("b"), py::arg("c"), py::arg("vars"),
           py::arg("is_convex") = py::none(),
           doc.MathematicalProgram.AddQuadraticCost.doc_5args)
+      .def("AddSparseQuadraticCost",
+          &MathematicalProgram::AddSparseQuadraticCost, py::arg("Q"),
+          py::arg("b"), py::arg("c"), py::arg("vars"),
+          py::arg("is_convex") = py::none(),
+          doc.MathematicalProgram.AddSparseQuadraticCost.doc)
       .def("AddQuadraticErrorCost",
           static_cast<Binding<QuadraticCost> (MathematicalProgram::*)(double,
               const Eigen::Ref<const Eigen::VectorXd>&,
@@ -747,6 +1018,41 @@ void BindMathematicalProgram(py::module_ m) {
           py::arg("func"), py::arg("lb"), py::arg("ub"), py::arg("vars"),
           py::arg("description") = "",
           "Adds a constraint using a Python function.")
+      .def(
+          "AddBatchedConstraint",
+          [](MathematicalProgram* self, py::callable func,
+              const Eigen::VectorXd& lb, const Eigen::VectorXd& ub,
+              const MatrixXDecisionVariable& vars, bool with_gradient,
+              const std::string& description) {
+            return self->AddConstraint(
+                std::make_shared<PyBatchedFunctionConstraint>(std::move(func),
+                    vars.rows(), vars.cols(), lb, ub, with_gradient,
+                    description),
+                StackRows(vars));
+          },
+          py::arg("func"), py::arg("lb"), py::arg("ub"), py::arg("vars"),
+          py::kw_only(), py::arg("with_gradient") = false,
+          py::arg("description") = "",
+          // N.B. There is no corresponding C++ method, so the docstring here
+          // is a literal, not a reference to generated_docstrings.
+          R"""(
+Adds a single constraint that applies a batched Python function to each
+row of ``vars``, requiring ``lb <= func(row) <= ub`` for every row, so
+that solvers make one Python call per evaluation instead of one per row
+(e.g., per knot point of a trajectory).
+
+``func`` is called with an (N, M) array of the values of ``vars``, and
+returns the (N, K) array of the constraint values of each row, where K
+is the size of ``lb`` and ``ub``. When ``with_gradient`` is False,
+``func`` must also accept an (N, M) array of AutoDiffXd, in which each
+row's derivatives are with respect to that row's M variables. When
+``with_gradient`` is True, ``func`` is only called with float arrays,
+and instead returns a tuple of the (N, K) values and the (N, K, M)
+Jacobians of each row's values with respect to its own variables.
+
+The constraint's gradient sparsity pattern is block diagonal. Returns
+the binding of the constraint, whose variables are the rows of ``vars``
+stacked, and whose values are the rows of values stacked.)""")
       .def("AddConstraint",
           static_cast<Binding<Constraint> (MathematicalProgram::*)(
               const Expression&, double, double)>(
@@ -1655,6 +1961,69 @@ void BindFreeFunctions(py::module_ m) {
               .doc_6args_progs_initial_guesses_solver_options_solver_id_parallelism_dynamic_schedule);
 }
 
+void BindSolverPortfolio(py::module_ m) {
+  constexpr auto& doc = pydrake_doc_solvers.drake.solvers;
+  class_<SolverPortfolioEntry>(
+      m, "SolverPortfolioEntry", doc.SolverPortfolioEntry.doc)
+      .def(
+          "__init__",
+          [](SolverPortfolioEntry* self, const SolverId& solver_id,
+              const SolverOptions& solver_options) {
+            new (self) SolverPortfolioEntry{solver_id, solver_options};
+          },
+          py::arg("solver_id"), py::arg("solver_options") = SolverOptions{})
+      .def_rw("solver_id", &SolverPortfolioEntry::solver_id,
+          doc.SolverPortfolioEntry.solver_id.doc)
+      .def_rw("solver_options", &SolverPortfolioEntry::solver_options,
+          doc.SolverPortfolioEntry.solver_options.doc);
+
+  using Class = SolverPortfolio;
+  constexpr auto& cls_doc = doc.SolverPortfolio;
+  class_<Class> cls(m, "SolverPortfolio", cls_doc.doc);
+  class_<Class::Statistics>(cls, "Statistics", cls_doc.Statistics.doc)
+      .def_ro("num_solves", &Class::Statistics::num_solves,
+          cls_doc.Statistics.num_solves.doc)
+      .def_ro("num_finished", &Class::Statistics::num_finished,
+          cls_doc.Statistics.num_finished.doc)
+      .def_ro("num_successes", &Class::Statistics::num_successes,
+          cls_doc.Statistics.num_successes.doc)
+      .def_ro("num_errors", &Class::Statistics::num_errors,
+          cls_doc.Statistics.num_errors.doc)
+      .def_ro("num_wins", &Class::Statistics::num_wins,
+          cls_doc.Statistics.num_wins.doc)
+      .def_ro("total_time", &Class::Statistics::total_time,
+          cls_doc.Statistics.total_time.doc);
+  cls  // BR
+      .def(py::init<std::vector<SolverPortfolioEntry>>(), py::arg("entries"),
+          cls_doc.ctor.doc)
+      .def("entries", &Class::entries, cls_doc.entries.doc)
+      .def("Solve", &Class::Solve, py::arg("prog"),
+          py::arg("initial_guess") = std::nullopt,
+          py::arg("deadline") = std::nullopt,
+          py::call_guard<py::gil_scoped_release>(), cls_doc.Solve.doc)
+      .def("statistics", &Class::statistics, cls_doc.statistics.doc);
+}
+
+void BindSolverSetupCache(py::module_ m) {
+  constexpr auto& doc = pydrake_doc_solvers.drake.solvers;
+  using Class = SolverSetupCache;
+  constexpr auto& cls_doc = doc.SolverSetupCache;
+  class_<Class>(m, "SolverSetupCache", cls_doc.doc)
+      .def(py::init<bool>(), py::arg("reuse_solver_setup") = true,
+          cls_doc.ctor.doc)
+      .def("Solve",
+          py::overload_cast<const MathematicalProgram&,
+              const std::optional<Eigen::VectorXd>&,
+              const std::optional<SolverOptions>&>(&Class::Solve),
+          py::arg("prog"), py::arg("initial_guess") = std::nullopt,
+          py::arg("solver_options") = std::nullopt, cls_doc.Solve.doc_3args)
+      .def("num_hits", &Class::num_hits, cls_doc.num_hits.doc)
+      .def("num_misses", &Class::num_misses, cls_doc.num_misses.doc)
+      .def("hit_rate", &Class::hit_rate, cls_doc.hit_rate.doc)
+      .def("size", &Class::size, cls_doc.size.doc)
+      .def("Clear", &Class::Clear, cls_doc.Clear.doc);
+}
+
 }  // namespace
 
 namespace internal {
@@ -1667,6 +2036,8 @@ void DefineSolversMathematicalProgram(py::module_ m) {
   BindMathematicalProgramResult(m);
   BindSolverInterface(m);
   BindFreeFunctions(m);
+  BindSolverPortfolio(m);
+  BindSolverSetupCache(m);
 }
 }  // namespace internal
 
@@ -15,7 +15,13 @@ void DefineSolversOsqp(py::module_ m) {
 
   class_<OsqpSolver, SolverInterface>(m, "OsqpSolver", doc.OsqpSolver.doc)
       .def(py::init<>(), doc.OsqpSolver.ctor.doc)
-      .def_static("id", &OsqpSolver::id, doc.OsqpSolver.id.doc);
+      .def_static("id", &OsqpSolver::id, doc.OsqpSolver.id.doc)
+      .def("set_reuse_setup", &OsqpSolver::set_reuse_setup,
+          py::arg("reuse_setup"), doc.OsqpSolver.set_reuse_setup.doc)
+      .def("reuse_setup", &OsqpSolver::reuse_setup,
+          doc.OsqpSolver.reuse_setup.doc)
+      .def(
+          "num_setups", &OsqpSolver::num_setups, doc.OsqpSolver.num_setups.doc);
 
   class_<OsqpSolverDetails>(m, "OsqpSolverDetails", doc.OsqpSolverDetails.doc)
       .def_ro("iter", &OsqpSolverDetails::iter, doc.OsqpSolverDetails.iter.doc)
@@ -25,6 +31,8 @@ void DefineSolversOsqp(py::module_ m) {
           doc.OsqpSolverDetails.primal_res.doc)
       .def_ro("dual_res", &OsqpSolverDetails::dual_res,
           doc.OsqpSolverDetails.dual_res.doc)
+      .def_ro("reused_setup", &OsqpSolverDetails::reused_setup,
+          doc.OsqpSolverDetails.reused_setup.doc)
       .def_ro("setup_time", &OsqpSolverDetails::setup_time,
           doc.OsqpSolverDetails.setup_time.doc)
       .def_ro("solve_time", &OsqpSolverDetails::solve_time,
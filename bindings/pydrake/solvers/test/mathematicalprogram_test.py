@@ -6,7 +6,12 @@ import weakref
 import numpy as np
 import scipy.sparse
 
-from pydrake.autodiffutils import AutoDiffXd
+from pydrake.autodiffutils import (
+    AutoDiffXd,
+    ExtractGradient,
+    ExtractValue,
+    InitializeAutoDiff,
+)
 from pydrake.common import Parallelism, kDrakeAssertIsArmed
 from pydrake.common.test_utilities import numpy_compare
 from pydrake.common.yaml import yaml_dump_typed, yaml_load_typed
@@ -1033,6 +1038,119 @@ class TestMathematicalProgram(unittest.TestCase):
             prog.generic_costs()[0].evaluator(), cost_binding.evaluator()
         )
 
+    def test_batched_cost_and_constraint(self):
+        num_rows = 4
+        calls = []
+
+        def row_cost(X):
+            return (X[:, 0] - 1) ** 2 + X[:, 0] * X[:, 1] ** 2
+
+        def row_constraint(X):
+            return np.stack([X[:, 0] * X[:, 1], X[:, 0] + X[:, 1]], axis=1)
+
+        def cost(X):
+            calls.append(X.shape)
+            return row_cost(X)
+
+        def cost_with_gradient(X):
+            calls.append(X.shape)
+            J = np.stack(
+                [2 * (X[:, 0] - 1) + X[:, 1] ** 2, 2 * X[:, 0] * X[:, 1]],
+                axis=1,
+            )
+            return row_cost(X), J
+
+        def constraint(X):
+            calls.append(X.shape)
+            return row_constraint(X)
+
+        def constraint_with_gradient(X):
+            calls.append(X.shape)
+            J = np.zeros((len(X), 2, 2))
+            J[:, 0, 0] = X[:, 1]
+            J[:, 0, 1] = X[:, 0]
+            J[:, 1, :] = 1
+            return row_constraint(X), J
+
+        x_values = np.arange(2 * num_rows, dtype=float) / 4 - 0.5
+        x_ad = InitializeAutoDiff(x_values).flatten()
+        X_values = x_values.reshape((num_rows, 2))
+        X_ad = x_ad.reshape((num_rows, 2))
+        for with_gradient in (False, True):
+            prog = mp.MathematicalProgram()
+            X = prog.NewContinuousVariables(num_rows, 2, "X")
+            cost_binding = prog.AddBatchedCost(
+                cost_with_gradient if with_gradient else cost,
+                vars=X,
+                with_gradient=with_gradient,
+                description="batched",
+            )
+            constraint_binding = prog.AddBatchedConstraint(
+                constraint_with_gradient if with_gradient else constraint,
+                lb=[-1.0, -2.0],
+                ub=[1.0, 2.0],
+                vars=X,
+                with_gradient=with_gradient,
+            )
+            # The variables are the rows of X, stacked.
+            self.assertEqual(cost_binding.variables().size, 2 * num_rows)
+            self.assertTrue(cost_binding.variables()[1].EqualTo(X[0, 1]))
+            self.assertTrue(constraint_binding.variables()[2].EqualTo(X[1, 0]))
+            self.assertEqual(
+                cost_binding.evaluator().get_description(), "batched"
+            )
+            constraint_evaluator = constraint_binding.evaluator()
+            self.assertEqual(constraint_evaluator.num_constraints(), 8)
+            np.testing.assert_equal(
+                constraint_evaluator.upper_bound(), [1.0, 2.0] * num_rows
+            )
+            self.assertEqual(
+                len(constraint_evaluator.gradient_sparsity_pattern()),
+                4 * num_rows,
+            )
+
+            # Each evaluation calls the Python function exactly once, for all
+            # of the rows.
+            calls.clear()
+            self.assertAlmostEqual(
+                cost_binding.evaluator().Eval(x_values)[0],
+                np.sum(row_cost(X_values)),
+            )
+            np.testing.assert_allclose(
+                constraint_evaluator.Eval(x_values),
+                row_constraint(X_values).flatten(),
+            )
+            self.assertEqual(calls, [(num_rows, 2)] * 2)
+
+            # The derivatives match those of the per-row function.
+            y_ad = cost_binding.evaluator().Eval(x_ad)
+            np.testing.assert_allclose(
+                ExtractGradient(y_ad), ExtractGradient([np.sum(row_cost(X_ad))])
+            )
+            y_ad = constraint_evaluator.Eval(x_ad)
+            expected = row_constraint(X_ad).flatten()
+            np.testing.assert_allclose(
+                ExtractValue(y_ad).flatten(), ExtractValue(expected).flatten()
+            )
+            np.testing.assert_allclose(
+                ExtractGradient(y_ad), ExtractGradient(expected)
+            )
+
+            result = mp.Solve(prog)
+            self.assertTrue(result.is_success())
+            self.assertTrue(
+                constraint_evaluator.CheckSatisfied(
+                    result.GetSolution(constraint_binding.variables()), tol=1e-6
+                )
+            )
+
+        # The function's result must have a value for every row.
+        prog = mp.MathematicalProgram()
+        X = prog.NewContinuousVariables(num_rows, 2, "X")
+        bad = prog.AddBatchedCost(lambda X: X[0, :], vars=X)
+        with self.assertRaisesRegex(RuntimeError, "expected 4"):
+            bad.evaluator().Eval(x_values)
+
     def test_cost_and_constraint_python_wrapper_lost(self):
         # Ensure cost and constraints python wrappers are kept alive when added
         # to a mathematical program. See issue #20131 for original problem
@@ -1265,6 +1383,24 @@ class TestMathematicalProgram(unittest.TestCase):
         self.assertEqual(len(prog.linear_constraints()), 1)
         self.assertEqual(prog.num_vars(), 4)
 
+    def test_add_sparse_quadratic_cost(self):
+        prog = mp.MathematicalProgram()
+        x = prog.NewContinuousVariables(4, "x")
+        Q = np.array([[2.0, 0, 1, 0], [0, 0, 0, 0], [1, 0, 3, 0], [0, 0, 0, 1]])
+        b = np.array([1.0, 2, 0, 0])
+        bindings = prog.AddSparseQuadraticCost(
+            Q=scipy.sparse.csc_matrix(Q), b=b, c=1.5, vars=x, is_convex=None
+        )
+        self.assertEqual(len(bindings), 3)
+        self.assertEqual(len(prog.quadratic_costs()), 3)
+        numpy_compare.assert_equal(bindings[0].variables(), x[[0, 2]])
+        np.testing.assert_equal(bindings[0].evaluator().Q(), [[2, 1], [1, 3]])
+        self.assertTrue(bindings[0].evaluator().is_convex())
+        numpy_compare.assert_equal(bindings[2].variables(), x[[1]])
+        x_val = np.array([0.5, -1, 2, 7])
+        total = sum(prog.EvalBinding(binding, x_val)[0] for binding in bindings)
+        self.assertAlmostEqual(total, 0.5 * x_val @ Q @ x_val + b @ x_val + 1.5)
+
     def test_addcost_shared_ptr(self):
         # In particular, confirm that LinearCost ends up in linear_costs, etc.
         # as opposed to everything ending up as a generic_cost.
@@ -1946,6 +2082,62 @@ class TestMathematicalProgram(unittest.TestCase):
         self.assertEqual(len(results), len(progs))
         self.assertTrue(all(r.is_success() for r in results))
 
+    def test_solver_setup_cache(self):
+        dut = mp.SolverSetupCache(reuse_solver_setup=False)
+        self.assertEqual(dut.hit_rate(), 0.0)
+        for i in range(4):
+            prog = mp.MathematicalProgram()
+            x = prog.NewContinuousVariables(2)
+            prog.AddLinearConstraint(x[0] + x[1] == 2)
+            prog.AddQuadraticCost((x[0] - i) ** 2, is_convex=True)
+            result = dut.Solve(prog=prog, initial_guess=None)
+            self.assertTrue(result.is_success())
+            self.assertAlmostEqual(result.GetSolution(x[0]), i, places=6)
+        self.assertEqual(dut.num_hits(), 3)
+        self.assertEqual(dut.num_misses(), 1)
+        self.assertEqual(dut.hit_rate(), 0.75)
+        self.assertEqual(dut.size(), 1)
+        dut.Clear()
+        self.assertEqual(dut.size(), 0)
+        mp.SolverSetupCache()
+
+    def test_solver_portfolio(self):
+        prog = mp.MathematicalProgram()
+        x = prog.NewContinuousVariables(2)
+        prog.AddLinearConstraint(x[0] + x[1] == 2)
+        prog.AddQuadraticCost(x[0] ** 2, is_convex=True)
+
+        # A solver id that MakeSolver() does not know always throws.
+        entries = [
+            mp.SolverPortfolioEntry(solver_id=SolverId("nonexistent")),
+            mp.SolverPortfolioEntry(
+                solver_id=ScsSolver().solver_id(),
+                solver_options=SolverOptions(),
+            ),
+        ]
+        dut = mp.SolverPortfolio(entries=entries)
+        self.assertEqual(len(dut.entries()), 2)
+        self.assertEqual(dut.entries()[1].solver_id, ScsSolver().solver_id())
+        result = dut.Solve(prog=prog, initial_guess=np.zeros(2), deadline=10.0)
+        self.assertTrue(result.is_success())
+        self.assertEqual(result.get_solver_id(), ScsSolver().solver_id())
+        result = dut.Solve(prog)
+        self.assertTrue(result.is_success())
+
+        statistics = dut.statistics()
+        self.assertEqual(len(statistics), 2)
+        self.assertEqual(statistics[0].num_solves, 2)
+        self.assertEqual(statistics[0].num_wins, 0)
+        self.assertEqual(statistics[1].num_solves, 2)
+        self.assertEqual(statistics[1].num_finished, 2)
+        self.assertEqual(statistics[1].num_successes, 2)
+        self.assertEqual(statistics[1].num_errors, 0)
+        self.assertEqual(statistics[1].num_wins, 2)
+        self.assertGreaterEqual(statistics[1].total_time, 0.0)
+
+        with self.assertRaisesRegex(ValueError, "no matching solver"):
+            mp.SolverPortfolio(entries=entries[:1]).Solve(prog)
+
     def test_cost_binding(self):
         prog = mp.MathematicalProgram()
         x = prog.NewContinuousVariables(2)
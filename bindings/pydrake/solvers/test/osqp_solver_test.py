@@ -32,6 +32,23 @@ class TestOsqpSolver(unittest.TestCase):
         np.testing.assert_allclose(result.GetDualSolution(constraint1), [1.0])
         np.testing.assert_allclose(result.GetDualSolution(constraint2), [1.0])
 
+    def test_reuse_setup(self):
+        prog = MathematicalProgram()
+        x = prog.NewContinuousVariables(2, "x")
+        bounds = prog.AddBoundingBoxConstraint([1, 1], [2, 2], x)
+        prog.AddQuadraticCost(np.eye(2), np.zeros(2), x)
+        solver = OsqpSolver()
+        self.assertFalse(solver.reuse_setup())
+        solver.set_reuse_setup(reuse_setup=True)
+        self.assertTrue(solver.reuse_setup())
+        result = solver.Solve(prog, None, None)
+        self.assertFalse(result.get_solver_details().reused_setup)
+        bounds.evaluator().set_bounds([-2, 1.5], [-1, 2])
+        result = solver.Solve(prog, None, None)
+        self.assertTrue(result.get_solver_details().reused_setup)
+        self.assertEqual(solver.num_setups(), 1)
+        self.assertTrue(np.allclose(result.GetSolution(x), [-1, 1.5]))
+
     def unavailable(self):
         """Per the BUILD file, this test is only run when OSQP is disabled."""
         solver = OsqpSolver()
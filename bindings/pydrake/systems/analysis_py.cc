@@ -15,6 +15,7 @@
 #include "drake/systems/analysis/discrete_time_approximation.h"
 #include "drake/systems/analysis/integrator_base.h"
 #include "drake/systems/analysis/monte_carlo.h"
+#include "drake/systems/analysis/realtime_step_statistics.h"
 #include "drake/systems/analysis/region_of_attraction.h"
 #include "drake/systems/analysis/runge_kutta2_integrator.h"
 #include "drake/systems/analysis/runge_kutta3_integrator.h"
@@ -98,6 +99,59 @@ PYDRAKE_MODULE(analysis, m) {
             cls_doc.IsIdenticalStatus.doc);
   }
 
+  {
+    using Class = DurationHistogram;
+    constexpr auto& cls_doc = doc.DurationHistogram;
+    class_<Class> cls(m, "DurationHistogram", cls_doc.doc);
+    cls  // BR
+        .def(py::init<>(), cls_doc.ctor.doc)
+        .def_ro_static("kNumBins", &Class::kNumBins)
+        .def_static("bin_upper_edge", &Class::bin_upper_edge, py::arg("i"),
+            cls_doc.bin_upper_edge.doc)
+        .def("Add", &Class::Add, py::arg("seconds"), cls_doc.Add.doc)
+        .def("Clear", &Class::Clear, cls_doc.Clear.doc)
+        .def("count", &Class::count, cls_doc.count.doc)
+        .def("mean", &Class::mean, cls_doc.mean.doc)
+        .def("max", &Class::max, cls_doc.max.doc)
+        .def("Quantile", &Class::Quantile, py::arg("q"), cls_doc.Quantile.doc)
+        .def("bin_counts", &Class::bin_counts, cls_doc.bin_counts.doc);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = RealtimeStepPhaseTimes;
+    constexpr auto& cls_doc = doc.RealtimeStepPhaseTimes;
+    class_<Class> cls(m, "RealtimeStepPhaseTimes", cls_doc.doc);
+    cls  // BR
+        .def(py::init<>())
+        .def_rw("unrestricted_update", &Class::unrestricted_update,
+            cls_doc.unrestricted_update.doc)
+        .def_rw("discrete_update", &Class::discrete_update,
+            cls_doc.discrete_update.doc)
+        .def_rw("integration", &Class::integration, cls_doc.integration.doc)
+        .def_rw("publish", &Class::publish, cls_doc.publish.doc)
+        .def("total", &Class::total, cls_doc.total.doc);
+    DefCopyAndDeepCopy(&cls);
+  }
+
+  {
+    using Class = RealtimeStepStatistics;
+    constexpr auto& cls_doc = doc.RealtimeStepStatistics;
+    class_<Class> cls(m, "RealtimeStepStatistics", cls_doc.doc);
+    cls  // BR
+        .def(py::init<>())
+        .def_rw("num_steps", &Class::num_steps, cls_doc.num_steps.doc)
+        .def_rw("num_deadline_misses", &Class::num_deadline_misses,
+            cls_doc.num_deadline_misses.doc)
+        .def_rw("start_jitter", &Class::start_jitter, cls_doc.start_jitter.doc)
+        .def_rw("step_latency", &Class::step_latency, cls_doc.step_latency.doc)
+        .def_rw("lateness", &Class::lateness, cls_doc.lateness.doc)
+        .def_rw("phase_times", &Class::phase_times, cls_doc.phase_times.doc)
+        .def_rw("missed_phase_times", &Class::missed_phase_times,
+            cls_doc.missed_phase_times.doc);
+    DefCopyAndDeepCopy(&cls);
+  }
+
   {
     constexpr auto& cls_doc = doc.InitializeParams;
     using Class = InitializeParams;
@@ -287,7 +341,7 @@ PYDRAKE_MODULE(analysis, m) {
             // Keep alive, reference: `self` keeps `context` alive.
             py::keep_alive<1, 3>(), doc.RungeKutta3Integrator.ctor.doc);
 
-    // See equivalent note about EventCallback in `framework_py_systems.cc`.
+    // See equivalent note about EventSignature in `framework_py_systems.cc`.
     using MonitorCallback =
         std::function<std::optional<EventStatus>(const Context<T>&)>;
 
@@ -413,6 +467,17 @@ Parameter ``interruptible``:
         .def("get_actual_realtime_rate",
             &Simulator<T>::get_actual_realtime_rate,
             doc.Simulator.get_actual_realtime_rate.doc)
+        .def("set_realtime_busy_wait_time",
+            &Simulator<T>::set_realtime_busy_wait_time,
+            py::arg("busy_wait_time"),
+            doc.Simulator.set_realtime_busy_wait_time.doc)
+        .def("get_realtime_busy_wait_time",
+            &Simulator<T>::get_realtime_busy_wait_time,
+            doc.Simulator.get_realtime_busy_wait_time.doc)
+        .def("get_realtime_step_statistics",
+            &Simulator<T>::get_realtime_step_statistics,
+            py_rvp::reference_internal,
+            doc.Simulator.get_realtime_step_statistics.doc)
         .def("ResetStatistics", &Simulator<T>::ResetStatistics,
             doc.Simulator.ResetStatistics.doc)
         .def("get_num_publishes", &Simulator<T>::get_num_publishes,
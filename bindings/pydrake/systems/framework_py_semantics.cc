@@ -21,6 +21,7 @@
 #include "drake/systems/framework/leaf_context.h"
 #include "drake/systems/framework/leaf_output_port.h"
 #include "drake/systems/framework/system_output.h"
+#include "drake/systems/framework/system_profiler.h"
 
 using std::string;
 
@@ -344,6 +345,60 @@ void DoScalarIndependentDefinitions(py::module_ m) {
             cls_doc.has_default_prerequisites.doc);
   }
 
+  {
+    using Enum = SystemProfileKind;
+    constexpr auto& enum_doc = doc.SystemProfileKind;
+    py::enum_<Enum>(m, "SystemProfileKind", enum_doc.doc)
+        .value("kCacheEntry", Enum::kCacheEntry, enum_doc.kCacheEntry.doc)
+        .value("kTimeDerivatives", Enum::kTimeDerivatives,
+            enum_doc.kTimeDerivatives.doc)
+        .value("kPublish", Enum::kPublish, enum_doc.kPublish.doc)
+        .value("kDiscreteUpdate", Enum::kDiscreteUpdate,
+            enum_doc.kDiscreteUpdate.doc)
+        .value("kUnrestrictedUpdate", Enum::kUnrestrictedUpdate,
+            enum_doc.kUnrestrictedUpdate.doc);
+  }
+
+  {
+    using Class = SystemProfileEntry;
+    constexpr auto& cls_doc = doc.SystemProfileEntry;
+    class_<Class>(m, "SystemProfileEntry", cls_doc.doc)
+        .def_ro("system_pathname", &Class::system_pathname,
+            cls_doc.system_pathname.doc)
+        .def_ro("system_type", &Class::system_type, cls_doc.system_type.doc)
+        .def_ro("kind", &Class::kind, cls_doc.kind.doc)
+        .def_ro("name", &Class::name, cls_doc.name.doc)
+        .def_ro("num_calls", &Class::num_calls, cls_doc.num_calls.doc)
+        .def_ro("total_time", &Class::total_time, cls_doc.total_time.doc)
+        .def_ro("self_time", &Class::self_time, cls_doc.self_time.doc)
+        .def_ro("max_time", &Class::max_time, cls_doc.max_time.doc)
+        .def_ro("num_cache_hits", &Class::num_cache_hits,
+            cls_doc.num_cache_hits.doc)
+        .def_ro("num_cache_misses", &Class::num_cache_misses,
+            cls_doc.num_cache_misses.doc)
+        .def("cache_hit_rate", &Class::cache_hit_rate,
+            cls_doc.cache_hit_rate.doc);
+  }
+
+  {
+    using Class = SystemProfiler;
+    constexpr auto& cls_doc = doc.SystemProfiler;
+    class_<Class>(m, "SystemProfiler", cls_doc.doc)
+        .def(py::init<int>(), py::arg("max_trace_events") = 100'000,
+            cls_doc.ctor.doc)
+        .def("Start", &Class::Start, cls_doc.Start.doc)
+        .def("Stop", &Class::Stop, cls_doc.Stop.doc)
+        .def("is_active", &Class::is_active, cls_doc.is_active.doc)
+        .def("GetEntries", &Class::GetEntries, cls_doc.GetEntries.doc)
+        .def("num_trace_events", &Class::num_trace_events,
+            cls_doc.num_trace_events.doc)
+        .def("num_dropped_trace_events", &Class::num_dropped_trace_events,
+            cls_doc.num_dropped_trace_events.doc)
+        .def("ToChromeTraceJson", &Class::ToChromeTraceJson,
+            cls_doc.ToChromeTraceJson.doc)
+        .def("Reset", &Class::Reset, cls_doc.Reset.doc);
+  }
+
   {
     // Binding this full feature in pydrake is non-trivial effort. For now,
     // we'll just provide the default constructor for use in our unit tests,
@@ -1,9 +1,12 @@
 #include "drake/bindings/pydrake/systems/framework_py_systems.h"
 
+#include <array>
+#include <atomic>
 #include <memory>
 #include <set>
 #include <source_location>
 #include <string>
+#include <type_traits>
 #include <utility>
 #include <vector>
 
@@ -129,9 +132,6 @@ void EnsureCallbackLifetime(py::object system, py::object callback,
 // in Python for the same effect.)
 template <typename... Args>
 using EventSignature = std::optional<EventStatus>(Args...);
-// Declare the handler signature within std::function.
-template <typename... Args>
-using EventCallback = std::function<EventSignature<Args...>>;
 // Declare the handler signature as a python function object with compile-time
 // readable type signature.
 #ifdef PYDRAKE_USE_PYBIND11
@@ -170,14 +170,21 @@ typename LeafOutputPort<T>::CalcVectorCallback MakeCalcVectorCallback(
     PyObject* callback_ptr) {
   return [callback_ptr](const Context<T>& context, BasicVector<T>* output) {
     py::gil_scoped_acquire guard;
-    py::handle py_callback_from_ptr = callback_ptr;
-    auto callback =
-        py::cast<std::function<void(const Context<T>*, BasicVector<T>*)>>(
-            py_callback_from_ptr);
+    // N.B. Calling the handle directly (rather than first casting it to a
+    // std::function, as for the declared signature) avoids building a new
+    // function wrapper on every call.
+    py::handle callback = callback_ptr;
     callback(&context, output);
   };
 }
 
+// Converts the result of a Python event callback (see EventSignature) to an
+// EventStatus, treating None as success. The GIL must be held.
+EventStatus CastEventResult(py::handle result) {
+  return py::cast<std::optional<EventStatus>>(result).value_or(
+      EventStatus::Succeeded());
+}
+
 // Constructs a publish event for bound Declare*Event methods.
 // @param trigger_type the trigger type.
 // @param callback_ptr a callable expecting a context. Aliased; its lifetime
@@ -189,10 +196,8 @@ PublishEvent<T> MakePublishEvent(
       trigger_type, [callback_ptr](const System<T>&, const Context<T>& context,
                         const PublishEvent<T>&) {
         py::gil_scoped_acquire guard;
-        py::handle py_callback_from_ptr = callback_ptr;
-        auto callback =
-            py::cast<EventCallback<const Context<T>*>>(py_callback_from_ptr);
-        return callback(&context).value_or(EventStatus::Succeeded());
+        py::handle callback = callback_ptr;
+        return CastEventResult(callback(&context));
       });
 }
 
@@ -207,11 +212,8 @@ DiscreteUpdateEvent<T> MakeDiscreteUpdateEvent(
       trigger_type, [callback_ptr](const System<T>&, const Context<T>& context,
                         const DiscreteUpdateEvent<T>&, DiscreteValues<T>* xd) {
         py::gil_scoped_acquire guard;
-        py::handle py_callback_from_ptr = callback_ptr;
-        auto callback =
-            py::cast<EventCallback<const Context<T>*, DiscreteValues<T>*>>(
-                py_callback_from_ptr);
-        return callback(&context, &*xd).value_or(EventStatus::Succeeded());
+        py::handle callback = callback_ptr;
+        return CastEventResult(callback(&context, &*xd));
       });
 }
 
@@ -226,10 +228,8 @@ UnrestrictedUpdateEvent<T> MakeUnrestrictedUpdateEvent(
       trigger_type, [callback_ptr](const System<T>&, const Context<T>& context,
                         const UnrestrictedUpdateEvent<T>&, State<T>* x) {
         py::gil_scoped_acquire guard;
-        py::handle py_callback_from_ptr = callback_ptr;
-        auto callback = py::cast<EventCallback<const Context<T>*, State<T>*>>(
-            py_callback_from_ptr);
-        return callback(&context, &*x).value_or(EventStatus::Succeeded());
+        py::handle callback = callback_ptr;
+        return CastEventResult(callback(&context, &*x));
       });
 }
 
@@ -403,26 +403,18 @@ struct Impl {
     NB_TRAMPOLINE(VectorSystemPublic, 0);
     using Base = VectorSystemPublic;
 
+    PyVectorSystem(int input_size, int output_size,
+        std::optional<bool> direct_feedthrough, bool use_read_only_views)
+        : Base(input_size, output_size, direct_feedthrough),
+          use_read_only_views_(use_read_only_views) {}
+
     void DoCalcVectorOutput(const Context<T>& context,
         const Eigen::VectorBlock<const VectorX<T>>& input,
         const Eigen::VectorBlock<const VectorX<T>>& state,
         Eigen::VectorBlock<VectorX<T>>* output) const override {
-      // We can't use PYDRAKE_OVERRIDE here because of the ToEigenRef.
-      //
-      // WARNING: Mutating `output` will not work when T is AutoDiffXd,
-      // Expression, etc. For pybind11 background, see
-      // https://github.com/pybind/pybind11/pull/1152#issuecomment-340091423
-      // TODO(eric.cousineau): This will be resolved once dtype=custom is
-      // resolved.
-      {
-        py::gil_scoped_acquire guard;
-        const VectorSystem<T>* const base = this;
-        py::object self = py::cast(base);
-        if (py::hasattr(self, "DoCalcVectorOutput")) {
-          self.attr("DoCalcVectorOutput")(
-              &context, input, state, ToEigenRef(output));
-          return;
-        }
+      if (CallOverride(
+              kOutput, "DoCalcVectorOutput", context, input, state, output)) {
+        return;
       }
       // If not overridden, use default functionality.
       Base::DoCalcVectorOutput(context, input, state, output);
@@ -432,19 +424,9 @@ struct Impl {
         const Eigen::VectorBlock<const VectorX<T>>& input,
         const Eigen::VectorBlock<const VectorX<T>>& state,
         Eigen::VectorBlock<VectorX<T>>* derivatives) const override {
-      // We can't use PYDRAKE_OVERRIDE here because of the ToEigenRef.
-      //
-      // WARNING: Mutating `derivatives` will not work when T is AutoDiffXd,
-      // Expression, etc. See above.
-      {
-        py::gil_scoped_acquire guard;
-        const VectorSystem<T>* const base = this;
-        py::object self = py::cast(base);
-        if (py::hasattr(self, "DoCalcVectorTimeDerivatives")) {
-          self.attr("DoCalcVectorTimeDerivatives")(
-              &context, input, state, ToEigenRef(derivatives));
-          return;
-        }
+      if (CallOverride(kTimeDerivatives, "DoCalcVectorTimeDerivatives", context,
+              input, state, derivatives)) {
+        return;
       }
       // If not overridden, use default functionality.
       Base::DoCalcVectorOutput(context, input, state, derivatives);
@@ -454,24 +436,77 @@ struct Impl {
         const Eigen::VectorBlock<const VectorX<T>>& input,
         const Eigen::VectorBlock<const VectorX<T>>& state,
         Eigen::VectorBlock<VectorX<T>>* next_state) const override {
-      // We can't use PYDRAKE_OVERRIDE here because of the ToEigenRef.
-      //
-      // WARNING: Mutating `next_state` will not work when T is AutoDiffXd,
-      // Expression, etc. See above.
-      {
-        py::gil_scoped_acquire guard;
-        const VectorSystem<T>* const base = this;
-        py::object self = py::cast(base);
-        if (py::hasattr(self, "DoCalcVectorDiscreteVariableUpdates")) {
-          self.attr("DoCalcVectorDiscreteVariableUpdates")(
-              &context, input, state, ToEigenRef(next_state));
-          return;
-        }
+      if (CallOverride(kDiscreteVariableUpdates,
+              "DoCalcVectorDiscreteVariableUpdates", context, input, state,
+              next_state)) {
+        return;
       }
       // If not overridden, use default functionality.
       Base::DoCalcVectorDiscreteVariableUpdates(
           context, input, state, next_state);
     }
+
+   private:
+    enum Override { kOutput = 0, kTimeDerivatives, kDiscreteVariableUpdates };
+    enum Resolution : int8_t { kUnresolved = 0, kAbsent, kPresent };
+
+    // Calls the Python override `name` (if there is one) and returns true, or
+    // else returns false. We can't use PYDRAKE_OVERRIDE here because of the
+    // ToEigenRef.
+    //
+    // Whether the Python class overrides each method is resolved on first use
+    // and then cached, so a method that is not overridden never needs the GIL.
+    // Overrides must therefore be in place before the system is first used.
+    //
+    // The input and state are passed as copies, unless T is double and the
+    // system opted in to `use_read_only_views`, in which case they are passed
+    // as read-only NumPy views of the C++ vectors that keep the Python context
+    // object alive.
+    //
+    // WARNING: Mutating `output` will not work when T is AutoDiffXd,
+    // Expression, etc. For pybind11 background, see
+    // https://github.com/pybind/pybind11/pull/1152#issuecomment-340091423
+    // TODO(eric.cousineau): This will be resolved once dtype=custom is
+    // resolved.
+    bool CallOverride(Override which, const char* name,
+        const Context<T>& context,
+        const Eigen::VectorBlock<const VectorX<T>>& input,
+        const Eigen::VectorBlock<const VectorX<T>>& state,
+        Eigen::VectorBlock<VectorX<T>>* output) const {
+      std::atomic<int8_t>& resolution = resolutions_[which];
+      if (resolution.load(std::memory_order_acquire) == kAbsent) {
+        return false;
+      }
+      py::gil_scoped_acquire guard;
+      const VectorSystem<T>* const base = this;
+      py::object self = py::cast(base);
+      if (resolution.load(std::memory_order_acquire) == kUnresolved) {
+        resolution.store(py::hasattr(self, name) ? kPresent : kAbsent,
+            std::memory_order_release);
+        if (resolution.load(std::memory_order_relaxed) == kAbsent) {
+          return false;
+        }
+      }
+      py::object method = self.attr(name);
+      if constexpr (std::is_same_v<T, double>) {
+        if (use_read_only_views_) {
+          py::object py_context = py::cast(&context, py_rvp::reference);
+          // Keep alive, reference: each view keeps `py_context` alive.
+          method(py_context,
+              py::cast(Eigen::Ref<const VectorX<T>>(input),
+                  py_rvp::reference_internal, py_context),
+              py::cast(Eigen::Ref<const VectorX<T>>(state),
+                  py_rvp::reference_internal, py_context),
+              ToEigenRef(output));
+          return true;
+        }
+      }
+      method(&context, input, state, ToEigenRef(output));
+      return true;
+    }
+
+    const bool use_read_only_views_{false};
+    mutable std::array<std::atomic<int8_t>, 3> resolutions_{};
   };
 
   class PySystemVisitor : public SystemVisitor<T> {
@@ -1274,7 +1309,26 @@ Note: The above is for the C++ documentation. For Python, use
       cls  // BR
           .def(py::init<int, int, std::optional<bool>>(), py::arg("input_size"),
               py::arg("output_size"), py::arg("direct_feedthrough"),
-              doc.VectorSystem.ctor.doc_3args);
+              doc.VectorSystem.ctor.doc_3args)
+          .def(py::init<int, int, std::optional<bool>, bool>(),
+              py::arg("input_size"), py::arg("output_size"),
+              py::arg("direct_feedthrough"), py::kw_only(),
+              py::arg("use_read_only_views"),
+              []() {
+                std::string new_doc = doc.VectorSystem.ctor.doc_3args;
+                new_doc += R"""(
+
+Parameter ``use_read_only_views``:
+    (Python only) When True and the scalar type is ``float``, the
+    ``input`` and ``state`` arguments of the ``DoCalcVector*`` overrides
+    are read-only NumPy views of the C++ vectors, rather than copies.
+    A view keeps the ``context`` argument alive, but its values are only
+    valid during the call; copy the array to keep the values afterwards.
+    For other scalar types, the arguments are always copies.
+)""";
+                return new_doc;
+              }()
+                  .c_str());
     }
   }
 
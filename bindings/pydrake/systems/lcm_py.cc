@@ -17,6 +17,7 @@
 #include "drake/systems/lcm/lcm_publisher_system.h"
 #include "drake/systems/lcm/lcm_scope_system.h"
 #include "drake/systems/lcm/lcm_subscriber_system.h"
+#include "drake/systems/lcm/realtime_step_statistics_lcm.h"
 #include "drake/systems/lcm/serializer.h"
 
 namespace drake {
@@ -280,6 +281,10 @@ PYDRAKE_MODULE(lcm, m) {
             cls_doc.AddToBuilder.doc);
   }
 
+  m.def("PublishRealtimeStepStatistics", &PublishRealtimeStepStatistics,
+      py::arg("statistics"), py::arg("time"), py::arg("channel"),
+      py::arg("lcm"), doc.PublishRealtimeStepStatistics.doc);
+
   // Bind C++ serializers.
   BindCppSerializers();
 
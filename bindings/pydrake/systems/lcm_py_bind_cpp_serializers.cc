@@ -36,6 +36,7 @@
 #include "drake/lcmt_point_cloud_field.hpp"
 #include "drake/lcmt_point_pair_contact_info_for_viz.hpp"
 #include "drake/lcmt_quaternion.hpp"
+#include "drake/lcmt_realtime_step_statistics.hpp"
 #include "drake/lcmt_robot_plan.hpp"
 #include "drake/lcmt_robot_state.hpp"
 #include "drake/lcmt_schunk_wsg_command.hpp"
@@ -91,6 +92,7 @@ void BindCppSerializers() {
   BindCppSerializer<drake::lcmt_point_cloud_field>("drake");
   BindCppSerializer<drake::lcmt_point_pair_contact_info_for_viz>("drake");
   BindCppSerializer<drake::lcmt_quaternion>("drake");
+  BindCppSerializer<drake::lcmt_realtime_step_statistics>("drake");
   BindCppSerializer<drake::lcmt_robot_plan>("drake");
   BindCppSerializer<drake::lcmt_robot_state>("drake");
   BindCppSerializer<drake::lcmt_schunk_wsg_command>("drake");
@@ -109,6 +109,15 @@ PYDRAKE_MODULE(primitives, m) {
     DefCopyAndDeepCopy(&cls);
   }
 
+  {
+    using Class = VectorLogParams;
+    class_<Class> cls(m, "VectorLogParams", doc.VectorLogParams.doc);
+    cls.def(ParamInit<Class>());
+    DefAttributesUsingSerialize(&cls, doc.VectorLogParams);
+    DefReprUsingSerialize(&cls);
+    DefCopyAndDeepCopy(&cls);
+  }
+
   // N.B. Capturing `&doc` should not be required; workaround per #9600.
   auto bind_common_scalar_types = [&m, &doc](auto dummy) {
     using T = decltype(dummy);
@@ -604,7 +613,14 @@ PYDRAKE_MODULE(primitives, m) {
         m, "VectorLog", GetPyParam<T>(), doc.VectorLog.doc)
         .def_prop_ro_static("kDefaultCapacity",
             [](py::object) { return VectorLog<T>::kDefaultCapacity; })
-        .def(py::init<int>(), py::arg("input_size"), doc.VectorLog.ctor.doc)
+        .def(py::init<int>(), py::arg("input_size"),
+            doc.VectorLog.ctor.doc_1args)
+        .def(py::init<int, const VectorLogParams&>(), py::arg("input_size"),
+            py::arg("params"), doc.VectorLog.ctor.doc_2args)
+        .def("get_params", &VectorLog<T>::get_params,
+            doc.VectorLog.get_params.doc)
+        .def("is_chunked", &VectorLog<T>::is_chunked,
+            doc.VectorLog.is_chunked.doc)
         .def("num_samples", &VectorLog<T>::num_samples,
             doc.VectorLog.num_samples.doc)
         .def(
@@ -614,7 +630,7 @@ PYDRAKE_MODULE(primitives, m) {
               return CopyIfNotPodType(self->sample_times());
             },
             return_value_policy_for_scalar_type<T>(),
-            doc.VectorLog.sample_times.doc)
+            doc.VectorLog.sample_times.doc_0args)
         .def(
             "data",
             [](const VectorLog<T>* self) {
@@ -629,7 +645,45 @@ PYDRAKE_MODULE(primitives, m) {
                 return MatrixX<T>(self->data());
               }
             },
-            return_value_policy_for_scalar_type<T>(), doc.VectorLog.data.doc)
+            return_value_policy_for_scalar_type<T>(),
+            doc.VectorLog.data.doc_0args)
+        .def("CopySampleTimes", &VectorLog<T>::CopySampleTimes,
+            doc.VectorLog.CopySampleTimes.doc)
+        .def("CopyData", &VectorLog<T>::CopyData, doc.VectorLog.CopyData.doc)
+        .def("sample_times",
+            py::overload_cast<double, double>(
+                &VectorLog<T>::sample_times, py::const_),
+            py::arg("t_start"), py::arg("t_end"),
+            doc.VectorLog.sample_times.doc_2args)
+        .def("data",
+            py::overload_cast<double, double>(&VectorLog<T>::data, py::const_),
+            py::arg("t_start"), py::arg("t_end"), doc.VectorLog.data.doc_2args)
+        .def("num_chunks", &VectorLog<T>::num_chunks,
+            doc.VectorLog.num_chunks.doc)
+        .def(
+            "get_chunk_sample_times",
+            [](const VectorLog<T>* self, int i) {
+              // Reference the chunk's storage for double; copy otherwise.
+              if constexpr (std::is_same_v<T, double>) {
+                return self->get_chunk_sample_times(i);
+              } else {
+                return VectorX<T>(self->get_chunk_sample_times(i));
+              }
+            },
+            py::arg("i"), return_value_policy_for_scalar_type<T>(),
+            doc.VectorLog.get_chunk_sample_times.doc)
+        .def(
+            "get_chunk_data",
+            [](const VectorLog<T>* self, int i) {
+              // Reference the chunk's storage for double; copy otherwise.
+              if constexpr (std::is_same_v<T, double>) {
+                return self->get_chunk_data(i);
+              } else {
+                return MatrixX<T>(self->get_chunk_data(i));
+              }
+            },
+            py::arg("i"), return_value_policy_for_scalar_type<T>(),
+            doc.VectorLog.get_chunk_data.doc)
         .def("Clear", &VectorLog<T>::Clear, doc.VectorLog.Clear.doc)
         .def("Reserve", &VectorLog<T>::Reserve, doc.VectorLog.Reserve.doc)
         .def("AddData", &VectorLog<T>::AddData, py::arg("time"),
@@ -644,6 +698,15 @@ PYDRAKE_MODULE(primitives, m) {
         .def(py::init<int, const TriggerTypeSet&, double>(),
             py::arg("input_size"), py::arg("publish_triggers"),
             py::arg("publish_period") = 0.0, doc.VectorLogSink.ctor.doc_3args)
+        .def(py::init<int, const TriggerTypeSet&, double,
+                 const VectorLogParams&, int>(),
+            py::arg("input_size"), py::arg("publish_triggers"),
+            py::arg("publish_period"), py::arg("log_params"),
+            py::arg("decimation") = 1, doc.VectorLogSink.ctor.doc_5args)
+        .def("get_log_params", &VectorLogSink<T>::get_log_params,
+            doc.VectorLogSink.get_log_params.doc)
+        .def("get_decimation", &VectorLogSink<T>::get_decimation,
+            doc.VectorLogSink.get_decimation.doc)
         .def(
             "GetLog",
             [](const VectorLogSink<T>* self, const Context<T>& context)
@@ -153,14 +153,15 @@ class PyPlotVisualizer(LeafSystem):
             Additional kwargs are passed through to FuncAnimation.
         """
         if isinstance(log, VectorLog):
-            t = log.sample_times()
-            x = log.data()
+            # The copies work for any storage (including chunked logs).
+            t = log.CopySampleTimes()
+            x = log.CopyData()
 
             if resample:
                 t, x = _resample_interp1d(t, x, self.time_step)
         elif isinstance(log, Trajectory):
             t = np.arange(log.start_time(), log.end_time(), self.time_step)
-            x = np.hstack([log.value(time) for time in t])
+            x = log.EvalBatch(t=t)[:, 0, :]
 
         def animate_update(i):
             self.draw(x[:, i])
@@ -0,0 +1,168 @@
+"""Measures the per-call overhead of systems written in Python, compared to
+equivalent systems from C++, for the small controllers typical of a 1 kHz
+discrete control loop.
+
+Each benchmark reports the mean wall-clock time per call, in microseconds.
+
+    bazel run //bindings/pydrake/systems:python_systems_benchmark
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from pydrake.systems.analysis import Simulator
+from pydrake.systems.framework import (
+    BasicVector,
+    LeafSystem,
+    VectorSystem,
+)
+from pydrake.systems.primitives import LinearSystem
+
+# The size of the controller's input, state, and output.
+_SIZE = 7
+_TIME_STEP = 0.001
+
+
+def _make_gains():
+    rng = np.random.default_rng(seed=0)
+    A = 0.1 * rng.standard_normal((_SIZE, _SIZE))
+    B = rng.standard_normal((_SIZE, _SIZE))
+    C = rng.standard_normal((_SIZE, _SIZE))
+    D = rng.standard_normal((_SIZE, _SIZE))
+    return A, B, C, D
+
+
+class _PyVectorController(VectorSystem):
+    """The discrete LinearSystem x[n+1] = Ax + Bu, y = Cx + Du, written as a
+    Python VectorSystem.
+
+    VectorSystem's periodic discrete update is not bound in Python, so the
+    periodic event forwards to the forced update, which dispatches to the
+    DoCalcVectorDiscreteVariableUpdates override.
+    """
+
+    def __init__(self, A, B, C, D, use_read_only_views=False):
+        VectorSystem.__init__(
+            self,
+            _SIZE,
+            _SIZE,
+            direct_feedthrough=True,
+            use_read_only_views=use_read_only_views,
+        )
+        self.DeclareDiscreteState(_SIZE)
+        self.DeclarePeriodicDiscreteUpdateEvent(
+            period_sec=_TIME_STEP,
+            offset_sec=0.0,
+            update=self._update,
+        )
+        self._A, self._B, self._C, self._D = A, B, C, D
+
+    def _update(self, context, discrete_state):
+        self.CalcForcedDiscreteVariableUpdate(context, discrete_state)
+
+    def DoCalcVectorOutput(self, context, u, x, y):
+        y[:] = self._C @ x + self._D @ u
+
+    def DoCalcVectorDiscreteVariableUpdates(self, context, u, x, x_next):
+        x_next[:] = self._A @ x + self._B @ u
+
+
+class _PyLeafController(LeafSystem):
+    """The same controller as _PyVectorController, written as a Python
+    LeafSystem.
+    """
+
+    def __init__(self, A, B, C, D):
+        LeafSystem.__init__(self)
+        self._u = self.DeclareVectorInputPort("u", _SIZE)
+        state = self.DeclareDiscreteState(_SIZE)
+        self.DeclareVectorOutputPort("y", _SIZE, self._calc_output)
+        self.DeclarePeriodicDiscreteUpdateEvent(
+            period_sec=_TIME_STEP, offset_sec=0.0, update=self._update
+        )
+        self._state = int(state)
+        self._A, self._B, self._C, self._D = A, B, C, D
+
+    def _calc_output(self, context, output):
+        u = self._u.Eval(context)
+        x = context.get_discrete_state(self._state).value()
+        output.SetFromVector(self._C @ x + self._D @ u)
+
+    def _update(self, context, discrete_state):
+        u = self._u.Eval(context)
+        x = context.get_discrete_state(self._state).value()
+        discrete_state.set_value(self._state, self._A @ x + self._B @ u)
+
+
+def _time_per_call(func, iterations):
+    """Returns the mean time per call of `func()`, in microseconds."""
+    # Warm up any lazily-initialized state.
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _benchmark_system(system, iterations):
+    """Returns a dict of the per-call times of the given controller's output,
+    and of one step of a simulated control loop.
+    """
+    context = system.CreateDefaultContext()
+    system.get_input_port(0).FixValue(context, np.ones(_SIZE))
+    output = system.AllocateOutput()
+    result = dict()
+    result["CalcOutput"] = _time_per_call(
+        lambda: system.CalcOutput(context, output), iterations
+    )
+
+    # A fixed-step simulation, which updates the discrete state and evaluates
+    # the output at every step.
+    simulator = Simulator(system)
+    sim_context = simulator.get_mutable_context()
+    system.get_input_port(0).FixValue(sim_context, BasicVector(np.ones(_SIZE)))
+    simulator.Initialize()
+
+    def step():
+        simulator.AdvanceTo(sim_context.get_time() + _TIME_STEP)
+        system.get_output_port(0).Eval(sim_context)
+
+    result["SimulatorStep"] = _time_per_call(step, iterations)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=10000,
+        help="The number of calls to time for each benchmark.",
+    )
+    args = parser.parse_args()
+
+    A, B, C, D = _make_gains()
+    systems = {
+        "C++ LinearSystem": LinearSystem(A, B, C, D, time_period=_TIME_STEP),
+        "Python VectorSystem": _PyVectorController(A, B, C, D),
+        "  (read-only views)": _PyVectorController(
+            A, B, C, D, use_read_only_views=True
+        ),
+        "Python LeafSystem": _PyLeafController(A, B, C, D),
+    }
+    results = {
+        name: _benchmark_system(system, args.iterations)
+        for name, system in systems.items()
+    }
+
+    columns = list(next(iter(results.values())).keys())
+    print(f"Mean time per call (µs), over {args.iterations} calls:")
+    print(f"{'':<22}" + "".join(f"{x:>16}" for x in columns))
+    for name, result in results.items():
+        print(f"{name:<22}" + "".join(f"{result[x]:>16.2f}" for x in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -41,12 +41,12 @@ void DefineSensorsLcm(py::module_ m) {
         m, "ImageToLcmImageArrayT", cls_doc.doc);
     cls  // BR
         .def(py::init<const std::string&, const std::string&,
-                 const std::string&, bool>(),
+                 const std::string&, bool, Parallelism>(),
             py::arg("color_frame_name"), py::arg("depth_frame_name"),
             py::arg("label_frame_name"), py::arg("do_compress") = false,
-            cls_doc.ctor.doc_4args)
-        .def(py::init<bool>(), py::arg("do_compress") = false,
-            cls_doc.ctor.doc_1args)
+            py::arg("parallelize") = false, cls_doc.ctor.doc_5args)
+        .def(py::init<bool, Parallelism>(), py::arg("do_compress") = false,
+            py::arg("parallelize") = false, cls_doc.ctor.doc_2args)
         .def("color_image_input_port", &Class::color_image_input_port,
             py_rvp::reference_internal, cls_doc.color_image_input_port.doc)
         .def("depth_image_input_port", &Class::depth_image_input_port,
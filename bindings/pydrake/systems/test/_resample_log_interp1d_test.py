@@ -261,13 +261,14 @@ class TestResampleLogInterp1d(unittest.TestCase):
         self.validate_resample(log, step, expected_t, expected_y)
 
         # Final test: make sure un-sorted data gets sorted.  Use a proxy to
-        # reverse the original log, only sample_times and data methods needed.
+        # reverse the original log, only CopySampleTimes and CopyData methods
+        # needed.
         class ReverseLog:
-            def sample_times(self):
-                return np.flip(np.array(log.sample_times(), copy=True), axis=0)
+            def CopySampleTimes(self):
+                return np.flip(log.CopySampleTimes(), axis=0)
 
-            def data(self):
-                return np.flip(np.array(log.data(), copy=True), axis=1)
+            def CopyData(self):
+                return np.flip(log.CopyData(), axis=1)
 
         # Re-use the previous test's expected t and x.
         r_log = ReverseLog()
@@ -275,7 +276,7 @@ class TestResampleLogInterp1d(unittest.TestCase):
 
     def validate_resample(self, log, time_step, t_expected, x_expected):
         """Perform the resampling and validate with the provided values."""
-        t, x = log.sample_times(), log.data()
+        t, x = log.CopySampleTimes(), log.CopyData()
         t, x = _resample_interp1d(t, x, time_step)
         self.assertTrue(
             t.shape[0] == x.shape[1],
@@ -15,10 +15,13 @@ from pydrake.systems.analysis import (
     BatchEvalTimeDerivatives,
     BatchEvalUniquePeriodicDiscreteUpdate,
     DiscreteTimeApproximation,
+    DurationHistogram,
     ExtractSimulatorConfig,
     InitializeParams,
     IntegratorBase_,
     PrintSimulatorStatistics,
+    RealtimeStepPhaseTimes,
+    RealtimeStepStatistics,
     RegionOfAttraction,
     RegionOfAttractionOptions,
     ResetIntegratorFromFlags,
@@ -345,6 +348,11 @@ class TestAnalysis(unittest.TestCase):
         simulator.set_target_realtime_rate(realtime_rate=0.0)
         self.assertEqual(simulator.get_target_realtime_rate(), 0.0)
         self.assertIsInstance(simulator.get_actual_realtime_rate(), float)
+        simulator.set_realtime_busy_wait_time(busy_wait_time=1e-4)
+        self.assertEqual(simulator.get_realtime_busy_wait_time(), 1e-4)
+        self.assertIsInstance(
+            simulator.get_realtime_step_statistics(), RealtimeStepStatistics
+        )
         simulator.ResetStatistics()
 
         self.assertEqual(simulator.get_num_publishes(), 0)
@@ -357,6 +365,40 @@ class TestAnalysis(unittest.TestCase):
         # Clearing the context is allowed.
         simulator.reset_context(context=None)
 
+    def test_realtime_step_statistics(self):
+        histogram = DurationHistogram()
+        self.assertEqual(histogram.count(), 0)
+        histogram.Add(seconds=0.5e-6)
+        histogram.Add(seconds=3e-6)
+        self.assertEqual(histogram.count(), 2)
+        self.assertEqual(histogram.max(), 3e-6)
+        self.assertAlmostEqual(histogram.mean(), 1.75e-6)
+        self.assertEqual(histogram.Quantile(q=0.5), 1e-6)
+        self.assertEqual(
+            len(histogram.bin_counts()), DurationHistogram.kNumBins
+        )
+        self.assertEqual(DurationHistogram.bin_upper_edge(i=1), 2e-6)
+        copy.copy(histogram)
+        histogram.Clear()
+        self.assertEqual(histogram.count(), 0)
+
+        phase_times = RealtimeStepPhaseTimes()
+        phase_times.publish = 1.0
+        phase_times.integration = 2.0
+        self.assertEqual(phase_times.total(), 3.0)
+
+        simulator = Simulator(ConstantVectorSource([1.0]))
+        simulator.set_target_realtime_rate(100.0)
+        simulator.AdvanceTo(0.1)
+        stats = simulator.get_realtime_step_statistics()
+        self.assertGreater(stats.num_steps, 0)
+        self.assertEqual(stats.step_latency.count(), stats.num_steps)
+        self.assertGreaterEqual(stats.num_deadline_misses, 0)
+        self.assertIsInstance(stats.missed_phase_times, RealtimeStepPhaseTimes)
+        self.assertGreaterEqual(stats.phase_times.total(), 0.0)
+        simulator.ResetStatistics()
+        self.assertEqual(stats.num_steps, 0)
+
     def test_simulator_default_context_no_cpp_leak(self):
         """Regression test for #23924"""
         gc.collect()
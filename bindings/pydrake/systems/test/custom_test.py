@@ -39,6 +39,9 @@ from pydrake.systems.framework import (
     PublishEvent,
     State,
     System,
+    SystemProfileEntry,
+    SystemProfileKind,
+    SystemProfiler,
     TriggerType,
     UnrestrictedUpdateEvent,
     ValueProducer,
@@ -257,6 +260,51 @@ class TestCustom(unittest.TestCase):
         )
         self.assertTrue(np.allclose([5, 7, 9], value))
 
+    def test_system_profiler(self):
+        builder = DiagramBuilder()
+        adder = builder.AddSystem(self._create_adder_system())
+        adder.set_name("custom_adder")
+        zoh = builder.AddSystem(ZeroOrderHold(0.1, 3))
+        zoh.set_name("zoh")
+        builder.ExportInput(adder.get_input_port(0))
+        builder.ExportInput(adder.get_input_port(1))
+        builder.Connect(adder.get_output_port(0), zoh.get_input_port(0))
+        diagram = builder.Build()
+        context = diagram.CreateDefaultContext()
+        self._fix_adder_inputs(diagram, context)
+        simulator = Simulator(diagram, context)
+
+        profiler = SystemProfiler(max_trace_events=10)
+        self.assertFalse(profiler.is_active())
+        profiler.Start()
+        self.assertTrue(profiler.is_active())
+        simulator.AdvanceTo(1)
+        profiler.Stop()
+
+        entries = profiler.GetEntries()
+        self.assertTrue(all(isinstance(x, SystemProfileEntry) for x in entries))
+        (adder_output,) = [
+            x
+            for x in entries
+            if x.system_pathname.endswith("custom_adder")
+            and x.kind == SystemProfileKind.kCacheEntry
+        ]
+        self.assertIn("sum", adder_output.name)
+        self.assertGreater(adder_output.num_calls, 0)
+        self.assertGreaterEqual(adder_output.total_time, adder_output.max_time)
+        self.assertGreaterEqual(adder_output.total_time, adder_output.self_time)
+        self.assertGreaterEqual(adder_output.num_cache_misses, 1)
+        self.assertGreaterEqual(adder_output.num_cache_hits, 0)
+        self.assertGreaterEqual(adder_output.cache_hit_rate(), 0.0)
+        self.assertIn(
+            SystemProfileKind.kDiscreteUpdate, [x.kind for x in entries]
+        )
+        self.assertEqual(profiler.num_trace_events(), 10)
+        self.assertGreater(profiler.num_dropped_trace_events(), 0)
+        self.assertIn('"traceEvents"', profiler.ToChromeTraceJson())
+        profiler.Reset()
+        self.assertEqual(len(profiler.GetEntries()), 0)
+
     def test_adder_graphviz(self):
         system = CustomAdder(2, 3)
         graph = system.GetGraphvizString()
@@ -927,6 +975,66 @@ class TestCustom(unittest.TestCase):
             y = output.get_vector_data(0).get_value()
             self.assertTrue(np.allclose(y, y_expected))
 
+    def test_vector_system_views(self):
+        test = self
+
+        class ViewsSystem(VectorSystem):
+            def __init__(self, **kwargs):
+                VectorSystem.__init__(
+                    self, 2, 2, direct_feedthrough=True, **kwargs
+                )
+                self.DeclareDiscreteState(2)
+                self.num_calls = 0
+                self.last_u = None
+
+            def DoCalcVectorOutput(self, context, u, x, y):
+                y[:] = u + x
+                self.num_calls += 1
+                self.last_u = u
+
+        # By default, the input and state are copies; the output is writeable.
+        system = ViewsSystem()
+        context = system.CreateDefaultContext()
+        system.get_input_port(0).FixValue(context, [1.0, 2.0])
+        context.SetDiscreteState([3.0, 4.0])
+        for _ in range(2):
+            output = system.AllocateOutput()
+            system.CalcOutput(context, output)
+            np.testing.assert_equal(output.get_vector_data(0).value(), [4, 6])
+        self.assertEqual(system.num_calls, 2)
+        self.assertTrue(system.last_u.flags.writeable)
+        system.last_u[0] = 0.0
+        np.testing.assert_equal(
+            system.get_input_port(0).Eval(context), [1.0, 2.0]
+        )
+        # The discrete update is not overridden, so uses the C++ default
+        # (which throws, since the state is not empty).
+        with self.assertRaises(RuntimeError):
+            system.CalcForcedDiscreteVariableUpdate(
+                context, system.AllocateDiscreteVariables()
+            )
+
+        # When opted in, they are read-only views that keep the context alive.
+        system = ViewsSystem(use_read_only_views=True)
+        context = system.CreateDefaultContext()
+        system.get_input_port(0).FixValue(context, [1.0, 2.0])
+        context.SetDiscreteState([3.0, 4.0])
+        output = system.AllocateOutput()
+        system.CalcOutput(context, output)
+        np.testing.assert_equal(output.get_vector_data(0).value(), [4, 6])
+        u = system.last_u
+        test.assertFalse(u.flags.writeable)
+        with test.assertRaises(ValueError):
+            u[0] = 0.0
+        spy = weakref.finalize(context, lambda: None)
+        del context
+        gc.collect()
+        self.assertTrue(spy.alive)
+        system.last_u = None
+        del u
+        gc.collect()
+        self.assertFalse(spy.alive)
+
     def test_context_api(self):
         # Capture miscellaneous functions not yet tested.
         model_value = Value("Hello")
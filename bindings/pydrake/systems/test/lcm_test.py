@@ -8,10 +8,14 @@ import unittest
 import numpy as np
 
 import drake as drake_lcmtypes
-from drake import lcmt_header, lcmt_quaternion
+from drake import (
+    lcmt_header,
+    lcmt_quaternion,
+    lcmt_realtime_step_statistics,
+)
 from pydrake.common.value import Value
 from pydrake.lcm import DrakeLcm, DrakeLcmParams, Subscriber
-from pydrake.systems.analysis import Simulator
+from pydrake.systems.analysis import RealtimeStepStatistics, Simulator
 from pydrake.systems.framework import (
     DiagramBuilder,
     LeafSystem,
@@ -341,6 +345,25 @@ class TestSystemsLcm(unittest.TestCase):
         self.assertIsInstance(scope, mut.LcmScopeSystem)
         self.assertIsInstance(publisher, mut.LcmPublisherSystem)
 
+    def test_publish_realtime_step_statistics(self):
+        lcm = DrakeLcm()
+        subscriber = Subscriber(
+            lcm=lcm,
+            channel="STATS",
+            lcm_type=lcmt_realtime_step_statistics,
+        )
+        stats = RealtimeStepStatistics()
+        stats.num_steps = 2
+        stats.step_latency.Add(seconds=1e-3)
+        mut.PublishRealtimeStepStatistics(
+            statistics=stats, time=0.5, channel="STATS", lcm=lcm
+        )
+        lcm.HandleSubscriptions(0)
+        self.assertEqual(subscriber.count, 1)
+        self.assertEqual(subscriber.message.utime, 500000)
+        self.assertEqual(subscriber.message.num_steps, 2)
+        self.assertEqual(subscriber.message.step_latency_max, 1e-3)
+
     def test_lcm_interface_system_getters(self):
         lcm = DrakeLcm()
         lcm_system = mut.LcmInterfaceSystem(lcm=lcm)
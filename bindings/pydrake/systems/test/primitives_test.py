@@ -87,6 +87,7 @@ from pydrake.systems.primitives import (
     TrajectorySource,
     TrajectorySource_,
     VectorLog,
+    VectorLogParams,
     VectorLogSink,
     VectorLogSink_,
     WrapToSystem,
@@ -1181,6 +1182,38 @@ class TestGeneral(unittest.TestCase):
         # but test the binding anyway.
         dut.Reserve(VectorLog.kDefaultCapacity * 3)
 
+    def test_vector_log_chunked(self):
+        params = VectorLogParams(chunk_size=2, memory_limit_bytes=0)
+        self.assertIn("chunk_size=2", repr(params))
+        dut = VectorLog(input_size=2, params=params)
+        self.assertTrue(dut.is_chunked())
+        self.assertEqual(dut.get_params().chunk_size, 2)
+        for i in range(5):
+            dut.AddData(time=0.1 * i, sample=[i, -i])
+        self.assertEqual(dut.num_samples(), 5)
+        self.assertEqual(dut.num_chunks(), 3)
+        # The first two chunks were spilled to disk (the memory limit is zero).
+        numpy_compare.assert_equal(dut.get_chunk_sample_times(i=0), [0.0, 0.1])
+        numpy_compare.assert_equal(
+            dut.get_chunk_data(i=1), [[2.0, 3.0], [-2.0, -3.0]]
+        )
+        numpy_compare.assert_equal(dut.get_chunk_sample_times(2), [0.4])
+        numpy_compare.assert_equal(
+            dut.sample_times(t_start=0.1, t_end=0.3), [0.1, 0.2, 0.3]
+        )
+        numpy_compare.assert_equal(
+            dut.data(t_start=0.1, t_end=0.3),
+            [[1.0, 2.0, 3.0], [-1.0, -2.0, -3.0]],
+        )
+        # The contiguous accessors are not available for a chunked log, but
+        # the copies are.
+        with self.assertRaises(RuntimeError):
+            dut.data()
+        numpy_compare.assert_equal(
+            dut.CopySampleTimes(), [0.0, 0.1, 0.2, 0.3, 0.4]
+        )
+        numpy_compare.assert_equal(dut.CopyData()[1], [0, -1, -2, -3, -4])
+
     @numpy_compare.check_nonsymbolic_types
     def test_vector_log_sink(self, T):
         # Add various redundant loggers to a system, to exercise the
@@ -1224,6 +1257,19 @@ class TestGeneral(unittest.TestCase):
                     )
                 )
             )
+            loggers.append(
+                builder.AddSystem(
+                    constructor(
+                        input_size=kSize,
+                        publish_triggers={TriggerType.kForced},
+                        publish_period=0.0,
+                        log_params=VectorLogParams(chunk_size=4),
+                        decimation=2,
+                    )
+                )
+            )
+            self.assertEqual(loggers[-1].get_log_params().chunk_size, 4)
+            self.assertEqual(loggers[-1].get_decimation(), 2)
 
         # Exercise all of the log access methods.
         diagram = builder.Build()
@@ -440,6 +440,16 @@ class TestSensors(unittest.TestCase):
             self._check_input(port)
         for port in (dut.image_array_t_msg_output_port(),):
             self._check_output(port)
+        dut = mut.ImageToLcmImageArrayT(
+            color_frame_name="color",
+            depth_frame_name="depth",
+            label_frame_name="label",
+            do_compress=True,
+            parallelize=True,
+        )
+        self.assertEqual(dut.num_input_ports(), 3)
+        dut = mut.ImageToLcmImageArrayT(do_compress=True, parallelize=False)
+        self.assertEqual(dut.num_input_ports(), 0)
 
     def test_image_to_lcm_image_array_custom(self):
         """Tests the custom constructor and runtime functionality."""
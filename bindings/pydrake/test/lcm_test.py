@@ -1,8 +1,25 @@
 import copy
+import os
 import unittest
 
-from drake import lcmt_quaternion
-from pydrake.lcm import DrakeLcm, DrakeLcmInterface, DrakeLcmParams, Subscriber
+import numpy as np
+
+from drake import (
+    lcmt_contact_results_for_viz,
+    lcmt_quaternion,
+    lcmt_robot_state,
+)
+from pydrake.common import temp_directory
+from pydrake.lcm import (
+    DrakeLcm,
+    DrakeLcmInterface,
+    DrakeLcmLog,
+    DrakeLcmParams,
+    LcmLogColumns,
+    LcmLogIndex,
+    Subscriber,
+    extract_lcm_log_columns,
+)
 
 
 class TestLcm(unittest.TestCase):
@@ -113,3 +130,118 @@ class TestLcm(unittest.TestCase):
         name, data = received[0]
         self.assertEqual(name, channel)
         self.assertEqual(data, self.quat.encode())
+
+    def test_log_round_trip(self):
+        filename = os.path.join(temp_directory(), "test.lcmlog")
+        writer = DrakeLcmLog(file_name=filename, is_write=True)
+        self.assertTrue(writer.is_write())
+        self.assertTrue(DrakeLcmLog.available())
+        for i in range(5):
+            writer.Publish(
+                channel="A" if i % 2 == 0 else "B",
+                buffer=self.quat.encode(),
+                time_sec=0.25 * i,
+            )
+        del writer
+
+        cache_filename = os.path.join(temp_directory(), "test.cache")
+        index = LcmLogIndex(filename=filename, cache_filename=cache_filename)
+        self.assertEqual(index.num_messages(), 5)
+        self.assertEqual(index.channels(), ["A", "B"])
+        self.assertEqual(index.GetTime(i=3), 0.75)
+        self.assertEqual(index.GetChannel(i=3), "B")
+        self.assertGreater(index.GetFileOffset(i=1), 0)
+        payload = index.GetPayload(i=2)
+        self.assertIsInstance(payload, memoryview)
+        self.assertTrue(payload.readonly)
+        self.assertEqual(payload, self.quat.encode())
+        self.assertEqual(index.FindMessage(time_sec=0.3), 2)
+        self.assertEqual(index.FindMessages(channel="A"), [0, 2, 4])
+        self.assertEqual(
+            index.FindMessages(channel="A", start_time=0.3, end_time=1.0), [2]
+        )
+        self.assertEqual(str(index.cache_filename()), cache_filename)
+        self.assertTrue(os.path.exists(cache_filename))
+        self.assertFalse(os.path.exists(filename + ".index"))
+        self.assertEqual(str(index.filename()), filename)
+
+        # The payload view keeps the index alive.
+        del index
+        self.assertEqual(bytes(payload), self.quat.encode())
+
+        reader = DrakeLcmLog(file_name=filename, is_write=False)
+        self.assertFalse(reader.is_write())
+        reader.Subscribe(channel="A", handler=self._handler)
+        reader.SeekToTime(time_sec=0.5)
+        self.assertEqual(reader.GetNextMessageTime(), 0.5)
+        reader.DispatchMessageAndAdvanceLog(current_time=0.5)
+        self.assertEqual(self.count, 1)
+        self.assertEqual(reader.GetNextMessageTime(), 0.75)
+
+    def test_log_columns(self):
+        filename = os.path.join(temp_directory(), "columns.lcmlog")
+        writer = DrakeLcmLog(file_name=filename, is_write=True)
+        for i in range(3):
+            state = lcmt_robot_state()
+            state.utime = 1000 * i
+            state.num_joints = i + 1
+            state.joint_name = [f"joint{j}" for j in range(i + 1)]
+            state.joint_position = [10 * i + j for j in range(i + 1)]
+            writer.Publish(
+                channel="STATE", buffer=state.encode(), time_sec=1.0 + i
+            )
+            contacts = lcmt_contact_results_for_viz()
+            contacts.timestamp = 1000 * i
+            writer.Publish(
+                channel="CONTACT", buffer=contacts.encode(), time_sec=1.5 + i
+            )
+        del writer
+
+        dut = extract_lcm_log_columns(
+            filename, channel="STATE", lcm_type=lcmt_robot_state
+        )
+        self.assertIsInstance(dut, LcmLogColumns)
+        np.testing.assert_equal(dut.times, [1.0, 2.0, 3.0])
+        np.testing.assert_equal(dut["utime"], [0, 1000, 2000])
+        self.assertEqual(dut["utime"].dtype, np.int64)
+        np.testing.assert_equal(dut["joint_position.offsets"], [0, 1, 3, 6])
+        self.assertEqual(dut["joint_position"].dtype, np.float32)
+        np.testing.assert_equal(
+            dut.get_message_values("joint_position", 2), [20, 21, 22]
+        )
+        self.assertEqual(
+            dut.get_strings("joint_name")[:3], ["joint0", "joint0", "joint1"]
+        )
+        self.assertIn("num_joints", dut)
+
+        # Nested types and time ranges.
+        contacts = extract_lcm_log_columns(
+            LcmLogIndex(filename=filename),
+            channel="CONTACT",
+            lcm_type=lcmt_contact_results_for_viz,
+            start_time=2.0,
+        )
+        np.testing.assert_equal(contacts.times, [2.5, 3.5])
+        np.testing.assert_equal(
+            contacts["point_pair_contact_info.offsets"], [0, 0, 0]
+        )
+        self.assertEqual(
+            contacts["point_pair_contact_info.contact_point"].shape, (0, 3)
+        )
+
+        # The wrong type is an error.
+        with self.assertRaisesRegex(Exception, "fingerprint"):
+            extract_lcm_log_columns(
+                filename, channel="CONTACT", lcm_type=lcmt_robot_state
+            )
+
+        # Round trip through disk.
+        directory = os.path.join(temp_directory(), "columns")
+        dut.save(directory)
+        readback = LcmLogColumns.load(directory)
+        self.assertEqual(sorted(readback.keys()), sorted(dut.keys()))
+        np.testing.assert_equal(readback.times, dut.times)
+        np.testing.assert_equal(
+            readback["joint_position"], dut["joint_position"]
+        )
+        self.assertIsInstance(readback["utime"], np.memmap)
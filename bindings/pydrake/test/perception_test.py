@@ -6,8 +6,14 @@ import unittest
 import numpy as np
 
 from pydrake.common.value import Value
+from pydrake.math import RigidTransform
 from pydrake.systems.framework import InputPort, OutputPort
-from pydrake.systems.sensors import CameraInfo, PixelType
+from pydrake.systems.sensors import (
+    CameraInfo,
+    ImageDepth32F,
+    ImageRgba8U,
+    PixelType,
+)
 
 
 class TestPerception(unittest.TestCase):
@@ -147,6 +153,99 @@ class TestPerception(unittest.TestCase):
             fields=mut.BaseField.kXYZs | mut.BaseField.kRGBs,
         )
 
+    def test_point_cloud_pipeline_api(self):
+        camera_info = CameraInfo(width=4, height=3, fov_y=np.pi / 4)
+        params = mut.PointCloudPipelineParams(
+            crop_lower_xyz=[-1.0, -1.0, 0.0],
+            crop_upper_xyz=[1.0, 1.0, 10.0],
+        )
+        self.assertIn("crop_lower_xyz", repr(params))
+        fields = mut.BaseField.kXYZs | mut.BaseField.kRGBs
+        dut = mut.PointCloudPipeline(
+            camera_infos=[camera_info] * 2, params=params, fields=fields
+        )
+        self.assertEqual(dut.num_cameras(), 2)
+        self.assertEqual(len(dut.camera_infos()), 2)
+        self.assertEqual(dut.params().voxel_size, 0.0)
+        self.assertEqual(dut.fields(), fields)
+
+        depth_images = [ImageDepth32F(4, 3), ImageDepth32F(4, 3)]
+        color_images = [ImageRgba8U(4, 3), ImageRgba8U(4, 3)]
+        for image in depth_images:
+            image.mutable_data[:] = 2.0
+        depth_images[1].mutable_data[0, 0] = np.inf
+        output = mut.PointCloud()
+        dut.Process(
+            depth_images=depth_images,
+            color_images=color_images,
+            camera_poses=[RigidTransform()] * 2,
+            output=output,
+            parallelize=False,
+        )
+        self.assertEqual(output.size(), 2 * 4 * 3 - 1)
+        self.assertTrue(output.has_rgbs())
+        copy.copy(dut)
+
+        system = mut.PointCloudPipelineSystem(
+            camera_infos=[camera_info] * 2,
+            params=mut.PointCloudPipelineParams(),
+            fields=fields,
+            parallelize=True,
+        )
+        self.assertEqual(system.num_cameras(), 2)
+        self.assertIsInstance(system.depth_image_input_port(i=1), InputPort)
+        self.assertIsInstance(system.color_image_input_port(i=1), InputPort)
+        self.assertIsInstance(system.camera_pose_input_port(i=1), InputPort)
+        self.assertIsInstance(system.point_cloud_output_port(), OutputPort)
+        context = system.CreateDefaultContext()
+        for i in range(2):
+            system.depth_image_input_port(i).FixValue(context, depth_images[i])
+            system.color_image_input_port(i).FixValue(context, color_images[i])
+        cloud = system.point_cloud_output_port().Eval(context)
+        self.assertEqual(cloud.size(), 2 * 4 * 3 - 1)
+
+    def test_point_cloud_kd_tree(self):
+        xyzs = np.array(
+            [[0.0, 1.0, 0.0, 5.0], [0.0, 0.0, 1.0, 5.0], [0.0, 0.0, 0.0, 5.0]],
+            dtype=np.float32,
+        )
+        cloud = mut.PointCloud(new_size=4)
+        cloud.mutable_xyzs()[:] = xyzs
+        dut = mut.PointCloudKdTree(cloud=cloud)
+        self.assertEqual(dut.size(), 4)
+        self.assertEqual(dut.num_builds(), 1)
+        self.assertEqual(dut.num_updated_points(), 0)
+
+        queries = np.array(
+            [[0.1, 4.0], [0.0, 4.0], [0.0, 4.0]], dtype=np.float32
+        )
+        indices, distances = dut.FindNearest(
+            queries=queries, k=2, parallelize=True
+        )
+        self.assertEqual(indices.shape, (2, 2))
+        np.testing.assert_equal(indices[:, 0], [0, 1])
+        np.testing.assert_allclose(distances[:, 0], [0.01, 0.81], rtol=1e-5)
+        self.assertEqual(indices[0, 1], 3)
+
+        indices, distances, offsets = dut.FindWithinRadius(
+            queries=queries, radius=1.1, parallelize=False
+        )
+        np.testing.assert_equal(offsets, [0, 3, 3])
+        np.testing.assert_equal(indices, [0, 1, 2])
+        self.assertEqual(distances.shape, (3,))
+
+        xyzs[:, 3] = [0.0, 0.0, 0.5]
+        dut.Update(xyzs=xyzs, max_updated_fraction=0.5)
+        self.assertEqual(dut.num_builds(), 1)
+        self.assertEqual(dut.num_updated_points(), 1)
+        queries[:, 1] = [0.0, 0.0, 1.0]
+        indices, _ = dut.FindNearest(queries=queries, k=1)
+        np.testing.assert_equal(indices[0, :], [0, 3])
+        dut.Update(cloud=cloud, max_updated_fraction=0.0)
+        self.assertEqual(dut.num_builds(), 2)
+        dut = mut.PointCloudKdTree(xyzs=xyzs)
+        self.assertEqual(dut.size(), 4)
+
     def test_point_cloud_to_lcm(self):
         dut = mut.PointCloudToLcm(frame_name="world")
         dut.get_input_port()
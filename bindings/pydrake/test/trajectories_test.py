@@ -107,6 +107,14 @@ class TestTrajectories(unittest.TestCase):
         )
         self.assertEqual(repr(clone), "_WrappedTrajectory(CustomTrajectory())")
 
+        numpy_compare.assert_float_equal(
+            trajectory.EvalBatch(t=[1.5, 2.5])[:, :, 1], np.array([[3.5, 4.5]])
+        )
+        numpy_compare.assert_float_equal(
+            trajectory.EvalBatch(t=[1.5, 2.5], derivative_order=1),
+            np.ones((1, 2, 2)),
+        )
+
         deriv = trajectory.MakeDerivative(derivative_order=1)
         numpy_compare.assert_float_equal(deriv.value(t=2.3), np.ones((1, 2)))
         self.assertIn(
@@ -726,6 +734,24 @@ class TestTrajectories(unittest.TestCase):
         v = pp.vector_values([0, 4])
         self.assertEqual(v.shape, (3, 2))
 
+    @numpy_compare.check_all_types
+    def test_eval_batch(self, T):
+        PiecewisePolynomial = PiecewisePolynomial_[T]
+
+        x = np.array([[1.0, 2.0, 4.0], [0.0, -1.0, 3.0]])
+        pp = PiecewisePolynomial.FirstOrderHold([0.0, 1.0, 2.0], x)
+        pp.Reshape(rows=1, cols=2)
+        t = np.array([1.5, 0.0, 0.5, 3.0])
+        values = pp.EvalBatch(t=t)
+        self.assertEqual(values.shape, (1, 2, 4))
+        for i, time in enumerate(t):
+            numpy_compare.assert_float_equal(values[:, :, i], pp.value(time))
+        derivatives = pp.EvalBatch(t=t, derivative_order=1)
+        self.assertEqual(derivatives.shape, (1, 2, 4))
+        numpy_compare.assert_float_equal(
+            derivatives[:, :, 0], pp.EvalDerivative(t=1.5, derivative_order=1)
+        )
+
     @numpy_compare.check_all_types
     def test_addition(self, T):
         PiecewisePolynomial = PiecewisePolynomial_[T]
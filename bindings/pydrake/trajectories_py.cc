@@ -369,6 +369,25 @@ struct Impl {
               overload_cast_explicit<MatrixX<T>, const std::vector<T>&>(
                   &Class::vector_values),
               py::arg("t"), cls_doc.vector_values.doc)
+          .def(
+              "EvalBatch",
+              [](const Class& self, const Eigen::Ref<const VectorX<T>>& t,
+                  int derivative_order) {
+                MatrixX<T> values;
+                {
+                  py::gil_scoped_release guard;
+                  values = self.EvalBatch(t, derivative_order);
+                }
+                // In Python, we reshape the (rows * cols, N) result to a
+                // (rows, cols, N) array. (Each column of `values` is a
+                // column-major matrix.)
+                return py::cast(std::move(values))
+                    .attr("T")
+                    .attr("reshape")(t.size(), self.cols(), self.rows())
+                    .attr("T");
+              },
+              py::arg("t"), py::arg("derivative_order") = 0,
+              cls_doc.EvalBatch.doc)
           .def("has_derivative", &Class::has_derivative,
               cls_doc.has_derivative.doc)
           .def("EvalDerivative", &Class::EvalDerivative, py::arg("t"),
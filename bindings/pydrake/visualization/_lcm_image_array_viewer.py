@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 import types
 import zlib
@@ -77,10 +78,50 @@ class LcmImageArrayViewer:
     channels.
     """
 
-    def __init__(self, *, host, port, channel, unit_test=False):
-        # Only the latest message from LCM is kept.
+    _MIME_TYPE = types.MappingProxyType(
+        {
+            "png": "image/png",
+            "jpeg": "image/jpeg",
+        }
+    )
+    """The mapping from the supported `image_format`s to their mime type."""
+
+    def __init__(
+        self,
+        *,
+        host,
+        port,
+        channel,
+        image_format="png",
+        jpeg_quality=90,
+        unit_test=False,
+    ):
+        """Constructs the viewer.
+
+        The `image_format` is either "png" (lossless) or "jpeg" (lossy, but
+        typically much faster to encode and smaller to send); `jpeg_quality`
+        is only used for "jpeg".
+        """
+        if image_format not in self._MIME_TYPE:
+            raise ValueError(f"Unsupported image_format: {image_format}")
+        self._image_format = image_format
+        self._jpeg_quality = jpeg_quality
+
+        # Only the latest message from LCM is kept. When new messages arrive
+        # faster than they can be processed (or sent), the older ones are
+        # skipped.
         self._latest_message = None
 
+        # The buffers reused from one message to the next, so that a steady
+        # stream of same-sized images does not allocate. See _get_buffer().
+        self._buffers = dict()
+        self._canvas = None
+
+        # The messages are processed on a worker thread, so that decoding and
+        # encoding one frame overlaps with receiving the next one and sending
+        # the prior one.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
         # Subscribe to the channel.
         self._lcm = DrakeLcm()
         self._lcm.Subscribe(channel=channel, handler=self._update_message)
@@ -100,28 +141,51 @@ class LcmImageArrayViewer:
             )
 
     def image_generator(self):
-        mime_type = "image/png"
+        mime_type = self._MIME_TYPE[self._image_format]
+        pending = None
         while True:
-            self._lcm.HandleSubscriptions(timeout_millis=1000)
-            if self._latest_message is not None:
-                new_image = self._process_message()
-                self._latest_message = None
+            # While a frame is being processed, only poll LCM briefly so that
+            # the result is sent promptly.
+            timeout_millis = 1000 if pending is None else 5
+            self._lcm.HandleSubscriptions(timeout_millis=timeout_millis)
+            if pending is not None and pending.done():
+                new_image = pending.result()
+                pending = None
                 yield (mime_type, new_image)
+            if pending is None and self._latest_message is not None:
+                pending = self._executor.submit(
+                    self._process_message, self._latest_message
+                )
+                self._latest_message = None
 
     def _update_message(self, message):
         self._latest_message = message
 
-    def _process_message(self):
-        """Processes the latest lcmt_image_array message into a single PNG
-        image. Depth and label images will be colorized to color images for
-        visualization. If the LCM message contains multiple images, they will
-        be concatenated together horizontally.
+    def _get_buffer(self, key, image_type, w, h):
+        """Returns the image of the given type and size that is reused for the
+        given key, (re)allocating it only when its size changes.
+        """
+        image = self._buffers.get(key)
+        if (
+            not isinstance(image, image_type)
+            or image.width() != w
+            or image.height() != h
+        ):
+            image = image_type(w, h)
+            self._buffers[key] = image
+        return image
+
+    def _process_message(self, message):
+        """Processes an lcmt_image_array message into a single image, encoded
+        per the `image_format`. Depth and label images will be colorized to
+        color images for visualization. If the LCM message contains multiple
+        images, they will be concatenated together horizontally.
         """
-        image_array = lcmt_image_array.decode(self._latest_message)
+        image_array = lcmt_image_array.decode(message)
         assert len(image_array.images) > 0
 
         rgba_images = []
-        for image in image_array.images:
+        for i, image in enumerate(image_array.images):
             w = image.width
             h = image.height
             data_type = self._IMAGE_DATA_TYPE[image.channel_type]
@@ -145,52 +209,69 @@ class LcmImageArrayViewer:
                 )
             np_image_data = np.frombuffer(data_bytes, dtype=data_type)
 
-            rgba = ImageRgba8U(w, h)
             if image.pixel_format == lcmt_image.PIXEL_FORMAT_RGBA:
-                rgba.mutable_data[:] = np_image_data.reshape(h, w, 4)
-            elif image.pixel_format == lcmt_image.PIXEL_FORMAT_LABEL:
-                label = ImageLabel16I(w, h)
+                # Color images need no conversion; they are copied directly
+                # into the canvas.
+                rgba_images.append(np_image_data.reshape(h, w, 4))
+                continue
+            rgba = self._get_buffer((i, "rgba"), ImageRgba8U, w, h)
+            if image.pixel_format == lcmt_image.PIXEL_FORMAT_LABEL:
+                label = self._get_buffer((i, "label"), ImageLabel16I, w, h)
                 label.mutable_data[:] = np_image_data.reshape(h, w, 1)
                 self._colorize_label.Calc(label, rgba)
             elif image.pixel_format == lcmt_image.PIXEL_FORMAT_DEPTH:
                 if image.channel_type == lcmt_image.CHANNEL_TYPE_UINT16:
-                    depth = ImageDepth16U(w, h)
+                    depth_type = ImageDepth16U
                 elif image.channel_type == lcmt_image.CHANNEL_TYPE_FLOAT32:
-                    depth = ImageDepth32F(w, h)
+                    depth_type = ImageDepth32F
                 else:
                     raise RuntimeError(
                         f"Unsupported depth pixel format: {image.pixel_format}"
                     )
+                depth = self._get_buffer((i, "depth"), depth_type, w, h)
                 depth.mutable_data[:] = np_image_data.reshape(h, w, 1)
                 self._colorize_depth.Calc(depth, rgba)
-            rgba_images.append(rgba)
+            rgba_images.append(rgba.data)
 
-        # Stack the images horizontally.
-        np_concatenated_image = self._concatenate_images(
-            rgba_images, rows=1, cols=len(rgba_images)
+        # Stack the images horizontally, into the reused canvas.
+        self._canvas = self._concatenate_images(
+            rgba_images, rows=1, cols=len(rgba_images), out=self._canvas
         )
 
         # Save the image in-memory.
-        pil_image = Image.fromarray(np_concatenated_image)
         buffer = BytesIO()
-        pil_image.save(buffer, format="png", compress_level=0)
+        if self._image_format == "jpeg":
+            # JPEG has no alpha channel.
+            pil_image = Image.fromarray(self._canvas[..., :3])
+            pil_image.save(buffer, format="jpeg", quality=self._jpeg_quality)
+        else:
+            pil_image = Image.fromarray(self._canvas)
+            pil_image.save(buffer, format="png", compress_level=0)
         return buffer.getbuffer()
 
     @staticmethod
-    def _concatenate_images(images, rows, cols):
+    def _concatenate_images(images, rows, cols, out=None):
         """Helper function to concatenate multiple images. It is assumed that
-        `images` to be a list of systems::sensors::Image with the same size.
+        `images` to be a list of systems::sensors::Image (or their `data`
+        arrays) with the same size. When `out` is an array of the right shape,
+        the result is written into it (and returned); otherwise a new array is
+        returned.
         """
         assert len(images) == rows * cols
-        col_images = []
+        arrays = [
+            image if isinstance(image, np.ndarray) else image.data
+            for image in images
+        ]
+        h, w, num_channels = arrays[0].shape
+        shape = (h * rows, w * cols, num_channels)
+        if out is None or out.shape != shape:
+            out = np.empty(shape, dtype=arrays[0].dtype)
         for r in range(rows):
-            row_images = []
             for c in range(cols):
-                image = images[r * cols + c]
-                row_images.append(image.data)
-            row_image = np.hstack(row_images)
-            col_images.append(row_image)
-        return np.vstack(col_images)
+                out[r * h : (r + 1) * h, c * w : (c + 1) * w] = arrays[
+                    r * cols + c
+                ]
+        return out
 
 
 def main():
@@ -218,9 +299,29 @@ def main():
         required=True,
         help="The LCM channel to subscribe to.",
     )
+    parser.add_argument(
+        "--image-format",
+        type=str,
+        choices=["png", "jpeg"],
+        default="png",
+        help="The image format to stream. JPEG is lossy, but much faster to"
+        " encode and smaller to send; default: png.",
+    )
+    parser.add_argument(
+        "--jpeg-quality",
+        type=int,
+        default=90,
+        help="The JPEG quality (1-95) when streaming JPEG, default: 90.",
+    )
     args = parser.parse_args()
 
-    LcmImageArrayViewer(host=args.host, port=args.port, channel=args.channel)
+    LcmImageArrayViewer(
+        host=args.host,
+        port=args.port,
+        channel=args.channel,
+        image_format=args.image_format,
+        jpeg_quality=args.jpeg_quality,
+    )
 
 
 if __name__ == "__main__":
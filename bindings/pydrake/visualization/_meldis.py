@@ -370,14 +370,16 @@ class _ViewerApplet:
 
     def on_viewer_draw(self, message):
         """Handler for lcmt_viewer_draw."""
+        link_paths = []
+        poses = []
         for i in range(message.num_links):
             if not self._should_accept_link(message.link_name[i]):
                 continue
             link_name = message.link_name[i].replace("::", "/")
             robot_num = message.robot_num[i]
-            link_path = f"{self._path}/{robot_num}/{link_name}"
-            pose = _to_pose(message.position[i], message.quaternion[i])
-            self._meshcat.SetTransform(path=link_path, X_ParentPath=pose)
+            link_paths.append(f"{self._path}/{robot_num}/{link_name}")
+            poses.append(_to_pose(message.position[i], message.quaternion[i]))
+        self._meshcat.SetTransforms(paths=link_paths, X_ParentPaths=poses)
         self._meshcat.SetSimulationTime(sim_time=message.timestamp * 1e-3)
         if self._waiting_for_first_draw_message:
             self._waiting_for_first_draw_message = False
@@ -647,9 +649,22 @@ class _PointCloudApplet:
     all the fields in this particular order.
     """
 
-    def __init__(self, *, meshcat):
+    def __init__(self, *, meshcat, voxel_size=None, max_upload_rate=None):
+        """Constructs an applet.
+
+        When voxel_size is given, each cloud is voxel-downsampled (using
+        PointCloud.VoxelizedDownSample) before it is sent to MeshCat. When
+        max_upload_rate (in Hz) is given, each channel is sent to MeshCat no
+        more often than that; in between, only the newest message is kept.
+        """
         self._meshcat = meshcat
+        self._voxel_size = voxel_size
+        self._min_upload_period = (
+            1.0 / max_upload_rate if max_upload_rate else 0.0
+        )
         self._already_warned_channel_names = set()
+        # Per-channel state, keyed by LCM channel name.
+        self._channels = {}
 
     def _validate_and_get_fields(self, message):
         """Checks the point cloud LCM message and returns the corresponding
@@ -704,30 +719,101 @@ class _PointCloudApplet:
                 _logger.warning(f"Unsupported point cloud data from {channel}.")
             return
 
-        # Transform the raw data into an N x num_fields array.
-        raw_data = np.frombuffer(message.data, dtype=np.float32).reshape(
-            -1, message.num_fields
-        )
-        num_points = raw_data.shape[0]
+        state = self._channels.setdefault(channel, _PointCloudChannel())
+        state.pending = (cloud_fields, message)
+        self._maybe_upload(channel, state)
 
-        cloud = PointCloud(num_points, cloud_fields)
-        xyzs = raw_data[:, 0:3]
-        cloud.mutable_xyzs()[:] = xyzs.transpose()
-        if message.num_fields > 3:
-            rgbs_with_padding = (
-                raw_data[:, 3].astype(np.float32).view(np.uint8).reshape(-1, 4)
+    def on_poll(self):
+        """Sends any messages that were held back by the upload-rate limit,
+        once their channel's period has elapsed.
+        """
+        for channel, state in self._channels.items():
+            if state.pending is not None:
+                self._maybe_upload(channel, state)
+
+    def _maybe_upload(self, channel, state):
+        now = time.time()
+        if (
+            state.last_upload_time is not None
+            and now - state.last_upload_time < self._min_upload_period
+        ):
+            return
+        cloud_fields, message = state.pending
+        state.pending = None
+
+        # MeshCat displays the positions and colors (but not the normals), so
+        # when those are unchanged since the prior upload there is nothing to
+        # send. Comparing the payload is much cheaper than re-sending it.
+        if state.num_fields == message.num_fields and (
+            state.data == message.data
+            or (
+                message.num_fields > 4
+                and len(state.data) == len(message.data)
+                and np.array_equal(
+                    self._reshape(state.data, 7).view(np.uint32)[:, 0:4],
+                    self._reshape(message.data, 7).view(np.uint32)[:, 0:4],
+                )
             )
-            rgbs = rgbs_with_padding[:, 0:3]
-            cloud.mutable_rgbs()[:] = rgbs.transpose()
-        if message.num_fields > 4:
-            normals = raw_data[:, 4:]
-            cloud.mutable_normals()[:] = normals.transpose()
+        ):
+            return
 
+        cloud = self._convert(cloud_fields, message, state)
+        if self._voxel_size is not None:
+            cloud = cloud.VoxelizedDownSample(voxel_size=self._voxel_size)
         self._meshcat.SetObject(
             path=self._channel_to_meshcat_path(channel),
             cloud=cloud,
             point_size=0.01,
         )
+        state.data = message.data
+        state.num_fields = message.num_fields
+        state.last_upload_time = now
+
+    @staticmethod
+    def _reshape(data, num_fields):
+        """Returns an N x num_fields view of the raw point data."""
+        return np.frombuffer(data, dtype=np.float32).reshape(-1, num_fields)
+
+    def _convert(self, cloud_fields, message, state):
+        """Copies the message's points into the channel's PointCloud, which
+        is reused (and resized, as needed) from one message to the next. The
+        fields are read through strided views of the message data, so each
+        point is copied exactly once.
+        """
+        raw_data = self._reshape(message.data, message.num_fields)
+        num_points = raw_data.shape[0]
+
+        cloud = state.cloud
+        if cloud is None or cloud.fields() != cloud_fields:
+            cloud = PointCloud(num_points, cloud_fields)
+            state.cloud = cloud
+        elif cloud.size() != num_points:
+            cloud.resize(new_size=num_points)
+
+        cloud.mutable_xyzs()[:] = raw_data[:, 0:3].T
+        if message.num_fields > 3:
+            # The packed rgb field is four bytes per point, the last of which
+            # is padding.
+            raw_bytes = raw_data.view(np.uint8)
+            cloud.mutable_rgbs()[:] = raw_bytes[:, 12:15].T
+        if message.num_fields > 4:
+            cloud.mutable_normals()[:] = raw_data[:, 4:7].T
+        return cloud
+
+
+class _PointCloudChannel:
+    """The per-channel state of a _PointCloudApplet."""
+
+    def __init__(self):
+        # The PointCloud buffer that is reused for every message.
+        self.cloud = None
+        # The (fields, message) that is waiting to be uploaded, if any.
+        self.pending = None
+        # The payload and field count of the most recent upload.
+        self.data = None
+        self.num_fields = None
+        # The time.time() of the most recent upload.
+        self.last_upload_time = None
 
 
 class _DrawFrameApplet:
@@ -748,11 +834,10 @@ class _DrawFrameApplet:
             suffix = channel[len("DRAKE_DRAW_FRAMES_") :]
             return f"/DRAKE_DRAW_FRAMES/{suffix}"
 
-    def _add_meshcat_triad(self, path, X_PT):
+    def _add_meshcat_triad(self, path):
         length = 0.25
         radius = 0.01
         opacity = 1.0
-        self._meshcat.SetTransform(path, X_PT)
         # x-axis
         X_TG = RigidTransform(
             RotationMatrix.MakeYRotation(np.pi / 2), [length / 2.0, 0, 0]
@@ -781,19 +866,25 @@ class _DrawFrameApplet:
         the lcmt_viewer_draw message."""
         channel_path = self._channel_to_meshcat_path(channel)
 
-        # delete old frames if the link names have changed
+        link_paths = [
+            f"{channel_path}/{link_name.replace('::', '/')}"
+            for link_name in message.link_name
+        ]
+
+        # Rebuild the triads only if the link names have changed; otherwise,
+        # we only need to move the existing ones.
         link_names = set(message.link_name)
         if self._channel_link_map.get(channel) != link_names:
             self._meshcat.Delete(path=channel_path)
+            for link_path in link_paths:
+                self._add_meshcat_triad(path=link_path)
         self._channel_link_map[channel] = link_names
 
-        for i in range(message.num_links):
-            link_name = message.link_name[i].replace("::", "/")
-            link_path = f"{channel_path}/{link_name}"
-            self._add_meshcat_triad(
-                path=link_path,
-                X_PT=_to_pose(message.position[i], message.quaternion[i]),
-            )
+        poses = [
+            _to_pose(message.position[i], message.quaternion[i])
+            for i in range(message.num_links)
+        ]
+        self._meshcat.SetTransforms(paths=link_paths, X_ParentPaths=poses)
 
 
 class Meldis:
@@ -816,10 +907,17 @@ class Meldis:
         meshcat_port: int | None = None,
         meshcat_params: MeshcatParams | None = None,
         environment_map: Path | None = None,
+        point_cloud_voxel_size: float | None = None,
+        point_cloud_max_rate: float | None = None,
     ):
         """Constructs a new Meldis instance. The meshcat_host (when given)
         takes precedence over meshcat_params.host. The meshcat_post (when
         given) takes precedence over meshcat_params.port.
+
+        When point_cloud_voxel_size (in meters) is given, point clouds are
+        voxel-downsampled before being sent to MeshCat. When
+        point_cloud_max_rate (in Hz) is given, each point cloud channel is sent
+        to MeshCat no more often than that.
         """
 
         # Bookkeeping for update throttling.
@@ -951,12 +1049,17 @@ class Meldis:
         )
 
         # Subscribe to all the point-cloud-related channels.
-        point_cloud = _PointCloudApplet(meshcat=self.meshcat)
+        point_cloud = _PointCloudApplet(
+            meshcat=self.meshcat,
+            voxel_size=point_cloud_voxel_size,
+            max_upload_rate=point_cloud_max_rate,
+        )
         self._subscribe_multichannel(
             regex="DRAKE_POINT_CLOUD.*",
             message_type=lcmt_point_cloud,
             handler=point_cloud.on_point_cloud,
         )
+        self._poll(handler=point_cloud.on_poll)
 
         # Subscribe to all the frame display channels.
         draw_frame = _DrawFrameApplet(meshcat=self.meshcat)
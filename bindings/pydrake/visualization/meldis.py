@@ -117,6 +117,20 @@ def _main(args=None):
         "It must be an image type normally used by your browser (e.g., "
         ".jpg, .png, etc.). HDR images are not supported yet.",
     )
+    parser.add_argument(
+        "--point-cloud-voxel-size",
+        metavar="METERS",
+        type=float,
+        help="When given, point clouds are downsampled to this voxel size "
+        "before being sent to MeshCat.",
+    )
+    parser.add_argument(
+        "--point-cloud-max-rate",
+        metavar="HZ",
+        type=float,
+        help="When given, each point cloud channel is sent to MeshCat no more "
+        "often than this rate; in between, only the newest cloud is kept.",
+    )
     args = parser.parse_args(args)
     meshcat_params = None
     if args.meshcat_params is not None:
@@ -128,6 +142,8 @@ def _main(args=None):
         meshcat_port=args.port,
         meshcat_params=meshcat_params,
         environment_map=args.environment_map,
+        point_cloud_voxel_size=args.point_cloud_voxel_size,
+        point_cloud_max_rate=args.point_cloud_max_rate,
     )
     if args.browser is not None and args.browser_new is None:
         args.browser_new = 1
@@ -79,7 +79,9 @@ class TestLcmImageArrayViewer(unittest.TestCase):
 
         # Manually invoke the image processing function and read the buffer
         # back to an image for testing.
-        image_buffer = lcm_image_array_viewer._process_message()
+        image_buffer = lcm_image_array_viewer._process_message(
+            lcm_image_array_viewer._latest_message
+        )
         pil_image = Image.open(BytesIO(image_buffer))
         # PIL Image returns the size as (width, height).
         self.assertEqual(pil_image.size, (12, 2))
@@ -101,6 +103,68 @@ class TestLcmImageArrayViewer(unittest.TestCase):
         self.assertGreaterEqual(len(depth_pixel_values), 6)
         self.assertGreaterEqual(len(label_pixel_values), 6)
 
+    def _get_image_array_message(self):
+        array_message = lcmt_image_array()
+        array_message.num_images = 2
+        array_message.images = [
+            self._get_rgba_lcmt_image(),
+            self._get_depth_lcmt_image(),
+        ]
+        return array_message.encode()
+
+    def test_jpeg_and_reuse(self):
+        """Checks the JPEG encoding, and that the buffers are reused from one
+        message to the next.
+        """
+        dut = LcmImageArrayViewer(
+            host="localhost",
+            port=1234,
+            channel="does_not_matter",
+            image_format="jpeg",
+            jpeg_quality=50,
+            unit_test=True,
+        )
+        message = self._get_image_array_message()
+        image_buffer = dut._process_message(message)
+        pil_image = Image.open(BytesIO(image_buffer))
+        self.assertEqual(pil_image.format, "JPEG")
+        self.assertEqual(pil_image.size, (6, 2))
+
+        canvas = dut._canvas
+        buffers = dict(dut._buffers)
+        dut._process_message(message)
+        self.assertIs(dut._canvas, canvas)
+        self.assertEqual(dut._buffers.keys(), buffers.keys())
+        for key, value in buffers.items():
+            self.assertIs(dut._buffers[key], value)
+
+        with self.assertRaisesRegex(ValueError, "image_format"):
+            LcmImageArrayViewer(
+                host="localhost",
+                port=1234,
+                channel="does_not_matter",
+                image_format="bmp",
+                unit_test=True,
+            )
+
+    def test_image_generator(self):
+        """Checks that the generator processes the (latest) message on its
+        worker thread and yields the encoded image.
+        """
+        dut = LcmImageArrayViewer(
+            host="localhost",
+            port=1234,
+            channel="does_not_matter",
+            unit_test=True,
+        )
+        dut._lcm.Publish(
+            channel="does_not_matter", buffer=self._get_image_array_message()
+        )
+        mime_type, image_buffer = next(dut.image_generator())
+        self.assertEqual(mime_type, "image/png")
+        pil_image = Image.open(BytesIO(image_buffer))
+        self.assertEqual(pil_image.size, (6, 2))
+
     def test_concatenate_images(self):
         """Checks the pixel values and the dimension of the image after the
         concatenation.
@@ -136,3 +200,11 @@ class TestLcmImageArrayViewer(unittest.TestCase):
                         c * image_width : (c + 1) * image_width,
                     ]
                     np.testing.assert_equal(sub_image, expected_pixel_value)
+
+        # The result can be written into an existing array.
+        out = np.zeros((image_height, image_width * 4, 4), dtype=np.uint8)
+        result = LcmImageArrayViewer._concatenate_images(
+            [image.data for image in test_images], 1, 4, out=out
+        )
+        self.assertIs(result, out)
+        np.testing.assert_equal(out[:, :image_width], pixel_value_base)
@@ -25,6 +25,7 @@ import umsgpack
 
 from drake import (
     lcmt_point_cloud,
+    lcmt_point_cloud_field,
     lcmt_viewer_draw,
     lcmt_viewer_geometry_data,
     lcmt_viewer_link_data,
@@ -899,6 +900,102 @@ Kd 1 1 0
                 dut._invoke_subscriptions()
                 self.assertEqual(dut.meshcat.HasPath(meshcat_path), True)
 
+    def test_point_cloud_uploads(self):
+        """Checks that _PointCloudApplet reuses its buffers, skips redundant
+        uploads, and obeys its downsampling and rate-limiting options.
+        """
+
+        class FakeMeshcat:
+            def __init__(self):
+                self.clouds = []
+
+            def SetObject(self, *, path, cloud, point_size):
+                self.clouds.append(cloud)
+
+        def make_message(xyzs, rgbs=None, normals=None):
+            applet_type = mut._meldis._PointCloudApplet
+            columns = [xyzs.astype(np.float32)]
+            if rgbs is not None:
+                padded = np.zeros((len(rgbs), 4), dtype=np.uint8)
+                padded[:, 0:3] = rgbs
+                columns.append(padded.view(np.float32))
+            if normals is not None:
+                columns.append(normals.astype(np.float32))
+            raw_data = np.hstack(columns)
+            message = lcmt_point_cloud()
+            message.flags = lcmt_point_cloud.IS_STRICTLY_FINITE
+            message.num_fields = raw_data.shape[1]
+            for (
+                name,
+                byte_offset,
+                datatype,
+                count,
+            ) in applet_type._POINT_CLOUD_FIELDS[: message.num_fields]:
+                field = lcmt_point_cloud_field()
+                field.name = name
+                field.byte_offset = byte_offset
+                field.datatype = datatype
+                field.count = count
+                message.fields.append(field)
+            message.data = raw_data.tobytes()
+            return message
+
+        meshcat = FakeMeshcat()
+        dut = mut._meldis._PointCloudApplet(meshcat=meshcat)
+        xyzs = np.arange(12).reshape(4, 3)
+        rgbs = np.arange(12, dtype=np.uint8).reshape(4, 3)
+        normals = np.ones((4, 3))
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs, rgbs))
+        self.assertEqual(len(meshcat.clouds), 1)
+        cloud = meshcat.clouds[0]
+        np.testing.assert_equal(cloud.xyzs(), xyzs.T)
+        np.testing.assert_equal(cloud.rgbs(), rgbs.T)
+
+        # An identical message is not re-sent.
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs, rgbs))
+        self.assertEqual(len(meshcat.clouds), 1)
+
+        # A changed (and resized) message reuses the same PointCloud.
+        dut.on_point_cloud(
+            "DRAKE_POINT_CLOUD", make_message(xyzs[:2], rgbs[:2])
+        )
+        self.assertEqual(len(meshcat.clouds), 2)
+        self.assertIs(meshcat.clouds[1], cloud)
+        self.assertEqual(cloud.size(), 2)
+
+        # Changing only the (undisplayed) normals is not re-sent.
+        dut.on_point_cloud(
+            "DRAKE_POINT_CLOUD", make_message(xyzs, rgbs, normals)
+        )
+        self.assertEqual(len(meshcat.clouds), 3)
+        dut.on_point_cloud(
+            "DRAKE_POINT_CLOUD", make_message(xyzs, rgbs, -normals)
+        )
+        self.assertEqual(len(meshcat.clouds), 3)
+        np.testing.assert_equal(meshcat.clouds[2].normals(), normals.T)
+
+        # Downsampling merges the points that share a voxel.
+        meshcat = FakeMeshcat()
+        dut = mut._meldis._PointCloudApplet(meshcat=meshcat, voxel_size=100.0)
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs))
+        self.assertEqual(meshcat.clouds[0].size(), 1)
+
+        # With a (very slow) rate limit, only the first message is sent right
+        # away; the newest of the others waits in the queue.
+        meshcat = FakeMeshcat()
+        dut = mut._meldis._PointCloudApplet(
+            meshcat=meshcat, max_upload_rate=1e-6
+        )
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs))
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs + 1))
+        dut.on_point_cloud("DRAKE_POINT_CLOUD", make_message(xyzs + 2))
+        dut.on_poll()
+        self.assertEqual(len(meshcat.clouds), 1)
+        dut._min_upload_period = 0.0
+        dut.on_poll()
+        self.assertEqual(len(meshcat.clouds), 2)
+        np.testing.assert_equal(meshcat.clouds[1].xyzs(), (xyzs + 2).T)
+
     def test_draw_frame_applet(self):
         """Checks that _DrawFrameApplet doesn't crash when frames are sent
         in DRAKE_DRAW_FRAMES channel.
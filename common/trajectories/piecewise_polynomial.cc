@@ -223,6 +223,43 @@ MatrixX<T> PiecewisePolynomial<T>::DoEvalDerivative(
   return ret;
 }
 
+template <typename T>
+void PiecewisePolynomial<T>::DoEvalBatch(const Eigen::Ref<const VectorX<T>>& t,
+                                         int derivative_order,
+                                         EigenPtr<MatrixX<T>> values) const {
+  if constexpr (!scalar_predicate<T>::is_bool) {
+    // Symbolic times cannot be ordered into segments.
+    Trajectory<T>::DoEvalBatch(t, derivative_order, values);
+  } else {
+    const std::vector<T>& breaks = this->breaks();
+    const int num_segments = this->get_number_of_segments();
+    const Eigen::Index num_rows = rows();
+    const Eigen::Index num_cols = cols();
+    int segment_index = 0;
+    T prior_time = this->start_time();
+    for (int i = 0; i < t.size(); ++i) {
+      const T time = clamp(t[i], this->start_time(), this->end_time());
+      // The segment is the one that starts at the last break <= time (but
+      // never the final break), as in get_segment_index().
+      const auto first =
+          breaks.begin() + (time < prior_time ? 0 : segment_index);
+      segment_index = std::clamp<int>(
+          std::upper_bound(first, breaks.end(), time) - breaks.begin() - 1, 0,
+          num_segments - 1);
+      prior_time = time;
+      const T segment_time = time - breaks[segment_index];
+      const PolynomialMatrix& polynomials = polynomials_[segment_index];
+      for (Eigen::Index col = 0; col < num_cols; ++col) {
+        for (Eigen::Index row = 0; row < num_rows; ++row) {
+          (*values)(row + col * num_rows, i) =
+              polynomials(row, col).EvaluateUnivariate(segment_time,
+                                                       derivative_order);
+        }
+      }
+    }
+  }
+}
+
 template <typename T>
 const typename PiecewisePolynomial<T>::PolynomialMatrix&
 PiecewisePolynomial<T>::getPolynomialMatrix(int segment_index) const {
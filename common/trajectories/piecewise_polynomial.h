@@ -820,6 +820,11 @@ class PiecewisePolynomial final : public PiecewiseTrajectory<T> {
   // @warning This method comes with the same caveats as value(). See value()
   // @pre derivative_order must be non-negative.
   MatrixX<T> DoEvalDerivative(const T& t, int derivative_order) const final;
+  // Evaluates the batch without allocating a matrix per time, and finds the
+  // segment of each time by searching only after the prior segment when the
+  // times are increasing.
+  void DoEvalBatch(const Eigen::Ref<const VectorX<T>>& t, int derivative_order,
+                   EigenPtr<MatrixX<T>> values) const final;
   std::unique_ptr<Trajectory<T>> DoMakeDerivative(
       int derivative_order) const final {
     return derivative(derivative_order).Clone();
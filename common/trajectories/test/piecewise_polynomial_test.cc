@@ -377,6 +377,58 @@ GTEST_TEST(testPiecewisePolynomial, VectorValueTest) {
       "This method only supports vector-valued trajectories.");
 }
 
+GTEST_TEST(testPiecewisePolynomial, EvalBatchTest) {
+  const Eigen::Vector4d breaks(0.0, 0.5, 1.5, 2.0);
+  Eigen::MatrixXd samples(6, 4);
+  samples << 1, 2, 0, 3,  //
+      0, 1, 4, 2,         //
+      -1, 0, 2, 1,        //
+      3, 1, 1, 0,         //
+      2, 2, 0, -2,        //
+      0, 5, 1, 1;
+  PiecewisePolynomial<double> spline =
+      PiecewisePolynomial<double>::CubicShapePreserving(breaks, samples);
+  spline.Reshape(2, 3);
+
+  // Sorted times (including the breaks, and times outside the breaks), and
+  // the same times out of order.
+  const Eigen::VectorXd sorted_times =
+      (Eigen::VectorXd(9) << -1, 0, 0.25, 0.5, 1.0, 1.5, 1.75, 2.0, 3.0)
+          .finished();
+  const Eigen::VectorXd unsorted_times =
+      (Eigen::VectorXd(9) << 1.75, 0, 3.0, 0.5, -1, 1.5, 2.0, 0.25, 1.0)
+          .finished();
+  for (const Eigen::VectorXd& times : {sorted_times, unsorted_times}) {
+    for (int derivative_order = 0; derivative_order < 3; ++derivative_order) {
+      const Eigen::MatrixXd values = spline.EvalBatch(times, derivative_order);
+      ASSERT_EQ(values.rows(), 6);
+      ASSERT_EQ(values.cols(), times.size());
+      for (int i = 0; i < times.size(); ++i) {
+        const Eigen::MatrixXd expected =
+            spline.EvalDerivative(times[i], derivative_order);
+        EXPECT_TRUE(
+            CompareMatrices(values.col(i).reshaped(2, 3), expected, 1e-14));
+      }
+    }
+  }
+  EXPECT_EQ(spline.EvalBatch(Eigen::VectorXd(0)).cols(), 0);
+
+  // Symbolic trajectories use the one-at-a-time implementation.
+  using symbolic::Expression;
+  const Vector3<Expression> symbolic_breaks(0, .5, 1.);
+  const RowVector3<Expression> symbolic_samples(6, 5, 4);
+  const PiecewisePolynomial<Expression> foh =
+      PiecewisePolynomial<Expression>::FirstOrderHold(symbolic_breaks,
+                                                      symbolic_samples);
+  const MatrixX<Expression> symbolic_values =
+      foh.EvalBatch(Vector3<Expression>(0.25, 0.75, 0.0));
+  ASSERT_EQ(symbolic_values.rows(), 1);
+  ASSERT_EQ(symbolic_values.cols(), 3);
+  EXPECT_NEAR(ExtractDoubleOrThrow(symbolic_values(0, 0)), 5.5, 1e-14);
+  EXPECT_NEAR(ExtractDoubleOrThrow(symbolic_values(0, 1)), 4.5, 1e-14);
+  EXPECT_NEAR(ExtractDoubleOrThrow(symbolic_values(0, 2)), 6.0, 1e-14);
+}
+
 GTEST_TEST(testPiecewisePolynomial, RemoveFinalSegmentTest) {
   Eigen::VectorXd breaks(3);
   breaks << 0, .5, 1.;
@@ -59,6 +59,18 @@ GTEST_TEST(TrajectoryTest, MakeDerivativesTest) {
                               ".* does not support .*");
 }
 
+GTEST_TEST(TrajectoryTest, EvalBatchTest) {
+  TrajectoryTester traj_no_deriv(false);
+  const Eigen::Vector3d times(0.0, 0.5, 1.0);
+  const Eigen::MatrixXd values = traj_no_deriv.EvalBatch(times);
+  EXPECT_EQ(values.rows(), 0);
+  EXPECT_EQ(values.cols(), 3);
+  DRAKE_EXPECT_THROWS_MESSAGE(traj_no_deriv.EvalBatch(times, 1),
+                              ".* does not support .*");
+  DRAKE_EXPECT_THROWS_MESSAGE(traj_no_deriv.EvalBatch(times, -1),
+                              ".*derivative_order >= 0.*");
+}
+
 template <typename T>
 void TestScalarType() {
   TrajectoryTester<T> traj(true);
@@ -39,6 +39,28 @@ MatrixX<T> Trajectory<T>::vector_values(
   return values;
 }
 
+template <typename T>
+MatrixX<T> Trajectory<T>::EvalBatch(const Eigen::Ref<const VectorX<T>>& t,
+                                    int derivative_order) const {
+  DRAKE_THROW_UNLESS(derivative_order >= 0);
+  MatrixX<T> values(rows() * cols(), t.size());
+  DoEvalBatch(t, derivative_order, &values);
+  return values;
+}
+
+template <typename T>
+void Trajectory<T>::DoEvalBatch(const Eigen::Ref<const VectorX<T>>& t,
+                                int derivative_order,
+                                EigenPtr<MatrixX<T>> values) const {
+  for (int i = 0; i < t.size(); ++i) {
+    const MatrixX<T> value_i = (derivative_order == 0)
+                                   ? value(t[i])
+                                   : EvalDerivative(t[i], derivative_order);
+    values->col(i) =
+        Eigen::Map<const VectorX<T>>(value_i.data(), value_i.size());
+  }
+}
+
 template <typename T>
 bool Trajectory<T>::has_derivative() const {
   return do_has_derivative();
@@ -55,6 +55,21 @@ class Trajectory {
    */
   MatrixX<T> vector_values(const Eigen::Ref<const VectorX<T>>& t) const;
 
+  /**
+   * Evaluates the trajectory (or its derivative) at each of the times @p t.
+   * This is equivalent to calling EvalDerivative(t[i], derivative_order) for
+   * each i (or value(t[i]) when derivative_order is zero), but subclasses may
+   * evaluate the whole batch more efficiently. The times need not be sorted,
+   * but sorted times are typically fastest.
+   *
+   * @return A matrix with rows() * cols() rows and t.size() columns, where
+   * column i holds the (column-major) elements of the value at time t[i].
+   * @throws std::exception if derivative_order is negative, or if it is
+   * positive and the derivatives are not supported.
+   */
+  MatrixX<T> EvalBatch(const Eigen::Ref<const VectorX<T>>& t,
+                       int derivative_order = 0) const;
+
   /**
    * Returns true iff the Trajectory provides and implementation for
    * EvalDerivative() and MakeDerivative().  The derivative need not be
@@ -105,6 +120,12 @@ class Trajectory {
 
   virtual bool do_has_derivative() const;
 
+  // Implements EvalBatch(). The `values` are pre-sized to rows() * cols() by
+  // t.size(). The default implementation evaluates one time after another.
+  virtual void DoEvalBatch(const Eigen::Ref<const VectorX<T>>& t,
+                           int derivative_order,
+                           EigenPtr<MatrixX<T>> values) const;
+
   virtual MatrixX<T> DoEvalDerivative(const T& t, int derivative_order) const;
 
   virtual std::unique_ptr<Trajectory<T>> DoMakeDerivative(
@@ -0,0 +1,114 @@
+/* Measures the rate at which RenderEngineGltfClient renders a scene that is
+ mostly static (an "environment" of many spheres, and a single moving "robot"
+ sphere), with and without RenderEngineGltfClientParams::reuse_uploaded_assets.
+
+ The benchmark requires a running render server that supports asset reuse, e.g.,
+ the reference server:
+
+   bazel run //geometry/render_gltf_client:server_demo
+
+ and then, in another terminal:
+
+   bazel run //geometry/benchmarking:gltf_client_benchmark
+
+ Each benchmark reports `renders_per_second`, which includes the time spent by
+ the server to render the image. */
+
+#include <cmath>
+#include <memory>
+#include <unordered_map>
+
+#include <benchmark/benchmark.h>
+#include <gflags/gflags.h>
+
+#include "drake/geometry/render_gltf_client/factory.h"
+
+namespace drake {
+namespace geometry {
+namespace {
+
+using Eigen::Vector3d;
+using math::RigidTransformd;
+using math::RotationMatrixd;
+using render::ColorRenderCamera;
+using render::RenderCameraCore;
+using render::RenderEngine;
+using render::RenderLabel;
+using systems::sensors::ImageRgba8U;
+
+DEFINE_string(server_base_url, RenderEngineGltfClientParams{}.base_url,
+              "The base url of the render server");
+
+// The sphere array lies in the z = kZSpherePosition plane, viewed from above.
+const double kZSpherePosition = -4.;
+const double kSphereRadius = 0.1;
+
+// NOLINTNEXTLINE(runtime/references)
+void GltfClientColor(benchmark::State& state) {
+  const bool reuse_uploaded_assets = state.range(0);
+  const int sphere_count = state.range(1);
+  std::unique_ptr<RenderEngine> engine = MakeRenderEngineGltfClient(
+      {.base_url = FLAGS_server_base_url,
+       .reuse_uploaded_assets = reuse_uploaded_assets});
+
+  // Look down the Wz axis.
+  const RigidTransformd X_WC{RotationMatrixd::MakeFromOrthonormalColumns(
+      Vector3d{1, 0, 0}, Vector3d{0, -1, 0}, Vector3d{0, 0, -1})};
+  engine->UpdateViewpoint(X_WC);
+  const ColorRenderCamera camera(
+      RenderCameraCore{"unused", {640, 480, M_PI_4}, {0.01, 100.0}, {}}, false);
+
+  PerceptionProperties material;
+  material.AddProperty("phong", "diffuse", Rgba(0, 0.8, 0.5, 1));
+  material.AddProperty("label", "id", RenderLabel::kDontCare);
+
+  // The static environment: a square grid of spheres.
+  const Sphere sphere(kSphereRadius);
+  const int grid_size = static_cast<int>(std::ceil(std::sqrt(sphere_count)));
+  for (int i = 0; i < sphere_count; ++i) {
+    const double x = (i % grid_size - grid_size / 2) * 3 * kSphereRadius;
+    const double y = (i / grid_size - grid_size / 2) * 3 * kSphereRadius;
+    engine->RegisterVisual(GeometryId::get_new_id(), sphere, material,
+                           RigidTransformd(Vector3d(x, y, kZSpherePosition)),
+                           /* needs_updates = */ false);
+  }
+
+  // The moving robot.
+  const GeometryId robot_id = GeometryId::get_new_id();
+  engine->RegisterVisual(robot_id, Sphere(2 * kSphereRadius), material,
+                         RigidTransformd(Vector3d(0, 0, kZSpherePosition + 1)));
+
+  ImageRgba8U color_image(camera.core().intrinsics().width(),
+                          camera.core().intrinsics().height());
+  // Warm start (e.g., so that the assets have been uploaded).
+  for (int i = 0; i < 2; ++i) {
+    engine->RenderColorImage(camera, &color_image);
+  }
+
+  std::unordered_map<GeometryId, RigidTransformd> poses;
+  int frame = 0;
+  for (auto _ : state) {
+    const double x = 0.5 * std::sin(0.1 * ++frame);
+    poses[robot_id] = RigidTransformd(Vector3d(x, 0, kZSpherePosition + 1));
+    engine->UpdatePoses(poses);
+    engine->RenderColorImage(camera, &color_image);
+  }
+  state.counters["renders_per_second"] =
+      benchmark::Counter(state.iterations(), benchmark::Counter::kIsRate);
+}
+
+// The arguments are: reuse_uploaded_assets, and the number of static spheres.
+BENCHMARK(GltfClientColor)
+    ->Unit(benchmark::kMillisecond)
+    ->UseRealTime()
+    ->ArgNames({"reuse", "spheres"})
+    ->Args({0, 12})
+    ->Args({1, 12})
+    ->Args({0, 240})
+    ->Args({1, 240})
+    ->Args({0, 1200})
+    ->Args({1, 1200});
+
+}  // namespace
+}  // namespace geometry
+}  // namespace drake
@@ -0,0 +1,97 @@
+// Benchmarks for sending per-frame poses to Meshcat.
+//
+// This compares one SetTransform() call per link against a single batched
+// SetTransforms() call, reporting the achievable frames per second as a
+// function of the number of links.
+
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <benchmark/benchmark.h>
+#include <fmt/format.h>
+
+#include "drake/geometry/meshcat.h"
+#include "drake/math/rigid_transform.h"
+#include "drake/tools/performance/fixture_common.h"
+
+namespace drake {
+namespace geometry {
+namespace {
+
+using math::RigidTransformd;
+
+class MeshcatFrames : public benchmark::Fixture {
+ public:
+  MeshcatFrames() { tools::performance::AddMinMaxStatistics(this); }
+
+  void SetUp(benchmark::State& state) override {
+    meshcat_ = std::make_unique<Meshcat>();
+    const int num_links = state.range(0);
+    paths_.clear();
+    poses_.clear();
+    for (int i = 0; i < num_links; ++i) {
+      paths_.push_back(fmt::format("robot/link_{}", i));
+      poses_.emplace_back(Eigen::Vector3d(0.01 * i, 0.0, 0.0));
+    }
+  }
+
+  void TearDown(benchmark::State&) override { meshcat_.reset(); }
+
+ protected:
+  // Nudges every pose, so that each frame differs from the last.
+  void AdvancePoses() {
+    for (RigidTransformd& pose : poses_) {
+      pose.set_translation(pose.translation() + Eigen::Vector3d(0, 0, 1e-3));
+    }
+  }
+
+  static void ReportFramesPerSecond(benchmark::State& state) {
+    state.counters["fps"] =
+        benchmark::Counter(state.iterations(), benchmark::Counter::kIsRate);
+  }
+
+  std::unique_ptr<Meshcat> meshcat_;
+  std::vector<std::string> paths_;
+  std::vector<RigidTransformd> poses_;
+};
+
+BENCHMARK_DEFINE_F(MeshcatFrames, SetTransformPerLink)
+// NOLINTNEXTLINE(runtime/references) cpplint disapproves of gbench choices.
+(benchmark::State& state) {
+  for (auto _ : state) {
+    AdvancePoses();
+    for (size_t i = 0; i < paths_.size(); ++i) {
+      meshcat_->SetTransform(paths_[i], poses_[i]);
+    }
+    // Wait for the websocket thread to drain the queue.
+    benchmark::DoNotOptimize(meshcat_->GetPackedTransform(paths_.back()));
+  }
+  ReportFramesPerSecond(state);
+}
+BENCHMARK_REGISTER_F(MeshcatFrames, SetTransformPerLink)
+    ->Unit(benchmark::kMicrosecond)
+    ->RangeMultiplier(10)
+    ->Range(10, 1000);
+
+BENCHMARK_DEFINE_F(MeshcatFrames, SetTransforms)
+// NOLINTNEXTLINE(runtime/references) cpplint disapproves of gbench choices.
+(benchmark::State& state) {
+  for (auto _ : state) {
+    AdvancePoses();
+    meshcat_->SetTransforms(paths_, poses_);
+    // Wait for the websocket thread to drain the queue.
+    benchmark::DoNotOptimize(meshcat_->GetPackedTransform(paths_.back()));
+  }
+  ReportFramesPerSecond(state);
+}
+BENCHMARK_REGISTER_F(MeshcatFrames, SetTransforms)
+    ->Unit(benchmark::kMicrosecond)
+    ->RangeMultiplier(10)
+    ->Range(10, 1000);
+
+}  // namespace
+}  // namespace geometry
+}  // namespace drake
+
+BENCHMARK_MAIN();
@@ -5,10 +5,12 @@
 #include <cctype>
 #include <cmath>
 #include <exception>
+#include <filesystem>
 #include <fstream>
 #include <functional>
 #include <future>
 #include <map>
+#include <memory>
 #include <optional>
 #include <regex>
 #include <set>
@@ -138,11 +140,27 @@ class SceneTreeElement {
   // Provide direct access to all member fields except the list of children.
   const std::optional<Message>& object() const { return object_; }
   std::optional<Message>& object() { return object_; }
-  const std::optional<Message>& transform() const { return transform_; }
-  std::optional<Message>& transform() { return transform_; }
+  const std::optional<Message>& transform() const {
+    PackBatchedTransform();
+    return transform_;
+  }
+  std::optional<Message>& transform() {
+    batched_transform_ = {};
+    return transform_;
+  }
   const std::map<std::string, Message>& properties() const { return props_; }
   std::map<std::string, Message>& properties() { return props_; }
 
+  // Sets this element's transform to the `index`'th entry of a batched
+  // set_transforms command. The equivalent set_transform message is only
+  // packed when it's actually needed (e.g., when a new client connects), so
+  // that streaming many poses per frame doesn't repack every one of them.
+  void SetBatchedTransform(
+      std::shared_ptr<const internal::SetTransformsData> batch, int index) {
+    transform_.reset();
+    batched_transform_ = {std::move(batch), index};
+  }
+
   // Returns this element or a descendant, based on a recursive evaluation of
   // the `path`.  Adds new elements if they do not exist.  Comparable to
   // std::map::operator[].
@@ -217,6 +235,7 @@ class SceneTreeElement {
     if (object_) {
       ws->send(object_->bytes);
     }
+    PackBatchedTransform();
     if (transform_) {
       ws->send(transform_->bytes);
     }
@@ -239,6 +258,7 @@ class SceneTreeElement {
     if (object_) {
       html += CreateCommand(object_->bytes);
     }
+    PackBatchedTransform();
     if (transform_) {
       html += CreateCommand(transform_->bytes);
     }
@@ -252,13 +272,38 @@ class SceneTreeElement {
   }
 
  private:
+  struct BatchedTransform {
+    std::shared_ptr<const internal::SetTransformsData> batch;
+    int index{};
+  };
+
+  // If our transform was set by SetBatchedTransform(), packs it into
+  // `transform_` as a stand-alone set_transform command.
+  void PackBatchedTransform() const {
+    if (batched_transform_.batch == nullptr) {
+      return;
+    }
+    const internal::SetTransformsData& batch = *batched_transform_.batch;
+    const int index = batched_transform_.index;
+    internal::SetTransformData data;
+    data.path = batch.paths[index];
+    std::copy(batch.matrices.begin() + 16 * index,
+              batch.matrices.begin() + 16 * (index + 1), data.matrix);
+    std::stringstream message_stream;
+    msgpack::pack(message_stream, data);
+    transform_.emplace() = message_stream.str();
+    batched_transform_ = {};
+  }
+
   // Note: We use std::optional here to clearly denote the variables that have
   // not been set, and therefore need not be sent over the websocket.
 
   // The msgpack'd set_object command.
   std::optional<Message> object_;
-  // The msgpack'd set_transform command.
-  std::optional<Message> transform_;
+  // The msgpack'd set_transform command. When `batched_transform_` is set, it
+  // supersedes this value (which is then empty) until it is packed on demand.
+  mutable std::optional<Message> transform_;
+  mutable BatchedTransform batched_transform_;
   // The msgpack'd set_property command(s).
   std::map<std::string, Message> props_;
   // Children, with the key value denoting their (relative) path name.
@@ -1391,6 +1436,39 @@ class Meshcat::Impl {
     });
   }
 
+  // This function is public via the PIMPL.
+  void SetTransforms(const std::vector<std::string>& paths,
+                     const std::vector<Eigen::Matrix4d>& matrices) {
+    DRAKE_DEMAND(IsThread(main_thread_id_));
+    DRAKE_THROW_UNLESS(paths.size() == matrices.size());
+    if (paths.empty()) {
+      return;
+    }
+
+    internal::SetTransformsData data;
+    data.paths.reserve(paths.size());
+    data.matrices.resize(16 * matrices.size());
+    for (size_t i = 0; i < paths.size(); ++i) {
+      data.paths.push_back(FullPath(paths[i]));
+      Eigen::Map<Eigen::Matrix4d>(data.matrices.data() + 16 * i) = matrices[i];
+    }
+
+    Defer([this, batch = std::make_shared<const internal::SetTransformsData>(
+                     std::move(data))]() {
+      DRAKE_DEMAND(IsThread(websocket_thread_id_));
+      DRAKE_DEMAND(app_ != nullptr);
+      std::stringstream message_stream;
+      msgpack::pack(message_stream, *batch);
+      app_->publish("all", message_stream.str(), uWS::OpCode::BINARY, false);
+      // The scene tree refers each path to its entry of the shared batch; the
+      // per-path set_transform messages (which newly connected clients receive
+      // instead of the batched message) are only packed if they're needed.
+      for (int i = 0; i < ssize(batch->paths); ++i) {
+        scene_tree_root_[batch->paths[i]].SetBatchedTransform(batch, i);
+      }
+    });
+  }
+
   // This function is public via the PIMPL.
   void Delete(std::string_view path) {
     DRAKE_DEMAND(IsThread(main_thread_id_));
@@ -1551,6 +1629,38 @@ class Meshcat::Impl {
       DRAKE_DEMAND(app_ != nullptr);
       app_->publish("all", message, uWS::OpCode::BINARY, false);
       animation_ = std::move(message);
+      streamed_recording_.clear();
+    });
+  }
+
+  // This function is public via the PIMPL.
+  DRAKE_NO_EXPORT std::string GetFullPath(std::string_view path) const {
+    return FullPath(path);
+  }
+
+  // This function is public via the PIMPL.
+  DRAKE_NO_EXPORT void SetStreamedRecording(std::filesystem::path directory,
+                                            bool play) {
+    DRAKE_DEMAND(IsThread(main_thread_id_));
+    // The browser fetches the index and the chunks over http; see
+    // HandleHttpGet() and StreamedRecordingPlayer in meshcat.html.
+    std::stringstream message_stream;
+    msgpack::packer o(message_stream);
+    o.pack_map(3);
+    o.pack("type");
+    o.pack("set_streamed_recording");
+    o.pack("url");
+    o.pack("recording/");
+    o.pack("play");
+    o.pack(play);
+    Defer([this, directory = std::move(directory),
+           message = message_stream.str()]() {
+      DRAKE_DEMAND(IsThread(websocket_thread_id_));
+      DRAKE_DEMAND(app_ != nullptr);
+      streamed_recording_directory_ = directory;
+      app_->publish("all", message, uWS::OpCode::BINARY, false);
+      streamed_recording_ = std::move(message);
+      animation_.clear();
     });
   }
 
@@ -2296,6 +2406,9 @@ class Meshcat::Impl {
     if (!animation_.empty()) {
       ws->send(animation_);
     }
+    if (!streamed_recording_.empty()) {
+      ws->send(streamed_recording_);
+    }
     std::lock_guard<std::mutex> lock(controls_mutex_);
     for (const auto& c : controls_) {
       auto b_iter = buttons_.find(c);
@@ -2401,6 +2514,32 @@ class Meshcat::Impl {
       response->end(handle->contents());
       return;
     }
+    // Handle the files of a streamed recording. Only the index and the chunk
+    // files are served (see MeshcatRecordingStream).
+    if (url_path.substr(0, 11) == "/recording/") {
+      const std::string_view name = url_path.substr(11);
+      const std::regex file_pattern(
+          R"""(index\.json|chunk_[0-9]+\.msgpack\.z)""");
+      std::string contents;
+      const bool found =
+          !streamed_recording_directory_.empty() &&
+          std::regex_match(name.begin(), name.end(), file_pattern) &&
+          ReadStreamedRecordingFile(name, &contents);
+      if (!found) {
+        log()->warn("Meshcat: Unknown streamed recording file {}", name);
+        response->writeStatus("404 Not Found");
+        response->writeHeader("Cache-Control", "no-cache");
+        response->end("");
+        return;
+      }
+      const char* const content_type = (name == "index.json")
+                                           ? "application/json"
+                                           : "application/octet-stream";
+      response->writeHeader("Content-Type", content_type);
+      response->writeHeader("Cache-Control", "no-cache");
+      response->end(contents);
+      return;
+    }
     // Handle static (i.e., compiled-in) files.
     if ((url_path == "/") || (url_path == "/index.html") ||
         (url_path == "/meshcat.html")) {
@@ -2420,6 +2559,21 @@ class Meshcat::Impl {
     response->end("");
   }
 
+  // Reads a file of the streamed recording into `contents`, returning false
+  // if it cannot be read. This function is for use by the websocket thread.
+  bool ReadStreamedRecordingFile(std::string_view name,
+                                 std::string* contents) const {
+    DRAKE_DEMAND(IsThread(websocket_thread_id_));
+    std::ifstream input(streamed_recording_directory_ / name, std::ios::binary);
+    if (!input.is_open()) {
+      return false;
+    }
+    std::stringstream buffer;
+    buffer << input.rdbuf();
+    *contents = buffer.str();
+    return true;
+  }
+
   // This function is a callback from a WebSocketBehavior. However, unit tests
   // may also call it (via InjectWebsocketMessage) in which case the `ws` will
   // be null.
@@ -2607,6 +2761,8 @@ class Meshcat::Impl {
   std::thread::id websocket_thread_id_{};
   SceneTreeElement scene_tree_root_{};
   std::string animation_;
+  std::string streamed_recording_;
+  std::filesystem::path streamed_recording_directory_;
   uWS::App* app_{nullptr};
   us_listen_socket_t* listen_socket_{nullptr};
   std::set<WebSocket*> websockets_{};
@@ -2714,6 +2870,8 @@ Meshcat::Meshcat(const MeshcatParams& params)
 }
 
 Meshcat::~Meshcat() {
+  // A streaming recording flushes itself using impl(), so must go first.
+  recording_.reset();
   delete static_cast<Impl*>(impl_);
 }
 
@@ -2885,6 +3043,33 @@ void Meshcat::SetTransform(std::string_view path,
   impl().SetTransform(path, matrix);
 }
 
+void Meshcat::SetTransforms(const std::vector<std::string>& paths,
+                            const std::vector<RigidTransformd>& X_ParentPaths,
+                            std::optional<double> time_in_recording) {
+  DRAKE_THROW_UNLESS(paths.size() == X_ParentPaths.size());
+  const bool show_live =
+      recording_->SetTransforms(paths, X_ParentPaths, time_in_recording);
+  if (show_live) {
+    std::vector<Eigen::Matrix4d> matrices;
+    matrices.reserve(X_ParentPaths.size());
+    for (const RigidTransformd& X_ParentPath : X_ParentPaths) {
+      matrices.push_back(X_ParentPath.GetAsMatrix4());
+    }
+    impl().SetTransforms(paths, matrices);
+  }
+}
+
+void Meshcat::SetTransforms(const std::vector<std::string>& paths,
+                            const std::vector<Eigen::Matrix4d>& matrices,
+                            std::optional<double> time_in_recording) {
+  DRAKE_THROW_UNLESS(paths.size() == matrices.size());
+  const bool show_live =
+      recording_->SetTransforms(paths, matrices, time_in_recording);
+  if (show_live) {
+    impl().SetTransforms(paths, matrices);
+  }
+}
+
 void Meshcat::Delete(std::string_view path) {
   impl().Delete(path);
 }
@@ -3037,11 +3222,28 @@ void Meshcat::StartRecording(double frames_per_second,
                              set_visualizations_while_recording);
 }
 
+void Meshcat::StartStreamingRecording(
+    const MeshcatStreamingRecordingParams& params,
+    bool set_visualizations_while_recording) {
+  recording_->StartStreamingRecording(params,
+                                      set_visualizations_while_recording,
+                                      [this](std::string_view path) {
+                                        return impl().GetFullPath(path);
+                                      });
+}
+
 void Meshcat::StopRecording() {
   recording_->StopRecording();
 }
 
 void Meshcat::PublishRecording() {
+  internal::MeshcatRecordingStream* stream = recording_->get_mutable_stream();
+  if (stream != nullptr) {
+    stream->Flush();
+    impl().SetStreamedRecording(stream->directory(),
+                                recording_->get_animation().autoplay());
+    return;
+  }
   impl().SetAnimation(recording_->get_animation());
 }
 
@@ -561,6 +561,50 @@ class Meshcat {
   void SetTransform(std::string_view path,
                     const Eigen::Ref<const Eigen::Matrix4d>& matrix);
 
+  /** Sets the transforms for many paths at once. This is equivalent to calling
+  SetTransform() for each (path, transform) pair in turn, except that all of
+  the transforms are sent to the browser in a single message (so they are
+  applied together), and the per-call overhead is only paid once. This is the
+  preferred way to update the poses of many objects every frame.
+  @param paths the "/"-delimited strings indicating the paths in the scene
+              tree. See @ref meshcat_path "Meshcat paths" for the semantics.
+  @param X_ParentPaths the relative transforms from each path to its immediate
+              parent, in the same order as `paths`.
+  @param time_in_recording (optional). If recording (see StartRecording()), then
+              in addition to publishing the transforms to any meshcat browsers
+              immediately, these transforms are saved to the current animation
+              at `time_in_recording`.
+  @throws std::exception if `paths` and `X_ParentPaths` differ in size.
+
+  @pydrake_mkdoc_identifier{RigidTransform}
+  */
+  void SetTransforms(const std::vector<std::string>& paths,
+                     const std::vector<math::RigidTransformd>& X_ParentPaths,
+                     std::optional<double> time_in_recording = std::nullopt);
+
+  /** Sets the homogeneous transforms for many paths at once. This is the
+  batched equivalent of the SetTransform() overload that takes a matrix; see
+  the other SetTransforms() overload for details.
+  @param paths the "/"-delimited strings indicating the paths in the scene
+              tree. See @ref meshcat_path "Meshcat paths" for the semantics.
+  @param matrices the relative transforms from each path to its immediate
+              parent, in the same order as `paths`.
+  @param time_in_recording (optional). If recording (see StartRecording()), then
+              in addition to publishing the transforms to any meshcat browsers
+              immediately, these transforms are saved to the current animation
+              at `time_in_recording`. Animations only store each path's
+              position and orientation, so the matrices must be valid rigid
+              transforms in this case.
+  @throws std::exception if `paths` and `matrices` differ in size.
+  @throws std::exception if the transforms are saved to the animation and any
+              of the `matrices` is not a valid rigid transform.
+
+  @pydrake_mkdoc_identifier{matrix}
+  */
+  void SetTransforms(const std::vector<std::string>& paths,
+                     const std::vector<Eigen::Matrix4d>& matrices,
+                     std::optional<double> time_in_recording = std::nullopt);
+
   /** Deletes the object at the given `path` as well as all of its children.
   See @ref meshcat_path for the detailed semantics of deletion. */
   void Delete(std::string_view path = "");
@@ -989,13 +1033,43 @@ class Meshcat {
   void StartRecording(double frames_per_second = 64.0,
                       bool set_visualizations_while_recording = true);
 
+  /** Like StartRecording(), but streams the recorded frames to disk as the
+  recording is made, instead of accumulating them in memory. Use this for long
+  recordings (e.g., hour-long simulations of many bodies) that would otherwise
+  exhaust memory or produce an animation too large for a browser to load.
+
+  The frames are grouped into chunks of `params.frames_per_chunk` frames. Each
+  chunk is compressed and written to its own file in `params.directory` as soon
+  as the recording moves past it, along with an `index.json` listing the chunks.
+  Keyframes that are within the `params` tolerances of the previously stored
+  keyframe of the same path and property are pruned.
+
+  PublishRecording() makes the browser play the chunks back by fetching them
+  lazily from this Meshcat's http server, so that seeking only needs to load the
+  chunk that is displayed. Streamed recordings are not included in StaticHtml()
+  or StaticZip(). While streaming, get_recording() only reflects the animation
+  options (e.g., autoplay); it does not hold any frames.
+
+  Frames may be recorded in any order within the chunk that is currently being
+  recorded (i.e., the chunk of the latest frame so far), but not in any earlier
+  chunk, since those chunks have already been written. Recording a frame before
+  the start of the current chunk throws.
+
+  @throws std::exception if `params` is invalid or the directory cannot be
+  created. */
+  void StartStreamingRecording(const MeshcatStreamingRecordingParams& params,
+                               bool set_visualizations_while_recording = true);
+
   /** Sets a flag to pause/stop recording.  When stopped, publish events will
-  not add frames to the animation. */
+  not add frames to the animation. When streaming (see
+  StartStreamingRecording()), also writes the pending frames to disk. */
   void StopRecording();
 
   /** Sends the recording to Meshcat as an animation. The published animation
   only includes transforms and properties; the objects that they modify must be
-  sent to the visualizer separately (e.g. by calling Publish()). */
+  sent to the visualizer separately (e.g. by calling Publish()). When streaming
+  (see StartStreamingRecording()), writes the pending frames to disk and
+  instructs the browser to load the chunks on demand. */
   void PublishRecording();
 
   /** Deletes the current animation holding the recorded frames.  Animation
@@ -94,5 +94,49 @@ struct MeshcatParams {
   double realtime_rate_period{0.25};
 };
 
+/** The set of parameters for Meshcat::StartStreamingRecording(). */
+struct MeshcatStreamingRecordingParams {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(directory));
+    a->Visit(DRAKE_NVP(frames_per_second));
+    a->Visit(DRAKE_NVP(frames_per_chunk));
+    a->Visit(DRAKE_NVP(translation_tolerance));
+    a->Visit(DRAKE_NVP(rotation_tolerance));
+    a->Visit(DRAKE_NVP(property_tolerance));
+  }
+
+  /** The directory that will hold the recording's chunk files and its
+  `index.json`. It is created if it does not exist. Any prior recording in the
+  same directory is overwritten. */
+  std::string directory;
+
+  /** The rate at which the recording will be played back (as in
+  MeshcatAnimation). It must be strictly positive. */
+  double frames_per_second{64.0};
+
+  /** The number of consecutive frames stored in each chunk. A chunk is written
+  to disk (and released from memory) as soon as the recording moves past it,
+  and it is the unit that a browser loads when seeking. It must be strictly
+  positive. */
+  int frames_per_chunk{1024};
+
+  /** A new "position" keyframe is only stored if some coordinate differs by
+  more than this distance (in meters) from the previously stored keyframe on
+  the same path. The default of zero only prunes unchanged values. */
+  double translation_tolerance{0.0};
+
+  /** A new "quaternion" keyframe is only stored if it differs by more than this
+  angle (in radians) from the previously stored keyframe on the same path. */
+  double rotation_tolerance{0.0};
+
+  /** A new keyframe for any other numeric property is only stored if some
+  element differs by more than this amount from the previously stored keyframe
+  of that property. Boolean properties are only stored when they change. */
+  double property_tolerance{0.0};
+};
+
 }  // namespace geometry
 }  // namespace drake
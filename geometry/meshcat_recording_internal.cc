@@ -1,10 +1,342 @@
 #include "drake/geometry/meshcat_recording_internal.h"
 
+#include <algorithm>
+#include <cmath>
+#include <fstream>
+#include <sstream>
+#include <stdexcept>
+#include <type_traits>
 #include <vector>
 
+#include <fmt/format.h>
+#include <msgpack.hpp>
+#include <nlohmann/json.hpp>
+#include <zlib.h>
+
+#include "drake/common/drake_assert.h"
+#include "drake/common/drake_throw.h"
+#include "drake/common/text_logging.h"
+
 namespace drake {
 namespace geometry {
 namespace internal {
+namespace {
+
+/* Writes `contents` to `filename` by writing to a temporary file in the same
+directory and then renaming it, so that a reader (e.g., Meshcat's http server)
+never observes a partially written file. */
+void WriteFileAtomically(const std::filesystem::path& filename,
+                         std::string_view contents) {
+  std::filesystem::path temp = filename;
+  temp += ".tmp";
+  {
+    std::ofstream output(temp, std::ios::binary);
+    output.write(contents.data(), contents.size());
+    if (!output.good()) {
+      throw std::runtime_error(
+          fmt::format("Meshcat: Failed to write {}", temp.string()));
+    }
+  }
+  std::filesystem::rename(temp, filename);
+}
+
+}  // namespace
+
+MeshcatRecordingStream::MeshcatRecordingStream(
+    const MeshcatStreamingRecordingParams& params,
+    std::function<std::string(std::string_view)> full_path)
+    : params_(params),
+      directory_(params.directory),
+      full_path_(std::move(full_path)) {
+  DRAKE_THROW_UNLESS(!params.directory.empty());
+  DRAKE_THROW_UNLESS(params.frames_per_second > 0);
+  DRAKE_THROW_UNLESS(params.frames_per_chunk > 0);
+  DRAKE_THROW_UNLESS(params.translation_tolerance >= 0);
+  DRAKE_THROW_UNLESS(params.rotation_tolerance >= 0);
+  DRAKE_THROW_UNLESS(params.property_tolerance >= 0);
+  DRAKE_THROW_UNLESS(full_path_ != nullptr);
+  std::filesystem::create_directories(directory_);
+  WriteIndex();
+}
+
+MeshcatRecordingStream::~MeshcatRecordingStream() {
+  try {
+    Flush();
+  } catch (const std::exception& e) {
+    // Destructors must not throw; the recording is simply left truncated.
+    drake::log()->error("Meshcat: Failed to flush the streaming recording: {}",
+                        e.what());
+  }
+}
+
+int MeshcatRecordingStream::frame(double time) const {
+  DRAKE_DEMAND(time >= 0);
+  return static_cast<int>(std::floor(time * params_.frames_per_second));
+}
+
+int64_t MeshcatRecordingStream::num_bytes() const {
+  int64_t result = 0;
+  for (const ChunkInfo& chunk : chunks_) {
+    result += chunk.bytes;
+  }
+  return result;
+}
+
+void MeshcatRecordingStream::SetTransform(
+    int frame, std::string_view path,
+    const math::RigidTransformd& X_ParentPath) {
+  // This must match MeshcatAnimation::SetTransform.
+  std::vector<double> position(3);
+  Eigen::Vector3d::Map(&position[0]) = X_ParentPath.translation();
+  const auto q = X_ParentPath.rotation().ToQuaternion();
+  std::vector<double> quaternion{q.x(), q.y(), q.z(), q.w()};
+  SetKey(frame, path, "position", "vector3", std::move(position));
+  SetKey(frame, path, "quaternion", "quaternion", std::move(quaternion));
+}
+
+template <typename T>
+void MeshcatRecordingStream::SetProperty(int frame, std::string_view path,
+                                         std::string_view property,
+                                         const T& value) {
+  // This must match MeshcatAnimation::SetProperty.
+  std::string_view js_type;
+  if constexpr (std::is_same_v<T, bool>) {
+    js_type = "boolean";
+  } else if constexpr (std::is_same_v<T, double>) {
+    js_type = "number";
+  } else {
+    js_type = "vector";
+  }
+  SetKey(frame, path, property, js_type, value);
+}
+
+template void MeshcatRecordingStream::SetProperty(int, std::string_view,
+                                                  std::string_view,
+                                                  const bool&);
+template void MeshcatRecordingStream::SetProperty(int, std::string_view,
+                                                  std::string_view,
+                                                  const double&);
+template void MeshcatRecordingStream::SetProperty(int, std::string_view,
+                                                  std::string_view,
+                                                  const std::vector<double>&);
+
+void MeshcatRecordingStream::SetKey(int frame, std::string_view path,
+                                    std::string_view property,
+                                    std::string_view js_type, Value value) {
+  if (frame < chunk_start_) {
+    throw std::logic_error(fmt::format(
+        "Meshcat: Cannot record frame {} of {} property {} because the "
+        "streaming recording has already written all frames before {} to disk",
+        frame, path, property, chunk_start_));
+  }
+  if (frame >= chunk_start_ + params_.frames_per_chunk) {
+    StartChunk(frame);
+  }
+  max_frame_ = std::max(max_frame_, frame);
+
+  auto& property_tracks =
+      tracks_.emplace(path, std::map<std::string, Track, std::less<>>{})
+          .first->second;
+  auto iter = property_tracks.find(property);
+  if (iter == property_tracks.end()) {
+    Track& track = property_tracks[std::string{property}];
+    track.js_type = js_type;
+    track.keys[frame] = value;
+    track.last_stored = std::move(value);
+    return;
+  }
+  Track& track = iter->second;
+  if (track.js_type != js_type) {
+    throw std::runtime_error(fmt::format(
+        "{} property {} already has a track with javascript type {} != {}",
+        path, property, track.js_type, js_type));
+  }
+  if (IsWithinTolerance(track, value)) {
+    track.pruned.emplace(frame, std::move(value));
+    ++num_pruned_;
+    return;
+  }
+  if (track.pruned.has_value()) {
+    // Hold the previous value until just before the change.
+    track.keys[track.pruned->first] = std::move(track.pruned->second);
+    track.pruned.reset();
+    --num_pruned_;
+  }
+  track.keys[frame] = value;
+  track.last_stored = std::move(value);
+}
+
+bool MeshcatRecordingStream::IsWithinTolerance(const Track& track,
+                                               const Value& value) const {
+  if (value.index() != track.last_stored.index()) {
+    return false;
+  }
+  if (const bool* b = std::get_if<bool>(&value)) {
+    return *b == std::get<bool>(track.last_stored);
+  }
+  if (const double* d = std::get_if<double>(&value)) {
+    return std::abs(*d - std::get<double>(track.last_stored)) <=
+           params_.property_tolerance;
+  }
+  const auto& a = std::get<std::vector<double>>(track.last_stored);
+  const auto& b = std::get<std::vector<double>>(value);
+  if (a.size() != b.size()) {
+    return false;
+  }
+  if (track.js_type == "quaternion") {
+    // The angle between the two rotations, treating q and -q as equivalent.
+    double dot = 0;
+    for (size_t i = 0; i < a.size(); ++i) {
+      dot += a[i] * b[i];
+    }
+    const double angle = 2 * std::acos(std::min(1.0, std::abs(dot)));
+    return angle <= params_.rotation_tolerance;
+  }
+  const double tolerance = (track.js_type == "vector3")
+                               ? params_.translation_tolerance
+                               : params_.property_tolerance;
+  for (size_t i = 0; i < a.size(); ++i) {
+    if (std::abs(a[i] - b[i]) > tolerance) {
+      return false;
+    }
+  }
+  return true;
+}
+
+void MeshcatRecordingStream::ReinstatePrunedKeys() {
+  for (auto& [path, property_tracks] : tracks_) {
+    for (auto& [property, track] : property_tracks) {
+      if (track.pruned.has_value()) {
+        track.keys[track.pruned->first] = track.pruned->second;
+        track.last_stored = std::move(track.pruned->second);
+        track.pruned.reset();
+        --num_pruned_;
+      }
+    }
+  }
+}
+
+void MeshcatRecordingStream::StartChunk(int frame) {
+  ReinstatePrunedKeys();
+  WriteChunk();
+  chunk_start_ = frame - (frame % params_.frames_per_chunk);
+  // Seed the new chunk with the latest value of every track.
+  for (auto& [path, property_tracks] : tracks_) {
+    for (auto& [property, track] : property_tracks) {
+      track.keys.clear();
+      track.keys[chunk_start_] = track.last_stored;
+    }
+  }
+}
+
+void MeshcatRecordingStream::Flush() {
+  ReinstatePrunedKeys();
+  WriteChunk();
+}
+
+void MeshcatRecordingStream::WriteChunk() {
+  if (max_frame_ < chunk_start_) {
+    // Nothing has been recorded into this chunk.
+    return;
+  }
+
+  // Pack the chunk in the same format as Meshcat::SetAnimation, but with times
+  // relative to the start of the chunk.
+  std::stringstream message_stream;
+  msgpack::packer o(message_stream);
+  o.pack_map(3);
+  o.pack("type");
+  o.pack("set_animation");
+  o.pack("animations");
+  o.pack_array(tracks_.size());
+  for (const auto& [path, property_tracks] : tracks_) {
+    o.pack_map(2);
+    o.pack("path");
+    o.pack(full_path_(path));
+    o.pack("clip");
+    o.pack_map(3);
+    o.pack("fps");
+    o.pack(params_.frames_per_second);
+    o.pack("name");
+    o.pack("default");
+    o.pack("tracks");
+    o.pack_array(property_tracks.size());
+    for (const auto& [property, track] : property_tracks) {
+      o.pack_map(3);
+      o.pack("name");
+      o.pack("." + property);
+      o.pack("type");
+      o.pack(track.js_type);
+      o.pack("keys");
+      o.pack_array(track.keys.size());
+      for (const auto& [frame, value] : track.keys) {
+        o.pack_map(2);
+        o.pack("time");
+        o.pack(frame - chunk_start_);
+        o.pack("value");
+        std::visit(
+            [&o](const auto& x) {
+              o.pack(x);
+            },
+            value);
+      }
+    }
+  }
+  o.pack("options");
+  o.pack_map(4);
+  o.pack("play");
+  o.pack(false);
+  o.pack("loopMode");
+  o.pack(static_cast<int>(MeshcatAnimation::kLoopOnce));
+  o.pack("repetitions");
+  o.pack(1);
+  o.pack("clampWhenFinished");
+  o.pack(true);
+  const std::string message = message_stream.str();
+
+  // Compress it. Browsers can decode this format using a "deflate"
+  // DecompressionStream.
+  uLongf compressed_size = compressBound(message.size());
+  std::string compressed(compressed_size, '\0');
+  const int status =
+      compress2(reinterpret_cast<Bytef*>(compressed.data()), &compressed_size,
+                reinterpret_cast<const Bytef*>(message.data()), message.size(),
+                Z_DEFAULT_COMPRESSION);
+  if (status != Z_OK) {
+    throw std::runtime_error(
+        fmt::format("Meshcat: zlib compression failed with status {}", status));
+  }
+  compressed.resize(compressed_size);
+
+  const int chunk_index = chunk_start_ / params_.frames_per_chunk;
+  ChunkInfo info{.file = fmt::format("chunk_{:06}.msgpack.z", chunk_index),
+                 .start_frame = chunk_start_,
+                 .end_frame = max_frame_ + 1,
+                 .bytes = static_cast<int64_t>(compressed.size())};
+  WriteFileAtomically(directory_ / info.file, compressed);
+  if (!chunks_.empty() && chunks_.back().start_frame == info.start_frame) {
+    // This chunk was flushed before; replace the stale entry.
+    chunks_.back() = std::move(info);
+  } else {
+    chunks_.push_back(std::move(info));
+  }
+  WriteIndex();
+}
+
+void MeshcatRecordingStream::WriteIndex() const {
+  nlohmann::json index;
+  index["frames_per_second"] = params_.frames_per_second;
+  index["frames_per_chunk"] = params_.frames_per_chunk;
+  index["num_frames"] = max_frame_ + 1;
+  index["chunks"] = nlohmann::json::array();
+  for (const ChunkInfo& chunk : chunks_) {
+    index["chunks"].push_back({{"file", chunk.file},
+                               {"start_frame", chunk.start_frame},
+                               {"end_frame", chunk.end_frame},
+                               {"bytes", chunk.bytes}});
+  }
+  WriteFileAtomically(directory_ / "index.json", index.dump());
+}
 
 MeshcatRecording::MeshcatRecording()
     : animation_{std::make_unique<MeshcatAnimation>()} {}
@@ -13,16 +345,33 @@ MeshcatRecording::~MeshcatRecording() = default;
 
 void MeshcatRecording::StartRecording(double frames_per_second,
                                       bool set_visualizations_while_recording) {
+  stream_.reset();
   animation_ = std::make_unique<MeshcatAnimation>(frames_per_second);
   recording_ = true;
   set_visualizations_while_recording_ = set_visualizations_while_recording;
 }
 
+void MeshcatRecording::StartStreamingRecording(
+    const MeshcatStreamingRecordingParams& params,
+    bool set_visualizations_while_recording,
+    std::function<std::string(std::string_view)> full_path) {
+  stream_.reset();
+  stream_ =
+      std::make_unique<MeshcatRecordingStream>(params, std::move(full_path));
+  animation_ = std::make_unique<MeshcatAnimation>(params.frames_per_second);
+  recording_ = true;
+  set_visualizations_while_recording_ = set_visualizations_while_recording;
+}
+
 void MeshcatRecording::StopRecording() {
   recording_ = false;
+  if (stream_ != nullptr) {
+    stream_->Flush();
+  }
 }
 
 void MeshcatRecording::DeleteRecording() {
+  stream_.reset();
   const double frames_per_second = animation_->frames_per_second();
   animation_ = std::make_unique<MeshcatAnimation>(frames_per_second);
 }
@@ -33,7 +382,11 @@ bool MeshcatRecording::SetProperty(std::string_view path,
                                    std::optional<double> time_in_recording) {
   const AnimationDetail detail = CalcDetail(time_in_recording);
   if (detail.frame.has_value()) {
-    animation_->SetProperty(*detail.frame, path, property, value);
+    if (stream_ != nullptr) {
+      stream_->SetProperty(*detail.frame, path, property, value);
+    } else {
+      animation_->SetProperty(*detail.frame, path, property, value);
+    }
   }
   return detail.show_live;
 }
@@ -52,17 +405,50 @@ bool MeshcatRecording::SetTransform(std::string_view path,
                                     std::optional<double> time_in_recording) {
   const AnimationDetail detail = CalcDetail(time_in_recording);
   if (detail.frame.has_value()) {
-    animation_->SetTransform(*detail.frame, path, X_ParentPath);
+    if (stream_ != nullptr) {
+      stream_->SetTransform(*detail.frame, path, X_ParentPath);
+    } else {
+      animation_->SetTransform(*detail.frame, path, X_ParentPath);
+    }
   }
   return detail.show_live;
 }
 
+template <typename Transform>
+bool MeshcatRecording::SetTransforms(
+    const std::vector<std::string>& paths,
+    const std::vector<Transform>& X_ParentPaths,
+    std::optional<double> time_in_recording) {
+  DRAKE_DEMAND(paths.size() == X_ParentPaths.size());
+  const AnimationDetail detail = CalcDetail(time_in_recording);
+  if (detail.frame.has_value()) {
+    for (size_t i = 0; i < paths.size(); ++i) {
+      const math::RigidTransformd X_ParentPath(X_ParentPaths[i]);
+      if (stream_ != nullptr) {
+        stream_->SetTransform(*detail.frame, paths[i], X_ParentPath);
+      } else {
+        animation_->SetTransform(*detail.frame, paths[i], X_ParentPath);
+      }
+    }
+  }
+  return detail.show_live;
+}
+
+template bool MeshcatRecording::SetTransforms(
+    const std::vector<std::string>&, const std::vector<math::RigidTransformd>&,
+    std::optional<double>);
+template bool MeshcatRecording::SetTransforms(
+    const std::vector<std::string>&, const std::vector<Eigen::Matrix4d>&,
+    std::optional<double>);
+
 MeshcatRecording::AnimationDetail MeshcatRecording::CalcDetail(
     std::optional<double> time_in_recording) const {
   if (!(recording_ && time_in_recording.has_value())) {
     return AnimationDetail{};
   }
-  const int frame = animation_->frame(*time_in_recording);
+  const int frame = (stream_ != nullptr)
+                        ? stream_->frame(*time_in_recording)
+                        : animation_->frame(*time_in_recording);
   return {.frame = frame, .show_live = set_visualizations_while_recording_};
 }
 
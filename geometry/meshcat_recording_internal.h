@@ -1,17 +1,142 @@
 #pragma once
 
+#include <cstdint>
+#include <filesystem>
+#include <functional>
+#include <map>
 #include <memory>
 #include <optional>
+#include <string>
 #include <string_view>
+#include <utility>
+#include <variant>
+#include <vector>
 
 #include "drake/common/drake_copyable.h"
 #include "drake/geometry/meshcat_animation.h"
+#include "drake/geometry/meshcat_params.h"
 #include "drake/math/rigid_transform.h"
 
 namespace drake {
 namespace geometry {
 namespace internal {
 
+/* Helper class used by MeshcatRecording to write a recording to disk while it
+is being made, instead of accumulating it in a MeshcatAnimation.
+
+The frames are grouped into chunks of `frames_per_chunk` consecutive frames.
+Each chunk is packed as a self-contained "set_animation" message (with key
+times relative to the start of the chunk), compressed with zlib, and written to
+its own file as soon as a frame beyond the chunk is recorded. The directory also
+holds an `index.json` file listing the chunks, which is rewritten every time a
+chunk is written so that a partial recording is always playable. Every file is
+written to a temporary file first and then renamed into place, because Meshcat
+may be serving the files while they are rewritten.
+
+A keyframe whose value is within tolerance of the previously stored keyframe on
+the same track is pruned. So that three.js's linear interpolation remains
+faithful, the most recently pruned keyframe is reinstated just before the next
+stored keyframe (or at the end of the chunk). Every chunk begins with the latest
+value of every track, so that it can be played without its predecessors. */
+class MeshcatRecordingStream {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(MeshcatRecordingStream);
+
+  /* Creates the output directory (if necessary).
+  @param full_path maps a recorded path to the scene tree path written into
+  the chunk messages.
+  @throws std::exception if the params are invalid or the directory cannot be
+  created. */
+  MeshcatRecordingStream(
+      const MeshcatStreamingRecordingParams& params,
+      std::function<std::string(std::string_view)> full_path);
+
+  /* Calls Flush(). */
+  ~MeshcatRecordingStream();
+
+  const std::filesystem::path& directory() const { return directory_; }
+
+  double frames_per_second() const { return params_.frames_per_second; }
+
+  /* Converts from time to the frame number, as in MeshcatAnimation::frame().
+  @pre `time` ≥ 0. */
+  int frame(double time) const;
+
+  /* Returns the number of distinct chunk files written so far. */
+  int num_chunks() const { return static_cast<int>(chunks_.size()); }
+
+  /* Returns the total number of bytes of the chunk files written so far. */
+  int64_t num_bytes() const;
+
+  /* Returns the number of keyframes that were pruned so far. */
+  int64_t num_pruned() const { return num_pruned_; }
+
+  /* Adds the "position" and "quaternion" keyframes of `X_ParentPath`.
+  @throws std::exception if `frame` precedes the current chunk, i.e., belongs
+  to a chunk that has already been written to disk. */
+  void SetTransform(int frame, std::string_view path,
+                    const math::RigidTransformd& X_ParentPath);
+
+  /* Adds a property keyframe; the same rules as SetTransform() apply.
+  @tparam T One of `bool`, `double`, or `vector<double>` */
+  template <typename T>
+  void SetProperty(int frame, std::string_view path, std::string_view property,
+                   const T& value);
+
+  /* Writes the current (partially filled) chunk and the index to disk. It is
+  fine to keep adding frames to the current chunk afterwards; its file will be
+  rewritten when the chunk is next written. */
+  void Flush();
+
+ private:
+  using Value = std::variant<bool, double, std::vector<double>>;
+
+  struct Track {
+    // Must match three.js getTrackTypeForValueTypeName.
+    std::string js_type;
+    // The keyframes in the current chunk, indexed by frame.
+    std::map<int, Value> keys;
+    // The most recently stored keyframe value (possibly in an earlier chunk).
+    Value last_stored;
+    // The most recent keyframe pruned since `last_stored`, if any.
+    std::optional<std::pair<int, Value>> pruned;
+  };
+
+  struct ChunkInfo {
+    std::string file;
+    int start_frame{};
+    int end_frame{};
+    int64_t bytes{};
+  };
+
+  void SetKey(int frame, std::string_view path, std::string_view property,
+              std::string_view js_type, Value value);
+
+  // Returns true iff `value` can be pruned in favor of `track.last_stored`.
+  bool IsWithinTolerance(const Track& track, const Value& value) const;
+
+  // Moves any pruned keyframes into their chunk.
+  void ReinstatePrunedKeys();
+
+  // Writes the current chunk to disk and starts the chunk that holds `frame`.
+  void StartChunk(int frame);
+
+  void WriteChunk();
+  void WriteIndex() const;
+
+  const MeshcatStreamingRecordingParams params_;
+  const std::filesystem::path directory_;
+  const std::function<std::string(std::string_view)> full_path_;
+
+  // A map of path => property => track, ordered for deterministic output.
+  std::map<std::string, std::map<std::string, Track, std::less<>>, std::less<>>
+      tracks_;
+  int chunk_start_{0};
+  int max_frame_{-1};
+  int64_t num_pruned_{0};
+  std::vector<ChunkInfo> chunks_;
+};
+
 /* Helper class used by Meshcat to implement all of the state machine logic for
 creating recordings. For clarity, note the distinction between MeshcatAnimation
 (the container object for the animation track data) and MeshcatRecording (this
@@ -31,13 +156,26 @@ class MeshcatRecording {
                       bool set_visualizations_while_recording);
 
   /* The implementation of the same-named function on Meshcat. Refer to that
-  public API for details. */
+  public API for details.
+  @param full_path maps a recorded path to its scene tree path. */
+  void StartStreamingRecording(
+      const MeshcatStreamingRecordingParams& params,
+      bool set_visualizations_while_recording,
+      std::function<std::string(std::string_view)> full_path);
+
+  /* The implementation of the same-named function on Meshcat. Refer to that
+  public API for details. When streaming, also flushes the stream to disk. */
   void StopRecording();
 
   /* The implementation of the same-named function on Meshcat. Refer to that
   public API for details. */
   void DeleteRecording();
 
+  /* Returns the stream of the current streaming recording, or nullptr if the
+  current recording is held in memory. The return value is invalidated by
+  StartRecording, StartStreamingRecording, or DeleteRecording. */
+  MeshcatRecordingStream* get_mutable_stream() { return stream_.get(); }
+
   /* The return value is invalidated by StartRecording or DeleteRecording. */
   const MeshcatAnimation& get_animation() const { return *animation_; }
 
@@ -67,6 +205,19 @@ class MeshcatRecording {
                     const math::RigidTransformd& X_ParentPath,
                     std::optional<double> time_in_recording);
 
+  /* Like SetTransform, but for many paths at once. The animation decision is
+  made once for the whole batch. When a keyframe is recorded, each homogeneous
+  matrix is converted to a RigidTransformd (since the animation only stores
+  position and orientation).
+  @pre `paths` and `X_ParentPaths` have the same size.
+  @throws std::exception if a keyframe is recorded and one of the matrices is
+  not a valid rigid transform.
+  @tparam Transform One of `RigidTransformd` or `Eigen::Matrix4d`. */
+  template <typename Transform>
+  bool SetTransforms(const std::vector<std::string>& paths,
+                     const std::vector<Transform>& X_ParentPaths,
+                     std::optional<double> time_in_recording);
+
  private:
   struct AnimationDetail {
     // A frame number for use with MeshcatAnimation, or nullopt if this event
@@ -85,6 +236,9 @@ class MeshcatRecording {
 
   /* The current animation (may be empty, but is never nullptr). */
   std::unique_ptr<MeshcatAnimation> animation_;
+  /* The current disk-backed stream; when non-null, it receives the recorded
+  frames instead of `animation_`. */
+  std::unique_ptr<MeshcatRecordingStream> stream_;
   bool recording_{false};
   bool set_visualizations_while_recording_{false};
 };
@@ -501,6 +501,17 @@ struct SetTransformData {
   MSGPACK_DEFINE_MAP(type, path, matrix);
 };
 
+// Note that this struct is unique to Drake's integration of meshcat; it is not
+// part of upstream meshcat.js. We handle it directly within meshcat.html, by
+// feeding one set_transform command per path into meshcat.js. The `matrices`
+// are the column-major 4x4 matrices for each path, concatenated.
+struct SetTransformsData {
+  std::string type{"set_transforms"};
+  std::vector<std::string> paths;
+  std::vector<double> matrices;
+  MSGPACK_DEFINE_MAP(type, paths, matrices);
+};
+
 // Note that this struct is unique to Drake's integration of meshcat; it is not
 // part of upstream meshcat.js. We handle it directly within meshcat.html,
 // without ever feeding it into meshcat.js.
@@ -5,6 +5,7 @@
 #include <optional>
 #include <string>
 #include <utility>
+#include <vector>
 
 #include <fmt/format.h>
 
@@ -385,12 +386,17 @@ template <typename T>
 void MeshcatVisualizer<T>::SetTransforms(
     const systems::Context<T>& context,
     const QueryObject<T>& query_object) const {
+  std::vector<std::string> paths;
+  std::vector<math::RigidTransformd> X_WFs;
+  paths.reserve(dynamic_frames_.size());
+  X_WFs.reserve(dynamic_frames_.size());
   for (const auto& [frame_id, path] : dynamic_frames_) {
-    const math::RigidTransformd X_WF =
-        internal::convert_to_double(query_object.GetPoseInWorld(frame_id));
-    meshcat_->SetTransform(path, X_WF,
-                           ExtractDoubleOrThrow(context.get_time()));
+    paths.push_back(path);
+    X_WFs.push_back(
+        internal::convert_to_double(query_object.GetPoseInWorld(frame_id)));
   }
+  meshcat_->SetTransforms(paths, X_WFs,
+                          ExtractDoubleOrThrow(context.get_time()));
 }
 
 template <typename T>
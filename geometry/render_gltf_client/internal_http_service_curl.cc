@@ -199,30 +199,38 @@ HttpServiceCurl::HttpServiceCurl() : HttpService() {
   static CURLcode ignored =
       curl_global_init(CURL_GLOBAL_ALL | CURL_GLOBAL_ACK_EINTR);
   unused(ignored);
+  curl_ = curl_easy_init();
+  DRAKE_DEMAND(curl_ != nullptr);
 }
 
-HttpServiceCurl::~HttpServiceCurl() {}
+HttpServiceCurl::~HttpServiceCurl() {
+  curl_easy_cleanup(curl_);
+}
 
 HttpResponse HttpServiceCurl::DoPostForm(const std::string& temp_directory,
                                          const std::string& url,
                                          const DataFieldsMap& data_fields,
                                          const FileFieldsMap& file_fields,
                                          bool verbose) {
+  // Reuse the handle from the previous post, along with its open connections.
+  CURL* curl = curl_;
+  curl_easy_setopt(curl, CURLOPT_TCP_KEEPALIVE, 1L);
+
   // Create and fill out a <form> to POST.
-  CURL* curl{nullptr};
   CURLcode result;
-  curl = curl_easy_init();
-  DRAKE_DEMAND(curl != nullptr);
   curl_mime* form{nullptr};
   struct curl_slist* headerlist{nullptr};
   form = curl_mime_init(curl);
 
   /* Defined to make cleanup easier before throwing any possible exceptions.
-   Frees resources for `curl`, `form`, and `headerlist`. */
+   Frees resources for `form` and `headerlist`, and resets `curl` for the next
+   post.  Resetting the handle clears the options set below (some of which
+   point to local variables), but keeps its open connections (and its DNS
+   cache), so that a keep-alive connection to the server can be reused. */
   auto cleanup_curl = [](CURL* c, curl_mime* f, curl_slist* h_list) {
+    curl_easy_reset(c);
     if (f != nullptr) curl_mime_free(f);
     if (h_list != nullptr) curl_slist_free_all(h_list);
-    curl_easy_cleanup(c);
   };
 
   // Used when verbose, needed in scope for logging after curl_easy_perform.
@@ -12,7 +12,11 @@ namespace geometry {
 namespace render_gltf_client {
 namespace internal {
 
-/* An HttpService that uses libcurl to communicate with the server. */
+/* An HttpService that uses libcurl to communicate with the server.  All of the
+ posts from one instance reuse the same libcurl handle, so that its connection
+ to the server is kept alive from one post to the next (for servers that allow
+ persistent connections).  As such, an instance must not be used by more than
+ one thread at a time. */
 class HttpServiceCurl : public HttpService {
  public:
   HttpServiceCurl();
@@ -26,6 +30,10 @@ class HttpServiceCurl : public HttpService {
                           const DataFieldsMap& data_fields,
                           const FileFieldsMap& file_fields,
                           bool verbose = false) override;
+
+ private:
+  // The libcurl easy handle (a CURL*, which libcurl declares to be void*).
+  void* curl_{};
 };
 
 }  // namespace internal
@@ -105,6 +105,10 @@ void VerifyImageSize(const std::string& image_path, Image* image,
 
 }  // namespace
 
+std::string MakeAssetUri(std::string_view sha256) {
+  return fmt::format("drake-asset:{}", sha256);
+}
+
 RenderClient::RenderClient(const RenderEngineGltfClientParams& params)
     : temp_directory_{drake::temp_directory()},
       params_{params},
@@ -132,7 +136,8 @@ RenderClient::~RenderClient() {
 std::string RenderClient::RenderOnServer(
     const RenderCameraCore& camera_core, RenderImageType image_type,
     const std::string& scene_path, const std::optional<std::string>& mime_type,
-    const std::optional<DepthRange>& depth_range) const {
+    const std::optional<DepthRange>& depth_range,
+    const SceneAssets& assets) const {
   // Make sure depth_range is only provided for depth images.
   const bool is_depth_type = (image_type == RenderImageType::kDepthDepth32F);
   DRAKE_THROW_UNLESS(depth_range.has_value() == is_depth_type);
@@ -164,11 +169,40 @@ std::string RenderClient::RenderOnServer(
   }
   AddField(&field_map, "submit", "Render");
 
+  // Send the content of only those assets that the server hasn't received.
+  bool withheld_assets = false;
+  for (const auto& [sha256, content] : assets) {
+    if (uploaded_assets_.contains(sha256)) {
+      withheld_assets = true;
+    } else {
+      AddField(&field_map, "asset_" + sha256, std::string(content));
+    }
+  }
+
   const std::string url = params_.GetUrl();
   // Post the form and validate the results.
-  const HttpResponse response = http_service_->PostForm(
-      temp_directory_, url, field_map, {{"scene", {scene_path, mime_type}}},
-      params_.verbose);
+  const FileFieldsMap file_fields{{"scene", {scene_path, mime_type}}};
+  HttpResponse response = http_service_->PostForm(
+      temp_directory_, url, field_map, file_fields, params_.verbose);
+  if (response.http_code == 409 && withheld_assets) {
+    // The server no longer has some of the assets we've uploaded before, so
+    // try again with all of them.
+    if (params_.verbose) {
+      log()->debug(
+          "RenderClient: the server at {} is missing previously uploaded "
+          "assets, uploading all {} assets of the scene.",
+          url, assets.size());
+    }
+    if (response.data_path.has_value()) {
+      fs::remove(response.data_path.value());
+    }
+    uploaded_assets_.clear();
+    for (const auto& [sha256, content] : assets) {
+      AddField(&field_map, "asset_" + sha256, std::string(content));
+    }
+    response = http_service_->PostForm(temp_directory_, url, field_map,
+                                       file_fields, params_.verbose);
+  }
   if (!response.Good()) {
     /* Server may have responded with meaningful text, try and load the file
      as a string. */
@@ -195,6 +229,10 @@ std::string RenderClient::RenderOnServer(
         url, service_error_message, response.http_code, server_message));
   }
 
+  for (const auto& [sha256, content] : assets) {
+    uploaded_assets_.insert(sha256);
+  }
+
   // If the server did not respond with a file, there is nothing to load.
   if (!response.data_path.has_value()) {
     throw std::runtime_error(fmt::format(
@@ -290,6 +328,7 @@ void RenderClient::LoadDepthImage(const std::string& path,
 
 void RenderClient::SetHttpService(std::unique_ptr<HttpService> service) {
   http_service_ = std::move(service);
+  uploaded_assets_.clear();
 }
 
 }  // namespace internal
@@ -1,8 +1,11 @@
 #pragma once
 
+#include <map>
 #include <memory>
 #include <optional>
+#include <set>
 #include <string>
+#include <string_view>
 
 #include "drake/common/drake_copyable.h"
 #include "drake/geometry/render/render_camera.h"
@@ -22,6 +25,16 @@ enum RenderImageType {
   kDepthDepth32F = 2,  ///< The depth frame.
 };
 
+/* The assets referenced by a scene file that uses asset reuse (see
+ RenderEngineGltfClientParams::reuse_uploaded_assets), keyed by the sha256 hash
+ of their content.  The content of each asset is the `data:` URI that the scene
+ file's `drake-asset:{sha256}` reference stands for. */
+using SceneAssets = std::map<std::string, std::string_view>;
+
+/* Returns the reference, `drake-asset:{sha256}`, that stands for the asset
+ with the given hash in a scene file. */
+std::string MakeAssetUri(std::string_view sha256);
+
 /* The client which communicates with a render server. */
 class RenderClient {
  public:
@@ -63,6 +76,12 @@ class RenderClient {
      When `image_type` describes a depth render, this parameter must be provided
      from the DepthRenderCamera::depth_range().  May not have a value for color
      or label image renders.
+   @param assets
+     The assets referenced by the scene file, when get_params()
+     .reuse_uploaded_assets is true.  Only the assets that this client has not
+     yet successfully uploaded to the server are sent with the scene.  If the
+     server responds that it is missing any of them (HTTP code 409), the
+     request is repeated once with all of the assets.
    @return
      A successful download of a rendering from the server will return the path
      to the downloaded file, which will be exactly
@@ -77,8 +96,8 @@ class RenderClient {
       const render::RenderCameraCore& camera_core, RenderImageType image_type,
       const std::string& scene_path,
       const std::optional<std::string>& mime_type = std::nullopt,
-      const std::optional<render::DepthRange>& depth_range =
-          std::nullopt) const;
+      const std::optional<render::DepthRange>& depth_range = std::nullopt,
+      const SceneAssets& assets = {}) const;
 
   //@}
 
@@ -191,13 +210,17 @@ class RenderClient {
 
   //@}
 
-  /* (Internal use only) for testing. */
+  /* (Internal use only) for testing.  The client forgets which assets it has
+   uploaded, since the new service might communicate with a different
+   server. */
   void SetHttpService(std::unique_ptr<HttpService> service);
 
  private:
   const std::string temp_directory_;
   const RenderEngineGltfClientParams params_;
   std::unique_ptr<HttpService> http_service_;
+  // The hashes of the assets that the server has successfully received.
+  mutable std::set<std::string> uploaded_assets_;
 };
 
 }  // namespace internal
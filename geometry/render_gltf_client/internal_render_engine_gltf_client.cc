@@ -7,6 +7,7 @@
 #include <map>
 #include <set>
 #include <string_view>
+#include <unordered_map>
 #include <utility>
 #include <vector>
 
@@ -20,6 +21,7 @@
 #include "drake/common/find_resource.h"
 #include "drake/common/never_destroyed.h"
 #include "drake/common/overloaded.h"
+#include "drake/common/sha256.h"
 #include "drake/common/text_logging.h"
 #include "drake/common/yaml/yaml_io.h"
 
@@ -249,6 +251,35 @@ void ChangeToLabelMaterials(nlohmann::json* gltf, const Rgba& color) {
   }
 }
 
+/* Replaces the `data:` URI of each of the gltf's buffers and images with a
+ reference to the asset (see MakeAssetUri()), and returns the assets, each
+ mapped to its sha256 hash.  The assets that are found in `previous` are moved
+ from it, reusing their hashes rather than computing them again. */
+std::unordered_map<std::string, std::string> ExtractAssets(
+    nlohmann::json* gltf,
+    std::unordered_map<std::string, std::string>* previous = nullptr) {
+  std::unordered_map<std::string, std::string> assets;
+  for (const char* array_name : {"buffers", "images"}) {
+    if (!gltf->contains(array_name)) continue;
+    for (nlohmann::json& item : (*gltf)[array_name]) {
+      if (!item.contains("uri")) continue;
+      std::string& uri = item["uri"].get_ref<std::string&>();
+      if (!uri.starts_with("data:")) continue;
+      auto iter = assets.find(uri);
+      if (iter == assets.end() && previous != nullptr) {
+        auto node = previous->extract(uri);
+        if (!node.empty()) iter = assets.insert(std::move(node)).position;
+      }
+      if (iter == assets.end()) {
+        std::string sha256 = Sha256::Checksum(uri).to_string();
+        iter = assets.emplace(std::move(uri), std::move(sha256)).first;
+      }
+      item["uri"] = MakeAssetUri(iter->second);
+    }
+  }
+  return assets;
+}
+
 }  // namespace
 
 RenderEngineGltfClient::RenderEngineGltfClient(
@@ -288,14 +319,14 @@ void RenderEngineGltfClient::DoRenderColorImage(
   const std::string scene_path =
       fs::path(temp_directory()) /
       GetSceneFileName(ImageType::kColor, color_scene_id);
-  ExportScene(scene_path, ImageType::kColor);
+  const SceneAssets assets = ExportScene(scene_path, ImageType::kColor);
   if (get_params().verbose) {
     LogFrameGltfExportPath(ImageType::kColor, scene_path);
   }
 
   const std::string image_path = render_client_->RenderOnServer(
       camera.core(), VtkToRenderImageType(ImageType::kColor), scene_path,
-      MimeType());
+      MimeType(), std::nullopt, assets);
   if (get_params().verbose) {
     LogFrameServerResponsePath(ImageType::kColor, image_path);
   }
@@ -327,14 +358,14 @@ void RenderEngineGltfClient::DoRenderDepthImage(
   const std::string scene_path =
       fs::path(temp_directory()) /
       GetSceneFileName(ImageType::kDepth, depth_scene_id);
-  ExportScene(scene_path, ImageType::kDepth);
+  const SceneAssets assets = ExportScene(scene_path, ImageType::kDepth);
   if (get_params().verbose) {
     LogFrameGltfExportPath(ImageType::kDepth, scene_path);
   }
 
   const std::string image_path = render_client_->RenderOnServer(
       camera.core(), VtkToRenderImageType(ImageType::kDepth), scene_path,
-      MimeType(), camera.depth_range());
+      MimeType(), camera.depth_range(), assets);
   if (get_params().verbose) {
     LogFrameServerResponsePath(ImageType::kDepth, image_path);
   }
@@ -367,14 +398,14 @@ void RenderEngineGltfClient::DoRenderLabelImage(
   const std::string scene_path =
       fs::path(temp_directory()) /
       GetSceneFileName(ImageType::kLabel, label_scene_id);
-  ExportScene(scene_path, ImageType::kLabel);
+  const SceneAssets assets = ExportScene(scene_path, ImageType::kLabel);
   if (get_params().verbose) {
     LogFrameGltfExportPath(ImageType::kLabel, scene_path);
   }
 
   const std::string image_path = render_client_->RenderOnServer(
       camera.core(), VtkToRenderImageType(ImageType::kLabel), scene_path,
-      MimeType());
+      MimeType(), std::nullopt, assets);
   if (get_params().verbose) {
     LogFrameServerResponsePath(ImageType::kLabel, image_path);
   }
@@ -413,8 +444,8 @@ std::string RenderEngineGltfClient::DoGetParameterYaml() const {
   return yaml::SaveYamlString(get_params(), "RenderEngineGltfClientParams");
 }
 
-void RenderEngineGltfClient::ExportScene(const std::string& export_path,
-                                         ImageType image_type) const {
+SceneAssets RenderEngineGltfClient::ExportScene(const std::string& export_path,
+                                                ImageType image_type) const {
   // TODO(SeanCurtis-TRI): Given the ability to edit the gltf in place, we
   //  should use VTK to create the gltf and merge the gltfs *once* and use that
   //  as the reference gltf. Then, with a mapping from geometry id to node
@@ -428,11 +459,29 @@ void RenderEngineGltfClient::ExportScene(const std::string& export_path,
   const std::string gltf_contents = gltf_exporter->WriteToString();
   nlohmann::json gltf = nlohmann::json::parse(gltf_contents);
 
+  // Replace the (re-exported) VTK assets with references, reusing the hashes
+  // of the assets that haven't changed since the previous export.
+  const bool reuse_assets = get_params().reuse_uploaded_assets;
+  SceneAssets assets;
+  if (reuse_assets) {
+    AssetHashes& exported = exported_assets_[image_type];
+    exported = ExtractAssets(&gltf, &exported);
+    for (const auto& [content, sha256] : exported) {
+      assets.emplace(sha256, content);
+    }
+  }
+
   // Merge in gltf files. The path below is an imaginary path that should not
   // appear in any error messages -- unless we start using extensions/extras in
   // RenderEngineVtk and VTK starts exporting those values into a glTF file.
   MergeRecord merge_record("scene_graph.gltf");
   for (const auto& [id, record] : gltfs_) {
+    // When reusing assets, the contents already reference the assets.
+    if (reuse_assets) {
+      for (const auto& [content, sha256] : record.assets) {
+        assets.emplace(sha256, content);
+      }
+    }
     nlohmann::json temp = record.contents;
     if (image_type == render_vtk::internal::kLabel) {
       const Rgba color = RenderEngine::MakeRgbFromLabel(record.label);
@@ -507,6 +556,7 @@ void RenderEngineGltfClient::ExportScene(const std::string& export_path,
     throw std::runtime_error(
         "RenderEngineGltfClient: Error writing exported scene data to disk.");
   }
+  return assets;
 }
 
 void RenderEngineGltfClient::DoUpdateVisualPose(
@@ -622,6 +672,13 @@ bool RenderEngineGltfClient::ImplementGltf(
   // that point. So, we'll simply convert all file URIs to data URIs.
   EmbedFileUris(&mesh_data, mesh.source());
 
+  // When reusing uploaded assets, hash the embedded assets once, here, rather
+  // than on every export.
+  AssetHashes assets;
+  if (get_params().reuse_uploaded_assets) {
+    assets = ExtractAssets(&mesh_data);
+  }
+
   // TODO(SeanCurtis-TRI) What to do about a gltf that has no materials? We need
   // to apply the same logic of the data.properties as we do to OBJ. We'll
   // defer for now because the expectation is that the gltf is used *because*
@@ -639,7 +696,8 @@ bool RenderEngineGltfClient::ImplementGltf(
                   .root_nodes = std::move(root_nodes),
                   .scale = mesh.scale3(),
                   .X_WG = data.X_WG,
-                  .label = GetRenderLabelOrThrow(data.properties)}});
+                  .label = GetRenderLabelOrThrow(data.properties),
+                  .assets = std::move(assets)}});
   return true;
 }
 
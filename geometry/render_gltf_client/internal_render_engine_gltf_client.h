@@ -4,6 +4,7 @@
 #include <map>
 #include <memory>
 #include <string>
+#include <unordered_map>
 
 #include <nlohmann/json.hpp>
 
@@ -90,9 +91,12 @@ class DRAKE_NO_EXPORT RenderEngineGltfClient
   std::string DoGetParameterYaml() const override;
 
   /* Exports the `RenderEngineVtk::pipelines_[image_type]` VTK scene to a
-   glTF file given `export_path`. */
-  void ExportScene(const std::string& export_path,
-                   render_vtk::internal::ImageType image_type) const;
+   glTF file given `export_path`.  When get_params().reuse_uploaded_assets is
+   true, the scene's assets are replaced by references; they are returned, and
+   remain valid until the next export of the same `image_type` or a change to
+   the registered geometries.  Otherwise, returns no assets. */
+  SceneAssets ExportScene(const std::string& export_path,
+                          render_vtk::internal::ImageType image_type) const;
 
   /* Overrides RenderEngineVtk's default handling of the mesh types. We want to
    detect .gltf meshes and handle them in a special way. */
@@ -116,6 +120,15 @@ class DRAKE_NO_EXPORT RenderEngineGltfClient
 
   std::unique_ptr<RenderClient> render_client_;
 
+  // The content (`data:` URI) of assets, each mapped to its sha256 hash.
+  using AssetHashes = std::unordered_map<std::string, std::string>;
+
+  // When reusing uploaded assets, the assets of the most recent export of
+  // each pipeline's VTK scene. Exported assets that are found here don't have
+  // to be hashed again.
+  mutable std::map<render_vtk::internal::ImageType, AssetHashes>
+      exported_assets_;
+
   struct GltfRecord {
     // The name for the .gltf file.
     //   If the glTF came from disk, it will be the file path, otherwise the
@@ -139,6 +152,8 @@ class DRAKE_NO_EXPORT RenderEngineGltfClient
     math::RigidTransformd X_WG;
     // The render label associated with the geometry.
     render::RenderLabel label;
+    // When reusing uploaded assets, the assets that `contents` references.
+    AssetHashes assets;
   };
 
   // TODO(SeanCurtis-TRI) Based on the file path, I should load a gltf *one
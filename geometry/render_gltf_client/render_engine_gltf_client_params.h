@@ -20,6 +20,7 @@ struct RenderEngineGltfClientParams {
     a->Visit(DRAKE_NVP(render_endpoint));
     a->Visit(DRAKE_NVP(verbose));
     a->Visit(DRAKE_NVP(cleanup));
+    a->Visit(DRAKE_NVP(reuse_uploaded_assets));
   }
 
   /** The base url of the server communicate with.
@@ -49,6 +50,17 @@ struct RenderEngineGltfClientParams {
    directory described by drake::temp_directory(). */
   bool cleanup = true;
 
+  /** Whether or not the client should upload each of the scene's assets (the
+   glTF buffers and images, e.g., meshes and textures) only once.  By default
+   (`reuse_uploaded_assets=false`), every scene file uploaded to the server is
+   self-contained.  When `true`, the client replaces each embedded asset in the
+   scene file with a reference to its content hash, and uploads the content
+   only if it has not already uploaded it to the server; for a scene whose
+   geometry doesn't change, each render then only transmits the node
+   transforms, cameras, and materials.  The server must support the "Asset
+   Reuse" extension of the @ref render_engine_gltf_client_server_api. */
+  bool reuse_uploaded_assets = false;
+
   /** Returns the post-processed full url used for client-server communication.
    The full url is constructed as `{base_url}/{render_endpoint}` where all
    trailing slashes in `base_url` and all leading slashes in `render_endpoint`
@@ -27,8 +27,10 @@ time it needs to render.
 
 The primary design goal for this RPC architecture is for batch-mode dataset
 generation (e.g., for machine learning), not for realtime simulation.
-We transmit the entire scene its entirety for each RPC request; the protocol
-does not support incremental changes to the scene.
+By default, we transmit the entire scene its entirety for each RPC request.
+Clients that render the same geometry many times can opt in to the
+[Asset Reuse](#asset-reuse) extension, in which the heavy assets of the scene
+(meshes and textures) are uploaded only once.
 
 The server is welcome to add in fixed scene elements beyond what's transmitted
 (e.g., the server could add in a building's walls and floor, rather than having
@@ -47,6 +49,7 @@ its own.
     - [Allowed Image Response Types](#allowed-image-response-types)
     - [Notes on glTF Camera Specification](#notes-on-gltf-camera-specification)
     - [Notes on Communicating Errors](#notes-on-communicating-errors)
+    - [Asset Reuse](#asset-reuse)
 - [Notes on Rendering Label Images](#notes-on-rendering-label-images)
 - [Existing Server Implementations](#existing-server-implementations)
 - [Developing your own Server](#developing-your-own-server)
@@ -62,7 +65,7 @@ of other metadata attributes related to the image being rendered (such as
 `width` and `height`), as well as the full specification of the
 systems::sensors::CameraInfo intrinsics being rendered.  The scene file must
 use the glTF 2.0 file format and must only use embedded assets (with `data:`
-URIs). A future version of this protocol might allow for non-embedded assets.
+URIs), unless the client has opted in to [Asset Reuse](#asset-reuse).
 
 The server is **expected to block** (delay sending a response) until it is ready
 to transmit the final rendered image back to the client.  This provides for an
@@ -354,6 +357,30 @@ required, the user of the server will have no hints as to what is going wrong
 with the client-server communication.  When the file response is provided, this
 information will be included in the exception message produced by the client.
 
+### Asset Reuse {#asset-reuse}
+<hr>
+
+When RenderEngineGltfClientParams::reuse_uploaded_assets is `true`, the client
+doesn't embed the scene's assets (the `"uri"` of each of the glTF `"buffers"`
+and `"images"`) in the scene file.  Instead, it replaces each `data:` URI with
+a reference of the form `drake-asset:{sha256}`, where `{sha256}` is the sha256
+hash of the (complete) `data:` URI string.  The content of an asset that the
+client has not yet uploaded to the server is sent alongside the scene, as form
+data `<input type="text" name="asset_{sha256}">` whose value is the `data:`
+URI.  Once the server has responded successfully to a request that included an
+asset, the client assumes that the server has kept it, and doesn't send it
+again.
+
+The server should store the assets it receives, keyed by their hash (the server
+may use the hash to validate that the full asset was uploaded), and restore
+each `drake-asset:` reference to its `data:` URI before rendering the scene.
+If the scene references an asset that the server doesn't have (e.g., because
+the server was restarted, or evicted it from its store), the server must
+respond with the HTTP response code `409` (Conflict).  The client will then
+repeat the request once, with all of the scene's assets included.  Because the
+assets are identified by their content, the server may share its store among
+all of its clients.
+
 ## Notes on Rendering Label Images {#notes-on-rendering-label-images}
 <hr>
 
@@ -116,6 +116,149 @@ class TestGltfRenderBinary(unittest.TestCase):
             with self.subTest(image=f"{image_type}.{ext}"):
                 self._check_call(proc_args)
 
+    def test_server_vtk_backend_serve(self):
+        """Renders each type of images twice with a single vtk backend process
+        that serves the requests from its stdin, and checks that the second
+        rendering reuses the resident scene."""
+
+        server_vtk_backend = self.runfiles.Rlocation(
+            "drake/geometry/render_gltf_client/server_vtk_backend"
+        )
+
+        tmp_dir = os.path.join(
+            os.environ.get("TEST_TMPDIR", "/tmp"), "server_vtk_backend_serve"
+        )
+        os.makedirs(tmp_dir, exist_ok=True)
+        gltf_input_path = os.path.join(tmp_dir, "test.gltf")
+        with open(gltf_input_path, "w") as f:
+            f.write(MINIMAL_GLTF)
+
+        proc = subprocess.Popen(
+            [server_vtk_backend, "--serve", "--max_resident_scenes=3"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        try:
+            for image_type, magic in zip(
+                ["color", "depth", "label"],
+                [b"\x89PNG", b"II*\x00", b"\x89PNG"],
+            ):
+                job = {
+                    "input_path": gltf_input_path,
+                    "scene_sha256": "0123456789abcdef",
+                    "geometry_sha256": "fedcba9876543210",
+                    "image_type": image_type,
+                    "width": 64,
+                    "height": 48,
+                    "near": 0.01,
+                    "far": 10.0,
+                    "focal_x": 0.052227,
+                    "focal_y": 0.052227,
+                    "center_x": 32,
+                    "center_y": 24,
+                    "min_depth": 0.01,
+                    "max_depth": 10.0,
+                }
+                for resident in [False, True]:
+                    with self.subTest(image_type=image_type, resident=resident):
+                        proc.stdin.write(json.dumps(job).encode() + b"\n")
+                        proc.stdin.flush()
+                        reply = json.loads(proc.stdout.readline())
+                        self.assertNotIn("error", reply)
+                        self.assertEqual(reply["resident"], resident)
+                        image = proc.stdout.read(reply["size"])
+                        self.assertEqual(image[:4], magic)
+
+            # An invalid request is reported, and the backend keeps serving.
+            proc.stdin.write(b'{"image_type": "color"}\n')
+            proc.stdin.flush()
+            reply = json.loads(proc.stdout.readline())
+            self.assertIn("error", reply)
+        finally:
+            proc.stdin.close()
+            self.assertEqual(proc.wait(), 0)
+
+    def test_server_vtk_backend_serve_moving_scene(self):
+        """Renders two frames of a scene that differ only in the pose of one
+        geometry with a single vtk backend process, and checks that the second
+        frame reuses the resident scene, posed anew, and renders the same
+        image as rendering the second frame from scratch."""
+
+        server_vtk_backend = self.runfiles.Rlocation(
+            "drake/geometry/render_gltf_client/server_vtk_backend"
+        )
+        label_scene = self.runfiles.Rlocation(
+            "drake/geometry/render_gltf_client/test/test_label_scene.gltf"
+        )
+
+        tmp_dir = os.path.join(
+            os.environ.get("TEST_TMPDIR", "/tmp"),
+            "server_vtk_backend_serve_moving_scene",
+        )
+        os.makedirs(tmp_dir, exist_ok=True)
+        with open(label_scene, encoding="utf-8") as f:
+            scene = json.load(f)
+        frame_paths = []
+        for i in range(2):
+            frame_path = os.path.join(tmp_dir, f"frame_{i}.gltf")
+            with open(frame_path, "w", encoding="utf-8") as f:
+                json.dump(scene, f)
+            frame_paths.append(frame_path)
+            # Move the first geometry for the next frame.
+            scene["nodes"][0]["matrix"][12] += 0.05
+
+        # A 45 degree field of view.
+        params = {
+            "image_type": "label",
+            "width": 64,
+            "height": 48,
+            "near": 0.01,
+            "far": 10.0,
+            "focal_x": 77.25,
+            "focal_y": 77.25,
+            "center_x": 32,
+            "center_y": 24,
+        }
+        proc = subprocess.Popen(
+            [server_vtk_backend, "--serve", "--max_resident_scenes=1"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        images = []
+        try:
+            for i, frame_path in enumerate(frame_paths):
+                job = {
+                    "input_path": frame_path,
+                    "scene_sha256": f"frame_{i}",
+                    "geometry_sha256": "0123456789abcdef",
+                    **params,
+                }
+                proc.stdin.write(json.dumps(job).encode() + b"\n")
+                proc.stdin.flush()
+                reply = json.loads(proc.stdout.readline())
+                self.assertNotIn("error", reply)
+                self.assertEqual(reply["resident"], i > 0)
+                images.append(proc.stdout.read(reply["size"]))
+        finally:
+            proc.stdin.close()
+            self.assertEqual(proc.wait(), 0)
+        self.assertNotEqual(images[0], images[1])
+
+        # The second frame matches the one rendered from scratch.
+        image_output_path = os.path.join(tmp_dir, "frame_1.png")
+        proc_args = [
+            server_vtk_backend,
+            "--input_path",
+            frame_paths[1],
+            "--output_path",
+            image_output_path,
+        ]
+        for name, value in params.items():
+            proc_args += [f"--{name}", str(value)]
+        self._check_call(proc_args)
+        with open(image_output_path, "rb") as f:
+            self.assertEqual(f.read(), images[1])
+
     def test_server_demo(self):
         """A minimal smoke test to ensure running the server demo won't crash,
         e.g., the imports are correct.  It doesn't currently test receiving a
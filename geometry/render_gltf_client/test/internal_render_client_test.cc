@@ -429,6 +429,86 @@ TEST_F(RenderClientTest, RenderOnServerValidImageReturn) {
   EXPECT_EQ(response_tiff, expected_tiff_path);
 }
 
+/* Verifies that assets are only sent until the server has received them, and
+ that all of them are sent again when the server reports missing assets. */
+TEST_F(RenderClientTest, RenderOnServerAssetReuse) {
+  RenderClient client{params_};
+
+  // The asset hashes sent with each request.
+  std::vector<std::set<std::string>> uploads;
+  // The http code for the server to respond with.
+  int http_code = 200;
+  DoPostFormCallback callback = [&](const DataFieldsMap& data_fields,
+                                    const FileFieldsMap&) {
+    std::set<std::string>& uploaded = uploads.emplace_back();
+    for (const auto& [name, value] : data_fields) {
+      if (name.starts_with("asset_")) {
+        uploaded.insert(name.substr(6));
+        EXPECT_EQ(value, "data:" + name.substr(6));
+      }
+    }
+    const std::string response_path =
+        scratch_ / fmt::format("{}.response", uploads.size());
+    if (http_code == 409) {
+      http_code = 200;  // Respond with success to the retry.
+      return HttpResponse{.http_code = 409};
+    }
+    fs::copy_file(kTestRgbaImagePath, response_path);
+    return HttpResponse{.http_code = 200, .data_path = response_path};
+  };
+  client.SetHttpService(std::make_unique<ProxyService>(callback));
+
+  // The content of an asset is its `data:` URI; the "hashes" of these are
+  // fake, but the client doesn't check them.
+  const std::string content_a = "data:a";
+  const std::string content_b = "data:b";
+  auto render = [&](const SceneAssets& assets) {
+    const std::string response = client.RenderOnServer(
+        color_camera_.core(), RenderImageType::kColorRgba8U, fake_scene_path_,
+        std::nullopt, std::nullopt, assets);
+    fs::remove(response);
+  };
+  using Hashes = std::set<std::string>;
+
+  // The first render sends its asset.
+  render({{"a", content_a}});
+  ASSERT_EQ(uploads.size(), 1);
+  EXPECT_EQ(uploads.back(), Hashes({"a"}));
+
+  // The next render only sends the new asset.
+  render({{"a", content_a}, {"b", content_b}});
+  ASSERT_EQ(uploads.size(), 2);
+  EXPECT_EQ(uploads.back(), Hashes({"b"}));
+
+  // A render with known assets sends nothing.
+  render({{"a", content_a}, {"b", content_b}});
+  ASSERT_EQ(uploads.size(), 3);
+  EXPECT_EQ(uploads.back(), Hashes());
+
+  // When the server is missing assets, the client retries with all of them.
+  http_code = 409;
+  render({{"a", content_a}, {"b", content_b}});
+  ASSERT_EQ(uploads.size(), 5);
+  EXPECT_EQ(uploads[3], Hashes());
+  EXPECT_EQ(uploads[4], Hashes({"a", "b"}));
+
+  // A new service (i.e., possibly a new server) gets all of the assets.
+  client.SetHttpService(std::make_unique<ProxyService>(callback));
+  render({{"a", content_a}});
+  ASSERT_EQ(uploads.size(), 6);
+  EXPECT_EQ(uploads.back(), Hashes({"a"}));
+
+  // A server that fails for reasons other than missing assets is not retried,
+  // and the assets are not considered uploaded.
+  http_code = 409;
+  DRAKE_EXPECT_THROWS_MESSAGE(render({{"b", content_b}}),
+                              "[\\s\\S]*HTTP Code: *409[\\s\\S]*");
+  ASSERT_EQ(uploads.size(), 7);
+  render({{"b", content_b}});
+  ASSERT_EQ(uploads.size(), 8);
+  EXPECT_EQ(uploads.back(), Hashes({"b"}));
+}
+
 TEST_F(RenderClientTest, ComputeSha256Good) {
   // To obtain this magic number, use a bash command:
   //   sha256sum geometry/render_gltf_client/test/test_depth_32F.tiff
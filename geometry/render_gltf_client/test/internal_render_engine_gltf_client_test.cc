@@ -278,6 +278,67 @@ TEST_F(RenderEngineGltfClientTest, DoRenderLabelImage) {
   }
 }
 
+/* A FakeServer that records the hashes of the assets uploaded with each
+ request. */
+class AssetRecordingServer : public FakeServer {
+ public:
+  HttpResponse DoPostForm(const std::string& temp_directory,
+                          const std::string& url,
+                          const DataFieldsMap& data_fields,
+                          const FileFieldsMap& file_fields,
+                          bool verbose) override {
+    std::set<std::string>& uploaded = uploads.emplace_back();
+    for (const auto& [name, value] : data_fields) {
+      if (name.starts_with("asset_")) {
+        uploaded.insert(name.substr(6));
+        EXPECT_TRUE(value.starts_with("data:"));
+      }
+    }
+    return FakeServer::DoPostForm(temp_directory, url, data_fields, file_fields,
+                                  verbose);
+  }
+
+  std::vector<std::set<std::string>> uploads;
+};
+
+/* With reuse_uploaded_assets, the exported scene references its assets rather
+ than embedding them, and each asset is only uploaded with the first render
+ that uses it. */
+TEST_F(RenderEngineGltfClientTest, ReuseUploadedAssets) {
+  Params params(params_);
+  params.reuse_uploaded_assets = true;
+  RenderEngineGltfClient engine{params};
+  PerceptionProperties properties;
+  properties.AddProperty("label", "id", render::RenderLabel(1));
+  EXPECT_TRUE(engine.RegisterVisual(
+      GeometryId::get_new_id(),
+      Mesh(FindResourceOrThrow(
+          "drake/geometry/render_gltf_client/test/tri_tree.gltf")),
+      properties, RigidTransformd::Identity()));
+
+  const fs::path scene_path = fs::path(engine.temp_directory()) / "scene.gltf";
+  RenderEngineGltfClientTester::ExportScene(engine, scene_path,
+                                            ImageType::kColor);
+  const json gltf = ReadJsonFile(scene_path);
+  ASSERT_FALSE(gltf["buffers"].empty());
+  for (const json& buffer : gltf["buffers"]) {
+    EXPECT_THAT(buffer["uri"].get<std::string>(),
+                ::testing::StartsWith("drake-asset:"));
+  }
+  fs::remove(scene_path);
+
+  auto server = std::make_unique<AssetRecordingServer>();
+  const std::vector<std::set<std::string>>& uploads = server->uploads;
+  engine.SetHttpService(std::move(server));
+  ImageRgba8U color_image{kTestImageWidth, kTestImageHeight};
+  engine.RenderColorImage(color_camera_, &color_image);
+  engine.RenderColorImage(color_camera_, &color_image);
+  ASSERT_EQ(uploads.size(), 2);
+  EXPECT_FALSE(uploads[0].empty());
+  EXPECT_TRUE(uploads[1].empty());
+  EXPECT_EQ(color_image, CreateTestColorImage(false));
+}
+
 class RenderEngineGltfClientGltfTest : public ::testing::Test {
  public:
   RenderEngineGltfClientGltfTest()
@@ -60,6 +60,7 @@ GTEST_TEST(RenderEngineGltfClientParams, Serialization) {
       .render_endpoint = "world",
       .verbose = true,
       .cleanup = false,
+      .reuse_uploaded_assets = true,
   };
   const std::string yaml = yaml::SaveYamlString<Params>(original);
   const Params dut = yaml::LoadYamlString<Params>(yaml);
@@ -67,6 +68,7 @@ GTEST_TEST(RenderEngineGltfClientParams, Serialization) {
   EXPECT_EQ(dut.render_endpoint, original.render_endpoint);
   EXPECT_EQ(dut.verbose, original.verbose);
   EXPECT_EQ(dut.cleanup, original.cleanup);
+  EXPECT_EQ(dut.reuse_uploaded_assets, original.reuse_uploaded_assets);
 }
 
 }  // namespace
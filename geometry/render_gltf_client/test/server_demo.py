@@ -1,7 +1,8 @@
 """
-A prototype glTF render server that receives HTTP requests and dispatches to a
-renderer backend to render images.  Users seeking to replace the sample
-VTK-based backend can simply change the implementation in `render_callback()`.
+A prototype glTF render server that receives HTTP requests and dispatches them
+to a pool of long-lived renderer backends to render images.  Users seeking to
+replace the sample VTK-based backend can simply change the implementation in
+`render_callback()`.
 
 Check the README page for more details:
 https://github.com/RobotLocomotion/drake/blob/master/geometry/render_gltf_client/test/README.md
@@ -9,11 +10,14 @@ https://github.com/RobotLocomotion/drake/blob/master/geometry/render_gltf_client
 
 import argparse
 import atexit
+from collections import OrderedDict
+from dataclasses import dataclass
 import datetime
 from enum import Enum
 from hashlib import sha256
 from io import BytesIO
 import itertools
+import json
 import math
 import os
 from pathlib import Path
@@ -21,10 +25,13 @@ import shutil
 import subprocess
 import tempfile
 from textwrap import dedent
+import threading
+import time
 import types
 
 from flask import Flask, request, send_file
 from python.runfiles import Create as CreateRunfiles
+from werkzeug.serving import WSGIRequestHandler
 
 """The main flask application."""
 app = Flask(__name__)
@@ -53,6 +60,29 @@ TMP_DIR = Path(os.environ.get("TEST_TMPDIR", "/tmp")) / "server_demo"
 TMP_DIR.mkdir(exist_ok=True)
 
 
+"""The prefix of the form fields with which clients that reuse uploaded assets
+upload them, and of the references to them in their scenes.  See the "Asset
+Reuse" section of Drake's documentation of the server API.
+"""
+ASSET_FIELD_PREFIX = "asset_"
+ASSET_URI_PREFIX = "drake-asset:"
+
+
+"""The assets uploaded by clients, keyed by their sha256 hash.  The value of
+each asset is the `data:` URI that its references stand for.  This reference
+server keeps the assets in memory for as long as it is running.
+"""
+ASSET_STORE: dict[str, str] = {}
+
+
+"""The number of render backend processes, i.e., of images that are rendered
+concurrently, and the number of scenes that each of them keeps resident.  See
+`RenderWorkerPool`.  These are set by the command-line arguments of `main()`.
+"""
+NUM_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+MAX_RESIDENT_SCENES = 4
+
+
 ###############################################################################
 # Helper classes and functions.
 ###############################################################################
@@ -70,6 +100,26 @@ def compute_hash(path: Path) -> str:
     return h.hexdigest()
 
 
+"""The properties of a glTF node that transform it relative to its parent."""
+NODE_TRANSFORM_KEYS = ("matrix", "rotation", "scale", "translation")
+
+
+def compute_geometry_hash(scene: dict) -> str:
+    """Returns the sha256 of the glTF `scene` without the transforms of its
+    nodes.  The render backends keep scenes resident by this hash, so that
+    the frames of a scene that differ only in the poses of its geometries and
+    camera reuse the same resident scene.  The backends do not pose lights, so
+    for a scene with lights this is the hash of the whole scene instead."""
+    if "KHR_lights_punctual" not in scene.get("extensionsUsed", []):
+        scene = dict(scene)
+        scene["nodes"] = [
+            {k: v for k, v in node.items() if k not in NODE_TRANSFORM_KEYS}
+            for node in scene.get("nodes", [])
+        ]
+    content = json.dumps(scene, sort_keys=True).encode("utf-8")
+    return sha256(content).hexdigest()
+
+
 @atexit.register
 def delete_server_cache():
     """Deletes `TMP_DIR` upon exit, e.g., `ctrl+C`, when CLEANUP is True."""
@@ -188,6 +238,9 @@ class RenderRequest:
 
         # Validate fields in `flask.request.form` first.
         for field_name in self.request.form:
+            if field_name.startswith(ASSET_FIELD_PREFIX):
+                self._parse_asset(field_name)
+                continue
             if field_name == "scene":
                 raise RenderError(
                     "Form field 'scene' should be in the files section."
@@ -247,6 +300,9 @@ class RenderRequest:
                 "The files section should contain a single field: 'scene'."
             )
         self._fields_map["scene"] = self._parse_scene("scene")
+        self._fields_map["geometry_sha256"] = self._resolve_assets(
+            self._fields_map["scene"]
+        )
 
     def get_field(self, field_name: str) -> int | float | str:
         """Queries the value of a field in the form. This function should be
@@ -263,7 +319,11 @@ class RenderRequest:
         # All the fields provided should be a subset of `expected_fields`. Some
         # of the fields are optional, i.e., min_depth and max_depth, and thus
         # the two sets may not match exactly.
-        extras = provided_fields.difference(expected_fields)
+        extras = {
+            field
+            for field in provided_fields.difference(expected_fields)
+            if not field.startswith(ASSET_FIELD_PREFIX)
+        }
         if extras:
             raise RenderError(f"Extra field(s) {extras} in the request <form>.")
 
@@ -295,6 +355,65 @@ class RenderRequest:
                 error_code=500,
             )
 
+    def _parse_asset(self, field_name: str):
+        """Validates the uploaded asset against the sha256 hash in its field
+        name, and adds it to the `ASSET_STORE`.
+
+        Raises:
+            RenderError: In the event that the sha256 hash of the asset is not
+            the one in its field name.
+        """
+        expected_sha256 = field_name[len(ASSET_FIELD_PREFIX) :]
+        content = self.request.form[field_name]
+        actual_sha256 = sha256(content.encode("utf-8")).hexdigest()
+        if actual_sha256 != expected_sha256:
+            raise RenderError(
+                f"Provided asset sha256='{expected_sha256}' does not match "
+                f"the computed sha256 of '{actual_sha256}'."
+            )
+        ASSET_STORE[expected_sha256] = content
+
+    def _resolve_assets(self, scene_path: Path) -> str:
+        """Replaces the asset references in the glTF scene file with the
+        content of the assets in the `ASSET_STORE`.  A scene without references
+        is left untouched.  Returns the hash of the scene's geometry; see
+        `compute_geometry_hash()`.
+
+        Raises:
+            RenderError: With the error code `409` in the event that the scene
+            references assets that are not in the `ASSET_STORE`, so that the
+            client will upload them.
+        """
+        with open(scene_path, encoding="utf-8") as f:
+            scene = json.load(f)
+        # Hash the scene before its (possibly large) asset references are
+        # resolved; the references are hashes of the assets themselves.
+        geometry_sha256 = compute_geometry_hash(scene)
+        missing = set()
+        resolved = False
+        for array_name in ("buffers", "images"):
+            for item in scene.get(array_name, []):
+                uri = item.get("uri", "")
+                if not uri.startswith(ASSET_URI_PREFIX):
+                    continue
+                asset_sha256 = uri[len(ASSET_URI_PREFIX) :]
+                if asset_sha256 in ASSET_STORE:
+                    item["uri"] = ASSET_STORE[asset_sha256]
+                    resolved = True
+                else:
+                    missing.add(asset_sha256)
+        if missing:
+            if CLEANUP:
+                scene_path.unlink(missing_ok=True)
+            raise RenderError(
+                f"The scene references unknown assets: {sorted(missing)}.",
+                error_code=409,
+            )
+        if resolved:
+            with open(scene_path, "w", encoding="utf-8") as f:
+                json.dump(scene, f)
+        return geometry_sha256
+
     def _parse_scene(self, field_name: str) -> Path:
         """Validates the uploaded scene file and returns the path to where it
         was saved in the `TMP_DIR`.
@@ -348,22 +467,242 @@ class RenderRequest:
             raise RenderError(f"Internal server error: {e}", error_code=500)
 
 
+###############################################################################
+# The pool of render backend processes.
+###############################################################################
+class RenderWorker:
+    """A long-lived render backend process, i.e., `server_vtk_backend --serve`.
+    It renders one request at a time, and keeps the most recently rendered
+    scenes resident so that they are not imported again.  See the description
+    of the `--serve` mode in `server_vtk_backend.cc` for its protocol.
+
+    Args:
+        backend_bin (str): The path to the render backend binary.
+        max_resident_scenes (int): The number of scenes the backend keeps
+            resident.
+    """
+
+    def __init__(self, backend_bin: str, max_resident_scenes: int):
+        self._args = [
+            backend_bin,
+            "--serve",
+            f"--max_resident_scenes={max_resident_scenes}",
+        ]
+        self._max_resident_scenes = max_resident_scenes
+        # The keys of the scenes that are resident in the backend, in order of
+        # their most recent use.  This mirrors the backend's own bookkeeping.
+        self.resident_scenes = OrderedDict()
+        self._start()
+
+    def _start(self):
+        """(Re)starts the backend process, which has no scene resident."""
+        self._proc = subprocess.Popen(
+            self._args, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        self.resident_scenes.clear()
+
+    def close(self):
+        """Stops the backend process."""
+        self._proc.kill()
+        self._proc.wait()
+
+    def render(self, job: dict) -> tuple[bytes, dict]:
+        """Renders the image described by `job`, and returns the encoded image
+        with the backend's reply, e.g., its timing of the rendering.
+
+        Raises:
+            RenderError: In the event that the backend fails to render the
+            image.  If the backend process failed, it is restarted.
+        """
+        try:
+            self._proc.stdin.write(json.dumps(job).encode("utf-8") + b"\n")
+            self._proc.stdin.flush()
+            header = self._proc.stdout.readline()
+            if not header:
+                raise RuntimeError(
+                    f"backend exited with code {self._proc.wait()}."
+                )
+            reply = json.loads(header)
+            if "error" in reply:
+                raise RenderError(
+                    f"Failed render invocation: {reply['error']}",
+                    error_code=500,
+                )
+            image = self._proc.stdout.read(reply["size"])
+            if len(image) != reply["size"]:
+                raise RuntimeError("backend sent a truncated image.")
+        except RenderError as re:
+            raise re from None  # Forward the exception.
+        except Exception as e:
+            self.close()
+            self._start()
+            raise RenderError(f"Failed render invocation: {e}", error_code=500)
+
+        key = RenderWorker.scene_key(job)
+        self.resident_scenes[key] = True
+        self.resident_scenes.move_to_end(key)
+        while len(self.resident_scenes) > self._max_resident_scenes:
+            self.resident_scenes.popitem(last=False)
+        return image, reply
+
+    @staticmethod
+    def scene_key(job: dict) -> str:
+        """Returns the key with which the backend keeps the scene of `job`
+        resident, which is shared by the frames of the scene that differ only
+        in their poses."""
+        return f"{job['geometry_sha256']}/{job['image_type']}"
+
+
+class RenderWorkerPool:
+    """A pool of `RenderWorker`s that render concurrent requests.  A request
+    waits in the queue until a worker is idle, and preferably goes to an idle
+    worker that has its scene resident.  The pool also keeps statistics of the
+    requests it served; see `stats()`.
+
+    Args:
+        backend_bin (str): The path to the render backend binary.
+        num_workers (int): The number of workers.
+        max_resident_scenes (int): The number of scenes each worker keeps
+            resident.
+    """
+
+    def __init__(
+        self, backend_bin: str, num_workers: int, max_resident_scenes: int
+    ):
+        assert num_workers >= 1
+        self._workers = [
+            RenderWorker(backend_bin, max_resident_scenes)
+            for _ in range(num_workers)
+        ]
+        self._idle_workers = list(self._workers)
+        self._condition = threading.Condition()
+        self._queue_depth = 0
+        self._num_requests = 0
+        self._num_resident = 0
+        self._total_seconds = dict.fromkeys(
+            ("queue", "load", "render", "encode"), 0.0
+        )
+
+    def close(self):
+        """Stops the processes of all the workers."""
+        for worker in self._workers:
+            worker.close()
+
+    def render(self, job: dict) -> tuple[bytes, dict[str, float]]:
+        """Renders the image described by `job` on the first idle worker, and
+        returns the encoded image with the time in seconds that the request
+        spent in each stage: `queue`, `load`, `render`, and `encode`.
+
+        Raises:
+            RenderError: In the event that the worker fails to render the
+            image.
+        """
+        key = RenderWorker.scene_key(job)
+        start = time.perf_counter()
+        with self._condition:
+            self._queue_depth += 1
+            self._condition.wait_for(lambda: self._idle_workers)
+            self._queue_depth -= 1
+            worker = next(
+                (w for w in self._idle_workers if key in w.resident_scenes),
+                self._idle_workers[0],
+            )
+            self._idle_workers.remove(worker)
+        queue_seconds = time.perf_counter() - start
+        try:
+            image, reply = worker.render(job)
+        finally:
+            with self._condition:
+                self._idle_workers.append(worker)
+                self._condition.notify()
+
+        timing = {
+            "queue": queue_seconds,
+            **{stage: reply[stage] for stage in ("load", "render", "encode")},
+        }
+        with self._condition:
+            self._num_requests += 1
+            self._num_resident += reply["resident"]
+            for stage, seconds in timing.items():
+                self._total_seconds[stage] += seconds
+        return image, timing
+
+    def stats(self) -> dict:
+        """Returns the number of workers, how many of them are busy, the number
+        of requests waiting for a worker, the number of requests served (and
+        how many of them had their scene resident), and the mean time in
+        seconds that the requests spent in each stage."""
+        with self._condition:
+            num_requests = self._num_requests
+            return {
+                "workers": len(self._workers),
+                "busy_workers": len(self._workers) - len(self._idle_workers),
+                "queue_depth": self._queue_depth,
+                "requests": num_requests,
+                "resident_scene_requests": self._num_resident,
+                "mean_seconds": {
+                    stage: total / max(num_requests, 1)
+                    for stage, total in self._total_seconds.items()
+                },
+            }
+
+
+"""The pool of render workers, started on first use by `get_worker_pool()`."""
+_WORKER_POOL: RenderWorkerPool | None = None
+_WORKER_POOL_LOCK = threading.Lock()
+
+
+def get_worker_pool() -> RenderWorkerPool:
+    """Returns the pool of render workers, starting it if need be."""
+    global _WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if _WORKER_POOL is None:
+            # Locate the binary of the renderer.
+            runfiles = CreateRunfiles()
+            backend_bin = runfiles.Rlocation(
+                "drake/geometry/render_gltf_client/server_vtk_backend"
+            )
+            _WORKER_POOL = RenderWorkerPool(
+                backend_bin, NUM_RENDER_WORKERS, MAX_RESIDENT_SCENES
+            )
+            atexit.register(_WORKER_POOL.close)
+        return _WORKER_POOL
+
+
 ###############################################################################
 # The main rendering call, replace with your own desired implementation.
 ###############################################################################
-def render_callback(render_request: RenderRequest) -> str:
-    """Invokes the renderer to produce and return an output image path.
+@dataclass
+class RenderResult:
+    """The result of `render_callback()`.
+
+    Attributes:
+        image (bytes): The contents of the rendered image file.
+        mime_type (str): The mime type of the image, i.e., `image/png` or
+            `image/tiff`.
+        timing (dict[str, float]): The time in seconds spent in each stage of
+            the rendering, reported to the client in the `Server-Timing`
+            header of the response.
+    """
+
+    image: bytes
+    mime_type: str
+    timing: dict[str, float]
+
+
+def render_callback(render_request: RenderRequest) -> RenderResult:
+    """Invokes the renderer to produce and return an encoded image.
 
     The data fields in `render_request` have already been validated based off
     the original flask request.  This function is responsible for determining
-    the final output image path and file extension.
+    the final image format.
 
     Args:
         render_request (RenderRequest): The validated flask request wrapped in
             a `RenderRequest` instance.
 
     Returns:
-        A path to the final rendered image file.
+        The rendered image, in a `RenderResult`.
 
     Raises:
         RenderError: In the event that anything goes wrong during the call to
@@ -373,79 +712,34 @@ def render_callback(render_request: RenderRequest) -> str:
             exceptions raised will result in an internal server error response
             message to the client.
     """
-    # Locate the binary of the renderer.
-    runfiles = CreateRunfiles()
-    backend_bin = runfiles.Rlocation(
-        "drake/geometry/render_gltf_client/server_vtk_backend"
-    )
-
-    # Determine the extension and the file path of the rendering.
-    # NOTE: When CLEANUP=True, this image path is deleted by the caller.
-    output_path = str(render_request.get_field("scene"))
+    # Create the render job to pass to a render backend.  The scene is keyed by
+    # the sha256 of its geometry, so that a backend that has it resident does
+    # not reload it, but only poses it anew.
     image_type = render_request.get_field("image_type")
-    if image_type in ["color", "label"]:
-        output_path += ".png"
-    else:  # image_type == "depth"
-        output_path += ".tiff"
-
-    # Create the command-line arguments to pass to the render backend.
-    # NOTE: Make sure you convert entries in the list to `str`.
-    proc_args = [
-        backend_bin,
-        "--input_path",
-        str(render_request.get_field("scene")),
-        "--output_path",
-        output_path,
-        "--image_type",
-        str(render_request.get_field("image_type")),
-        "--width",
-        str(render_request.get_field("width")),
-        "--height",
-        str(render_request.get_field("height")),
-        "--near",
-        str(render_request.get_field("near")),
-        "--far",
-        str(render_request.get_field("far")),
-        "--focal_x",
-        str(render_request.get_field("focal_x")),
-        "--focal_y",
-        str(render_request.get_field("focal_y")),
-        "--fov_x",
-        str(render_request.get_field("fov_x")),
-        "--fov_y",
-        str(render_request.get_field("fov_y")),
-        "--center_x",
-        str(render_request.get_field("center_x")),
-        "--center_y",
-        str(render_request.get_field("center_y")),
-    ]
+    job = {
+        "input_path": str(render_request.get_field("scene")),
+        "scene_sha256": render_request.get_field("scene_sha256"),
+        "geometry_sha256": render_request.get_field("geometry_sha256"),
+    }
+    for field_name in (
+        "image_type",
+        "width",
+        "height",
+        "near",
+        "far",
+        "focal_x",
+        "focal_y",
+        "center_x",
+        "center_y",
+    ):
+        job[field_name] = render_request.get_field(field_name)
     if image_type == "depth":
-        proc_args.extend(
-            [
-                "--min_depth",
-                str(render_request.get_field("min_depth")),
-                "--max_depth",
-                str(render_request.get_field("max_depth")),
-            ]
-        )
+        job["min_depth"] = render_request.get_field("min_depth")
+        job["max_depth"] = render_request.get_field("max_depth")
 
-    # Call the render backend, including capturing any errors.
-    try:
-        proc = subprocess.run(proc_args, capture_output=True, check=False)
-        if proc.returncode != 0:
-            message = f"backend exited with code {proc.returncode}."
-            stdout = proc.stdout.decode("utf-8")
-            stderr = proc.stderr.decode("utf-8")
-            if stdout:
-                message += f"\nstdout:\n{stdout}"
-            if stderr:
-                message += f"\nstderr:\n{stderr}"
-            raise RuntimeError(message)
-
-        # Inform the caller where the final rendering resides.
-        return output_path
-    except Exception as e:
-        raise RenderError(f"Failed render invocation: {e}", error_code=500)
+    image, timing = get_worker_pool().render(job)
+    mime_type = "image/tiff" if image_type == "depth" else "image/png"
+    return RenderResult(image=image, mime_type=mime_type, timing=timing)
 
 
 ###############################################################################
@@ -503,55 +797,36 @@ def render_endpoint():
     if request.method == "POST":
         try:
             # Validate the request and render the image.
+            start = time.perf_counter()
             render_request = RenderRequest(request)
-            output_image = Path(render_callback(render_request))
+            result = render_callback(render_request)
             if render_request.verbose:
-                print(f"Rendering image: {output_image!s}")
+                scene_str = str(render_request.get_field("scene"))
+                print(f"Rendered scene file: {scene_str}")
 
             # Now that the image is rendered, it is safe to delete the scene.
             if CLEANUP:
                 if render_request.verbose:
-                    scene_str = str(render_request.get_field("scene"))
                     print(f"Deleting scene file: {scene_str}")
                 render_request.get_field("scene").unlink(missing_ok=True)
 
-            # The mime type response is only populated based off the file
-            # extension, implementation of render_callback is responsible for
-            # invalid file extensions / mime types being reported.
+            # The rendered image is sent straight from memory.
             #
             # NOTE: the client does *NOT* rely on the mime type.
-            mime_type = None
-            image_extension = output_image.suffix.lower()
-            if image_extension == ".png":
-                mime_type = "image/png"
-            elif image_extension in {".tif", ".tiff"}:
-                mime_type = "image/tiff"
-            else:
-                raise RuntimeError(f"Missing mime_type for '{image_extension}'")
-            # If we are not deleting the file, use the file path directly for
-            # simplicity.  Otherwise, we load the image into RAM, delete it,
-            # and then send that.  See the documentation:
-            #
-            # https://flask.palletsprojects.com/en/2.0.x/api/#flask.send_file
-            #
-            # There is a small concern in loading into RAM when sending files
-            # in the sense that the potential wrapping frameworks such as nginx
-            # or apache are optimized for sending files (not python buffers).
-            #
-            # However, in practice, the size of the image file will be on the
-            # order of megabytes and it is preferable to delete the image file
-            # now rather than implement a cleanup scheme on the next request
-            # (you cannot execute code after send_file).
-            if not CLEANUP:
-                return send_file(output_image, mimetype=mime_type)
-            else:
-                buffer = None
-                with open(output_image, "rb") as f:
-                    buffer = BytesIO(f.read())
-                if render_request.verbose:
-                    print(f"Deleting rendered image: {output_image!s}")
-                output_image.unlink(missing_ok=True)
-                return send_file(buffer, mimetype=mime_type)
+            response = send_file(
+                BytesIO(result.image), mimetype=result.mime_type
+            )
+            # Report the time spent in each stage of the request, in
+            # milliseconds, per the `Server-Timing` header syntax.
+            timing = {
+                **result.timing,
+                "total": time.perf_counter() - start,
+            }
+            response.headers["Server-Timing"] = ", ".join(
+                f"{stage};dur={seconds * 1e3:.3f}"
+                for stage, seconds in timing.items()
+            )
+            return response
         except RenderError as re:
             return re.flask_json_code_response()
         except Exception as e:
@@ -611,7 +886,19 @@ def render_endpoint():
     return f"{html_prefix}{''.join(table_rows)}{html_suffix}"
 
 
+@app.route("/stats")
+def stats_endpoint():
+    """Reports the state of the render worker pool as JSON, i.e., the number of
+    busy workers and the depth of the queue of requests waiting for one, and
+    the number of requests served with their mean time spent in each stage.
+    This endpoint is not required by the drake server-client relationship and
+    only serves to monitor the server.
+    """
+    return get_worker_pool().stats()
+
+
 def main():
+    global NUM_RENDER_WORKERS, MAX_RESIDENT_SCENES
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument(
         "--host",
@@ -642,10 +929,39 @@ def main():
         " but doesn't run it.",
     )
 
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        required=False,
+        default=NUM_RENDER_WORKERS,
+        help="The number of render backend processes, i.e., of images "
+        f"rendered concurrently, default: {NUM_RENDER_WORKERS}.",
+    )
+    parser.add_argument(
+        "--max_resident_scenes",
+        type=int,
+        required=False,
+        default=MAX_RESIDENT_SCENES,
+        help="The number of the most recently rendered scenes that each "
+        "render backend process keeps loaded, default: "
+        f"{MAX_RESIDENT_SCENES}.",
+    )
+
     args = parser.parse_args()
+    if args.num_workers < 1 or args.max_resident_scenes < 1:
+        parser.error(
+            "--num_workers and --max_resident_scenes must be positive."
+        )
     if args.acceptance_test:
         return
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    NUM_RENDER_WORKERS = args.num_workers
+    MAX_RESIDENT_SCENES = args.max_resident_scenes
+    # Allow clients to keep their connection alive from one render to the
+    # next, rather than closing it after every response.
+    WSGIRequestHandler.protocol_version = "HTTP/1.1"
+    # Handle each request on its own thread, so that requests are rendered
+    # concurrently by the render worker pool.
+    app.run(host=args.host, port=args.port, debug=args.debug, threaded=True)
 
 
 if __name__ == "__main__":
@@ -1,25 +1,68 @@
 /* This file implements a program that can consume a glTF file and produce a
-single rendered image.  The sample code is kept straightforward deliberately
-without too much optimization.  As this program and RenderEngineVtk both use VTK
-to render images, some functions are ported directly from RenderEngineVtk.
+rendered image.  The sample code is kept straightforward deliberately without
+too much optimization.  As this program and RenderEngineVtk both use VTK to
+render images, some functions are ported directly from RenderEngineVtk.
 See also:
 https://drake.mit.edu/doxygen_cxx/classdrake_1_1geometry_1_1render_1_1_render_engine_vtk.html
 
+The program runs in one of two modes:
+
+- By default, it renders a single image of the `--input_path` scene to the
+  `--output_path` file, and exits.
+- With `--serve`, it is a long-lived render worker.  It reads render requests
+  from stdin, one JSON object per line, whose keys are the names of the
+  command-line flags below (but for `output_path`), `scene_sha256`, and
+  `geometry_sha256`.  For each request, it writes to stdout a single line of
+  JSON, followed by the encoded image (PNG for color and label images, TIFF for
+  depth images).  The JSON line is either `{"error": message}` (and no image
+  follows), or contains the `size` of the image in bytes, whether the scene was
+  `resident`, and the time in seconds spent to `load`, `render`, and `encode`
+  the image.  It exits when stdin is closed.
+
+  The worker keeps the most recently used scenes imported, keyed by their
+  `geometry_sha256` (the hash of the scene without the transforms of its nodes,
+  as computed by server_demo.py) and image type.  A request for a resident
+  scene whose `scene_sha256` differs (e.g., the next frame of a simulation, in
+  which the geometries or the camera moved) only reads the transforms of the
+  scene's nodes, and poses the imported geometries and camera with them, so
+  that it costs little more than the rendering itself.  If the worker cannot
+  match the imported geometries to the nodes of the scene, it instead imports
+  the scene again whenever its `scene_sha256` changes.
+
 In the glTF Render Client-Server pipeline, the server receives HTTP requests
-from a client and invokes this program as a rendering backend to render images.
-See README.md in this folder for more details.
+from a client and dispatches them to a pool of these programs, as rendering
+backends, to render images.  See README.md in this folder for more details.
 
 The program serves as a working example and is used in conjunction with other
 programs for the glTF Render Client-Server integration test. */
 
+#include <unistd.h>
+
+#include <array>
+#include <chrono>
 #include <cstdint>
+#include <cstdio>
+#include <cstring>
 #include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <iterator>
+#include <list>
 #include <map>
+#include <memory>
+#include <optional>
+#include <stdexcept>
 #include <string>
+#include <utility>
+#include <vector>
 
+#include <Eigen/Dense>
+#include <fmt/format.h>
 #include <gflags/gflags.h>
+#include <nlohmann/json.hpp>
 
 // To ease build system upkeep, we annotate VTK includes with their deps.
+#include <vtkActor.h>                 // vtkRenderingCore
 #include <vtkActorCollection.h>       // vtkRenderingCore
 #include <vtkAutoInit.h>              // vtkCommonCore
 #include <vtkCamera.h>                // vtkRenderingCore
@@ -29,25 +72,25 @@ programs for the glTF Render Client-Server integration test. */
 #include <vtkMatrix4x4.h>             // vtkCommonMath
 #include <vtkOpenGLPolyDataMapper.h>  // vtkRenderingOpenGL2
 #include <vtkOpenGLShaderProperty.h>  // vtkRenderingOpenGL2
-#include <vtkPNGWriter.h>             // vtkIOImage
 #include <vtkProperty.h>              // vtkRenderingCore
 #include <vtkRenderWindow.h>          // vtkRenderingCore
 #include <vtkRenderer.h>              // vtkRenderingCore
-#include <vtkTIFFWriter.h>            // vtkIOImage
 #include <vtkWindowToImageFilter.h>   // vtkRenderingCore
 
 #include "drake/common/drake_assert.h"
+#include "drake/common/drake_throw.h"
 #include "drake/common/text_logging.h"
 #include "drake/geometry/render/shaders/depth_shaders.h"
 #include "drake/geometry/render_vtk/internal_make_render_window.h"
 #include "drake/geometry/render_vtk/internal_render_engine_vtk.h"
 #include "drake/systems/sensors/image.h"
+#include "drake/systems/sensors/image_io.h"
 
 VTK_MODULE_INIT(vtkRenderingOpenGL2);
 
-// Note: All arguments are required to be supplied on the command line. Other
-// than `input_path` and `output_path`, this program assumes the rest of the
-// inputs are validated beforehand.
+// Note: Unless `serve` is set, all arguments are required to be supplied on the
+// command line. Other than `input_path` and `output_path`, this program assumes
+// the rest of the inputs are validated beforehand.
 DEFINE_string(input_path, "", "The input glTF scene to render.");
 DEFINE_string(output_path, "",
               "The path to save the rendered image. Only `.png` and `.tiff` "
@@ -70,54 +113,80 @@ DEFINE_double(
 DEFINE_double(
     max_depth, -1.0,
     "The maximum depth range.  Only required when rendering a depth image.");
+DEFINE_bool(serve, false,
+            "Whether to serve render requests read from stdin, instead of "
+            "rendering the single image specified by the other flags.");
+DEFINE_int32(max_resident_scenes, 4,
+             "When serving, the number of the most recently rendered scenes "
+             "to keep imported.");
+
+namespace drake {
+namespace geometry {
+namespace render_gltf_client {
+namespace internal {
+namespace {
+
+using render_vtk::internal::MakeRenderWindow;
+using render_vtk::internal::RenderEngineVtkBackend;
+using render_vtk::internal::ShaderCallback;
+using systems::sensors::ImageDepth32F;
+using systems::sensors::ImageFileFormat;
+using systems::sensors::ImageIo;
+using systems::sensors::ImageRgba8U;
+using systems::sensors::ImageTraits;
+using systems::sensors::PixelType;
+
+/* The parameters of a single rendering, as given by the command-line flags, or
+ by a request when serving. */
+struct RenderParams {
+  std::string input_path;
+  // Only used when serving.
+  std::string scene_sha256;
+  std::string geometry_sha256;
+  std::string image_type;
+  int width{};
+  int height{};
+  double near{};
+  double far{};
+  double focal_x{};
+  double focal_y{};
+  double center_x{};
+  double center_y{};
+  double min_depth{-1.0};
+  double max_depth{-1.0};
+};
 
 /* Requires that the input path is specified, exists and with a `.gltf`
  extension. */
-static bool ValidateInputPath(const char*, const std::string& path) {
+bool ValidateInputPath(const std::string& path) {
   if (path.empty()) {
-    drake::log()->debug("Input path is not specified");
+    log()->error("Input path is not specified");
     return false;
   }
   const std::filesystem::path input_path{path};
   if (!std::filesystem::exists(path) || input_path.extension() != ".gltf") {
-    drake::log()->debug("Invalid input path: {}", path);
+    log()->error("Invalid input path: {}", path);
     return false;
   }
   return true;
 }
-DEFINE_validator(input_path, &ValidateInputPath);
 
 /* Requires that an output path is specified, does not exist, and has a
  supported extension, i.e., .png or .tiff. */
-static bool ValidateOutputPath(const char*, const std::string& path) {
+bool ValidateOutputPath(const std::string& path) {
   if (path.empty()) {
-    drake::log()->debug("Output path is not specified");
+    log()->error("Output path is not specified");
     return false;
   }
   const std::filesystem::path output_path{path};
   const std::string ext{output_path.extension()};
   if (std::filesystem::exists(output_path) ||
       (ext != ".png" && ext != ".tiff")) {
-    drake::log()->debug("Invalid output path: {}", path);
+    log()->error("Invalid output path: {}", path);
     return false;
   }
   return true;
 }
-DEFINE_validator(output_path, &ValidateOutputPath);
-
-namespace drake {
-namespace geometry {
-namespace render_gltf_client {
-namespace internal {
-namespace {
-
-using render_vtk::internal::MakeRenderWindow;
-using render_vtk::internal::RenderEngineVtkBackend;
-using render_vtk::internal::ShaderCallback;
-using systems::sensors::ImageDepth32F;
-using systems::sensors::ImageRgba8U;
-using systems::sensors::ImageTraits;
-using systems::sensors::PixelType;
 
 // Imported from internal_render_engine_vtk.cc, for converting the depth image.
 float CheckRangeAndConvertToMeters(float z_buffer_value, double z_near,
@@ -135,13 +204,13 @@ float CheckRangeAndConvertToMeters(float z_buffer_value, double z_near,
 bool ValidateOutputExtension() {
   if (FLAGS_image_type == "depth") {
     if (std::filesystem::path(FLAGS_output_path).extension() == ".png") {
-      log()->debug("Depth images must have a .tiff extension.");
+      log()->error("Depth images must have a .tiff extension.");
       return false;
     }
   } else {
     const std::filesystem::path output_path{FLAGS_output_path};
     if (output_path.extension() != ".png") {
-      log()->debug("Color and label images must have a .png extension.");
+      log()->error("Color and label images must have a .png extension.");
       return false;
     }
   }
@@ -154,20 +223,20 @@ bool ValidateOutputExtension() {
  @sa
  https://github.com/RobotLocomotion/drake/blob/master/geometry/render/render_camera.cc
  */
-void CalcProjectionMatrix(vtkRenderer* renderer) {
+void CalcProjectionMatrix(const RenderParams& params, vtkRenderer* renderer) {
   vtkCamera* camera = renderer->GetActiveCamera();
   camera->UseExplicitProjectionTransformMatrixOn();
 
   vtkNew<vtkMatrix4x4> projection;
   projection->Zero();
-  const double fx = FLAGS_focal_x;
-  const double fy = FLAGS_focal_y;
-  const double n = FLAGS_near;
-  const double f = FLAGS_far;
-  const double w = FLAGS_width;
-  const double h = FLAGS_height;
-  const double cx = FLAGS_center_x;
-  const double cy = FLAGS_center_y;
+  const double fx = params.focal_x;
+  const double fy = params.focal_y;
+  const double n = params.near;
+  const double f = params.far;
+  const double w = params.width;
+  const double h = params.height;
+  const double cx = params.center_x;
+  const double cy = params.center_y;
   const double d = f - n;
   projection->SetElement(0, 0, 2 * fx / w);
   projection->SetElement(0, 2, (w - 2 * cx) / w);
@@ -195,185 +264,607 @@ void SetDefaultLighting(vtkRenderer* renderer) {
   renderer->AddLight(light);
 }
 
-int DoMain() {
-  // All the input args should be validated past this point.
-  if (!ValidateOutputExtension()) return 1;
+/* The world transforms of the nodes of a glTF scene that ResidentScene poses
+ for each request: the nodes with meshes, and the camera. */
+struct ScenePoses {
+  /* One transform per actor that vtkGLTFImporter creates (i.e., one per
+   primitive of each node's mesh), in the order in which it creates them.  Like
+   vtkGLTFImporter, we traverse the nodes depth first using a stack, so the
+   last root node (and the last child of each node) comes first. */
+  std::vector<Eigen::Matrix4d> actors;
+  /* The transform of the first node (in the same order) of the camera that is
+   rendered from, i.e., the first camera, if there is such a node. */
+  std::optional<Eigen::Matrix4d> camera;
+};
+
+/* Returns the transform of a glTF node relative to its parent. */
+Eigen::Matrix4d CalcNodeTransform(const nlohmann::json& node) {
+  if (node.contains("matrix")) {
+    const auto values = node.at("matrix").get<std::array<double, 16>>();
+    // glTF matrices are column major, as are Eigen's.
+    return Eigen::Map<const Eigen::Matrix4d>(values.data());
+  }
+  Eigen::Matrix4d result = Eigen::Matrix4d::Identity();
+  if (node.contains("scale")) {
+    const auto s = node.at("scale").get<std::array<double, 3>>();
+    result.topLeftCorner<3, 3>() =
+        Eigen::Vector3d(s[0], s[1], s[2]).asDiagonal();
+  }
+  if (node.contains("rotation")) {
+    // glTF quaternions are (x, y, z, w).
+    const auto q = node.at("rotation").get<std::array<double, 4>>();
+    result.topLeftCorner<3, 3>() = Eigen::Quaterniond(q[3], q[0], q[1], q[2])
+                                       .normalized()
+                                       .toRotationMatrix() *
+                                   result.topLeftCorner<3, 3>();
+  }
+  if (node.contains("translation")) {
+    const auto t = node.at("translation").get<std::array<double, 3>>();
+    result.topRightCorner<3, 1>() = Eigen::Vector3d(t[0], t[1], t[2]);
+  }
+  return result;
+}
+
+/* Reads the poses of the glTF scene at `input_path`; see ScenePoses. */
+ScenePoses ReadScenePoses(const std::string& input_path) {
+  std::ifstream input(input_path);
+  if (!input) {
+    throw std::runtime_error(
+        fmt::format("Cannot read the scene '{}'", input_path));
+  }
+  // Skip the buffers and images, which can be large, and don't affect the
+  // poses.
+  const nlohmann::json gltf = nlohmann::json::parse(
+      input, [](int depth, nlohmann::json::parse_event_t event,
+                nlohmann::json& parsed) {
+        return !(depth == 1 && event == nlohmann::json::parse_event_t::key &&
+                 (parsed == "buffers" || parsed == "images"));
+      });
+  ScenePoses result;
+  if (!gltf.contains("scenes")) {
+    return result;
+  }
+  const nlohmann::json& scene = gltf.at("scenes").at(gltf.value("scene", 0));
+  const nlohmann::json& nodes = gltf.at("nodes");
+  std::vector<std::pair<int, Eigen::Matrix4d>> stack;
+  for (const int index : scene.value("nodes", std::vector<int>{})) {
+    stack.emplace_back(index, CalcNodeTransform(nodes.at(index)));
+  }
+  while (!stack.empty()) {
+    const auto [index, X_WN] = stack.back();
+    stack.pop_back();
+    const nlohmann::json& node = nodes.at(index);
+    if (node.contains("mesh")) {
+      const nlohmann::json& mesh =
+          gltf.at("meshes").at(node.at("mesh").get<int>());
+      result.actors.insert(result.actors.end(), mesh.at("primitives").size(),
+                           X_WN);
+    }
+    if (node.value("camera", -1) == 0 && !result.camera.has_value()) {
+      result.camera = X_WN;
+    }
+    for (const int child : node.value("children", std::vector<int>{})) {
+      stack.emplace_back(child, X_WN * CalcNodeTransform(nodes.at(child)));
+    }
+  }
+  return result;
+}
 
-  vtkNew<vtkRenderer> renderer;
-  renderer->UseHiddenLineRemovalOn();
+/* A glTF scene imported into its own render window, and set up to render one
+ type of image.  The scene can be rendered any number of times, with any camera
+ intrinsics, and its geometries and camera can be posed anew (see SetPoses()).
+ */
+class ResidentScene {
+ public:
+  ResidentScene(const std::string& input_path, const std::string& image_type)
+      : image_type_(image_type) {
+    renderer_->UseHiddenLineRemovalOn();
 
-  vtkSmartPointer<vtkRenderWindow> render_window = MakeRenderWindow(
+    render_window_ = MakeRenderWindow(
 #ifdef __APPLE__
-      RenderEngineVtkBackend::kCocoa
+        RenderEngineVtkBackend::kCocoa
 #else
-      RenderEngineVtkBackend::kEgl
+        RenderEngineVtkBackend::kEgl
 #endif
-  );  // NOLINT(whitespace/parens)
-  render_window->SetSize(FLAGS_width, FLAGS_height);
-  render_window->AddRenderer(renderer);
-  render_window->SetOffScreenRendering(true);
-  // Applied to all pipelines.
-  render_window->SetMultiSamples(0);
-
-  vtkNew<vtkWindowToImageFilter> window_to_image_filter;
-  window_to_image_filter->SetInput(render_window);
-  window_to_image_filter->SetScale(1);
-  window_to_image_filter->SetInputBufferTypeToRGBA();
-  window_to_image_filter->ReadFrontBufferOff();
-  // See notes in internal_render_engine_vtk.cc.
-  window_to_image_filter->SetShouldRerender(false);
-
-  /* Import the glTF scene and pose the camera.  `camera 0` is assumed to be
-   defined in the glTF file.  The vtkGLTFExporter in drake always provides one
-   camera per scene. */
-  vtkNew<vtkGLTFImporter> importer;
-  importer->SetFileName(FLAGS_input_path.c_str());
-  importer->SetRenderWindow(render_window);
-  importer->SetCamera(0);
-  importer->Update();
-
-  CalcProjectionMatrix(renderer);
-  SetDefaultLighting(renderer);
-
-  /* Apply render-specific settings, such as the background color and texture
-   property based on the type of the rendered image. */
-  if (FLAGS_image_type == "color") {
-    renderer->SetUseDepthPeeling(1);
-    renderer->UseFXAAOn();
-    // Same default background color as defined in RenderEngineVtk.
-    renderer->SetBackground(204.0 / 255.0, 229.0 / 255.0, 255.0 / 255.0);
-    renderer->SetBackgroundAlpha(1.0);
-
-    /* The glTF import / export uses the newer "PBR Materials" in VTK 9+,
-     including for materials without textures (it is a different lighting system
-     altogether).  To match the original RenderEngineVtk, for any actor that
-     does not have an explicit texture applied, revert to the old lighting.
-
-     NOTE: The glTF standard requires PBR textures. */
-    vtkActorCollection* actor_collection = renderer->GetActors();
-    actor_collection->InitTraversal();
-    for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
-      vtkActor* actor = actor_collection->GetNextActor();
-      const std::map<std::string, vtkTexture*>& texture_maps =
-          actor->GetProperty()->GetAllTextures();
-      if (texture_maps.size() == 0) {
-        actor->GetProperty()->SetInterpolationToGouraud();
+    );  // NOLINT(whitespace/parens)
+    render_window_->AddRenderer(renderer_);
+    render_window_->SetOffScreenRendering(true);
+    // Applied to all pipelines.
+    render_window_->SetMultiSamples(0);
+
+    window_to_image_filter_->SetInput(render_window_);
+    window_to_image_filter_->SetScale(1);
+    window_to_image_filter_->SetInputBufferTypeToRGBA();
+    window_to_image_filter_->ReadFrontBufferOff();
+    // See notes in internal_render_engine_vtk.cc.
+    window_to_image_filter_->SetShouldRerender(false);
+    image_export_->SetInputConnection(window_to_image_filter_->GetOutputPort());
+    // Export the image with Drake's convention, i.e., with (0, 0) being the
+    // top-left pixel.
+    image_export_->ImageLowerLeftOff();
+
+    /* Import the glTF scene and pose the camera.  `camera 0` is assumed to be
+     defined in the glTF file.  The vtkGLTFExporter in drake always provides
+     one camera per scene. */
+    importer_->SetFileName(input_path.c_str());
+    importer_->SetRenderWindow(render_window_);
+    importer_->SetCamera(0);
+    importer_->Update();
+
+    SetDefaultLighting(renderer_);
+
+    /* Apply render-specific settings, such as the background color and
+     texture property based on the type of the rendered image. */
+    if (image_type_ == "color") {
+      renderer_->SetUseDepthPeeling(1);
+      renderer_->UseFXAAOn();
+      // Same default background color as defined in RenderEngineVtk.
+      renderer_->SetBackground(204.0 / 255.0, 229.0 / 255.0, 255.0 / 255.0);
+      renderer_->SetBackgroundAlpha(1.0);
+
+      /* The glTF import / export uses the newer "PBR Materials" in VTK 9+,
+       including for materials without textures (it is a different lighting
+       system altogether).  To match the original RenderEngineVtk, for any actor
+       that does not have an explicit texture applied, revert to the old
+       lighting.
+
+       NOTE: The glTF standard requires PBR textures. */
+      vtkActorCollection* actor_collection = renderer_->GetActors();
+      actor_collection->InitTraversal();
+      for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
+        vtkActor* actor = actor_collection->GetNextActor();
+        const std::map<std::string, vtkTexture*>& texture_maps =
+            actor->GetProperty()->GetAllTextures();
+        if (texture_maps.size() == 0) {
+          actor->GetProperty()->SetInterpolationToGouraud();
+        }
+      }
+    } else if (image_type_ == "depth") {
+      renderer_->SetBackground(1.0, 1.0, 1.0);
+
+      // Set the custom drake vertex / fragment shader for each imported actor.
+      vtkActorCollection* actor_collection = renderer_->GetActors();
+      actor_collection->InitTraversal();
+      for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
+        vtkActor* actor = actor_collection->GetNextActor();
+        vtkOpenGLPolyDataMapper* mapper =
+            vtkOpenGLPolyDataMapper::SafeDownCast(actor->GetMapper());
+        if (mapper && mapper->GetInput()) {
+          vtkOpenGLShaderProperty* shader_property =
+              vtkOpenGLShaderProperty::SafeDownCast(actor->GetShaderProperty());
+          DRAKE_DEMAND(shader_property != nullptr);
+          shader_property->SetVertexShaderCode(render::shaders::kDepthVS);
+          shader_property->SetFragmentShaderCode(render::shaders::kDepthFS);
+          mapper->AddObserver(vtkCommand::UpdateShaderEvent,
+                              uniform_setting_callback_.Get());
+        }
+      }
+    } else {  // image_type_ == "label"
+      // Following the client-server API (see render_gltf_client_doxygen.h), the
+      // background of a label image should be set to white.
+      renderer_->SetBackground(1.0, 1.0, 1.0);
+
+      // Same as RenderEngineVtk, label actors have lighting disabled.  Labels
+      // have already been encoded as geometry materials in the glTF.  By
+      // disabling lighting we also don't have to worry about the same PBR
+      // issues as for color images.
+      vtkActorCollection* actor_collection = renderer_->GetActors();
+      actor_collection->InitTraversal();
+      for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
+        vtkActor* actor = actor_collection->GetNextActor();
+        actor->GetProperty()->LightingOff();
       }
     }
-  } else if (FLAGS_image_type == "depth") {
-    renderer->SetBackground(1.0, 1.0, 1.0);
-
-    vtkNew<ShaderCallback> uniform_setting_callback;
-    uniform_setting_callback->set_z_near(FLAGS_min_depth);
-    uniform_setting_callback->set_z_far(FLAGS_max_depth);
+  }
 
-    // Set the custom drake vertex / fragment shader for each imported actor.
-    vtkActorCollection* actor_collection = renderer->GetActors();
+  /* Returns true iff the imported actors and camera have the given `poses`,
+   i.e., iff ScenePoses matches the actors (and camera) that vtkGLTFImporter
+   created for the scene whose poses they are. */
+  bool HasPoses(const ScenePoses& poses) const {
+    const auto is_near = [](const Eigen::Vector3d& a, const double* b) {
+      return (a - Eigen::Vector3d(b[0], b[1], b[2])).norm() <=
+             kPoseTolerance * (1 + a.norm());
+    };
+    vtkActorCollection* actor_collection = renderer_->GetActors();
+    if (actor_collection->GetNumberOfItems() != ssize(poses.actors)) {
+      return false;
+    }
     actor_collection->InitTraversal();
-    for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
-      vtkActor* actor = actor_collection->GetNextActor();
-      vtkOpenGLPolyDataMapper* mapper =
-          vtkOpenGLPolyDataMapper::SafeDownCast(actor->GetMapper());
-      if (mapper && mapper->GetInput()) {
-        vtkOpenGLShaderProperty* shader_property =
-            vtkOpenGLShaderProperty::SafeDownCast(actor->GetShaderProperty());
-        DRAKE_DEMAND(shader_property != nullptr);
-        shader_property->SetVertexShaderCode(render::shaders::kDepthVS);
-        shader_property->SetFragmentShaderCode(render::shaders::kDepthFS);
-        mapper->AddObserver(vtkCommand::UpdateShaderEvent,
-                            uniform_setting_callback.Get());
+    for (const Eigen::Matrix4d& X_WA : poses.actors) {
+      vtkMatrix4x4* matrix = actor_collection->GetNextActor()->GetUserMatrix();
+      Eigen::Matrix4d X_WA_imported = Eigen::Matrix4d::Identity();
+      if (matrix != nullptr) {
+        for (int i = 0; i < 4; ++i) {
+          for (int j = 0; j < 4; ++j) {
+            X_WA_imported(i, j) = matrix->GetElement(i, j);
+          }
+        }
+      }
+      if ((X_WA_imported - X_WA).norm() > kPoseTolerance * (1 + X_WA.norm())) {
+        return false;
       }
     }
-  } else {  // FLAGS_image_type == "label"
-    // Following the client-server API (see render_gltf_client_doxygen.h), the
-    // background of a label image should be set to white.
-    renderer->SetBackground(1.0, 1.0, 1.0);
-
-    // Same as RenderEngineVtk, label actors have lighting disabled.  Labels
-    // have already been encoded as geometry materials in the glTF.  By
-    // disabling lighting we also don't have to worry about the same PBR issues
-    // as for color images.
-    vtkActorCollection* actor_collection = renderer->GetActors();
-    actor_collection->InitTraversal();
-    for (int i = 0; i < actor_collection->GetNumberOfItems(); ++i) {
-      vtkActor* actor = actor_collection->GetNextActor();
-      actor->GetProperty()->LightingOff();
+    if (poses.camera.has_value()) {
+      const Eigen::Matrix4d& X_WC = *poses.camera;
+      vtkCamera* camera = renderer_->GetActiveCamera();
+      // glTF cameras look along their -z axis, with +y up.
+      if (!is_near(X_WC.topRightCorner<3, 1>(), camera->GetPosition()) ||
+          !is_near(-X_WC.col(2).head<3>().normalized(),
+                   camera->GetDirectionOfProjection()) ||
+          !is_near(X_WC.col(1).head<3>().normalized(), camera->GetViewUp())) {
+        return false;
+      }
     }
+    return true;
   }
 
-  // Render the scene and export to a vtkWindowToImageFilter.
-  render_window->Render();
-
-  // Export to the image file via vtk{PNG, TIFF}Writer.
-  if (FLAGS_image_type == "depth") {
-    /* For the depth image, we need to unpack the RGB channels from the shader
-     in the same way that RenderEngineVtk does. */
-    // First: export the image to a local buffer.
-    vtkNew<vtkImageExport> image_export;
-    image_export->SetInputConnection(window_to_image_filter->GetOutputPort());
-    image_export->Update();
-    ImageRgba8U rgb_image(FLAGS_width, FLAGS_height);
-    image_export->Export(rgb_image.at(0, 0));
-
-    // Next: convert this to a 32-bit floating point format.
-    ImageDepth32F depth_image_out(FLAGS_width, FLAGS_height);
-    const double min_depth = FLAGS_min_depth;
-    const double max_depth = FLAGS_max_depth;
-    for (int v = 0; v < FLAGS_height; ++v) {
-      for (int u = 0; u < FLAGS_width; ++u) {
-        if (rgb_image.at(u, v)[0] == 255u && rgb_image.at(u, v)[1] == 255u &&
-            rgb_image.at(u, v)[2] == 255u) {
-          depth_image_out.at(u, v)[0] =
-              ImageTraits<PixelType::kDepth32F>::kTooFar;
-        } else {
-          /* Decoding three channel color values to a float value. For the
-           detail, see depth_shaders.h. */
-          float shader_value = rgb_image.at(u, v)[0] +
-                               rgb_image.at(u, v)[1] / 255. +
-                               rgb_image.at(u, v)[2] / (255. * 255.);
-
-          // Dividing by 255 so that the range gets to be [0, 1].
-          shader_value /= 255.f;
-          depth_image_out.at(u, v)[0] =
-              CheckRangeAndConvertToMeters(shader_value, min_depth, max_depth);
+  /* Poses the actors and the camera with the given `poses`, which must be
+   those of a scene with the same geometry as the one that was imported (i.e.,
+   the same `geometry_sha256`).
+   @pre HasPoses() was true for the poses of the imported scene. */
+  void SetPoses(const ScenePoses& poses) {
+    vtkActorCollection* actor_collection = renderer_->GetActors();
+    DRAKE_THROW_UNLESS(actor_collection->GetNumberOfItems() ==
+                       ssize(poses.actors));
+    actor_collection->InitTraversal();
+    for (const Eigen::Matrix4d& X_WA : poses.actors) {
+      vtkNew<vtkMatrix4x4> matrix;
+      for (int i = 0; i < 4; ++i) {
+        for (int j = 0; j < 4; ++j) {
+          matrix->SetElement(i, j, X_WA(i, j));
         }
       }
+      actor_collection->GetNextActor()->SetUserMatrix(matrix);
+    }
+    if (poses.camera.has_value()) {
+      const Eigen::Matrix4d& X_WC = *poses.camera;
+      vtkCamera* camera = renderer_->GetActiveCamera();
+      const double distance = camera->GetDistance();
+      const Eigen::Vector3d position = X_WC.topRightCorner<3, 1>();
+      const Eigen::Vector3d focal_point =
+          position - distance * X_WC.col(2).head<3>().normalized();
+      const Eigen::Vector3d view_up = X_WC.col(1).head<3>().normalized();
+      camera->SetPosition(position.data());
+      camera->SetFocalPoint(focal_point.data());
+      camera->SetViewUp(view_up.data());
     }
+  }
 
-    /* Allocate a single channel float image.  Note that vtkImageData supports
-     3D data, the last channel in SetDimensions being `z`. */
-    vtkNew<vtkTIFFWriter> writer;
-    vtkNew<vtkImageData> image_data;
-    writer->SetInputDataObject(image_data);
-    image_data->SetDimensions(FLAGS_width, FLAGS_height, 1);
-    image_data->AllocateScalars(VTK_FLOAT, 1);
-    float* ptr = static_cast<float*>(image_data->GetScalarPointer(0, 0, 0));
-    for (int y = 0; y < FLAGS_height; ++y) {
-      for (int x = 0; x < FLAGS_width; ++x) {
-        *ptr++ = depth_image_out.at(x, y)[0];
-      }
+  /* Renders the scene with the given camera intrinsics, and returns the
+   rendered RGBA image.  For a depth image, the depth is encoded in the RGB
+   channels; see EncodeImage(). */
+  ImageRgba8U Render(const RenderParams& params) {
+    DRAKE_DEMAND(params.image_type == image_type_);
+    render_window_->SetSize(params.width, params.height);
+    CalcProjectionMatrix(params, renderer_);
+    uniform_setting_callback_->set_z_near(params.min_depth);
+    uniform_setting_callback_->set_z_far(params.max_depth);
+
+    render_window_->Render();
+    window_to_image_filter_->Modified();
+    window_to_image_filter_->Update();
+
+    ImageRgba8U image(params.width, params.height);
+    image_export_->Update();
+    image_export_->Export(image.at(0, 0));
+    return image;
+  }
+
+ private:
+  // The tolerance for matching the imported poses, which vtkGLTFImporter
+  // might have computed in single precision.
+  static constexpr double kPoseTolerance = 1e-5;
+
+  const std::string image_type_;
+  vtkNew<vtkRenderer> renderer_;
+  vtkSmartPointer<vtkRenderWindow> render_window_;
+  vtkNew<vtkWindowToImageFilter> window_to_image_filter_;
+  vtkNew<vtkImageExport> image_export_;
+  vtkNew<vtkGLTFImporter> importer_;
+  // Only used for depth images.
+  vtkNew<ShaderCallback> uniform_setting_callback_;
+};
+
+/* Encodes the depth image as the contents of an uncompressed, single strip,
+ 32-bit floating point TIFF file.  This is done by hand because ImageIo cannot
+ save TIFF images to memory. */
+std::vector<uint8_t> EncodeTiff(const ImageDepth32F& image) {
+  const uint32_t width = image.width();
+  const uint32_t height = image.height();
+  const uint32_t data_size = width * height * sizeof(float);
+  std::vector<uint8_t> result;
+  result.reserve(data_size + 256);
+  // All values are little-endian.
+  const auto put16 = [&result](uint16_t value) {
+    result.push_back(value & 0xff);
+    result.push_back(value >> 8);
+  };
+  const auto put32 = [&put16](uint32_t value) {
+    put16(value & 0xffff);
+    put16(value >> 16);
+  };
+
+  // The header, with the offset of the image file directory that follows the
+  // pixel data.
+  result.push_back('I');
+  result.push_back('I');
+  put16(42);
+  put32(8 + data_size);
+
+  // The pixel data, row by row from the top.
+  for (uint32_t v = 0; v < height; ++v) {
+    for (uint32_t u = 0; u < width; ++u) {
+      const float value = image.at(u, v)[0];
+      uint32_t bits{};
+      std::memcpy(&bits, &value, sizeof(bits));
+      put32(bits);
+    }
+  }
+
+  // The image file directory, i.e., its number of entries, the entries (in
+  // increasing order of their tags) each with a single value of type SHORT (3)
+  // or LONG (4), and the offset of the next directory (none).
+  struct Entry {
+    uint16_t tag;
+    uint16_t type;
+    uint32_t value;
+  };
+  const Entry entries[] = {
+      {256, 4, width},      // ImageWidth.
+      {257, 4, height},     // ImageLength.
+      {258, 3, 32},         // BitsPerSample.
+      {259, 3, 1},          // Compression: none.
+      {262, 3, 1},          // PhotometricInterpretation: BlackIsZero.
+      {273, 4, 8},          // StripOffsets.
+      {277, 3, 1},          // SamplesPerPixel.
+      {278, 4, height},     // RowsPerStrip.
+      {279, 4, data_size},  // StripByteCounts.
+      {339, 3, 3},          // SampleFormat: IEEE floating point.
+  };
+  put16(std::size(entries));
+  for (const Entry& entry : entries) {
+    put16(entry.tag);
+    put16(entry.type);
+    put32(1);
+    if (entry.type == 3) {
+      put16(entry.value);
+      put16(0);
+    } else {
+      put32(entry.value);
     }
-    writer->SetFileName(FLAGS_output_path.c_str());
-    writer->Write();
-  } else {  // FLAGS_image_type == "label" || FLAGS_image_type == "color"
-    /* Exporting the color image is straightforward, just use the normal VTK
-     pipeline to save the final results from the render_window.
-
-     For the label image, the server returns a colored label image instead. The
-     client, RenderEngineGltfClient, is responsible for reading the colored
+  }
+  put32(0);
+  return result;
+}
+
+/* Encodes the image rendered by ResidentScene::Render() as the contents of a
+ PNG file (for color and label images) or a TIFF file (for depth images). */
+std::vector<uint8_t> EncodeImage(const RenderParams& params,
+                                 const ImageRgba8U& rgb_image) {
+  if (params.image_type != "depth") {
+    /* For the label image, the server returns a colored label image instead.
+     The client, RenderEngineGltfClient, is responsible for reading the colored
      label image and converting it to the actual label image.  This decision
      was made because Drake has its own internal interpretation from a color
      value to a label value.  The glTF file for the label images already
      contains RGB values encoding labels. */
-    vtkNew<vtkPNGWriter> writer;
-    writer->SetFileName(FLAGS_output_path.c_str());
-    writer->SetInputConnection(window_to_image_filter->GetOutputPort());
-    writer->Write();
+    return ImageIo{}.Save(rgb_image, ImageFileFormat::kPng);
+  }
+
+  /* For the depth image, we need to unpack the RGB channels from the shader in
+   the same way that RenderEngineVtk does, to a 32-bit floating point format. */
+  ImageDepth32F depth_image_out(params.width, params.height);
+  for (int v = 0; v < params.height; ++v) {
+    for (int u = 0; u < params.width; ++u) {
+      if (rgb_image.at(u, v)[0] == 255u && rgb_image.at(u, v)[1] == 255u &&
+          rgb_image.at(u, v)[2] == 255u) {
+        depth_image_out.at(u, v)[0] =
+            ImageTraits<PixelType::kDepth32F>::kTooFar;
+      } else {
+        /* Decoding three channel color values to a float value. For the
+         detail, see depth_shaders.h. */
+        float shader_value = rgb_image.at(u, v)[0] +
+                             rgb_image.at(u, v)[1] / 255. +
+                             rgb_image.at(u, v)[2] / (255. * 255.);
+
+        // Dividing by 255 so that the range gets to be [0, 1].
+        shader_value /= 255.f;
+        depth_image_out.at(u, v)[0] = CheckRangeAndConvertToMeters(
+            shader_value, params.min_depth, params.max_depth);
+      }
+    }
+  }
+  return EncodeTiff(depth_image_out);
+}
+
+/* The scenes kept imported while serving, in order of their most recent use.
+ Scenes are identified by the sha256 hash of their geometry (i.e., of the scene
+ without the transforms of its nodes) and the type of image that they are set
+ up to render; see the description of the `--serve` mode at the top of this
+ file. */
+class ResidentScenes {
+ public:
+  explicit ResidentScenes(int capacity) : capacity_(capacity) {
+    DRAKE_DEMAND(capacity >= 1);
+  }
+
+  /* Returns the scene for the given request, posed as in the scene at
+   `params.input_path`.  The scene is imported from there (evicting the least
+   recently used scene, if need be) unless its geometry is already resident
+   (and it can be posed anew, if its poses differ).  Sets `resident` to whether
+   it was. */
+  ResidentScene& Get(const RenderParams& params, bool* resident) {
+    if (!ValidateInputPath(params.input_path)) {
+      throw std::runtime_error(
+          fmt::format("Invalid input path: '{}'", params.input_path));
+    }
+    const std::string key = params.geometry_sha256 + "/" + params.image_type;
+    for (auto iter = scenes_.begin(); iter != scenes_.end(); ++iter) {
+      if (iter->key != key) continue;
+      if (iter->scene_sha256 != params.scene_sha256) {
+        if (!iter->posable) {
+          // Import the scene anew, below.
+          scenes_.erase(iter);
+          break;
+        }
+        iter->scene->SetPoses(ReadScenePoses(params.input_path));
+        iter->scene_sha256 = params.scene_sha256;
+      }
+      scenes_.splice(scenes_.begin(), scenes_, iter);
+      *resident = true;
+      return *scenes_.front().scene;
+    }
+    *resident = false;
+    // Evict first, so that at most `capacity_` render windows ever exist.
+    while (static_cast<int>(scenes_.size()) >= capacity_) {
+      scenes_.pop_back();
+    }
+    auto scene =
+        std::make_unique<ResidentScene>(params.input_path, params.image_type);
+    const bool posable = scene->HasPoses(ReadScenePoses(params.input_path));
+    if (!posable) {
+      log()->warn(
+          "The imported geometries of '{}' do not match the nodes of the "
+          "scene; it will be imported again whenever it moves",
+          params.input_path);
+    }
+    scenes_.push_front(Entry{.key = key,
+                             .scene_sha256 = params.scene_sha256,
+                             .posable = posable,
+                             .scene = std::move(scene)});
+    return *scenes_.front().scene;
+  }
+
+ private:
+  struct Entry {
+    std::string key;
+    // The hash of the scene whose poses the resident scene has.
+    std::string scene_sha256;
+    // Whether the resident scene can be posed anew; see
+    // ResidentScene::HasPoses().
+    bool posable{};
+    std::unique_ptr<ResidentScene> scene;
+  };
+
+  const int capacity_;
+  std::list<Entry> scenes_;
+};
+
+/* Returns the parameters of a request read when serving. */
+RenderParams ParseRequest(const std::string& line) {
+  const nlohmann::json request = nlohmann::json::parse(line);
+  RenderParams params{
+      .input_path = request.at("input_path").get<std::string>(),
+      .scene_sha256 = request.at("scene_sha256").get<std::string>(),
+      .geometry_sha256 = request.at("geometry_sha256").get<std::string>(),
+      .image_type = request.at("image_type").get<std::string>(),
+      .width = request.at("width").get<int>(),
+      .height = request.at("height").get<int>(),
+      .near = request.at("near").get<double>(),
+      .far = request.at("far").get<double>(),
+      .focal_x = request.at("focal_x").get<double>(),
+      .focal_y = request.at("focal_y").get<double>(),
+      .center_x = request.at("center_x").get<double>(),
+      .center_y = request.at("center_y").get<double>(),
+      .min_depth = request.value("min_depth", -1.0),
+      .max_depth = request.value("max_depth", -1.0)};
+  if (params.image_type != "color" && params.image_type != "depth" &&
+      params.image_type != "label") {
+    throw std::runtime_error(
+        fmt::format("Invalid image_type: '{}'", params.image_type));
+  }
+  if (params.width <= 0 || params.height <= 0) {
+    throw std::runtime_error(
+        fmt::format("Invalid image size: {}x{}", params.width, params.height));
   }
+  return params;
+}
 
+/* Serves the render requests read from stdin until it is closed; see the
+ description of the `--serve` mode at the top of this file. */
+int DoServe() {
+  if (FLAGS_max_resident_scenes < 1) {
+    log()->error("max_resident_scenes must be positive");
+    return 1;
+  }
+
+  // The replies are written to the original stdout.  Anything else printed to
+  // stdout (e.g., by VTK) is redirected to stderr, so that it cannot corrupt
+  // the replies.
+  FILE* const replies = fdopen(dup(STDOUT_FILENO), "wb");
+  DRAKE_DEMAND(replies != nullptr);
+  dup2(STDERR_FILENO, STDOUT_FILENO);
+
+  using Clock = std::chrono::steady_clock;
+  const auto seconds_since = [](const Clock::time_point& start) {
+    return std::chrono::duration<double>(Clock::now() - start).count();
+  };
+
+  ResidentScenes scenes(FLAGS_max_resident_scenes);
+  std::string line;
+  while (std::getline(std::cin, line)) {
+    if (line.empty()) continue;
+    nlohmann::json reply;
+    std::vector<uint8_t> image;
+    try {
+      const RenderParams params = ParseRequest(line);
+      auto start = Clock::now();
+      bool resident{};
+      ResidentScene& scene = scenes.Get(params, &resident);
+      const double load_time = seconds_since(start);
+      start = Clock::now();
+      const ImageRgba8U rgb_image = scene.Render(params);
+      const double render_time = seconds_since(start);
+      start = Clock::now();
+      image = EncodeImage(params, rgb_image);
+      const double encode_time = seconds_since(start);
+      reply = {{"size", image.size()},
+               {"resident", resident},
+               {"load", load_time},
+               {"render", render_time},
+               {"encode", encode_time}};
+    } catch (const std::exception& e) {
+      image.clear();
+      reply = {{"error", e.what()}};
+    }
+    const std::string header = reply.dump() + "\n";
+    std::fwrite(header.data(), 1, header.size(), replies);
+    std::fwrite(image.data(), 1, image.size(), replies);
+    std::fflush(replies);
+  }
+  std::fclose(replies);
   return 0;
 }
 
+/* Renders the single image specified by the command-line flags. */
+int DoMain() {
+  if (FLAGS_serve) return DoServe();
+
+  if (!ValidateInputPath(FLAGS_input_path) ||
+      !ValidateOutputPath(FLAGS_output_path) || !ValidateOutputExtension()) {
+    return 1;
+  }
+  // All the input args should be validated past this point.
+  const RenderParams params{.input_path = FLAGS_input_path,
+                            .image_type = FLAGS_image_type,
+                            .width = FLAGS_width,
+                            .height = FLAGS_height,
+                            .near = FLAGS_near,
+                            .far = FLAGS_far,
+                            .focal_x = FLAGS_focal_x,
+                            .focal_y = FLAGS_focal_y,
+                            .center_x = FLAGS_center_x,
+                            .center_y = FLAGS_center_y,
+                            .min_depth = FLAGS_min_depth,
+                            .max_depth = FLAGS_max_depth};
+
+  ResidentScene scene(params.input_path, params.image_type);
+  const std::vector<uint8_t> image = EncodeImage(params, scene.Render(params));
+  std::ofstream output(FLAGS_output_path, std::ios::binary);
+  output.write(reinterpret_cast<const char*>(image.data()), image.size());
+  return output.good() ? 0 : 1;
+}
+
 }  // namespace
 }  // namespace internal
 }  // namespace render_gltf_client
@@ -1,8 +1,17 @@
 #include "drake/geometry/meshcat_recording_internal.h"
 
+#include <filesystem>
+#include <fstream>
+#include <sstream>
+#include <string>
 #include <vector>
 
 #include <gtest/gtest.h>
+#include <nlohmann/json.hpp>
+#include <zlib.h>
+
+#include "drake/common/temp_directory.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
 
 namespace drake {
 namespace geometry {
@@ -103,6 +112,130 @@ GTEST_TEST(MeshcatRecordingInternalTest, Properties) {
   }
 }
 
+std::string ReadFile(const std::filesystem::path& filename) {
+  std::ifstream input(filename, std::ios::binary);
+  std::stringstream buffer;
+  buffer << input.rdbuf();
+  return buffer.str();
+}
+
+// Reads back a chunk file written by MeshcatRecordingStream.
+nlohmann::json ReadChunk(const std::filesystem::path& filename) {
+  const std::string compressed = ReadFile(filename);
+  std::vector<uint8_t> message(1 << 20);
+  uLongf size = message.size();
+  const int status = uncompress(
+      message.data(), &size, reinterpret_cast<const Bytef*>(compressed.data()),
+      compressed.size());
+  DRAKE_DEMAND(status == Z_OK);
+  message.resize(size);
+  return nlohmann::json::from_msgpack(message);
+}
+
+// Returns the key times of the given path's property track in a chunk.
+std::vector<int> GetKeyTimes(const nlohmann::json& chunk, std::string_view path,
+                             std::string_view property) {
+  std::vector<int> result;
+  for (const auto& animation : chunk["animations"]) {
+    if (animation["path"] != path) continue;
+    for (const auto& track : animation["clip"]["tracks"]) {
+      if (track["name"] != fmt::format(".{}", property)) continue;
+      for (const auto& key : track["keys"]) {
+        result.push_back(key["time"].get<int>());
+      }
+    }
+  }
+  return result;
+}
+
+GTEST_TEST(MeshcatRecordingInternalTest, Stream) {
+  const std::filesystem::path directory = temp_directory() + "/stream";
+  MeshcatStreamingRecordingParams params;
+  params.directory = directory.string();
+  params.frames_per_second = 64.0;
+  params.frames_per_chunk = 10;
+  params.translation_tolerance = 0.1;
+  MeshcatRecordingStream dut(params, [](std::string_view path) {
+    return fmt::format("/drake/{}", path);
+  });
+  EXPECT_EQ(dut.frame(0.5), 32);
+
+  // The body sits still for 15 frames, then jumps and sits still again. The
+  // small wiggles are within tolerance and will be pruned.
+  for (int frame = 0; frame < 25; ++frame) {
+    const double x = (frame < 15 ? 0.0 : 1.0) + 0.01 * (frame % 2);
+    dut.SetTransform(frame, "body", RigidTransformd(Eigen::Vector3d(x, 0, 0)));
+    dut.SetProperty(frame, "body", "visible", true);
+  }
+
+  // Frames in chunks that have already been written are rejected.
+  EXPECT_EQ(dut.num_chunks(), 2);
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      dut.SetProperty(5, "body", "visible", false),
+      ".*frame 5 of body property visible.*before 20.*");
+
+  // Going back in time within the current chunk is fine.
+  EXPECT_NO_THROW(dut.SetProperty(20, "body", "visible", true));
+
+  // Changing the type of a track is rejected.
+  DRAKE_EXPECT_THROWS_MESSAGE(dut.SetProperty(22, "body", "visible", 1.0),
+                              ".*visible.*boolean != number.*");
+
+  dut.Flush();
+  EXPECT_EQ(dut.num_chunks(), 3);
+  EXPECT_GT(dut.num_bytes(), 0);
+  EXPECT_GT(dut.num_pruned(), 0);
+
+  const nlohmann::json index =
+      nlohmann::json::parse(ReadFile(directory / "index.json"));
+  EXPECT_EQ(index["num_frames"], 25);
+  EXPECT_EQ(index["frames_per_chunk"], 10);
+  ASSERT_EQ(index["chunks"].size(), 3);
+  EXPECT_EQ(index["chunks"][1]["start_frame"], 10);
+  EXPECT_EQ(index["chunks"][1]["end_frame"], 20);
+
+  // The files are written via temporary files, none of which are left behind.
+  int num_files = 0;
+  for (const auto& entry : std::filesystem::directory_iterator(directory)) {
+    EXPECT_NE(entry.path().extension(), ".tmp") << entry.path();
+    ++num_files;
+  }
+  EXPECT_EQ(num_files, 4);
+
+  // Each chunk starts with a keyframe (at relative time zero), and the jump at
+  // frame 15 is preceded by a hold keyframe at frame 14.
+  const nlohmann::json chunk =
+      ReadChunk(directory / index["chunks"][1]["file"].get<std::string>());
+  EXPECT_EQ(chunk["type"], "set_animation");
+  EXPECT_EQ(GetKeyTimes(chunk, "/drake/body", "position"),
+            std::vector<int>({0, 4, 5, 9}));
+  EXPECT_EQ(GetKeyTimes(chunk, "/drake/body", "quaternion"),
+            std::vector<int>({0, 9}));
+  EXPECT_EQ(GetKeyTimes(chunk, "/drake/body", "visible"),
+            std::vector<int>({0, 9}));
+}
+
+GTEST_TEST(MeshcatRecordingInternalTest, StreamingLifecycle) {
+  MeshcatStreamingRecordingParams params;
+  params.directory = temp_directory() + "/lifecycle";
+  params.frames_per_chunk = 4;
+  MeshcatRecording dut;
+  dut.StartStreamingRecording(params, false, [](std::string_view path) {
+    return std::string(path);
+  });
+  ASSERT_NE(dut.get_mutable_stream(), nullptr);
+  EXPECT_FALSE(dut.SetProperty("path", "bravo", true, 0.0));
+  EXPECT_FALSE(dut.SetTransform("path", RigidTransformd::Identity(), 0.5));
+  EXPECT_TRUE(dut.SetTransform("path", RigidTransformd::Identity(), {}));
+  // Frames go to the stream, not the in-memory animation.
+  EXPECT_EQ(dut.get_animation().get_key_frame<bool>(0, "path", "bravo"),
+            std::nullopt);
+  dut.StopRecording();
+  EXPECT_EQ(dut.get_mutable_stream()->num_chunks(), 2);
+  dut.DeleteRecording();
+  EXPECT_EQ(dut.get_mutable_stream(), nullptr);
+}
+
 }  // namespace
 }  // namespace internal
 }  // namespace geometry
@@ -728,6 +728,50 @@ GTEST_TEST(MeshcatTest, SetTransformWithMatrix) {
   EXPECT_TRUE(CompareMatrices(actual_value, matrix));
 }
 
+GTEST_TEST(MeshcatTest, SetTransforms) {
+  Meshcat meshcat;
+  const std::vector<std::string> paths{"frame1", "frame2", "/absolute"};
+  const std::vector<RigidTransformd> X_ParentPaths{
+      RigidTransformd{RollPitchYawd(0.5, 0.26, -3), Vector3d{0.9, -2.0, 0.12}},
+      RigidTransformd{Vector3d{1.0, 2.0, 3.0}},
+      RigidTransformd{RollPitchYawd(-0.1, 0.2, 0.3), Vector3d::Zero()}};
+  meshcat.SetTransforms(paths, X_ParentPaths);
+
+  // The result is the same as one SetTransform() call per path.
+  const std::vector<std::string> expected_paths{"/drake/frame1",
+                                                "/drake/frame2", "/absolute"};
+  for (int i = 0; i < ssize(paths); ++i) {
+    const auto [actual_path, actual_value] =
+        GetDecodedTransform(meshcat, paths[i]);
+    EXPECT_EQ(actual_path, expected_paths[i]);
+    EXPECT_TRUE(CompareMatrices(actual_value, X_ParentPaths[i].GetAsMatrix4()));
+  }
+
+  // Matrix overload.
+  Eigen::Matrix4d matrix;
+  // clang-format off
+  matrix <<  1,  2,  3,  4,
+             5,  6,  7,  8,
+            -1, -2, -3, -4,
+            -5, -6, -7, -8;
+  // clang-format on
+  meshcat.SetTransforms({"frame1"}, std::vector<Eigen::Matrix4d>{matrix});
+  const auto [actual_path, actual_value] =
+      GetDecodedTransform(meshcat, "frame1");
+  EXPECT_EQ(actual_path, "/drake/frame1");
+  EXPECT_TRUE(CompareMatrices(actual_value, matrix));
+
+  // Empty batches are fine.
+  meshcat.SetTransforms({}, std::vector<RigidTransformd>{});
+
+  // Mismatched sizes are not.
+  EXPECT_THROW(meshcat.SetTransforms({"frame1", "frame2"}, {RigidTransformd{}}),
+               std::exception);
+  EXPECT_THROW(
+      meshcat.SetTransforms({"frame1"}, std::vector<Eigen::Matrix4d>{}),
+      std::exception);
+}
+
 GTEST_TEST(MeshcatTest, Delete) {
   Meshcat meshcat;
   // Ok to delete an empty tree.
@@ -1362,6 +1406,15 @@ GTEST_TEST(MeshcatTest, Recording) {
       dut->SetProperty("foo", "delta", time, time);
       dut->SetProperty("foo", "victor", Vec{time, time, time}, time);
       dut->SetTransform("foo", RigidTransformd{Vector3d::Constant(time)}, time);
+      dut->SetTransforms({"bar", "baz"},
+                         {RigidTransformd{Vector3d::Constant(time)},
+                          RigidTransformd{Vector3d::Constant(-time)}},
+                         time);
+      dut->SetTransforms(
+          {"qux"},
+          std::vector<Eigen::Matrix4d>{
+              RigidTransformd{Vector3d::Constant(time)}.GetAsMatrix4()},
+          time);
 
       // Check exactly which properties and frames have been recorded. (Note
       // that nothing here is affected by `is_live`; the recording should be the
@@ -1376,6 +1429,13 @@ GTEST_TEST(MeshcatTest, Recording) {
         ASSERT_EQ(has_animation_property<double>(*dut, "delta", i), expected);
         ASSERT_EQ(has_animation_property<Vec>(*dut, "victor", i), expected);
         ASSERT_EQ(has_animation_property<Vec>(*dut, "position", i), expected);
+        for (const char* path : {"bar", "baz", "qux"}) {
+          ASSERT_EQ(dut->get_recording()
+                        .get_key_frame<Vec>(i, path, "position")
+                        .has_value(),
+                    expected)
+              << path;
+        }
       }
 
       // Check the live property values. The dut_live will update all the time,
@@ -1391,8 +1451,18 @@ GTEST_TEST(MeshcatTest, Recording) {
       EXPECT_EQ(delta, live_time);
       EXPECT_EQ(victor.at(0), live_time);
       EXPECT_EQ(transform(0, 3), live_time);
+      EXPECT_EQ(GetDecodedTransform(*dut, "bar").second(0, 3), live_time);
+      EXPECT_EQ(GetDecodedTransform(*dut, "baz").second(0, 3), -live_time);
+      EXPECT_EQ(GetDecodedTransform(*dut, "qux").second(0, 3), live_time);
     }
   }
+
+  // When recording, the matrices must be rigid transforms.
+  Meshcat meshcat;
+  meshcat.StartRecording();
+  const std::vector<Eigen::Matrix4d> scaled{2 * Eigen::Matrix4d::Identity()};
+  EXPECT_NO_THROW(meshcat.SetTransforms({"foo"}, scaled));
+  EXPECT_THROW(meshcat.SetTransforms({"foo"}, scaled, 0.0), std::exception);
 }
 
 GTEST_TEST(MeshcatTest, Set2dRenderMode) {
@@ -1,6 +1,7 @@
 #include "drake/lcm/drake_lcm_log.h"
 
 #include <chrono>
+#include <cstdio>
 #include <limits>
 #include <map>
 #include <stdexcept>
@@ -11,6 +12,7 @@
 
 #include "drake/common/drake_assert.h"
 #include "drake/common/string_map.h"
+#include "drake/lcm/lcm_log_index.h"
 
 namespace drake {
 namespace lcm {
@@ -27,6 +29,8 @@ class DrakeLcmLog::Impl {
       log_{nullptr, &::lcm_eventlog_destroy};
   std::unique_ptr<::lcm_eventlog_event_t, decltype(&::lcm_eventlog_free_event)>
       next_event_{nullptr, &::lcm_eventlog_free_event};
+  // Built upon the first call to SeekToTime.
+  std::unique_ptr<LcmLogIndex> index_;
 };
 
 DrakeLcmLog::DrakeLcmLog(const std::string& file_name, bool is_write,
@@ -34,6 +38,7 @@ DrakeLcmLog::DrakeLcmLog(const std::string& file_name, bool is_write,
     : is_write_(is_write),
       overwrite_publish_time_with_system_clock_(
           overwrite_publish_time_with_system_clock),
+      file_name_(file_name),
       url_("lcmlog://" + file_name),
       impl_(new Impl) {
   if (is_write_) {
@@ -157,6 +162,27 @@ void DrakeLcmLog::DispatchMessageAndAdvanceLog(double current_time) {
   impl_->next_event_.reset(lcm_eventlog_read_next_event(impl_->log_.get()));
 }
 
+void DrakeLcmLog::SeekToTime(double time_sec) {
+  if (is_write_) {
+    throw std::logic_error("SeekToTime is only available for log playback.");
+  }
+
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (impl_->index_ == nullptr) {
+    impl_->index_ = std::make_unique<LcmLogIndex>(file_name_);
+  }
+  const LcmLogIndex& index = *impl_->index_;
+  const int next = index.FindMessage(time_sec);
+  ::FILE* const file = impl_->log_->f;
+  const int error = (next < index.num_messages())
+                        ? ::fseeko(file, index.GetFileOffset(next), SEEK_SET)
+                        : ::fseeko(file, 0, SEEK_END);
+  if (error != 0) {
+    throw std::runtime_error("SeekToTime failed to seek in the log file.");
+  }
+  impl_->next_event_.reset(lcm_eventlog_read_next_event(impl_->log_.get()));
+}
+
 void DrakeLcmLog::OnHandleSubscriptionsError(const std::string& error_message) {
   // We are not called via LCM C code, so it's safe to throw there.
   throw std::runtime_error(error_message);
@@ -117,6 +117,18 @@ class DrakeLcmLog : public DrakeLcmInterface {
    */
   void DispatchMessageAndAdvanceLog(double current_time);
 
+  /**
+   * Moves the cursor of the log so that the next message is the first one
+   * logged at or after @p time_sec (or the end of the log, if there is no such
+   * message). The cursor may move backward or forward. The first call builds
+   * an LcmLogIndex by scanning the log (without writing anything to disk),
+   * after which each call takes O(log n) time.
+   *
+   * @throws std::exception if this instance is not constructed in read-only
+   * mode.
+   */
+  void SeekToTime(double time_sec);
+
   /**
    * Returns true if this instance is constructed in write-only mode.
    */
@@ -152,6 +164,7 @@ class DrakeLcmLog : public DrakeLcmInterface {
 
   const bool is_write_;
   const bool overwrite_publish_time_with_system_clock_;
+  const std::string file_name_;
   const std::string url_;
 
   // TODO(jwnimmer-tri) It is not clear to me why this class needs a mutex
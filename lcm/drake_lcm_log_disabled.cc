@@ -75,6 +75,10 @@ void DrakeLcmLog::DispatchMessageAndAdvanceLog(double) {
   ThrowError();
 }
 
+void DrakeLcmLog::SeekToTime(double) {
+  ThrowError();
+}
+
 void DrakeLcmLog::OnHandleSubscriptionsError(const std::string&) {
   ThrowError();
 }
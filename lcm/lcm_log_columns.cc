@@ -0,0 +1,428 @@
+#include "drake/lcm/lcm_log_columns.h"
+
+#include <algorithm>
+#include <bit>
+#include <cstring>
+#include <memory>
+#include <stdexcept>
+#include <utility>
+
+#include <fmt/format.h>
+
+#include "drake/common/drake_assert.h"
+
+namespace drake {
+namespace lcm {
+namespace {
+
+struct PrimitiveInfo {
+  std::string_view lcm_name;
+  std::string_view dtype;
+  int size{};
+  bool is_integer{};
+};
+
+// The LCM primitive types (other than "string"), and their NumPy equivalents.
+constexpr PrimitiveInfo kPrimitives[] = {
+    {"int8_t", "int8", 1, true},    {"int16_t", "int16", 2, true},
+    {"int32_t", "int32", 4, true},  {"int64_t", "int64", 8, true},
+    {"float", "float32", 4, false}, {"double", "float64", 8, false},
+    {"boolean", "bool", 1, false},  {"byte", "uint8", 1, false},
+};
+
+const PrimitiveInfo* FindPrimitive(std::string_view lcm_name) {
+  for (const PrimitiveInfo& info : kPrimitives) {
+    if (info.lcm_name == lcm_name) {
+      return &info;
+    }
+  }
+  return nullptr;
+}
+
+// Reads big-endian values from one message's encoding.
+class Reader {
+ public:
+  Reader(std::string_view data, int message) : data_(data), message_(message) {}
+
+  int64_t remaining() const { return static_cast<int64_t>(data_.size()); }
+
+  const char* Take(int64_t num_bytes) {
+    if (num_bytes > remaining()) {
+      throw std::runtime_error(fmt::format(
+          "ExtractLcmLogColumns: message {} is truncated or does not match the "
+          "schema",
+          message_));
+    }
+    const char* result = data_.data();
+    data_.remove_prefix(num_bytes);
+    return result;
+  }
+
+  uint64_t ReadUnsigned(int num_bytes) {
+    const char* data = Take(num_bytes);
+    uint64_t result = 0;
+    for (int i = 0; i < num_bytes; ++i) {
+      result = (result << 8) | static_cast<uint8_t>(data[i]);
+    }
+    return result;
+  }
+
+  int message() const { return message_; }
+
+ private:
+  std::string_view data_;
+  const int message_;
+};
+
+// Sign-extends the low `num_bytes` bytes of `value`.
+int64_t SignExtend(uint64_t value, int num_bytes) {
+  const int shift = 64 - 8 * num_bytes;
+  return static_cast<int64_t>(value << shift) >> shift;
+}
+
+// Decodes messages of one schema into columns. The schema is compiled into a
+// tree of plans once, so that decoding a message does no lookups by name and
+// no allocations other than growing the output arrays.
+class ColumnDecoder {
+ public:
+  explicit ColumnDecoder(const LcmMessageSchema& schema)
+      : fingerprint_(schema.fingerprint) {
+    if (schema.structs.empty()) {
+      throw std::logic_error(
+          "ExtractLcmLogColumns: the schema does not describe any structs");
+    }
+    std::vector<int> stack;
+    root_ = Compile(schema, 0, "", &stack);
+  }
+
+  void Decode(std::string_view payload, int message) {
+    Reader reader(payload, message);
+    const uint64_t fingerprint = reader.ReadUnsigned(8);
+    if (fingerprint_.has_value() && fingerprint != *fingerprint_) {
+      throw std::runtime_error(fmt::format(
+          "ExtractLcmLogColumns: message {} has fingerprint {:#018x} but the "
+          "schema expects {:#018x}",
+          message, fingerprint, *fingerprint_));
+    }
+    DecodeStruct(*root_, &reader);
+    if (reader.remaining() != 0) {
+      throw std::runtime_error(fmt::format(
+          "ExtractLcmLogColumns: message {} has {} bytes left over after "
+          "decoding; it does not match the schema",
+          message, reader.remaining()));
+    }
+  }
+
+  // Grows the output capacities in proportion to what has been decoded so far.
+  void Reserve(double scale) {
+    for (Values& values : values_) {
+      values.data.reserve(values.data.size() * scale);
+    }
+    for (Offsets& offsets : offsets_) {
+      offsets.data.reserve(offsets.data.size() * scale);
+    }
+  }
+
+  std::map<std::string, LcmLogArray> Release() {
+    std::map<std::string, LcmLogArray> result;
+    for (Values& values : values_) {
+      LcmLogArray array;
+      array.dtype = values.dtype;
+      array.shape.push_back(values.rows);
+      array.shape.insert(array.shape.end(), values.trailing_shape.begin(),
+                         values.trailing_shape.end());
+      array.data = std::move(values.data);
+      result.emplace(std::move(values.name), std::move(array));
+    }
+    for (Offsets& offsets : offsets_) {
+      LcmLogArray array;
+      array.dtype = "int64";
+      array.shape.push_back(offsets.data.size());
+      array.data.resize(offsets.data.size() * sizeof(int64_t));
+      std::memcpy(array.data.data(), offsets.data.data(), array.data.size());
+      result.emplace(std::move(offsets.name), std::move(array));
+    }
+    values_.clear();
+    offsets_.clear();
+    return result;
+  }
+
+ private:
+  struct StructPlan;
+
+  struct FieldPlan {
+    enum Kind { kPrimitive, kString, kStruct };
+
+    // A dimension is either a fixed size, or the index of the (earlier)
+    // field in the same struct that holds the size.
+    struct Dimension {
+      int64_t fixed{-1};
+      int field{-1};
+    };
+
+    Kind kind{kPrimitive};
+    const PrimitiveInfo* primitive{};
+    std::unique_ptr<StructPlan> nested;
+    std::vector<Dimension> dimensions;
+    // The leading dimensions that are stored as levels of offsets.
+    int num_levels{};
+    // The indices into offsets_ of each level.
+    std::vector<int> offsets;
+    // The index into values_ (for primitives and strings), or -1.
+    int values{-1};
+    // The index into offsets_ of a string field's per-string offsets, or -1.
+    int string_offsets{-1};
+  };
+
+  struct StructPlan {
+    std::vector<FieldPlan> fields;
+    // The index into scratch_ of this struct's decoded integer fields.
+    int depth{};
+  };
+
+  // An output array of primitive values (or of string characters).
+  struct Values {
+    std::string name;
+    std::string dtype;
+    int element_size{};
+    std::vector<int64_t> trailing_shape;
+    int64_t rows{};
+    std::string data;
+  };
+
+  struct Offsets {
+    std::string name;
+    std::vector<int64_t> data{0};
+  };
+
+  std::unique_ptr<StructPlan> Compile(const LcmMessageSchema& schema,
+                                      int struct_index,
+                                      const std::string& prefix,
+                                      std::vector<int>* stack) {
+    const LcmStructSchema& struct_schema = schema.structs.at(struct_index);
+    if (std::find(stack->begin(), stack->end(), struct_index) != stack->end()) {
+      throw std::logic_error(fmt::format(
+          "ExtractLcmLogColumns: the schema's struct {} contains itself",
+          struct_schema.name));
+    }
+    stack->push_back(struct_index);
+    auto plan = std::make_unique<StructPlan>();
+    plan->depth = static_cast<int>(stack->size()) - 1;
+    if (static_cast<int>(scratch_.size()) <= plan->depth) {
+      scratch_.resize(plan->depth + 1);
+    }
+    scratch_[plan->depth].resize(
+        std::max(scratch_[plan->depth].size(), struct_schema.fields.size()));
+    plan->fields.reserve(struct_schema.fields.size());
+    for (const LcmFieldSchema& field_schema : struct_schema.fields) {
+      const std::string path = prefix + field_schema.name;
+      FieldPlan field;
+
+      // Resolve the field's type.
+      int nested_index = -1;
+      if (field_schema.type == "string") {
+        field.kind = FieldPlan::kString;
+      } else if ((field.primitive = FindPrimitive(field_schema.type))) {
+        field.kind = FieldPlan::kPrimitive;
+      } else {
+        const auto iter =
+            std::find_if(schema.structs.begin(), schema.structs.end(),
+                         [&field_schema](const LcmStructSchema& candidate) {
+                           return candidate.name == field_schema.type;
+                         });
+        if (iter == schema.structs.end()) {
+          throw std::logic_error(
+              fmt::format("ExtractLcmLogColumns: field {} has unknown type {}",
+                          path, field_schema.type));
+        }
+        field.kind = FieldPlan::kStruct;
+        nested_index = iter - schema.structs.begin();
+      }
+
+      // Resolve the field's dimensions.
+      for (const std::string& dimension : field_schema.dimensions) {
+        FieldPlan::Dimension& resolved = field.dimensions.emplace_back();
+        if (!dimension.empty() &&
+            std::all_of(dimension.begin(), dimension.end(), [](char c) {
+              return c >= '0' && c <= '9';
+            })) {
+          resolved.fixed = std::stoll(dimension);
+          continue;
+        }
+        for (int i = 0; i < static_cast<int>(plan->fields.size()); ++i) {
+          const FieldPlan& earlier = plan->fields[i];
+          if (struct_schema.fields[i].name == dimension &&
+              earlier.kind == FieldPlan::kPrimitive &&
+              earlier.primitive->is_integer && earlier.dimensions.empty()) {
+            resolved.field = i;
+          }
+        }
+        if (resolved.field < 0) {
+          throw std::logic_error(fmt::format(
+              "ExtractLcmLogColumns: the dimension {} of field {} is neither "
+              "an integer nor an earlier integer field",
+              dimension, path));
+        }
+      }
+      for (int k = 0; k < static_cast<int>(field.dimensions.size()); ++k) {
+        if (field.dimensions[k].field >= 0) {
+          field.num_levels = k + 1;
+        }
+      }
+
+      // Allocate the field's outputs.
+      for (int k = 0; k < field.num_levels; ++k) {
+        field.offsets.push_back(static_cast<int>(offsets_.size()));
+        offsets_.push_back(
+            Offsets{.name = (k == 0) ? path + ".offsets"
+                                     : fmt::format("{}.offsets{}", path, k)});
+      }
+      if (field.kind == FieldPlan::kStruct) {
+        field.nested = Compile(schema, nested_index, path + ".", stack);
+      } else {
+        Values values;
+        values.name = path;
+        if (field.kind == FieldPlan::kString) {
+          values.dtype = "uint8";
+          values.element_size = 1;
+          field.string_offsets = static_cast<int>(offsets_.size());
+          offsets_.push_back(Offsets{.name = path + ".string_offsets"});
+        } else {
+          values.dtype = field.primitive->dtype;
+          values.element_size = field.primitive->size;
+          for (int k = field.num_levels;
+               k < static_cast<int>(field.dimensions.size()); ++k) {
+            values.trailing_shape.push_back(field.dimensions[k].fixed);
+          }
+        }
+        field.values = static_cast<int>(values_.size());
+        values_.push_back(std::move(values));
+      }
+      plan->fields.push_back(std::move(field));
+    }
+    stack->pop_back();
+    return plan;
+  }
+
+  void DecodeStruct(const StructPlan& plan, Reader* reader) {
+    int64_t* const ints = scratch_[plan.depth].data();
+    for (int i = 0; i < static_cast<int>(plan.fields.size()); ++i) {
+      ints[i] = DecodeField(plan.fields[i], ints, reader);
+    }
+  }
+
+  // Decodes one field, and returns its value when it's a non-array integer
+  // (or zero otherwise).
+  int64_t DecodeField(const FieldPlan& field, const int64_t* ints,
+                      Reader* reader) {
+    // Append the offsets of each level, while counting the elements.
+    int64_t count = 1;
+    int64_t rows = 1;
+    for (int k = 0; k < static_cast<int>(field.dimensions.size()); ++k) {
+      const FieldPlan::Dimension& dimension = field.dimensions[k];
+      const int64_t size =
+          (dimension.field >= 0) ? ints[dimension.field] : dimension.fixed;
+      if (size < 0) {
+        throw std::runtime_error(fmt::format(
+            "ExtractLcmLogColumns: message {} has a negative array size",
+            reader->message()));
+      }
+      if (k < field.num_levels) {
+        std::vector<int64_t>& offsets = offsets_[field.offsets[k]].data;
+        for (int64_t j = 0; j < count; ++j) {
+          offsets.push_back(offsets.back() + size);
+        }
+      }
+      count *= size;
+      if (k + 1 == field.num_levels) {
+        rows = count;
+      }
+    }
+
+    switch (field.kind) {
+      case FieldPlan::kPrimitive: {
+        Values& values = values_[field.values];
+        const int size = values.element_size;
+        const char* source = reader->Take(count * size);
+        const size_t start = values.data.size();
+        values.data.resize(start + count * size);
+        char* destination = values.data.data() + start;
+        if constexpr (std::endian::native == std::endian::little) {
+          for (int64_t j = 0; j < count; ++j) {
+            std::reverse_copy(source + j * size, source + (j + 1) * size,
+                              destination + j * size);
+          }
+        } else {
+          std::memcpy(destination, source, count * size);
+        }
+        values.rows += rows;
+        if (field.primitive->is_integer && field.dimensions.empty()) {
+          uint64_t value = 0;
+          for (int j = 0; j < size; ++j) {
+            value = (value << 8) | static_cast<uint8_t>(source[j]);
+          }
+          return SignExtend(value, size);
+        }
+        return 0;
+      }
+      case FieldPlan::kString: {
+        Values& values = values_[field.values];
+        std::vector<int64_t>& offsets = offsets_[field.string_offsets].data;
+        for (int64_t j = 0; j < count; ++j) {
+          // The encoded length includes a trailing NUL.
+          const int64_t length = SignExtend(reader->ReadUnsigned(4), 4);
+          if (length < 1) {
+            throw std::runtime_error(fmt::format(
+                "ExtractLcmLogColumns: message {} has a malformed string",
+                reader->message()));
+          }
+          values.data.append(reader->Take(length), length - 1);
+          offsets.push_back(offsets.back() + length - 1);
+        }
+        values.rows = static_cast<int64_t>(values.data.size());
+        return 0;
+      }
+      case FieldPlan::kStruct: {
+        for (int64_t j = 0; j < count; ++j) {
+          DecodeStruct(*field.nested, reader);
+        }
+        return 0;
+      }
+    }
+    DRAKE_UNREACHABLE();
+  }
+
+  const std::optional<uint64_t> fingerprint_;
+  std::unique_ptr<StructPlan> root_;
+  std::vector<Values> values_;
+  std::vector<Offsets> offsets_;
+  // For each struct nesting depth, the decoded integer fields of the struct
+  // currently being decoded at that depth.
+  std::vector<std::vector<int64_t>> scratch_;
+};
+
+}  // namespace
+
+LcmLogColumns ExtractLcmLogColumns(const LcmLogIndex& index,
+                                   std::string_view channel,
+                                   const LcmMessageSchema& schema,
+                                   double start_time, double end_time) {
+  ColumnDecoder decoder(schema);
+  const std::vector<int> messages =
+      index.FindMessages(channel, start_time, end_time);
+  LcmLogColumns result;
+  result.times.resize(messages.size());
+  for (int i = 0; i < static_cast<int>(messages.size()); ++i) {
+    result.times[i] = index.GetTime(messages[i]);
+    decoder.Decode(index.GetPayload(messages[i]), messages[i]);
+    if (i == 0) {
+      // Size the outputs by assuming that all messages are like the first.
+      decoder.Reserve(messages.size());
+    }
+  }
+  result.arrays = decoder.Release();
+  return result;
+}
+
+}  // namespace lcm
+}  // namespace drake
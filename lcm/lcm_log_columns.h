@@ -0,0 +1,140 @@
+#pragma once
+
+#include <cstdint>
+#include <limits>
+#include <map>
+#include <optional>
+#include <string>
+#include <string_view>
+#include <vector>
+
+#include "drake/common/eigen_types.h"
+#include "drake/common/name_value.h"
+#include "drake/lcm/lcm_log_index.h"
+
+namespace drake {
+namespace lcm {
+
+/** Describes one field of an LCM struct, as declared in its `.lcm` file. The
+members mirror the `__slots__`, `__typenames__`, and `__dimensions__`
+metadata of the Python classes generated by lcm-gen. */
+struct LcmFieldSchema {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(name));
+    a->Visit(DRAKE_NVP(type));
+    a->Visit(DRAKE_NVP(dimensions));
+  }
+
+  /** The field name. */
+  std::string name;
+
+  /** Either an LCM primitive type ("int8_t", "int16_t", "int32_t", "int64_t",
+  "float", "double", "boolean", "byte", or "string") or the name of another
+  struct in the same LcmMessageSchema. */
+  std::string type;
+
+  /** The array dimensions, outermost first (empty for a non-array field).
+  Each is either a non-negative integer literal or the name of an earlier
+  integer-valued, non-array field of the same struct. */
+  std::vector<std::string> dimensions;
+};
+
+/** Describes one LCM struct type. */
+struct LcmStructSchema {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(name));
+    a->Visit(DRAKE_NVP(fields));
+  }
+
+  /** The struct's type name, e.g., "drake.lcmt_viewer_draw". */
+  std::string name;
+
+  /** The fields, in declaration (i.e., encoding) order. */
+  std::vector<LcmFieldSchema> fields;
+};
+
+/** Describes an LCM message type for use by ExtractLcmLogColumns(). */
+struct LcmMessageSchema {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(structs));
+    a->Visit(DRAKE_NVP(fingerprint));
+  }
+
+  /** The message's struct is `structs[0]`; the remaining elements are the
+  nested struct types that it (transitively) refers to. */
+  std::vector<LcmStructSchema> structs;
+
+  /** When set, every message's leading 8-byte fingerprint must equal this
+  value (read as a big-endian integer). When unset, it is not checked. */
+  std::optional<uint64_t> fingerprint;
+};
+
+/** A packed n-dimensional array of a single primitive type, in the host's
+byte order and C (row-major) layout. */
+struct LcmLogArray {
+  /** The NumPy name of the element type: "int8", "int16", "int32", "int64",
+  "float32", "float64", "bool", or "uint8". */
+  std::string dtype;
+
+  /** The array's shape. */
+  std::vector<int64_t> shape;
+
+  /** The array's elements. */
+  std::string data;
+};
+
+/** The messages of one LCM channel, decoded into columns. See
+ExtractLcmLogColumns() for how the fields map to arrays. */
+struct LcmLogColumns {
+  /** The time (in seconds) of each message. */
+  Eigen::VectorXd times;
+
+  /** The columns, keyed by their names. */
+  std::map<std::string, LcmLogArray> arrays;
+};
+
+/** Decodes every message on `channel` in `index` whose time lies in the
+half-open interval [start_time, end_time) into columnar arrays, without
+decoding the messages of any other channel or allocating any per-message
+objects.
+
+Each field of the message becomes one array, named by its dotted path from
+the top-level message (e.g., "point_pair_contact_info.contact_point"), with one
+row per message for top-level fields, or one row per element for fields nested
+within struct arrays:
+- A non-array field has shape `(rows,)`.
+- A fixed-size array field such as `double normal[3]` has shape `(rows, 3)`.
+- A variable-size array field such as `float joint_position[num_joints]`
+  concatenates its elements across rows, into shape `(total_elements,)`.
+  An additional int64 array named "joint_position.offsets", of shape
+  `(rows + 1,)`, locates row `i`'s elements at
+  `[offsets[i], offsets[i + 1])`. Any fixed dimensions after the last variable
+  one remain in the array's shape (e.g., `float position[num_links][3]` has
+  shape `(total_links, 3)`). Each additional variable (or leading fixed)
+  dimension adds one more level of offsets, named ".offsets1", ".offsets2",
+  etc., which index into the level before it.
+- A struct array field has no array of its own; only its offsets (if any). Its
+  struct's fields are stored with one row per element.
+- A string field stores its concatenated characters as a uint8 array, along
+  with an int64 array named, e.g., "joint_name.string_offsets" that has one
+  more entry than the number of strings.
+
+@throws std::exception if `schema` is malformed, or if a message does not
+match `schema` (a wrong fingerprint or a truncated encoding). */
+LcmLogColumns ExtractLcmLogColumns(
+    const LcmLogIndex& index, std::string_view channel,
+    const LcmMessageSchema& schema,
+    double start_time = -std::numeric_limits<double>::infinity(),
+    double end_time = std::numeric_limits<double>::infinity());
+
+}  // namespace lcm
+}  // namespace drake
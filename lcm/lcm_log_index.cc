@@ -0,0 +1,304 @@
+#include "drake/lcm/lcm_log_index.h"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <algorithm>
+#include <cstring>
+#include <fstream>
+#include <map>
+#include <stdexcept>
+#include <system_error>
+#include <type_traits>
+#include <utility>
+
+#include <fmt/format.h>
+
+#include "drake/common/drake_assert.h"
+#include "drake/common/text_logging.h"
+
+namespace drake {
+namespace lcm {
+namespace {
+
+// The LCM log file format is a sequence of events, each of which is:
+//   uint32 sync word (kSyncWord)
+//   int64  event number
+//   int64  timestamp (microseconds)
+//   int32  channel name length
+//   int32  data length
+//   char[] channel name (not NUL-terminated)
+//   byte[] data
+// All integers are big-endian. See lcm/eventlog.c in the LCM sources.
+constexpr uint32_t kSyncWord = 0xEDA1DA01;
+constexpr int64_t kHeaderSize = 4 + 8 + 8 + 4 + 4;
+
+uint64_t ReadBigEndian(const char* data, int num_bytes) {
+  uint64_t result = 0;
+  for (int i = 0; i < num_bytes; ++i) {
+    result = (result << 8) | static_cast<uint8_t>(data[i]);
+  }
+  return result;
+}
+
+// The cache file begins with this magic string and version number.
+constexpr char kCacheMagic[8] = {'D', 'R', 'K', 'L', 'C', 'M', 'I', 'X'};
+constexpr uint32_t kCacheVersion = 1;
+
+template <typename T>
+void WritePod(std::ostream* output, const T& value) {
+  static_assert(std::is_trivially_copyable_v<T>);
+  output->write(reinterpret_cast<const char*>(&value), sizeof(value));
+}
+
+template <typename T>
+bool ReadPod(std::istream* input, T* value) {
+  static_assert(std::is_trivially_copyable_v<T>);
+  input->read(reinterpret_cast<char*>(value), sizeof(*value));
+  return input->good();
+}
+
+}  // namespace
+
+LcmLogIndex::LcmLogIndex(const std::filesystem::path& filename,
+                         std::optional<std::filesystem::path> cache_filename)
+    : filename_(filename), cache_filename_(std::move(cache_filename)) {
+  const int fd = ::open(filename.c_str(), O_RDONLY);
+  if (fd < 0) {
+    throw std::runtime_error("Failed to open log file: " + filename.string());
+  }
+  struct stat file_stat{};
+  if (::fstat(fd, &file_stat) != 0) {
+    ::close(fd);
+    throw std::runtime_error("Failed to stat log file: " + filename.string());
+  }
+  size_ = file_stat.st_size;
+  mtime_ =
+      std::filesystem::last_write_time(filename).time_since_epoch().count();
+  if (size_ > 0) {
+    void* mapped = ::mmap(nullptr, size_, PROT_READ, MAP_PRIVATE, fd, 0);
+    if (mapped == MAP_FAILED) {
+      ::close(fd);
+      throw std::runtime_error("Failed to map log file: " + filename.string());
+    }
+    data_ = static_cast<const char*>(mapped);
+  }
+  // The mapping remains valid after the descriptor is closed.
+  ::close(fd);
+
+  if (!(cache_filename_.has_value() && LoadCache())) {
+    Scan();
+    if (cache_filename_.has_value()) {
+      SaveCache();
+    }
+  }
+
+  // Group the messages by channel.
+  channel_entries_.resize(channels_.size());
+  for (int i = 0; i < num_messages(); ++i) {
+    channel_entries_[entries_[i].channel].push_back(i);
+  }
+}
+
+LcmLogIndex::~LcmLogIndex() {
+  if (data_ != nullptr) {
+    ::munmap(const_cast<char*>(data_), size_);
+  }
+}
+
+double LcmLogIndex::GetTime(int i) const {
+  DRAKE_DEMAND(i >= 0 && i < num_messages());
+  // This must match DrakeLcmLog::timestamp_to_second.
+  return static_cast<double>(entries_[i].timestamp) / 1e6;
+}
+
+std::string_view LcmLogIndex::GetChannel(int i) const {
+  DRAKE_DEMAND(i >= 0 && i < num_messages());
+  return channels_[entries_[i].channel];
+}
+
+int64_t LcmLogIndex::GetFileOffset(int i) const {
+  DRAKE_DEMAND(i >= 0 && i < num_messages());
+  return entries_[i].offset;
+}
+
+std::string_view LcmLogIndex::GetPayload(int i) const {
+  DRAKE_DEMAND(i >= 0 && i < num_messages());
+  const Entry& entry = entries_[i];
+  const int64_t start =
+      entry.offset + kHeaderSize + channels_[entry.channel].size();
+  return std::string_view(data_ + start, entry.data_size);
+}
+
+int LcmLogIndex::FindMessage(double time_sec) const {
+  return FindRange(time_sec, std::numeric_limits<double>::infinity()).first;
+}
+
+std::vector<int> LcmLogIndex::FindMessages(std::string_view channel,
+                                           double start_time,
+                                           double end_time) const {
+  const auto iter = std::find(channels_.begin(), channels_.end(), channel);
+  if (iter == channels_.end()) {
+    return {};
+  }
+  const std::vector<int>& candidates =
+      channel_entries_[std::distance(channels_.begin(), iter)];
+  const auto time_before = [this](int i, double time) {
+    return GetTime(i) < time;
+  };
+  const auto begin = std::lower_bound(candidates.begin(), candidates.end(),
+                                      start_time, time_before);
+  const auto end =
+      std::lower_bound(begin, candidates.end(), end_time, time_before);
+  return std::vector<int>(begin, end);
+}
+
+std::pair<int, int> LcmLogIndex::FindRange(double start_time,
+                                           double end_time) const {
+  const auto time_before = [](const Entry& entry, double time) {
+    return static_cast<double>(entry.timestamp) / 1e6 < time;
+  };
+  const auto begin = std::lower_bound(entries_.begin(), entries_.end(),
+                                      start_time, time_before);
+  const auto end =
+      std::lower_bound(begin, entries_.end(), end_time, time_before);
+  return {static_cast<int>(begin - entries_.begin()),
+          static_cast<int>(end - entries_.begin())};
+}
+
+void LcmLogIndex::Scan() {
+  channels_.clear();
+  entries_.clear();
+  std::map<std::string, int, std::less<>> channel_ids;
+  int64_t offset = 0;
+  while (offset + kHeaderSize <= size_) {
+    const char* header = data_ + offset;
+    if (ReadBigEndian(header, 4) != kSyncWord) {
+      // Resynchronize on the next sync word, as the LCM reader does.
+      ++offset;
+      continue;
+    }
+    const auto timestamp = static_cast<int64_t>(ReadBigEndian(header + 12, 8));
+    const auto channel_size =
+        static_cast<int32_t>(ReadBigEndian(header + 20, 4));
+    const auto data_size = static_cast<int32_t>(ReadBigEndian(header + 24, 4));
+    if (channel_size <= 0 || data_size < 0) {
+      ++offset;
+      continue;
+    }
+    const int64_t next_offset = offset + kHeaderSize + channel_size + data_size;
+    if (next_offset > size_) {
+      // The final event is truncated.
+      break;
+    }
+    const std::string_view channel(header + kHeaderSize, channel_size);
+    auto iter = channel_ids.find(channel);
+    if (iter == channel_ids.end()) {
+      iter = channel_ids.emplace(channel, channels_.size()).first;
+      channels_.emplace_back(channel);
+    }
+    entries_.push_back(Entry{.timestamp = timestamp,
+                             .offset = offset,
+                             .channel = iter->second,
+                             .data_size = data_size});
+    offset = next_offset;
+  }
+}
+
+bool LcmLogIndex::LoadCache() {
+  DRAKE_DEMAND(cache_filename_.has_value());
+  std::ifstream input(*cache_filename_, std::ios::binary);
+  if (!input.is_open()) {
+    return false;
+  }
+  char magic[sizeof(kCacheMagic)]{};
+  uint32_t version{};
+  int64_t size{};
+  int64_t mtime{};
+  uint32_t num_channels{};
+  input.read(magic, sizeof(magic));
+  if (!(input.good() && std::memcmp(magic, kCacheMagic, sizeof(magic)) == 0 &&
+        ReadPod(&input, &version) && version == kCacheVersion &&
+        ReadPod(&input, &size) && size == size_ && ReadPod(&input, &mtime) &&
+        mtime == mtime_ && ReadPod(&input, &num_channels))) {
+    return false;
+  }
+  std::vector<std::string> channels(num_channels);
+  for (std::string& channel : channels) {
+    uint32_t channel_size{};
+    if (!ReadPod(&input, &channel_size) ||
+        channel_size > static_cast<uint64_t>(size_)) {
+      return false;
+    }
+    channel.resize(channel_size);
+    input.read(channel.data(), channel_size);
+  }
+  uint64_t num_entries{};
+  if (!ReadPod(&input, &num_entries) ||
+      num_entries * sizeof(Entry) > static_cast<uint64_t>(size_)) {
+    return false;
+  }
+  std::vector<Entry> entries(num_entries);
+  input.read(reinterpret_cast<char*>(entries.data()),
+             num_entries * sizeof(Entry));
+  if (!input.good()) {
+    return false;
+  }
+  // Reject a cache that does not fit this log, rather than trusting it.
+  for (const Entry& entry : entries) {
+    if (entry.channel < 0 || entry.channel >= static_cast<int>(num_channels) ||
+        entry.offset + kHeaderSize +
+                static_cast<int64_t>(channels[entry.channel].size()) +
+                entry.data_size >
+            size_) {
+      return false;
+    }
+  }
+  channels_ = std::move(channels);
+  entries_ = std::move(entries);
+  return true;
+}
+
+void LcmLogIndex::SaveCache() const {
+  static_assert(sizeof(Entry) == 24);
+  DRAKE_DEMAND(cache_filename_.has_value());
+  const std::filesystem::path& filename = *cache_filename_;
+  std::filesystem::path temp_filename = filename;
+  temp_filename += ".tmp";
+  {
+    std::ofstream output(temp_filename, std::ios::binary);
+    output.write(kCacheMagic, sizeof(kCacheMagic));
+    WritePod(&output, kCacheVersion);
+    WritePod(&output, size_);
+    WritePod(&output, mtime_);
+    WritePod(&output, static_cast<uint32_t>(channels_.size()));
+    for (const std::string& channel : channels_) {
+      WritePod(&output, static_cast<uint32_t>(channel.size()));
+      output.write(channel.data(), channel.size());
+    }
+    WritePod(&output, static_cast<uint64_t>(entries_.size()));
+    output.write(reinterpret_cast<const char*>(entries_.data()),
+                 entries_.size() * sizeof(Entry));
+    if (!output.good()) {
+      drake::log()->debug("LcmLogIndex: Could not write the index cache {}",
+                          temp_filename.string());
+      std::error_code ignored;
+      std::filesystem::remove(temp_filename, ignored);
+      return;
+    }
+  }
+  // Renaming (rather than writing in place) means that a concurrent reader
+  // never sees a partially written cache.
+  std::error_code error;
+  std::filesystem::rename(temp_filename, filename, error);
+  if (error) {
+    drake::log()->debug("LcmLogIndex: Could not write the index cache {}: {}",
+                        filename.string(), error.message());
+    std::filesystem::remove(temp_filename, error);
+  }
+}
+
+}  // namespace lcm
+}  // namespace drake
@@ -0,0 +1,137 @@
+#pragma once
+
+#include <cstdint>
+#include <filesystem>
+#include <limits>
+#include <optional>
+#include <string>
+#include <string_view>
+#include <utility>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+
+namespace drake {
+namespace lcm {
+
+/**
+ * A random-access, read-only view of an LCM log file (as written by
+ * DrakeLcmLog or the lcm-logger binary).
+ *
+ * On construction, the log file is memory-mapped and a table of every message's
+ * timestamp, channel, and file offset is built (or loaded from a cache file,
+ * if the caller provides one). Afterwards, seeking to a time or to the messages
+ * of one channel takes O(log n) time, and a message's payload can be accessed
+ * without copying it and without reading (or decoding) any other messages.
+ *
+ * As with DrakeLcmLog, timestamps are converted to seconds by dividing the
+ * logged microseconds by 1e6. The time-based queries assume that the messages
+ * are logged in non-decreasing time order, as DrakeLcmLog and lcm-logger both
+ * do.
+ *
+ * This class does not depend on the LCM runtime library, so it is available
+ * even when DrakeLcmLog::available() is false.
+ */
+class LcmLogIndex {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(LcmLogIndex);
+
+  /**
+   * Opens the log file and indexes it.
+   * @param filename The LCM log file.
+   * @param cache_filename (Optional) A file in which to cache the index between
+   * runs. When provided, the index is loaded from this file if it was written
+   * for the current contents (size and modification time) of the log;
+   * otherwise the index is built by scanning the log and then saved to this
+   * file on a best-effort basis (e.g., a read-only directory is not an error).
+   * When not provided, the index is always built by scanning the log and
+   * nothing is written to disk.
+   * @throws std::exception if the log file cannot be opened.
+   */
+  explicit LcmLogIndex(
+      const std::filesystem::path& filename,
+      std::optional<std::filesystem::path> cache_filename = std::nullopt);
+
+  ~LcmLogIndex();
+
+  /** Returns the log's file name. */
+  const std::filesystem::path& filename() const { return filename_; }
+
+  /** Returns the file name used to cache the index, if any. */
+  const std::optional<std::filesystem::path>& cache_filename() const {
+    return cache_filename_;
+  }
+
+  /** Returns the number of messages in the log. A truncated message at the end
+   * of the log (e.g., one that is still being written) is not counted. */
+  int num_messages() const { return static_cast<int>(entries_.size()); }
+
+  /** Returns the distinct channel names in the log, in order of first
+   * appearance. */
+  const std::vector<std::string>& channels() const { return channels_; }
+
+  /** Returns the time (in seconds) of the `i`th message.
+   * @pre 0 <= i < num_messages() */
+  double GetTime(int i) const;
+
+  /** Returns the channel name of the `i`th message.
+   * @pre 0 <= i < num_messages() */
+  std::string_view GetChannel(int i) const;
+
+  /** Returns the offset in the log file of the `i`th message's event header.
+   * Seeking a log reader to this offset resumes reading at that message.
+   * @pre 0 <= i < num_messages() */
+  int64_t GetFileOffset(int i) const;
+
+  /** Returns the encoded payload of the `i`th message. The view aliases the
+   * memory-mapped log file and remains valid for the lifetime of `this`.
+   * @pre 0 <= i < num_messages() */
+  std::string_view GetPayload(int i) const;
+
+  /** Returns the index of the first message whose time is at or after
+   * `time_sec`, or num_messages() if there is no such message. This takes
+   * O(log n) time. */
+  int FindMessage(double time_sec) const;
+
+  /** Returns the indices (in log order) of the messages on the given `channel`
+   * whose times lie in the half-open interval [start_time, end_time). This
+   * takes O(log n + k) time for k results; messages on other channels are not
+   * visited. An unknown channel returns an empty list. */
+  std::vector<int> FindMessages(
+      std::string_view channel,
+      double start_time = -std::numeric_limits<double>::infinity(),
+      double end_time = std::numeric_limits<double>::infinity()) const;
+
+ private:
+  // The on-disk layout of the cache file relies on this being trivially
+  // copyable, with no padding.
+  struct Entry {
+    int64_t timestamp{};
+    int64_t offset{};
+    int32_t channel{};
+    int32_t data_size{};
+  };
+
+  void Scan();
+  bool LoadCache();
+  void SaveCache() const;
+
+  // Returns the entries_ index range of messages at or after `start_time` and
+  // strictly before `end_time`, as a [begin, end) pair.
+  std::pair<int, int> FindRange(double start_time, double end_time) const;
+
+  const std::filesystem::path filename_;
+  const std::optional<std::filesystem::path> cache_filename_;
+  // The memory-mapped contents of the log file.
+  const char* data_{nullptr};
+  int64_t size_{0};
+  int64_t mtime_{0};
+
+  std::vector<std::string> channels_;
+  std::vector<Entry> entries_;
+  // For each channel, the indices into entries_ of its messages.
+  std::vector<std::vector<int>> channel_entries_;
+};
+
+}  // namespace lcm
+}  // namespace drake
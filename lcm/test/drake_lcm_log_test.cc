@@ -1,5 +1,7 @@
 #include "drake/lcm/drake_lcm_log.h"
 
+#include <filesystem>
+#include <limits>
 #include <memory>
 #include <string>
 #include <utility>
@@ -69,6 +71,48 @@ GTEST_TEST(LcmLogTest, LcmLogTestSaveAndRead) {
   EXPECT_TRUE(multichannel_received);
 }
 
+GTEST_TEST(LcmLogTest, SeekToTime) {
+  const std::string filename = "seek_test.log";
+  {
+    DrakeLcmLog w_log(filename, true);
+    lcmt_drake_signal msg{};
+    for (int i = 0; i < 5; ++i) {
+      msg.timestamp = i;
+      Publish(&w_log, "channel", msg, 10.0 + i);
+    }
+  }
+
+  DrakeLcmLog r_log(filename, false);
+  int64_t received = -1;
+  Subscribe(&r_log, "channel",
+            std::function{[&received](const lcmt_drake_signal& message) {
+              received = message.timestamp;
+            }});
+
+  // Seek forward to a time between messages.
+  r_log.SeekToTime(12.5);
+  EXPECT_EQ(r_log.GetNextMessageTime(), 13.0);
+  r_log.DispatchMessageAndAdvanceLog(13.0);
+  EXPECT_EQ(received, 3);
+
+  // Seek backward to an exact message time.
+  r_log.SeekToTime(11.0);
+  EXPECT_EQ(r_log.GetNextMessageTime(), 11.0);
+  r_log.DispatchMessageAndAdvanceLog(11.0);
+  EXPECT_EQ(received, 1);
+
+  // Seek past the end.
+  r_log.SeekToTime(100.0);
+  EXPECT_EQ(r_log.GetNextMessageTime(),
+            std::numeric_limits<double>::infinity());
+
+  // Seeking does not leave any files beside the log.
+  EXPECT_FALSE(std::filesystem::exists(filename + ".index"));
+
+  DrakeLcmLog w_log(filename + ".new", true);
+  EXPECT_THROW(w_log.SeekToTime(0.0), std::logic_error);
+}
+
 }  // namespace
 }  // namespace lcm
 }  // namespace drake
@@ -0,0 +1,175 @@
+#include "drake/lcm/lcm_log_columns.h"
+
+#include <cstring>
+#include <string>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/temp_directory.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
+#include "drake/lcm/drake_lcm_log.h"
+#include "drake/lcmt_contact_results_for_viz.hpp"
+#include "drake/lcmt_robot_state.hpp"
+
+namespace drake {
+namespace lcm {
+namespace {
+
+// Returns the elements of `array`, which must have the given element type.
+template <typename T>
+std::vector<T> Elements(const LcmLogArray& array) {
+  EXPECT_EQ(array.data.size() % sizeof(T), 0);
+  std::vector<T> result(array.data.size() / sizeof(T));
+  std::memcpy(result.data(), array.data.data(), array.data.size());
+  return result;
+}
+
+class LcmLogColumnsTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    filename_ = temp_directory() + "/columns_test.log";
+    DrakeLcmLog log(filename_, true);
+    for (int i = 0; i < 3; ++i) {
+      // Message i has i + 1 joints.
+      lcmt_robot_state state{};
+      state.utime = 1000 * i;
+      state.num_joints = i + 1;
+      for (int j = 0; j <= i; ++j) {
+        state.joint_name.push_back("joint" + std::to_string(j));
+        state.joint_position.push_back(10 * i + j);
+      }
+      Publish(&log, "STATE", state, 1.0 + i);
+
+      // Message i has i point contacts.
+      lcmt_contact_results_for_viz contacts{};
+      contacts.timestamp = 1000 * i;
+      contacts.num_point_pair_contacts = i;
+      for (int j = 0; j < i; ++j) {
+        auto& info = contacts.point_pair_contact_info.emplace_back();
+        info.body1_name = "body" + std::to_string(j);
+        info.body2_name = "ground";
+        info.contact_point[2] = j;
+      }
+      contacts.num_hydroelastic_contacts = 0;
+      Publish(&log, "CONTACT", contacts, 1.5 + i);
+    }
+  }
+
+  static LcmMessageSchema MakeRobotStateSchema() {
+    LcmMessageSchema schema;
+    schema.structs.push_back(LcmStructSchema{
+        .name = "drake.lcmt_robot_state",
+        .fields = {{"utime", "int64_t", {}},
+                   {"num_joints", "int16_t", {}},
+                   {"joint_name", "string", {"num_joints"}},
+                   {"joint_position", "float", {"num_joints"}}}});
+    schema.fingerprint = lcmt_robot_state::getHash();
+    return schema;
+  }
+
+  std::string filename_;
+};
+
+TEST_F(LcmLogColumnsTest, RaggedPrimitives) {
+  const LcmLogIndex index(filename_);
+  const LcmLogColumns dut =
+      ExtractLcmLogColumns(index, "STATE", MakeRobotStateSchema());
+  EXPECT_EQ(dut.times, Eigen::Vector3d(1.0, 2.0, 3.0));
+
+  const LcmLogArray& utime = dut.arrays.at("utime");
+  EXPECT_EQ(utime.dtype, "int64");
+  EXPECT_EQ(utime.shape, std::vector<int64_t>({3}));
+  EXPECT_EQ(Elements<int64_t>(utime), std::vector<int64_t>({0, 1000, 2000}));
+
+  const LcmLogArray& position = dut.arrays.at("joint_position");
+  EXPECT_EQ(position.dtype, "float32");
+  EXPECT_EQ(position.shape, std::vector<int64_t>({6}));
+  EXPECT_EQ(Elements<float>(position),
+            std::vector<float>({0, 10, 11, 20, 21, 22}));
+  EXPECT_EQ(Elements<int64_t>(dut.arrays.at("joint_position.offsets")),
+            std::vector<int64_t>({0, 1, 3, 6}));
+
+  const LcmLogArray& name = dut.arrays.at("joint_name");
+  EXPECT_EQ(name.dtype, "uint8");
+  EXPECT_EQ(name.data, "joint0joint0joint1joint0joint1joint2");
+  EXPECT_EQ(Elements<int64_t>(dut.arrays.at("joint_name.string_offsets")),
+            std::vector<int64_t>({0, 6, 12, 18, 24, 30, 36}));
+
+  // Restricting the time range.
+  const LcmLogColumns later =
+      ExtractLcmLogColumns(index, "STATE", MakeRobotStateSchema(), 1.5);
+  EXPECT_EQ(later.times, Eigen::Vector2d(2.0, 3.0));
+  EXPECT_EQ(Elements<int64_t>(later.arrays.at("joint_position.offsets")),
+            std::vector<int64_t>({0, 2, 5}));
+}
+
+TEST_F(LcmLogColumnsTest, NestedStructs) {
+  LcmMessageSchema schema;
+  schema.structs.push_back(LcmStructSchema{
+      .name = "drake.lcmt_contact_results_for_viz",
+      .fields = {
+          {"timestamp", "int64_t", {}},
+          {"num_point_pair_contacts", "int32_t", {}},
+          {"point_pair_contact_info",
+           "drake.lcmt_point_pair_contact_info_for_viz",
+           {"num_point_pair_contacts"}},
+          {"num_hydroelastic_contacts", "int32_t", {}},
+          // There are no hydroelastic contacts, so a stand-in type suffices.
+          {"hydroelastic_contacts", "byte", {"num_hydroelastic_contacts"}}}});
+  schema.structs.push_back(
+      LcmStructSchema{.name = "drake.lcmt_point_pair_contact_info_for_viz",
+                      .fields = {{"timestamp", "int64_t", {}},
+                                 {"body1_name", "string", {}},
+                                 {"body2_name", "string", {}},
+                                 {"contact_point", "double", {"3"}},
+                                 {"contact_force", "double", {"3"}},
+                                 {"normal", "double", {"3"}}}});
+
+  const LcmLogIndex index(filename_);
+  const LcmLogColumns dut = ExtractLcmLogColumns(index, "CONTACT", schema);
+  EXPECT_EQ(dut.times.size(), 3);
+  EXPECT_EQ(Elements<int64_t>(dut.arrays.at("point_pair_contact_info.offsets")),
+            std::vector<int64_t>({0, 0, 1, 3}));
+  const LcmLogArray& point =
+      dut.arrays.at("point_pair_contact_info.contact_point");
+  EXPECT_EQ(point.shape, std::vector<int64_t>({3, 3}));
+  EXPECT_EQ(Elements<double>(point),
+            std::vector<double>({0, 0, 0, 0, 0, 0, 0, 0, 1}));
+  EXPECT_EQ(dut.arrays.at("point_pair_contact_info.body1_name").data,
+            "body0body0body1");
+  EXPECT_EQ(dut.arrays.at("point_pair_contact_info.timestamp").shape,
+            std::vector<int64_t>({3}));
+  EXPECT_FALSE(dut.arrays.contains("point_pair_contact_info"));
+}
+
+TEST_F(LcmLogColumnsTest, Errors) {
+  const LcmLogIndex index(filename_);
+
+  // Decoding the wrong channel.
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      ExtractLcmLogColumns(index, "CONTACT", MakeRobotStateSchema()),
+      ".*fingerprint.*");
+  LcmMessageSchema unchecked = MakeRobotStateSchema();
+  unchecked.fingerprint.reset();
+  EXPECT_THROW(ExtractLcmLogColumns(index, "CONTACT", unchecked),
+               std::exception);
+
+  // Malformed schemas.
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      ExtractLcmLogColumns(index, "STATE", LcmMessageSchema{}),
+      ".*any structs.*");
+  LcmMessageSchema bad_type = MakeRobotStateSchema();
+  bad_type.structs[0].fields[0].type = "int128_t";
+  DRAKE_EXPECT_THROWS_MESSAGE(ExtractLcmLogColumns(index, "STATE", bad_type),
+                              ".*utime has unknown type int128_t.*");
+  LcmMessageSchema bad_dimension = MakeRobotStateSchema();
+  bad_dimension.structs[0].fields[2].dimensions = {"joint_position"};
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      ExtractLcmLogColumns(index, "STATE", bad_dimension),
+      ".*dimension joint_position of field joint_name.*");
+}
+
+}  // namespace
+}  // namespace lcm
+}  // namespace drake
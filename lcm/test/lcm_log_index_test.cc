@@ -0,0 +1,124 @@
+#include "drake/lcm/lcm_log_index.h"
+
+#include <filesystem>
+#include <fstream>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/temp_directory.h"
+#include "drake/lcm/drake_lcm_log.h"
+#include "drake/lcmt_drake_signal.hpp"
+
+namespace drake {
+namespace lcm {
+namespace {
+
+class LcmLogIndexTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    filename_ = temp_directory() + "/index_test.log";
+    // Log channel "A" at integer times and channel "B" at half-integer times,
+    // using the message's timestamp field to identify each message.
+    DrakeLcmLog log(filename_, true);
+    for (int i = 0; i < 10; ++i) {
+      Publish(&log, "A", MakeMessage(100 + i), 1.0 + i);
+      Publish(&log, "B", MakeMessage(200 + i), 1.5 + i);
+    }
+  }
+
+  static lcmt_drake_signal MakeMessage(int64_t timestamp) {
+    lcmt_drake_signal message{};
+    message.timestamp = timestamp;
+    return message;
+  }
+
+  static int64_t DecodeTimestamp(std::string_view payload) {
+    lcmt_drake_signal message{};
+    const int decoded = message.decode(payload.data(), 0, payload.size());
+    EXPECT_EQ(decoded, static_cast<int>(payload.size()));
+    return message.timestamp;
+  }
+
+  std::string filename_;
+};
+
+TEST_F(LcmLogIndexTest, Queries) {
+  const LcmLogIndex dut(filename_);
+  EXPECT_FALSE(dut.cache_filename().has_value());
+  EXPECT_FALSE(std::filesystem::exists(filename_ + ".index"));
+  ASSERT_EQ(dut.num_messages(), 20);
+  EXPECT_EQ(dut.channels(), std::vector<std::string>({"A", "B"}));
+  EXPECT_EQ(dut.GetTime(3), 2.5);
+  EXPECT_EQ(dut.GetChannel(3), "B");
+  EXPECT_EQ(DecodeTimestamp(dut.GetPayload(3)), 201);
+  EXPECT_EQ(dut.GetFileOffset(0), 0);
+  EXPECT_GT(dut.GetFileOffset(1), 0);
+
+  // Seeking by time.
+  EXPECT_EQ(dut.FindMessage(-1.0), 0);
+  EXPECT_EQ(dut.FindMessage(2.0), 2);
+  EXPECT_EQ(dut.FindMessage(2.1), 3);
+  EXPECT_EQ(dut.FindMessage(100.0), 20);
+
+  // Filtering by channel and time.
+  const std::vector<int> b = dut.FindMessages("B", 3.0, 6.0);
+  ASSERT_EQ(b.size(), 3);
+  for (int i : b) {
+    EXPECT_EQ(dut.GetChannel(i), "B");
+  }
+  EXPECT_EQ(DecodeTimestamp(dut.GetPayload(b.front())), 202);
+  EXPECT_EQ(DecodeTimestamp(dut.GetPayload(b.back())), 204);
+  EXPECT_EQ(dut.FindMessages("A").size(), 10);
+  EXPECT_TRUE(dut.FindMessages("no_such_channel").empty());
+}
+
+TEST_F(LcmLogIndexTest, Cache) {
+  std::vector<int> expected;
+  const std::filesystem::path cache_filename =
+      temp_directory() + "/cache/index_test.index";
+  std::filesystem::create_directories(cache_filename.parent_path());
+  {
+    const LcmLogIndex dut(filename_, cache_filename);
+    EXPECT_EQ(dut.cache_filename(), cache_filename);
+    expected = dut.FindMessages("A", 2.0, 8.0);
+  }
+  ASSERT_TRUE(std::filesystem::exists(cache_filename));
+
+  // A second index loads the same results from the cache.
+  {
+    const LcmLogIndex dut(filename_, cache_filename);
+    EXPECT_EQ(dut.num_messages(), 20);
+    EXPECT_EQ(dut.FindMessages("A", 2.0, 8.0), expected);
+  }
+
+  // A corrupt cache is ignored (and replaced).
+  {
+    std::ofstream output(cache_filename, std::ios::binary);
+    output << "garbage";
+  }
+  {
+    const LcmLogIndex dut(filename_, cache_filename);
+    EXPECT_EQ(dut.num_messages(), 20);
+    EXPECT_EQ(dut.FindMessages("A", 2.0, 8.0), expected);
+  }
+  EXPECT_GT(std::filesystem::file_size(cache_filename), 100);
+}
+
+TEST_F(LcmLogIndexTest, TruncatedLog) {
+  // Chop the final message in half; it is not indexed.
+  const auto size = std::filesystem::file_size(filename_);
+  std::filesystem::resize_file(filename_, size - 10);
+  const LcmLogIndex dut(filename_);
+  EXPECT_EQ(dut.num_messages(), 19);
+}
+
+GTEST_TEST(LcmLogIndexMissingTest, Throws) {
+  EXPECT_THROW(LcmLogIndex("/no/such/file.log"), std::exception);
+}
+
+}  // namespace
+}  // namespace lcm
+}  // namespace drake
@@ -36,6 +36,7 @@ ALL_LCM_SRCS = [
     "lcmt_point_cloud_field.lcm",
     "lcmt_point_pair_contact_info_for_viz.lcm",
     "lcmt_quaternion.lcm",
+    "lcmt_realtime_step_statistics.lcm",
     "lcmt_robot_plan.lcm",
     "lcmt_robot_state.lcm",
     "lcmt_schunk_wsg_command.lcm",
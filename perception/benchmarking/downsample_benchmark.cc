@@ -1,13 +1,23 @@
+#include <algorithm>
 #include <chrono>
+#include <cmath>
 #include <iostream>
+#include <vector>
 
 #include <gflags/gflags.h>
 
 #include "drake/perception/point_cloud.h"
+#include "drake/perception/point_cloud_pipeline.h"
 
 // TODO(jwnimmer-tri) Port this program to use googlebench.
 
 DEFINE_int32(size, 1000000, "number of points in the cloud");
+DEFINE_int32(num_cameras, 6, "number of cameras in the pipeline benchmark");
+DEFINE_int32(width, 640, "width of each camera's depth image");
+DEFINE_int32(height, 480, "height of each camera's depth image");
+DEFINE_int32(iterations, 10, "number of pipeline ticks to time");
+DEFINE_int32(num_threads, 0,
+             "number of pipeline threads (zero means Parallelism::Max())");
 
 namespace drake {
 namespace perception {
@@ -43,11 +53,70 @@ int DoMain() {
             << "maximal fields time " << duration_max << std::endl;
   return 0;
 }
+
+// Times the end-to-end latency of a PointCloudPipeline tick, i.e., converting,
+// cropping, downsampling, estimating normals for, and fusing the depth images
+// of several cameras.
+int DoPipelineMain() {
+  using systems::sensors::CameraInfo;
+  using systems::sensors::ImageDepth32F;
+
+  const CameraInfo camera_info(FLAGS_width, FLAGS_height, M_PI / 4);
+  std::vector<ImageDepth32F> depth_images;
+  std::vector<math::RigidTransformd> camera_poses;
+  for (int i = 0; i < FLAGS_num_cameras; ++i) {
+    ImageDepth32F& depth = depth_images.emplace_back(FLAGS_width, FLAGS_height);
+    Eigen::Map<Eigen::VectorXf>(depth.at(0, 0), depth.size()).setRandom();
+    Eigen::Map<Eigen::VectorXf>(depth.at(0, 0), depth.size()).array() += 2.0;
+    camera_poses.emplace_back(
+        math::RotationMatrixd::MakeZRotation(2 * M_PI * i / FLAGS_num_cameras),
+        Eigen::Vector3d::Zero());
+  }
+  std::vector<const ImageDepth32F*> depth_pointers;
+  for (const ImageDepth32F& depth : depth_images) {
+    depth_pointers.push_back(&depth);
+  }
+
+  PointCloudPipelineParams params;
+  params.crop_lower_xyz = Eigen::Vector3d::Constant(-2.5);
+  params.crop_upper_xyz = Eigen::Vector3d::Constant(2.5);
+  params.voxel_size = 0.02;
+  params.normals_radius = 0.05;
+  PointCloudPipeline pipeline(
+      std::vector<CameraInfo>(FLAGS_num_cameras, camera_info), params,
+      pc_flags::kXYZs | pc_flags::kNormals);
+  const Parallelism parallelism = (FLAGS_num_threads > 0)
+                                      ? Parallelism(FLAGS_num_threads)
+                                      : Parallelism::Max();
+
+  PointCloud fused;
+  double total = 0.0;
+  double worst = 0.0;
+  for (int i = 0; i < FLAGS_iterations; ++i) {
+    const auto start = std::chrono::high_resolution_clock::now();
+    pipeline.Process(depth_pointers, {}, camera_poses, &fused, parallelism);
+    const auto end = std::chrono::high_resolution_clock::now();
+    const double duration =
+        static_cast<std::chrono::duration<double>>(end - start).count();
+    total += duration;
+    worst = std::max(worst, duration);
+  }
+
+  std::cout << "pipeline (" << FLAGS_num_cameras << " cameras, "
+            << parallelism.num_threads() << " threads, " << fused.size()
+            << " fused points) mean latency " << total / FLAGS_iterations
+            << ", max latency " << worst << std::endl;
+  return 0;
+}
 }  // namespace
 }  // namespace perception
 }  // namespace drake
 
 int main(int argc, char* argv[]) {
   gflags::ParseCommandLineFlags(&argc, &argv, true);
-  return drake::perception::DoMain();
+  const int result = drake::perception::DoMain();
+  if (result != 0) {
+    return result;
+  }
+  return drake::perception::DoPipelineMain();
 }
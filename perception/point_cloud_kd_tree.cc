@@ -0,0 +1,303 @@
+#include "drake/perception/point_cloud_kd_tree.h"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <vector>
+
+#include <nanoflann.hpp>
+
+#include "drake/common/drake_assert.h"
+
+namespace drake {
+namespace perception {
+namespace {
+
+// Adapts the 3xN matrix of points that the tree was built from to nanoflann's
+// dataset interface, so that the points need not be transposed.
+struct Dataset {
+  size_t kdtree_get_point_count() const { return xyzs.cols(); }
+
+  float kdtree_get_pt(size_t i, size_t dim) const { return xyzs(dim, i); }
+
+  template <class BoundingBox>
+  bool kdtree_get_bbox(BoundingBox&) const {
+    return false;
+  }
+
+  Matrix3X<float> xyzs;
+};
+
+using Tree = nanoflann::KDTreeSingleIndexAdaptor<
+    nanoflann::L2_Simple_Adaptor<float, Dataset>, Dataset, 3, uint32_t>;
+
+// A nanoflann result set for a k-nearest query that skips the points whose
+// tree positions are out of date. Results are kept sorted by distance.
+class NearestResults {
+ public:
+  NearestResults(const std::vector<bool>& updated, int k, int* indices,
+                 float* distances)
+      : updated_(updated), k_(k), indices_(indices), distances_(distances) {
+    std::fill(indices_, indices_ + k_, -1);
+    std::fill(distances_, distances_ + k_,
+              std::numeric_limits<float>::infinity());
+  }
+
+  size_t size() const { return count_; }
+  bool full() const { return count_ == k_; }
+  float worstDist() const { return distances_[k_ - 1]; }
+
+  bool addPoint(float distance, uint32_t index) {
+    if (!updated_[index]) {
+      Insert(distance, index);
+    }
+    return true;
+  }
+
+  void Insert(float distance, int index) {
+    if (!(distance < worstDist())) {
+      return;
+    }
+    int i = std::min(count_, k_ - 1);
+    for (; i > 0 && distances_[i - 1] > distance; --i) {
+      distances_[i] = distances_[i - 1];
+      indices_[i] = indices_[i - 1];
+    }
+    distances_[i] = distance;
+    indices_[i] = index;
+    count_ = std::min(count_ + 1, k_);
+  }
+
+ private:
+  const std::vector<bool>& updated_;
+  const int k_;
+  int* const indices_;
+  float* const distances_;
+  int count_{0};
+};
+
+// A nanoflann result set for a radius query that skips the points whose tree
+// positions are out of date.
+class RadiusResults {
+ public:
+  RadiusResults(const std::vector<bool>& updated, float squared_radius,
+                std::vector<std::pair<float, int>>* results)
+      : updated_(updated), squared_radius_(squared_radius), results_(results) {
+    results_->clear();
+  }
+
+  size_t size() const { return results_->size(); }
+  bool full() const { return true; }
+  // N.B. nanoflann only offers points strictly nearer than this, so we nudge
+  // it outward to include the points exactly at the radius.
+  float worstDist() const {
+    return std::nextafter(squared_radius_,
+                          std::numeric_limits<float>::infinity());
+  }
+
+  bool addPoint(float distance, uint32_t index) {
+    if (!updated_[index]) {
+      Insert(distance, index);
+    }
+    return true;
+  }
+
+  void Insert(float distance, int index) {
+    if (distance <= squared_radius_) {
+      results_->emplace_back(distance, index);
+    }
+  }
+
+ private:
+  const std::vector<bool>& updated_;
+  const float squared_radius_;
+  std::vector<std::pair<float, int>>* const results_;
+};
+
+void ThrowUnlessFinite(const Eigen::Ref<const Matrix3X<float>>& xyzs) {
+  if (!xyzs.allFinite()) {
+    throw std::logic_error(
+        "PointCloudKdTree: all of the points must be finite");
+  }
+}
+
+Eigen::Ref<const Matrix3X<float>> GetXyzs(const PointCloud& cloud) {
+  DRAKE_THROW_UNLESS(cloud.has_xyzs());
+  return cloud.xyzs();
+}
+
+}  // namespace
+
+class PointCloudKdTree::Impl {
+ public:
+  explicit Impl(const Eigen::Ref<const Matrix3X<float>>& xyzs) { Build(xyzs); }
+
+  void Build(const Eigen::Ref<const Matrix3X<float>>& xyzs) {
+    ThrowUnlessFinite(xyzs);
+    tree_.reset();
+    dataset_.xyzs = xyzs;
+    updated_.assign(xyzs.cols(), false);
+    updated_indices_.clear();
+    updated_xyzs_.resize(3, 0);
+    if (size() > 0) {
+      tree_ = std::make_unique<Tree>(3, dataset_);
+    }
+    ++num_builds_;
+  }
+
+  void Update(const Eigen::Ref<const Matrix3X<float>>& xyzs,
+              double max_updated_fraction) {
+    DRAKE_THROW_UNLESS(0 <= max_updated_fraction && max_updated_fraction <= 1);
+    if (xyzs.cols() != size()) {
+      Build(xyzs);
+      return;
+    }
+    ThrowUnlessFinite(xyzs);
+    // Compare against the positions in the tree (rather than those from the
+    // prior Update), so that a point that moves back is no longer updated.
+    std::vector<int> changed;
+    for (int i = 0; i < size(); ++i) {
+      if (xyzs.col(i) != dataset_.xyzs.col(i)) {
+        changed.push_back(i);
+      }
+    }
+    if (changed.size() > max_updated_fraction * size()) {
+      Build(xyzs);
+      return;
+    }
+    updated_.assign(size(), false);
+    updated_xyzs_.resize(3, changed.size());
+    for (int j = 0; j < ssize(changed); ++j) {
+      updated_[changed[j]] = true;
+      updated_xyzs_.col(j) = xyzs.col(changed[j]);
+    }
+    updated_indices_ = std::move(changed);
+  }
+
+  int size() const { return dataset_.xyzs.cols(); }
+  int num_updated_points() const { return updated_indices_.size(); }
+  int num_builds() const { return num_builds_; }
+  const std::vector<bool>& updated() const { return updated_; }
+
+  // Offers the updated points (by brute force) to the given result set.
+  template <typename Results>
+  void SearchUpdated(const float* query, Results* results) const {
+    const Eigen::Map<const Vector3<float>> p_Q(query);
+    for (int j = 0; j < ssize(updated_indices_); ++j) {
+      results->Insert((updated_xyzs_.col(j) - p_Q).squaredNorm(),
+                      updated_indices_[j]);
+    }
+  }
+
+  template <typename Results>
+  void Search(const float* query, Results* results) const {
+    if (tree_ != nullptr) {
+      tree_->findNeighbors(*results, query);
+    }
+    SearchUpdated(query, results);
+  }
+
+ private:
+  Dataset dataset_;
+  std::unique_ptr<Tree> tree_;
+  // Whether each point's position in the tree is out of date.
+  std::vector<bool> updated_;
+  // The indices and new positions of the points whose positions in the tree
+  // are out of date.
+  std::vector<int> updated_indices_;
+  Matrix3X<float> updated_xyzs_;
+  int num_builds_{0};
+};
+
+PointCloudKdTree::PointCloudKdTree(const PointCloud& cloud)
+    : PointCloudKdTree(GetXyzs(cloud)) {}
+
+PointCloudKdTree::PointCloudKdTree(
+    const Eigen::Ref<const Matrix3X<float>>& xyzs)
+    : impl_(std::make_unique<Impl>(xyzs)) {}
+
+PointCloudKdTree::~PointCloudKdTree() = default;
+
+int PointCloudKdTree::size() const {
+  return impl_->size();
+}
+
+int PointCloudKdTree::num_updated_points() const {
+  return impl_->num_updated_points();
+}
+
+int PointCloudKdTree::num_builds() const {
+  return impl_->num_builds();
+}
+
+void PointCloudKdTree::Update(const PointCloud& cloud,
+                              double max_updated_fraction) {
+  impl_->Update(GetXyzs(cloud), max_updated_fraction);
+}
+
+void PointCloudKdTree::Update(const Eigen::Ref<const Matrix3X<float>>& xyzs,
+                              double max_updated_fraction) {
+  impl_->Update(xyzs, max_updated_fraction);
+}
+
+std::pair<MatrixX<int>, MatrixX<float>> PointCloudKdTree::FindNearest(
+    const Eigen::Ref<const Matrix3X<float>>& queries, int k,
+    [[maybe_unused]] Parallelism parallelize) const {
+  DRAKE_THROW_UNLESS(k >= 1);
+  const int num_queries = queries.cols();
+  MatrixX<int> indices(k, num_queries);
+  MatrixX<float> distances(k, num_queries);
+  const std::vector<bool>& updated = impl_->updated();
+
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(parallelize.num_threads())
+#endif
+  for (int j = 0; j < num_queries; ++j) {
+    const Vector3<float> query = queries.col(j);
+    NearestResults results(updated, k, indices.col(j).data(),
+                           distances.col(j).data());
+    impl_->Search(query.data(), &results);
+  }
+  return {std::move(indices), std::move(distances)};
+}
+
+std::tuple<VectorX<int>, VectorX<float>, VectorX<int>>
+PointCloudKdTree::FindWithinRadius(
+    const Eigen::Ref<const Matrix3X<float>>& queries, double radius,
+    [[maybe_unused]] Parallelism parallelize) const {
+  DRAKE_THROW_UNLESS(radius >= 0);
+  const int num_queries = queries.cols();
+  const float squared_radius = radius * radius;
+  const std::vector<bool>& updated = impl_->updated();
+
+  // Search each query into its own list, and then concatenate the lists.
+  std::vector<std::vector<std::pair<float, int>>> per_query(num_queries);
+#if defined(_OPENMP)
+#pragma omp parallel for num_threads(parallelize.num_threads())
+#endif
+  for (int j = 0; j < num_queries; ++j) {
+    const Vector3<float> query = queries.col(j);
+    RadiusResults results(updated, squared_radius, &per_query[j]);
+    impl_->Search(query.data(), &results);
+    std::sort(per_query[j].begin(), per_query[j].end());
+  }
+
+  VectorX<int> offsets(num_queries + 1);
+  offsets[0] = 0;
+  for (int j = 0; j < num_queries; ++j) {
+    offsets[j + 1] = offsets[j] + per_query[j].size();
+  }
+  VectorX<int> indices(offsets[num_queries]);
+  VectorX<float> distances(offsets[num_queries]);
+  for (int j = 0; j < num_queries; ++j) {
+    for (int n = 0; n < ssize(per_query[j]); ++n) {
+      distances[offsets[j] + n] = per_query[j][n].first;
+      indices[offsets[j] + n] = per_query[j][n].second;
+    }
+  }
+  return {std::move(indices), std::move(distances), std::move(offsets)};
+}
+
+}  // namespace perception
+}  // namespace drake
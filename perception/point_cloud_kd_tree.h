@@ -0,0 +1,100 @@
+#pragma once
+
+#include <memory>
+#include <tuple>
+#include <utility>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/common/eigen_types.h"
+#include "drake/common/parallelism.h"
+#include "drake/perception/point_cloud.h"
+
+namespace drake {
+namespace perception {
+
+/// A k-d tree over the xyzs of a PointCloud, for repeated nearest-neighbor and
+/// radius queries (e.g., for ICP, outlier removal, or point-to-model
+/// distances).
+///
+/// The tree owns a copy of the points it was built from; later changes to
+/// the cloud are only seen by the tree after calling Update().
+///
+/// <h3>Incremental updates</h3>
+///
+/// When only some of the points change from one frame to the next, Update()
+/// avoids rebuilding the tree. Instead, it marks the points that differ from
+/// the ones the tree was built from as "updated": the tree ignores their old
+/// positions, and queries check their new positions by brute force. Once more
+/// than `max_updated_fraction` of the points have been updated (or when the
+/// number of points changes), Update() rebuilds the tree from scratch.
+///
+/// All distances reported by the queries are *squared* Euclidean distances.
+class PointCloudKdTree {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(PointCloudKdTree);
+
+  /// Builds the tree from the xyzs of `cloud`.
+  /// @throws std::exception if `cloud` has no xyzs or any of them are not
+  ///   finite.
+  explicit PointCloudKdTree(const PointCloud& cloud);
+
+  /// Builds the tree from the given points.
+  /// @throws std::exception if any of the points are not finite.
+  explicit PointCloudKdTree(const Eigen::Ref<const Matrix3X<float>>& xyzs);
+
+  ~PointCloudKdTree();
+
+  /// Returns the number of points in the tree.
+  int size() const;
+
+  /// Returns the number of points whose positions have been updated by
+  /// Update() since the tree was last (re)built.
+  int num_updated_points() const;
+
+  /// Returns the number of times the tree has been built (including by the
+  /// constructor).
+  int num_builds() const;
+
+  /// Replaces the points in the tree with the xyzs of `cloud`, incrementally
+  /// when possible; see the class overview.
+  /// @pre 0 <= max_updated_fraction <= 1.
+  /// @throws std::exception if `cloud` has no xyzs or any of them are not
+  ///   finite.
+  void Update(const PointCloud& cloud, double max_updated_fraction = 0.1);
+
+  /// Replaces the points in the tree with `xyzs`; see the class overview.
+  /// @pre 0 <= max_updated_fraction <= 1.
+  /// @throws std::exception if any of the points are not finite.
+  void Update(const Eigen::Ref<const Matrix3X<float>>& xyzs,
+              double max_updated_fraction = 0.1);
+
+  /// Finds the `k` nearest points to each of the `queries` (one per column).
+  ///
+  /// @returns a pair (indices, squared_distances) of k-by-M matrices, where
+  ///   column j lists the neighbors of query j from nearest to farthest. When
+  ///   the tree has fewer than `k` points, the excess entries are -1 and
+  ///   infinity, respectively.
+  /// @pre k >= 1.
+  std::pair<MatrixX<int>, MatrixX<float>> FindNearest(
+      const Eigen::Ref<const Matrix3X<float>>& queries, int k,
+      Parallelism parallelize = false) const;
+
+  /// Finds the points within `radius` of each of the `queries` (one per
+  /// column).
+  ///
+  /// @returns a tuple (indices, squared_distances, offsets), where the
+  ///   neighbors of query j are at positions [offsets[j], offsets[j + 1]) of
+  ///   `indices` and `squared_distances`, sorted from nearest to farthest.
+  ///   `offsets` has M + 1 entries.
+  /// @pre radius >= 0.
+  std::tuple<VectorX<int>, VectorX<float>, VectorX<int>> FindWithinRadius(
+      const Eigen::Ref<const Matrix3X<float>>& queries, double radius,
+      Parallelism parallelize = false) const;
+
+ private:
+  class Impl;
+  std::unique_ptr<Impl> impl_;
+};
+
+}  // namespace perception
+}  // namespace drake
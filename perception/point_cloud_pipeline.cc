@@ -0,0 +1,271 @@
+#include "drake/perception/point_cloud_pipeline.h"
+
+#include <algorithm>
+#include <limits>
+#include <utility>
+
+#include <common_robotics_utilities/parallelism.hpp>
+#include <fmt/format.h>
+
+#include "drake/common/drake_assert.h"
+
+namespace drake {
+namespace perception {
+
+using common_robotics_utilities::parallelism::DegreeOfParallelism;
+using common_robotics_utilities::parallelism::ParallelForBackend;
+using common_robotics_utilities::parallelism::StaticParallelForIndexLoop;
+using Eigen::Vector3d;
+using math::RigidTransformd;
+using systems::sensors::CameraInfo;
+using systems::sensors::ImageDepth32F;
+using systems::sensors::ImageRgba8U;
+
+namespace {
+
+// Projects the depth image into `cloud`, keeping only the finite points that
+// lie within [lower, upper], so that later stages see only the useful points.
+// This fuses DepthImageToPointCloud::Convert() with PointCloud::Crop(), and
+// writes directly into the (reused) storage of `cloud`.
+void ConvertAndCrop(const CameraInfo& camera_info, const RigidTransformd& X_PC,
+                    const ImageDepth32F& depth_image,
+                    const ImageRgba8U* color_image, const double scale,
+                    const Vector3d& lower, const Vector3d& upper,
+                    PointCloud* cloud) {
+  const int height = depth_image.height();
+  const int width = depth_image.width();
+  cloud->resize(width * height, /* skip_initialize = */ true);
+  auto xyzs = cloud->mutable_xyzs();
+  std::optional<Eigen::Ref<Matrix3X<uint8_t>>> rgbs;
+  if (color_image != nullptr) {
+    rgbs = cloud->mutable_rgbs();
+  }
+
+  const double cx = camera_info.center_x();
+  const double cy = camera_info.center_y();
+  const double fx_inv = 1.0 / camera_info.focal_x();
+  const double fy_inv = 1.0 / camera_info.focal_y();
+  int num_points = 0;
+  for (int v = 0; v < height; ++v) {
+    for (int u = 0; u < width; ++u) {
+      // The kTooClose and kTooFar sentinels (zero and infinity) are excluded
+      // along with NaNs, by virtue of being non-finite or behind the camera.
+      const double z = scale * depth_image.at(u, v)[0];
+      if (!(z > 0 && z < std::numeric_limits<double>::infinity())) {
+        continue;
+      }
+      const Vector3d p_PQ =
+          X_PC * Vector3d(z * (u - cx) * fx_inv, z * (v - cy) * fy_inv, z);
+      if ((p_PQ.array() < lower.array()).any() ||
+          (p_PQ.array() > upper.array()).any()) {
+        continue;
+      }
+      xyzs.col(num_points) = p_PQ.cast<float>();
+      if (color_image != nullptr) {
+        const uint8_t* color = color_image->at(u, v);
+        rgbs->col(num_points) = Vector3<uint8_t>(color[0], color[1], color[2]);
+      }
+      ++num_points;
+    }
+  }
+  cloud->resize(num_points);
+}
+
+// Copies `source` into columns [start, start + source.size()) of `dest`.
+void CopyInto(const PointCloud& source, int start, PointCloud* dest) {
+  const int n = source.size();
+  dest->mutable_xyzs().middleCols(start, n) = source.xyzs();
+  if (dest->has_rgbs()) {
+    dest->mutable_rgbs().middleCols(start, n) = source.rgbs();
+  }
+  if (dest->has_normals()) {
+    dest->mutable_normals().middleCols(start, n) = source.normals();
+  }
+}
+
+}  // namespace
+
+PointCloudPipeline::PointCloudPipeline(std::vector<CameraInfo> camera_infos,
+                                       const PointCloudPipelineParams& params,
+                                       pc_flags::BaseFieldT fields)
+    : camera_infos_(std::move(camera_infos)), params_(params), fields_(fields) {
+  DRAKE_THROW_UNLESS(!camera_infos_.empty());
+  DRAKE_THROW_UNLESS((fields & pc_flags::kXYZs) != 0);
+  DRAKE_THROW_UNLESS((fields & ~(pc_flags::kXYZs | pc_flags::kRGBs |
+                                 pc_flags::kNormals)) == 0);
+  DRAKE_THROW_UNLESS(params.depth_scale > 0);
+  DRAKE_THROW_UNLESS(params.voxel_size >= 0);
+  if ((fields & pc_flags::kNormals) != 0) {
+    DRAKE_THROW_UNLESS(params.normals_radius > 0);
+    DRAKE_THROW_UNLESS(params.normals_num_closest >= 3);
+  }
+  // The normals are not part of the converted clouds; they are added by
+  // EstimateNormals().
+  const pc_flags::BaseFieldT converted_fields = fields & ~pc_flags::kNormals;
+  converted_.resize(num_cameras(), PointCloud(0, converted_fields));
+  downsampled_.resize(num_cameras(), PointCloud(0, converted_fields));
+}
+
+PointCloudPipeline::~PointCloudPipeline() = default;
+
+void PointCloudPipeline::Process(
+    const std::vector<const ImageDepth32F*>& depth_images,
+    const std::vector<const ImageRgba8U*>& color_images,
+    const std::vector<RigidTransformd>& camera_poses, PointCloud* output,
+    Parallelism parallelize) {
+  DRAKE_THROW_UNLESS(output != nullptr);
+  const bool has_color = (fields_ & pc_flags::kRGBs) != 0;
+  const bool has_normals = (fields_ & pc_flags::kNormals) != 0;
+  DRAKE_THROW_UNLESS(ssize(depth_images) == num_cameras());
+  DRAKE_THROW_UNLESS(ssize(color_images) == (has_color ? num_cameras() : 0));
+  DRAKE_THROW_UNLESS(ssize(camera_poses) == num_cameras());
+  for (int i = 0; i < num_cameras(); ++i) {
+    const CameraInfo& info = camera_infos_[i];
+    DRAKE_THROW_UNLESS(depth_images[i] != nullptr);
+    DRAKE_THROW_UNLESS(depth_images[i]->width() == info.width());
+    DRAKE_THROW_UNLESS(depth_images[i]->height() == info.height());
+    if (has_color) {
+      DRAKE_THROW_UNLESS(color_images[i] != nullptr);
+      DRAKE_THROW_UNLESS(color_images[i]->width() == info.width());
+      DRAKE_THROW_UNLESS(color_images[i]->height() == info.height());
+    }
+  }
+
+  // Split the threads between the cameras, and give any left over to the
+  // stages within each camera.
+  const int num_threads = parallelize.num_threads();
+  const int outer_threads = std::min(num_threads, num_cameras());
+  const Parallelism inner_parallelism(std::max(1, num_threads / outer_threads));
+  const double kInf = std::numeric_limits<double>::infinity();
+  const Vector3d lower =
+      params_.crop_lower_xyz.value_or(Vector3d::Constant(-kInf));
+  const Vector3d upper =
+      params_.crop_upper_xyz.value_or(Vector3d::Constant(kInf));
+
+  // The result of each camera's stages.
+  std::vector<const PointCloud*> results(num_cameras());
+  const auto process_camera = [&](const int, const int64_t i) {
+    PointCloud* cloud = &converted_[i];
+    ConvertAndCrop(camera_infos_[i], camera_poses[i], *depth_images[i],
+                   has_color ? color_images[i] : nullptr, params_.depth_scale,
+                   lower, upper, cloud);
+    if (params_.voxel_size > 0) {
+      downsampled_[i] =
+          cloud->VoxelizedDownSample(params_.voxel_size, inner_parallelism);
+      cloud = &downsampled_[i];
+    }
+    if (has_normals) {
+      cloud->EstimateNormals(params_.normals_radius,
+                             params_.normals_num_closest, inner_parallelism);
+      cloud->FlipNormalsTowardPoint(
+          camera_poses[i].translation().cast<float>());
+    }
+    results[i] = cloud;
+  };
+  StaticParallelForIndexLoop(DegreeOfParallelism(outer_threads), 0,
+                             num_cameras(), process_camera,
+                             ParallelForBackend::BEST_AVAILABLE);
+
+  // Concatenate the results into the output, reusing its storage.
+  std::vector<int> starts(num_cameras() + 1, 0);
+  for (int i = 0; i < num_cameras(); ++i) {
+    starts[i + 1] = starts[i] + results[i]->size();
+  }
+  output->SetFields(fields_, /* skip_initialize = */ true);
+  output->resize(starts.back(), /* skip_initialize = */ true);
+  const auto copy_camera = [&](const int, const int64_t i) {
+    CopyInto(*results[i], starts[i], output);
+  };
+  StaticParallelForIndexLoop(DegreeOfParallelism(outer_threads), 0,
+                             num_cameras(), copy_camera,
+                             ParallelForBackend::BEST_AVAILABLE);
+}
+
+PointCloudPipelineSystem::PointCloudPipelineSystem(
+    std::vector<CameraInfo> camera_infos,
+    const PointCloudPipelineParams& params, pc_flags::BaseFieldT fields,
+    Parallelism parallelize)
+    : parallelize_(parallelize) {
+  // Constructing the pipeline checks the arguments. Each Context gets its own
+  // copy (in a cache entry) so that its buffers are never shared between
+  // threads.
+  PointCloudPipeline pipeline(std::move(camera_infos), params, fields);
+  for (int i = 0; i < pipeline.num_cameras(); ++i) {
+    depth_image_input_ports_.push_back(
+        this->DeclareAbstractInputPort(fmt::format("depth_image_{}", i),
+                                       Value<ImageDepth32F>{})
+            .get_index());
+    if ((fields & pc_flags::kRGBs) != 0) {
+      color_image_input_ports_.push_back(
+          this->DeclareAbstractInputPort(fmt::format("color_image_{}", i),
+                                         Value<ImageRgba8U>{})
+              .get_index());
+    }
+    camera_pose_input_ports_.push_back(
+        this->DeclareAbstractInputPort(fmt::format("camera_pose_{}", i),
+                                       Value<RigidTransformd>{})
+            .get_index());
+  }
+
+  // This cache entry only holds the pipeline's buffers; CalcOutput() updates
+  // it, so it needs no invalidation support from the cache system.
+  pipeline_cache_index_ =
+      this->DeclareCacheEntry(
+              "pipeline",
+              systems::ValueProducer(std::move(pipeline),
+                                     &systems::ValueProducer::NoopCalc),
+              {this->nothing_ticket()})
+          .cache_index();
+
+  this->DeclareAbstractOutputPort("point_cloud", PointCloud{0, fields},
+                                  &PointCloudPipelineSystem::CalcOutput);
+}
+
+PointCloudPipelineSystem::~PointCloudPipelineSystem() = default;
+
+const systems::InputPort<double>&
+PointCloudPipelineSystem::depth_image_input_port(int i) const {
+  DRAKE_THROW_UNLESS(0 <= i && i < num_cameras());
+  return this->get_input_port(depth_image_input_ports_[i]);
+}
+
+const systems::InputPort<double>&
+PointCloudPipelineSystem::color_image_input_port(int i) const {
+  DRAKE_THROW_UNLESS(!color_image_input_ports_.empty());
+  DRAKE_THROW_UNLESS(0 <= i && i < num_cameras());
+  return this->get_input_port(color_image_input_ports_[i]);
+}
+
+const systems::InputPort<double>&
+PointCloudPipelineSystem::camera_pose_input_port(int i) const {
+  DRAKE_THROW_UNLESS(0 <= i && i < num_cameras());
+  return this->get_input_port(camera_pose_input_ports_[i]);
+}
+
+void PointCloudPipelineSystem::CalcOutput(
+    const systems::Context<double>& context, PointCloud* output) const {
+  std::vector<const ImageDepth32F*> depth_images;
+  std::vector<const ImageRgba8U*> color_images;
+  std::vector<RigidTransformd> camera_poses;
+  for (int i = 0; i < num_cameras(); ++i) {
+    depth_images.push_back(this->EvalInputValue<ImageDepth32F>(
+        context, depth_image_input_ports_[i]));
+    if (!color_image_input_ports_.empty()) {
+      color_images.push_back(this->EvalInputValue<ImageRgba8U>(
+          context, color_image_input_ports_[i]));
+    }
+    const auto* pose_or_null = this->EvalInputValue<RigidTransformd>(
+        context, camera_pose_input_ports_[i]);
+    camera_poses.push_back(pose_or_null != nullptr ? *pose_or_null
+                                                   : RigidTransformd{});
+  }
+  PointCloudPipeline& pipeline =
+      this->get_cache_entry(pipeline_cache_index_)
+          .get_mutable_cache_entry_value(context)
+          .GetMutableValueOrThrow<PointCloudPipeline>();
+  pipeline.Process(depth_images, color_images, camera_poses, output,
+                   parallelize_);
+}
+
+}  // namespace perception
+}  // namespace drake
@@ -0,0 +1,201 @@
+#pragma once
+
+#include <optional>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/common/eigen_types.h"
+#include "drake/common/name_value.h"
+#include "drake/common/parallelism.h"
+#include "drake/math/rigid_transform.h"
+#include "drake/perception/point_cloud.h"
+#include "drake/systems/framework/leaf_system.h"
+#include "drake/systems/sensors/camera_info.h"
+#include "drake/systems/sensors/image.h"
+
+namespace drake {
+namespace perception {
+
+/// The stages of a PointCloudPipeline that follow the depth image conversion.
+/// Each stage is applied to each camera's cloud independently, in the order
+/// of the members below.
+struct PointCloudPipelineParams {
+  /// Passes this object to an Archive.
+  /// Refer to @ref yaml_serialization "YAML Serialization" for background.
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(depth_scale));
+    a->Visit(DRAKE_NVP(crop_lower_xyz));
+    a->Visit(DRAKE_NVP(crop_upper_xyz));
+    a->Visit(DRAKE_NVP(voxel_size));
+    a->Visit(DRAKE_NVP(normals_radius));
+    a->Visit(DRAKE_NVP(normals_num_closest));
+  }
+
+  /// The depth images are multiplied by this scale factor before projecting
+  /// to a point cloud.
+  double depth_scale{1.0};
+
+  /// When set, points with any xyz coordinate less than this bound (measured
+  /// in the parent frame of the camera poses) are discarded. Points that are
+  /// not finite (i.e., missing, too close, or too far) are always discarded.
+  std::optional<Eigen::Vector3d> crop_lower_xyz;
+
+  /// When set, points with any xyz coordinate greater than this bound are
+  /// discarded.
+  std::optional<Eigen::Vector3d> crop_upper_xyz;
+
+  /// When positive, each camera's cloud is downsampled using
+  /// PointCloud::VoxelizedDownSample() with this voxel size.
+  double voxel_size{0.0};
+
+  /// When the pipeline's fields include normals, they are estimated using
+  /// PointCloud::EstimateNormals() with this radius and number of closest
+  /// points, and then flipped to point toward the camera.
+  double normals_radius{0.01};
+
+  /// See normals_radius.
+  int normals_num_closest{30};
+};
+
+/// Converts the depth images of several cameras into a single point cloud,
+/// running each camera's stages (conversion, cropping, downsampling, and
+/// normal estimation; see PointCloudPipelineParams) in parallel and then
+/// concatenating the results.
+///
+/// Unlike chaining DepthImageToPointCloud, PointCloud::Crop(), and so on, the
+/// pipeline keeps its per-camera conversion buffers and reuses them (along
+/// with the output cloud's storage) from one call to the next, so that a
+/// steady-state call only allocates within the downsampling stage. Because of
+/// those buffers, an instance must not be used by more than one thread at a
+/// time; see PointCloudPipelineSystem for a System that keeps one per Context.
+class PointCloudPipeline {
+ public:
+  DRAKE_DEFAULT_COPY_AND_MOVE_AND_ASSIGN(PointCloudPipeline);
+
+  /// Constructs the pipeline.
+  ///
+  /// @param camera_infos The intrinsics of each camera.
+  /// @param params The stages to apply.
+  /// @param fields The fields of the output cloud. Must include kXYZs, and
+  ///   may include kRGBs (in which case color images must be provided) and
+  ///   kNormals.
+  /// @throws std::exception if `camera_infos` is empty, or if `params` or
+  ///   `fields` are invalid.
+  PointCloudPipeline(std::vector<systems::sensors::CameraInfo> camera_infos,
+                     const PointCloudPipelineParams& params,
+                     pc_flags::BaseFieldT fields = pc_flags::kXYZs);
+
+  ~PointCloudPipeline();
+
+  /// Returns the number of cameras.
+  int num_cameras() const { return camera_infos_.size(); }
+
+  /// Returns the camera intrinsics passed to the constructor.
+  const std::vector<systems::sensors::CameraInfo>& camera_infos() const {
+    return camera_infos_;
+  }
+
+  /// Returns the params passed to the constructor.
+  const PointCloudPipelineParams& params() const { return params_; }
+
+  /// Returns the fields of the output cloud.
+  pc_flags::BaseFieldT fields() const { return fields_; }
+
+  /// Runs the pipeline on one image from each camera.
+  ///
+  /// @param depth_images The depth image from each camera.
+  /// @param color_images The color image from each camera, aligned with its
+  ///   depth image. Must be empty unless fields() includes kRGBs.
+  /// @param camera_poses The pose of each camera (X_PC); the output cloud is
+  ///   represented in the common parent frame P.
+  /// @param[out] output The fused cloud. Its storage is reused when possible.
+  /// @param parallelize The parallelism to use across (and within) cameras.
+  /// @throws std::exception if the number of images or poses does not match
+  ///   the number of cameras, or if any image is null or does not match its
+  ///   camera's size.
+  void Process(
+      const std::vector<const systems::sensors::ImageDepth32F*>& depth_images,
+      const std::vector<const systems::sensors::ImageRgba8U*>& color_images,
+      const std::vector<math::RigidTransformd>& camera_poses,
+      PointCloud* output, Parallelism parallelize = Parallelism::Max());
+
+ private:
+  std::vector<systems::sensors::CameraInfo> camera_infos_;
+  PointCloudPipelineParams params_;
+  pc_flags::BaseFieldT fields_{};
+  // The per-camera working clouds, reused from one call to the next.
+  std::vector<PointCloud> converted_;
+  std::vector<PointCloud> downsampled_;
+};
+
+/// A System wrapper around PointCloudPipeline.
+///
+/// @system
+/// name: PointCloudPipelineSystem
+/// input_ports:
+/// - depth_image_0
+/// - color_image_0 (if fields include kRGBs)
+/// - camera_pose_0 (optional)
+/// - ...
+/// - depth_image_N-1
+/// - color_image_N-1 (if fields include kRGBs)
+/// - camera_pose_N-1 (optional)
+/// output_ports:
+/// - point_cloud
+/// @endsystem
+///
+/// The depth images are ImageDepth32F, the color images are ImageRgba8U, and
+/// the camera poses are RigidTransformd (X_PC). When a camera's pose input is
+/// not connected, the identity is used.
+///
+/// @ingroup perception_systems
+class PointCloudPipelineSystem final : public systems::LeafSystem<double> {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(PointCloudPipelineSystem);
+
+  /// Constructs the system; see PointCloudPipeline for the arguments.
+  /// @param parallelize The parallelism used each time the output is
+  ///   calculated.
+  PointCloudPipelineSystem(
+      std::vector<systems::sensors::CameraInfo> camera_infos,
+      const PointCloudPipelineParams& params,
+      pc_flags::BaseFieldT fields = pc_flags::kXYZs,
+      Parallelism parallelize = Parallelism::Max());
+
+  ~PointCloudPipelineSystem() final;
+
+  /// Returns the number of cameras.
+  int num_cameras() const { return depth_image_input_ports_.size(); }
+
+  /// Returns the abstract valued input port that expects camera `i`'s
+  /// ImageDepth32F.
+  const systems::InputPort<double>& depth_image_input_port(int i) const;
+
+  /// Returns the abstract valued input port that expects camera `i`'s
+  /// ImageRgba8U.
+  /// @throws std::exception if the fields do not include kRGBs.
+  const systems::InputPort<double>& color_image_input_port(int i) const;
+
+  /// Returns the abstract valued input port that expects camera `i`'s X_PC as
+  /// a RigidTransformd.
+  const systems::InputPort<double>& camera_pose_input_port(int i) const;
+
+  /// Returns the abstract valued output port that provides the fused
+  /// PointCloud.
+  const systems::OutputPort<double>& point_cloud_output_port() const {
+    return LeafSystem<double>::get_output_port(0);
+  }
+
+ private:
+  void CalcOutput(const systems::Context<double>&, PointCloud*) const;
+
+  const Parallelism parallelize_;
+  std::vector<systems::InputPortIndex> depth_image_input_ports_;
+  std::vector<systems::InputPortIndex> color_image_input_ports_;
+  std::vector<systems::InputPortIndex> camera_pose_input_ports_;
+  systems::CacheIndex pipeline_cache_index_;
+};
+
+}  // namespace perception
+}  // namespace drake
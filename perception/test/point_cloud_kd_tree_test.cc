@@ -0,0 +1,172 @@
+#include "drake/perception/point_cloud_kd_tree.h"
+
+#include <algorithm>
+#include <limits>
+#include <utility>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+
+namespace drake {
+namespace perception {
+namespace {
+
+constexpr float kInf = std::numeric_limits<float>::infinity();
+
+// Returns (squared_distance, index) for every point, sorted by distance.
+std::vector<std::pair<float, int>> BruteForce(const Matrix3X<float>& xyzs,
+                                              const Vector3<float>& query) {
+  std::vector<std::pair<float, int>> result;
+  for (int i = 0; i < xyzs.cols(); ++i) {
+    result.emplace_back((xyzs.col(i) - query).squaredNorm(), i);
+  }
+  std::sort(result.begin(), result.end());
+  return result;
+}
+
+// Points on a jittered grid, so that the distances are (mostly) distinct.
+Matrix3X<float> MakePoints(int n) {
+  Matrix3X<float> xyzs(3, n);
+  for (int i = 0; i < n; ++i) {
+    xyzs.col(i) << 0.1f * (i % 7) + 0.001f * i, 0.1f * ((i / 7) % 5),
+        0.1f * (i / 35) - 0.0007f * i;
+  }
+  return xyzs;
+}
+
+Matrix3X<float> MakeQueries() {
+  Matrix3X<float> queries(3, 4);
+  queries.col(0) << 0, 0, 0;
+  queries.col(1) << 0.33f, 0.21f, 0.05f;
+  queries.col(2) << -1, 2, 0.5f;
+  queries.col(3) << 0.6f, 0.4f, 0.3f;
+  return queries;
+}
+
+// Checks the queries of `dut` against brute force over `xyzs`.
+void CheckQueries(const PointCloudKdTree& dut, const Matrix3X<float>& xyzs) {
+  const Matrix3X<float> queries = MakeQueries();
+  const int k = 5;
+  const double radius = 0.25;
+  for (const int num_threads : {1, 2}) {
+    const auto [indices, distances] =
+        dut.FindNearest(queries, k, Parallelism(num_threads));
+    ASSERT_EQ(indices.rows(), k);
+    ASSERT_EQ(indices.cols(), queries.cols());
+    const auto [radius_indices, radius_distances, offsets] =
+        dut.FindWithinRadius(queries, radius, Parallelism(num_threads));
+    ASSERT_EQ(offsets.size(), queries.cols() + 1);
+    EXPECT_EQ(offsets[0], 0);
+    EXPECT_EQ(offsets[queries.cols()], radius_indices.size());
+
+    for (int j = 0; j < queries.cols(); ++j) {
+      const auto expected = BruteForce(xyzs, queries.col(j));
+      for (int n = 0; n < k; ++n) {
+        EXPECT_EQ(indices(n, j), expected[n].second);
+        EXPECT_NEAR(distances(n, j), expected[n].first, 1e-6);
+      }
+      const auto within = std::count_if(
+          expected.begin(), expected.end(), [&](const auto& item) {
+            return item.first <= static_cast<float>(radius * radius);
+          });
+      ASSERT_EQ(offsets[j + 1] - offsets[j], within);
+      for (int n = 0; n < within; ++n) {
+        EXPECT_EQ(radius_indices[offsets[j] + n], expected[n].second);
+        EXPECT_NEAR(radius_distances[offsets[j] + n], expected[n].first, 1e-6);
+      }
+    }
+  }
+}
+
+GTEST_TEST(PointCloudKdTreeTest, MatchesBruteForce) {
+  const Matrix3X<float> xyzs = MakePoints(100);
+  PointCloud cloud(xyzs.cols());
+  cloud.mutable_xyzs() = xyzs;
+  const PointCloudKdTree dut(cloud);
+  EXPECT_EQ(dut.size(), 100);
+  EXPECT_EQ(dut.num_builds(), 1);
+  EXPECT_EQ(dut.num_updated_points(), 0);
+  CheckQueries(dut, xyzs);
+}
+
+GTEST_TEST(PointCloudKdTreeTest, FewPoints) {
+  const Matrix3X<float> xyzs = MakePoints(2);
+  const PointCloudKdTree dut(xyzs);
+  const Matrix3X<float> queries = MakeQueries();
+  const auto [indices, distances] = dut.FindNearest(queries, 4);
+  for (int j = 0; j < queries.cols(); ++j) {
+    const auto expected = BruteForce(xyzs, queries.col(j));
+    EXPECT_EQ(indices(0, j), expected[0].second);
+    EXPECT_EQ(indices(1, j), expected[1].second);
+    EXPECT_EQ(indices(2, j), -1);
+    EXPECT_EQ(indices(3, j), -1);
+    EXPECT_EQ(distances(2, j), kInf);
+    EXPECT_EQ(distances(3, j), kInf);
+  }
+
+  // An empty tree finds nothing.
+  const PointCloudKdTree empty(Matrix3X<float>(3, 0));
+  EXPECT_EQ(empty.size(), 0);
+  EXPECT_TRUE((empty.FindNearest(queries, 1).first.array() == -1).all());
+  const auto [radius_indices, radius_distances, offsets] =
+      empty.FindWithinRadius(queries, 1.0);
+  EXPECT_EQ(radius_indices.size(), 0);
+  EXPECT_TRUE((offsets.array() == 0).all());
+}
+
+GTEST_TEST(PointCloudKdTreeTest, Update) {
+  Matrix3X<float> xyzs = MakePoints(100);
+  PointCloudKdTree dut(xyzs);
+
+  // Moving a few points does not rebuild the tree.
+  xyzs.col(3) << 0.33f, 0.2f, 0.06f;
+  xyzs.col(50) << 10, 10, 10;
+  xyzs.col(99) << 0.01f, 0.0f, 0.0f;
+  dut.Update(xyzs, 0.1);
+  EXPECT_EQ(dut.num_builds(), 1);
+  EXPECT_EQ(dut.num_updated_points(), 3);
+  CheckQueries(dut, xyzs);
+
+  // Updates are relative to the tree, so moving a point back un-updates it.
+  xyzs.col(50) = MakePoints(100).col(50);
+  dut.Update(xyzs, 0.1);
+  EXPECT_EQ(dut.num_builds(), 1);
+  EXPECT_EQ(dut.num_updated_points(), 2);
+  CheckQueries(dut, xyzs);
+
+  // Moving too many points rebuilds the tree.
+  xyzs.leftCols(20).array() += 0.05f;
+  dut.Update(xyzs, 0.1);
+  EXPECT_EQ(dut.num_builds(), 2);
+  EXPECT_EQ(dut.num_updated_points(), 0);
+  CheckQueries(dut, xyzs);
+
+  // Changing the number of points rebuilds the tree.
+  xyzs = MakePoints(60);
+  PointCloud cloud(xyzs.cols());
+  cloud.mutable_xyzs() = xyzs;
+  dut.Update(cloud);
+  EXPECT_EQ(dut.num_builds(), 3);
+  EXPECT_EQ(dut.size(), 60);
+  CheckQueries(dut, xyzs);
+}
+
+GTEST_TEST(PointCloudKdTreeTest, BadArguments) {
+  Matrix3X<float> xyzs = MakePoints(10);
+  PointCloudKdTree dut(xyzs);
+  EXPECT_THROW(dut.FindNearest(MakeQueries(), 0), std::exception);
+  EXPECT_THROW(dut.FindWithinRadius(MakeQueries(), -1.0), std::exception);
+  EXPECT_THROW(dut.Update(xyzs, 1.5), std::exception);
+
+  xyzs(1, 4) = std::numeric_limits<float>::quiet_NaN();
+  EXPECT_THROW(PointCloudKdTree{xyzs}, std::exception);
+  EXPECT_THROW(dut.Update(xyzs), std::exception);
+  EXPECT_THROW(PointCloudKdTree(PointCloud(10, pc_flags::kRGBs)),
+               std::exception);
+}
+
+}  // namespace
+}  // namespace perception
+}  // namespace drake
@@ -0,0 +1,173 @@
+#include "drake/perception/point_cloud_pipeline.h"
+
+#include <limits>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/perception/depth_image_to_point_cloud.h"
+
+using drake::math::RigidTransformd;
+using drake::math::RollPitchYawd;
+using drake::systems::sensors::CameraInfo;
+using drake::systems::sensors::ImageDepth32F;
+using drake::systems::sensors::ImageRgba8U;
+using Eigen::Vector3d;
+
+namespace drake {
+namespace perception {
+namespace {
+
+constexpr float kInf = std::numeric_limits<float>::infinity();
+constexpr float kNaN = std::numeric_limits<float>::quiet_NaN();
+
+class PointCloudPipelineTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    for (int i = 0; i < 2; ++i) {
+      infos_.emplace_back(6, 4, 0.8);
+      ImageDepth32F& depth = depth_images_.emplace_back(6, 4);
+      ImageRgba8U& color = color_images_.emplace_back(6, 4);
+      for (int v = 0; v < 4; ++v) {
+        for (int u = 0; u < 6; ++u) {
+          depth.at(u, v)[0] = 1.0 + 0.1 * u + 0.2 * v + i;
+          color.at(u, v)[0] = 10 * u;
+          color.at(u, v)[1] = 10 * v;
+          color.at(u, v)[2] = i;
+        }
+      }
+      // Missing, too close, and too far pixels are discarded.
+      depth.at(0, 0)[0] = kNaN;
+      depth.at(1, 0)[0] = 0.0f;
+      depth.at(2, 0)[0] = kInf;
+      poses_.emplace_back(RollPitchYawd(0.1 * i, 0.2, 0.3), Vector3d(i, 0, 1));
+    }
+  }
+
+  std::vector<const ImageDepth32F*> depth_pointers() const {
+    return {&depth_images_[0], &depth_images_[1]};
+  }
+
+  std::vector<const ImageRgba8U*> color_pointers() const {
+    return {&color_images_[0], &color_images_[1]};
+  }
+
+  // Returns the finite points of camera i, per DepthImageToPointCloud.
+  PointCloud Reference(int i, pc_flags::BaseFieldT fields) const {
+    PointCloud converted(0, fields);
+    DepthImageToPointCloud::Convert(infos_[i], poses_[i], depth_images_[i],
+                                    (fields & pc_flags::kRGBs)
+                                        ? std::optional(color_images_[i])
+                                        : std::nullopt,
+                                    std::nullopt, &converted);
+    // Cropping to a (large) finite box discards the non-finite points.
+    return converted.Crop(Eigen::Vector3f::Constant(-1e6),
+                          Eigen::Vector3f::Constant(1e6));
+  }
+
+  std::vector<CameraInfo> infos_;
+  std::vector<ImageDepth32F> depth_images_;
+  std::vector<ImageRgba8U> color_images_;
+  std::vector<RigidTransformd> poses_;
+};
+
+// With no optional stages, the pipeline matches DepthImageToPointCloud
+// (without the non-finite points), concatenated across the cameras.
+TEST_F(PointCloudPipelineTest, MatchesConvert) {
+  const pc_flags::BaseFieldT fields = pc_flags::kXYZs | pc_flags::kRGBs;
+  PointCloudPipeline dut(infos_, {}, fields);
+  EXPECT_EQ(dut.num_cameras(), 2);
+  EXPECT_EQ(dut.fields(), fields);
+  const PointCloud expected =
+      Concatenate({Reference(0, fields), Reference(1, fields)});
+  EXPECT_EQ(expected.size(), 2 * (6 * 4 - 3));
+
+  for (const int num_threads : {1, 2}) {
+    PointCloud output;
+    dut.Process(depth_pointers(), color_pointers(), poses_, &output,
+                Parallelism(num_threads));
+    ASSERT_EQ(output.size(), expected.size());
+    EXPECT_TRUE(CompareMatrices(output.xyzs(), expected.xyzs(), 1e-6));
+    EXPECT_EQ(output.rgbs(), expected.rgbs());
+
+    // A repeated call reuses the output's storage.
+    const float* const storage = output.xyzs().data();
+    dut.Process(depth_pointers(), color_pointers(), poses_, &output,
+                Parallelism(num_threads));
+    EXPECT_EQ(output.xyzs().data(), storage);
+    EXPECT_TRUE(CompareMatrices(output.xyzs(), expected.xyzs(), 1e-6));
+  }
+}
+
+TEST_F(PointCloudPipelineTest, Stages) {
+  PointCloudPipelineParams params;
+  params.crop_lower_xyz = Vector3d(-10, -10, 2.0);
+  params.crop_upper_xyz = Vector3d(10, 10, 10);
+  params.voxel_size = 0.1;
+  params.normals_radius = 10.0;
+  params.normals_num_closest = 5;
+  PointCloudPipeline dut(infos_, params, pc_flags::kXYZs | pc_flags::kNormals);
+  PointCloud output;
+  dut.Process(depth_pointers(), {}, poses_, &output);
+  EXPECT_TRUE(output.has_normals());
+  EXPECT_FALSE(output.has_rgbs());
+  EXPECT_GT(output.size(), 0);
+  EXPECT_LT(output.size(), 2 * (6 * 4 - 3));
+  EXPECT_TRUE((output.xyzs().row(2).array() >= 2.0f).all());
+}
+
+TEST_F(PointCloudPipelineTest, System) {
+  const pc_flags::BaseFieldT fields = pc_flags::kXYZs | pc_flags::kRGBs;
+  const PointCloudPipelineSystem dut(infos_, {}, fields, Parallelism(2));
+  EXPECT_EQ(dut.num_cameras(), 2);
+  EXPECT_EQ(dut.num_input_ports(), 6);
+  EXPECT_EQ(dut.depth_image_input_port(1).get_name(), "depth_image_1");
+  EXPECT_EQ(dut.color_image_input_port(1).get_name(), "color_image_1");
+  EXPECT_EQ(dut.camera_pose_input_port(1).get_name(), "camera_pose_1");
+
+  auto context = dut.CreateDefaultContext();
+  for (int i = 0; i < 2; ++i) {
+    dut.depth_image_input_port(i).FixValue(context.get(), depth_images_[i]);
+    dut.color_image_input_port(i).FixValue(context.get(), color_images_[i]);
+  }
+  // Only the second camera's pose is connected.
+  dut.camera_pose_input_port(1).FixValue(context.get(), poses_[1]);
+  poses_[0] = RigidTransformd::Identity();
+  const PointCloud expected =
+      Concatenate({Reference(0, fields), Reference(1, fields)});
+  const auto& output = dut.point_cloud_output_port().Eval<PointCloud>(*context);
+  EXPECT_TRUE(CompareMatrices(output.xyzs(), expected.xyzs(), 1e-6));
+  EXPECT_EQ(output.rgbs(), expected.rgbs());
+
+  const PointCloudPipelineSystem no_color(infos_, {});
+  EXPECT_EQ(no_color.num_input_ports(), 4);
+  EXPECT_THROW(no_color.color_image_input_port(0), std::exception);
+}
+
+TEST_F(PointCloudPipelineTest, BadArguments) {
+  EXPECT_THROW(PointCloudPipeline({}, {}), std::exception);
+  EXPECT_THROW(PointCloudPipeline(infos_, {}, pc_flags::kRGBs), std::exception);
+  PointCloudPipelineParams params;
+  params.normals_radius = 0;
+  EXPECT_THROW(
+      PointCloudPipeline(infos_, params, pc_flags::kXYZs | pc_flags::kNormals),
+      std::exception);
+
+  PointCloudPipeline dut(infos_, {});
+  PointCloud output;
+  // Wrong number of images.
+  EXPECT_THROW(dut.Process({&depth_images_[0]}, {}, poses_, &output),
+               std::exception);
+  // Unexpected color images.
+  EXPECT_THROW(dut.Process(depth_pointers(), color_pointers(), poses_, &output),
+               std::exception);
+  // Wrong image size.
+  const ImageDepth32F small(2, 2);
+  EXPECT_THROW(dut.Process({&depth_images_[0], &small}, {}, poses_, &output),
+               std::exception);
+}
+
+}  // namespace
+}  // namespace perception
+}  // namespace drake
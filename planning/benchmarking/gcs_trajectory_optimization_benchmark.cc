@@ -0,0 +1,120 @@
+// @file
+// Benchmarks for repeated GcsTrajectoryOptimization queries.
+//
+// This compares the per-query latency of SolvePath() against
+// SolvePathWithCache() when a fixed set of regions is queried repeatedly for a
+// small set of pick-and-place (source, target) pairs.
+
+#include <memory>
+#include <vector>
+
+#include <benchmark/benchmark.h>
+#include <gflags/gflags.h>
+
+#include "drake/geometry/optimization/hpolyhedron.h"
+#include "drake/geometry/optimization/hyperrectangle.h"
+#include "drake/geometry/optimization/point.h"
+#include "drake/planning/trajectory_optimization/gcs_trajectory_optimization.h"
+#include "drake/tools/performance/fixture_common.h"
+
+namespace drake {
+namespace planning {
+namespace trajectory_optimization {
+namespace {
+
+using Eigen::Vector2d;
+using geometry::optimization::ConvexSets;
+using geometry::optimization::GraphOfConvexSetsOptions;
+using geometry::optimization::HPolyhedron;
+using geometry::optimization::Hyperrectangle;
+using geometry::optimization::MakeConvexSets;
+using geometry::optimization::Point;
+
+DEFINE_bool(test, false, "Enable unit test mode.");
+
+using Subgraph = GcsTrajectoryOptimization::Subgraph;
+
+// A fixed set of overlapping boxes tiling a square workspace stands in for a
+// precomputed IRIS region set. Pick and place locations sit on opposite sides.
+class FixedRegions : public benchmark::Fixture {
+ public:
+  FixedRegions() { tools::performance::AddMinMaxStatistics(this); }
+
+  void SetUp(benchmark::State&) override {
+    const int grid_size = FLAGS_test ? 2 : 4;
+    const int num_queries = FLAGS_test ? 1 : 4;
+
+    ConvexSets regions;
+    for (int i = 0; i < grid_size; ++i) {
+      for (int j = 0; j < grid_size; ++j) {
+        const Vector2d lb(i - 0.1, j - 0.1);
+        const Vector2d ub(i + 1.1, j + 1.1);
+        regions.emplace_back(Hyperrectangle(lb, ub).MakeHPolyhedron());
+      }
+    }
+
+    gcs_ = std::make_unique<GcsTrajectoryOptimization>(2);
+    Subgraph& workspace = gcs_->AddRegions(regions, 1, 1e-3);
+    for (int k = 0; k < num_queries; ++k) {
+      const double y = (k + 0.5) * grid_size / num_queries;
+      Subgraph& source =
+          gcs_->AddRegions(MakeConvexSets(Point(Vector2d(0.05, y))), 0, 0);
+      Subgraph& target = gcs_->AddRegions(
+          MakeConvexSets(Point(Vector2d(grid_size - 0.05, grid_size - y))), 0,
+          0);
+      gcs_->AddEdges(source, workspace);
+      gcs_->AddEdges(workspace, target);
+      sources_.push_back(&source);
+      targets_.push_back(&target);
+    }
+    gcs_->AddPathLengthCost();
+    gcs_->AddTimeCost();
+
+    options_.max_rounded_paths = 3;
+  }
+
+  void TearDown(benchmark::State&) override {
+    sources_.clear();
+    targets_.clear();
+    gcs_.reset();
+  }
+
+ protected:
+  // Cycles through the (source, target) pairs, one query per iteration.
+  template <typename SolveFunction>
+  void RunQueries(benchmark::State& state, SolveFunction solve) {
+    int k = 0;
+    for (auto _ : state) {
+      auto [trajectory, result] = solve(*sources_[k], *targets_[k]);
+      DRAKE_DEMAND(result.is_success());
+      benchmark::DoNotOptimize(trajectory);
+      k = (k + 1) % sources_.size();
+    }
+  }
+
+  std::unique_ptr<GcsTrajectoryOptimization> gcs_;
+  std::vector<Subgraph*> sources_;
+  std::vector<Subgraph*> targets_;
+  GraphOfConvexSetsOptions options_;
+};
+
+BENCHMARK_F(FixedRegions, SolvePath)
+// NOLINTNEXTLINE(runtime/references) cpplint disapproves of gbench choices.
+(benchmark::State& state) {
+  RunQueries(state, [this](const Subgraph& source, const Subgraph& target) {
+    return gcs_->SolvePath(source, target, options_);
+  });
+}
+
+BENCHMARK_F(FixedRegions, SolvePathWithCache)
+// NOLINTNEXTLINE(runtime/references) cpplint disapproves of gbench choices.
+(benchmark::State& state) {
+  RunQueries(state, [this](const Subgraph& source, const Subgraph& target) {
+    return gcs_->SolvePathWithCache(source, target, options_);
+  });
+}
+
+}  // namespace
+}  // namespace trajectory_optimization
+}  // namespace planning
+}  // namespace drake
@@ -19,6 +19,7 @@
 
 #include "drake/common/drake_assert.h"
 #include "drake/common/fmt_eigen.h"
+#include "drake/common/nice_type_name.h"
 #include "drake/common/text_logging.h"
 #include "drake/planning/linear_distance_and_interpolation_provider.h"
 
@@ -934,6 +935,85 @@ RobotClearance CollisionChecker::CalcContextRobotClearance(
   return result;
 }
 
+RobotClearanceBatch CollisionChecker::CalcConfigsRobotClearance(
+    const std::vector<Eigen::VectorXd>& configs,
+    const double influence_distance, const bool compute_jacobians,
+    const bool compute_witness_points, const Parallelism parallelize) const {
+  DRAKE_THROW_UNLESS(influence_distance >= 0.0);
+  DRAKE_THROW_UNLESS(std::isfinite(influence_distance));
+  // Validate every configuration up front, because an exception must not
+  // escape the parallel loop below.
+  for (const Eigen::VectorXd& q : configs) {
+    DRAKE_THROW_UNLESS(q.size() == plant().num_positions() && q.allFinite());
+  }
+
+  // RobotClearance has no default constructor; we seed every slot with an
+  // empty value of the correct width and overwrite it below.
+  std::vector<RobotClearance> clearances(
+      configs.size(), RobotClearance(plant().num_positions()));
+
+  const int number_of_threads = GetNumberOfThreads(parallelize);
+  drake::log()->debug("CalcConfigsRobotClearance uses {} thread(s)",
+                      number_of_threads);
+
+  const auto config_work = [&](const int thread_num, const int64_t index) {
+    clearances.at(index) =
+        CalcRobotClearance(configs.at(index), influence_distance, thread_num);
+  };
+
+  StaticParallelForIndexLoop(DegreeOfParallelism(number_of_threads), 0,
+                             configs.size(), config_work,
+                             ParallelForBackend::BEST_AVAILABLE);
+
+  // Stack the per-configuration tables into one.
+  RobotClearanceBatch result;
+  result.offsets.resize(configs.size() + 1);
+  result.offsets[0] = 0;
+  for (int k = 0; k < static_cast<int>(clearances.size()); ++k) {
+    const RobotClearance& clearance = clearances[k];
+    if (compute_witness_points && !clearance.has_witness_points()) {
+      throw std::logic_error(fmt::format(
+          "CalcConfigsRobotClearance(): this {} does not report witness points",
+          NiceTypeName::Get(*this)));
+    }
+    result.offsets[k + 1] = result.offsets[k] + clearance.size();
+  }
+  const int num_rows = result.offsets[configs.size()];
+  result.robot_indices.resize(num_rows);
+  result.other_indices.resize(num_rows);
+  result.collision_types.resize(num_rows);
+  result.distances.resize(num_rows);
+  if (compute_jacobians) {
+    result.jacobians.emplace(num_rows, plant().num_positions());
+  }
+  if (compute_witness_points) {
+    result.robot_witness_points.emplace(num_rows, 3);
+    result.other_witness_points.emplace(num_rows, 3);
+  }
+  for (int k = 0; k < static_cast<int>(clearances.size()); ++k) {
+    const RobotClearance& clearance = clearances[k];
+    const int start = result.offsets[k];
+    const int size = clearance.size();
+    for (int i = 0; i < size; ++i) {
+      result.robot_indices[start + i] = clearance.robot_indices()[i];
+      result.other_indices[start + i] = clearance.other_indices()[i];
+      result.collision_types[start + i] =
+          static_cast<int>(clearance.collision_types()[i]);
+    }
+    result.distances.segment(start, size) = clearance.distances();
+    if (compute_jacobians) {
+      result.jacobians->middleRows(start, size) = clearance.jacobians();
+    }
+    if (compute_witness_points) {
+      result.robot_witness_points->middleRows(start, size) =
+          clearance.robot_witness_points().transpose();
+      result.other_witness_points->middleRows(start, size) =
+          clearance.other_witness_points().transpose();
+    }
+  }
+  return result;
+}
+
 int CollisionChecker::MaxNumDistances(
     const std::optional<int> context_number) const {
   return MaxContextNumDistances(model_context(context_number));
@@ -1112,6 +1112,34 @@ class CollisionChecker {
       CollisionCheckerContext* model_context, const Eigen::VectorXd& q,
       double influence_distance) const;
 
+  /** Calculates the robot clearance (see CalcRobotClearance()) for each of a
+   vector of configurations, evaluating in parallel when supported and enabled
+   by `parallelize`. Each configuration is evaluated using the implicit context
+   associated with the thread that processes it, so the per-configuration
+   context updates are spread across the threads' contexts rather than
+   serialized through a single one.
+   See @ref collision_checker_parallel_edge "function-level parallelism" for
+   guidance on proper usage.
+   @param configs            Configurations to evaluate.
+   @param influence_distance As documented for CalcRobotClearance().
+   @param compute_jacobians  Whether to fill in RobotClearanceBatch::jacobians.
+   The Jacobians are by far the largest part of the result (one row of
+   `plant.num_positions()` values per distance), so they are opt-in.
+   @param compute_witness_points Whether to fill in the witness points of the
+   RobotClearanceBatch.
+   @param parallelize        How much should the queries be parallelized?
+   @returns the clearances of all of the `configs`, stacked into one table (in
+   the same order as `configs`).
+   @throws if any of `configs` has the wrong size or contains non-finite
+   values.
+   @throws if `influence_distance` is negative or non-finite.
+   @throws if `compute_witness_points` is true but this checker does not report
+   witness points (see RobotClearance::has_witness_points()). */
+  RobotClearanceBatch CalcConfigsRobotClearance(
+      const std::vector<Eigen::VectorXd>& configs, double influence_distance,
+      bool compute_jacobians = false, bool compute_witness_points = false,
+      Parallelism parallelize = Parallelism::Max()) const;
+
   // TODO(calderpg-tri) Improve MaxNumDistances to use the prototype context
   // instead, and deprecate context-specific forms.
   /** Returns an upper bound on the number of distances returned by
@@ -0,0 +1,159 @@
+#include "drake/planning/iris/iris_region_library.h"
+
+#include <algorithm>
+#include <atomic>
+#include <future>
+#include <memory>
+#include <optional>
+#include <string>
+#include <utility>
+
+#include <fmt/format.h>
+
+#include "drake/common/text_logging.h"
+
+namespace drake {
+namespace planning {
+
+using geometry::optimization::HPolyhedron;
+using geometry::optimization::Hyperellipsoid;
+
+namespace {
+
+// Returns true iff `a` and `b` are each contained in the other, up to `tol`.
+bool IsDuplicate(const HPolyhedron& a, const HPolyhedron& b, double tol) {
+  return a.ambient_dimension() == b.ambient_dimension() &&
+         a.ContainedIn(b, tol) && b.ContainedIn(a, tol);
+}
+
+// Estimates the fraction of collision-free samples in `domain` that lie in at
+// least one of the `library` regions.
+double EstimateCoverage(const CollisionChecker& checker,
+                        const HPolyhedron& domain,
+                        const IrisRegionLibraryOptions& options,
+                        const IrisRegionLibrary& library,
+                        RandomGenerator* generator) {
+  if (library.regions.empty()) {
+    return 0.0;
+  }
+  std::vector<Eigen::VectorXd> samples;
+  samples.reserve(options.num_points_per_coverage_check);
+  Eigen::VectorXd last_sample = domain.UniformSample(generator);
+  for (int i = 0; i < options.num_points_per_coverage_check; ++i) {
+    last_sample = domain.UniformSample(generator, last_sample);
+    samples.push_back(last_sample);
+  }
+  const std::vector<uint8_t> collision_free =
+      checker.CheckConfigsCollisionFree(samples, options.parallelism);
+
+  int num_free = 0;
+  int num_covered = 0;
+  for (int i = 0; i < ssize(samples); ++i) {
+    if (!collision_free[i]) {
+      continue;
+    }
+    ++num_free;
+    for (const auto& [name, region] : library.regions) {
+      if (region.PointInSet(samples[i], options.point_in_set_tol)) {
+        ++num_covered;
+        break;
+      }
+    }
+  }
+  if (num_free == 0) {
+    return 0.0;
+  }
+  return static_cast<double>(num_covered) / num_free;
+}
+
+}  // namespace
+
+int GrowIrisRegionLibrary(const CollisionChecker& checker,
+                          const std::vector<Hyperellipsoid>& seeds,
+                          const HPolyhedron& domain,
+                          const IrisRegionLibraryOptions& options,
+                          RandomGenerator* generator,
+                          IrisRegionLibrary* library) {
+  DRAKE_THROW_UNLESS(generator != nullptr);
+  DRAKE_THROW_UNLESS(library != nullptr);
+  DRAKE_THROW_UNLESS(options.duplicate_tol >= 0);
+  DRAKE_THROW_UNLESS(options.num_points_per_coverage_check > 0);
+
+  // Each job is serial, and runs outside of the main thread, so it must not
+  // write to meshcat.
+  IrisZoOptions job_options = options.iris_zo_options;
+  job_options.sampled_iris_options.parallelism = Parallelism::None();
+  job_options.sampled_iris_options.meshcat = nullptr;
+
+  const int num_seeds = ssize(seeds);
+  std::vector<std::optional<HPolyhedron>> grown(num_seeds);
+  std::atomic<int> next_seed{0};
+  // Every worker pulls seeds off of the shared queue until it is empty.
+  const auto work = [&](const CollisionChecker& worker_checker) {
+    for (int i = next_seed++; i < num_seeds; i = next_seed++) {
+      log()->debug("GrowIrisRegionLibrary is growing region {}/{}.", i + 1,
+                   num_seeds);
+      grown[i] = IrisZo(worker_checker, seeds[i], domain, job_options);
+    }
+  };
+
+  // As in IrisZo(), jobs can only run concurrently if the additional
+  // constraints and the parameterization are threadsafe.
+  const auto& prog =
+      job_options.sampled_iris_options.prog_with_additional_constraints;
+  const bool jobs_threadsafe =
+      (prog == nullptr || prog->IsThreadSafe()) &&
+      job_options.parameterization.get_parameterization_is_threadsafe();
+  const int num_workers =
+      jobs_threadsafe ? std::min(options.parallelism.num_threads(), num_seeds)
+                      : 1;
+  if (num_workers <= 1) {
+    std::unique_ptr<CollisionChecker> worker_checker = checker.Clone();
+    work(*worker_checker);
+  } else {
+    std::vector<std::unique_ptr<CollisionChecker>> worker_checkers;
+    std::vector<std::future<void>> futures;
+    for (int i = 0; i < num_workers; ++i) {
+      worker_checkers.push_back(checker.Clone());
+    }
+    for (int i = 0; i < num_workers; ++i) {
+      futures.push_back(
+          std::async(std::launch::async, work, std::cref(*worker_checkers[i])));
+    }
+    for (auto& future : futures) {
+      future.get();
+    }
+  }
+
+  // Add the non-duplicate regions in seed order.
+  int num_added = 0;
+  for (std::optional<HPolyhedron>& region : grown) {
+    DRAKE_DEMAND(region.has_value());
+    const bool is_duplicate = std::any_of(
+        library->regions.begin(), library->regions.end(),
+        [&](const auto& item) {
+          return IsDuplicate(*region, item.second, options.duplicate_tol);
+        });
+    if (is_duplicate) {
+      continue;
+    }
+    int index = ssize(library->regions);
+    while (library->regions.contains(fmt::format("region_{}", index))) {
+      ++index;
+    }
+    library->regions.emplace(fmt::format("region_{}", index),
+                             std::move(*region));
+    ++num_added;
+  }
+  log()->debug(
+      "GrowIrisRegionLibrary added {} of {} new regions; the library now has "
+      "{} regions.",
+      num_added, num_seeds, ssize(library->regions));
+
+  library->coverage =
+      EstimateCoverage(checker, domain, options, *library, generator);
+  return num_added;
+}
+
+}  // namespace planning
+}  // namespace drake
@@ -0,0 +1,119 @@
+#pragma once
+
+#include <vector>
+
+#include "drake/common/name_value.h"
+#include "drake/common/parallelism.h"
+#include "drake/common/random.h"
+#include "drake/geometry/optimization/hpolyhedron.h"
+#include "drake/geometry/optimization/hyperellipsoid.h"
+#include "drake/geometry/optimization/iris.h"
+#include "drake/planning/collision_checker.h"
+#include "drake/planning/iris/iris_zo.h"
+
+namespace drake {
+namespace planning {
+
+/** A persistent collection of named IRIS regions, together with an estimate of
+how much of the collision-free configuration space they cover. A library is
+typically grown incrementally with GrowIrisRegionLibrary() and stored between
+runs with yaml::SaveYamlFile() / yaml::LoadYamlFile().
+
+@experimental
+@ingroup planning_iris */
+struct IrisRegionLibrary {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(regions));
+    a->Visit(DRAKE_NVP(coverage));
+  }
+
+  /** The regions in the library, keyed by name. */
+  geometry::optimization::IrisRegions regions;
+
+  /** The estimated fraction of collision-free samples in the domain that are
+  contained in at least one of the `regions`, as of the last call to
+  GrowIrisRegionLibrary(). */
+  double coverage{0.0};
+};
+
+/** Options for GrowIrisRegionLibrary().
+
+@experimental
+@ingroup planning_iris */
+struct IrisRegionLibraryOptions {
+  /** Passes this object to an Archive.
+  Refer to @ref yaml_serialization "YAML Serialization" for background.
+  Note: This only serializes options that are YAML built-in types. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(iris_zo_options));
+    a->Visit(DRAKE_NVP(duplicate_tol));
+    a->Visit(DRAKE_NVP(num_points_per_coverage_check));
+    a->Visit(DRAKE_NVP(point_in_set_tol));
+  }
+
+  /** The options used to grow each region. Each region-growing job runs on
+  its own thread, so `iris_zo_options.sampled_iris_options.parallelism` is
+  ignored (each job is serial) and
+  `iris_zo_options.sampled_iris_options.meshcat` is not used. */
+  IrisZoOptions iris_zo_options{};
+
+  /** The number of region-growing jobs to run concurrently. Each job uses its
+  own Clone() of the collision checker. If the additional constraints or the
+  parameterization in `iris_zo_options` are not threadsafe, only one job runs
+  at a time. This is also the parallelism used for the coverage estimate. */
+  Parallelism parallelism{Parallelism::Max()};
+
+  /** A newly grown region is discarded as a duplicate if it and a region
+  already in the library are each contained in the other, up to this
+  tolerance (see HPolyhedron::ContainedIn()). */
+  double duplicate_tol{1e-6};
+
+  /** The number of samples drawn from the domain to estimate
+  IrisRegionLibrary::coverage. Only the samples that are collision free count
+  towards the estimate, so it is based on at most this many points (and is zero
+  if none of them are collision free). */
+  int num_points_per_coverage_check{1000};
+
+  /** The tolerance used for checking whether a sample is in a region when
+  estimating coverage. */
+  double point_in_set_tol{1e-6};
+};
+
+/** Grows one IRIS-ZO region around each of the given `seeds` and adds the
+results to `library`, skipping any region which duplicates one already in the
+library (see IrisRegionLibraryOptions::duplicate_tol). Existing regions in the
+library are retained, so a library can be extended across many calls (and
+across runs, by serializing it) instead of being recomputed from scratch.
+
+The seeds are processed from a shared queue by up to
+`options.parallelism.num_threads()` concurrent workers, each of which grows
+regions with IrisZo() using its own Clone() of `checker`. New regions are added
+to the library in the order of their seeds, and are named `region_{i}` where
+`i` is the number of regions in the library at the time it is added (skipping
+any names already in use). After the new regions are added,
+IrisRegionLibrary::coverage is re-estimated by sampling the collision-free part
+of `domain`.
+
+@param checker the collision checker for the robot's configuration space.
+@param seeds the starting ellipsoids for the regions to grow; see IrisZo().
+@param domain the domain in which regions are grown; see IrisZo().
+@param options algorithm parameters.
+@param generator the source of randomness for the coverage estimate.
+@param[in,out] library the library to add regions to.
+@returns the number of regions added to `library`.
+
+@experimental
+@ingroup planning_iris */
+int GrowIrisRegionLibrary(
+    const CollisionChecker& checker,
+    const std::vector<geometry::optimization::Hyperellipsoid>& seeds,
+    const geometry::optimization::HPolyhedron& domain,
+    const IrisRegionLibraryOptions& options, RandomGenerator* generator,
+    IrisRegionLibrary* library);
+
+}  // namespace planning
+}  // namespace drake
@@ -0,0 +1,81 @@
+#include "drake/planning/iris/iris_region_library.h"
+
+#include <string>
+#include <vector>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/common/yaml/yaml_io.h"
+#include "drake/planning/iris/test/iris_test_utilities.h"
+
+namespace drake {
+namespace planning {
+namespace {
+
+using geometry::optimization::HPolyhedron;
+using geometry::optimization::Hyperellipsoid;
+
+GTEST_TEST(IrisRegionLibraryOptionsTest, Serialize) {
+  IrisRegionLibraryOptions options;
+  options.duplicate_tol = 0.25;
+  options.num_points_per_coverage_check = 17;
+  const std::string serialized = yaml::SaveYamlString(options);
+  const auto deserialized =
+      yaml::LoadYamlString<IrisRegionLibraryOptions>(serialized);
+  EXPECT_EQ(deserialized.duplicate_tol, options.duplicate_tol);
+  EXPECT_EQ(deserialized.num_points_per_coverage_check,
+            options.num_points_per_coverage_check);
+  EXPECT_EQ(deserialized.point_in_set_tol, options.point_in_set_tol);
+  EXPECT_EQ(deserialized.iris_zo_options.bisection_steps,
+            options.iris_zo_options.bisection_steps);
+}
+
+// Every seed grows the same region (the joint limits), so all but the first
+// are discarded as duplicates.
+TEST_F(JointLimits1D, GrowIrisRegionLibrary) {
+  const std::vector<Hyperellipsoid> seeds(4, starting_ellipsoid_);
+  IrisRegionLibraryOptions options;
+  options.parallelism = Parallelism(2);
+  RandomGenerator generator(0);
+
+  IrisRegionLibrary library;
+  EXPECT_EQ(GrowIrisRegionLibrary(*checker_, seeds, domain_, options,
+                                  &generator, &library),
+            1);
+  ASSERT_EQ(library.regions.size(), 1);
+  ASSERT_TRUE(library.regions.contains("region_0"));
+  CheckRegion(library.regions.at("region_0"));
+  EXPECT_EQ(library.coverage, 1.0);
+
+  // Growing more regions from the same seeds adds nothing new.
+  EXPECT_EQ(GrowIrisRegionLibrary(*checker_, seeds, domain_, options,
+                                  &generator, &library),
+            0);
+  EXPECT_EQ(library.regions.size(), 1);
+
+  // The library round-trips through YAML.
+  const std::string serialized = yaml::SaveYamlString(library);
+  const auto deserialized = yaml::LoadYamlString<IrisRegionLibrary>(serialized);
+  ASSERT_EQ(deserialized.regions.size(), 1);
+  EXPECT_TRUE(CompareMatrices(deserialized.regions.at("region_0").A(),
+                              library.regions.at("region_0").A()));
+  EXPECT_TRUE(CompareMatrices(deserialized.regions.at("region_0").b(),
+                              library.regions.at("region_0").b()));
+  EXPECT_EQ(deserialized.coverage, library.coverage);
+}
+
+TEST_F(JointLimits1D, GrowIrisRegionLibraryEmpty) {
+  IrisRegionLibraryOptions options;
+  RandomGenerator generator(0);
+  IrisRegionLibrary library;
+  EXPECT_EQ(GrowIrisRegionLibrary(*checker_, {}, domain_, options, &generator,
+                                  &library),
+            0);
+  EXPECT_TRUE(library.regions.empty());
+  EXPECT_EQ(library.coverage, 0.0);
+}
+
+}  // namespace
+}  // namespace planning
+}  // namespace drake
@@ -17,11 +17,48 @@ void RobotClearance::Reserve(int size) {
   jacobians_.reserve(size * nq_);
 }
 
+Eigen::Map<const Eigen::Matrix3Xd> RobotClearance::robot_witness_points()
+    const {
+  DRAKE_THROW_UNLESS(has_witness_points());
+  return Eigen::Map<const Eigen::Matrix3Xd>(robot_witness_points_.data(), 3,
+                                            size());
+}
+
+Eigen::Map<const Eigen::Matrix3Xd> RobotClearance::other_witness_points()
+    const {
+  DRAKE_THROW_UNLESS(has_witness_points());
+  return Eigen::Map<const Eigen::Matrix3Xd>(other_witness_points_.data(), 3,
+                                            size());
+}
+
 void RobotClearance::Append(
     BodyIndex robot_index, BodyIndex other_index,
     RobotCollisionType collision_type, double distance,
     const Eigen::Ref<const Eigen::RowVectorXd>& jacobian) {
   DRAKE_THROW_UNLESS(jacobian.cols() == nq_);
+  // Once a row lacks witness points, the table as a whole does too.
+  robot_witness_points_.clear();
+  other_witness_points_.clear();
+  robot_indices_.push_back(robot_index);
+  other_indices_.push_back(other_index);
+  collision_types_.push_back(collision_type);
+  distances_.push_back(distance);
+  for (int j = 0; j < nq_; ++j) {
+    jacobians_.push_back(jacobian[j]);
+  }
+}
+
+void RobotClearance::Append(
+    BodyIndex robot_index, BodyIndex other_index,
+    RobotCollisionType collision_type, double distance,
+    const Eigen::Ref<const Eigen::RowVectorXd>& jacobian,
+    const Eigen::Vector3d& p_WCr, const Eigen::Vector3d& p_WCo) {
+  DRAKE_THROW_UNLESS(jacobian.cols() == nq_);
+  DRAKE_THROW_UNLESS(has_witness_points());
+  robot_witness_points_.insert(robot_witness_points_.end(), p_WCr.data(),
+                               p_WCr.data() + 3);
+  other_witness_points_.insert(other_witness_points_.end(), p_WCo.data(),
+                               p_WCo.data() + 3);
   robot_indices_.push_back(robot_index);
   other_indices_.push_back(other_index);
   collision_types_.push_back(collision_type);
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <optional>
 #include <vector>
 
 #include "drake/common/drake_copyable.h"
@@ -60,6 +61,9 @@ namespace planning {
       the structure of the robot and its representative collision geometry, it
       is still possible to evaluate the Jacobian at a configuration that
       represents a local optimum (zero-valued Jacobian).
+    - Some collision checkers also report the *witness points* of each row:
+      the closest points on body R and on body O, measured and expressed in
+      the world frame. See has_witness_points().
 
  @ingroup planning_collision_checker */
 class RobotClearance {
@@ -109,6 +113,23 @@ class RobotClearance {
     return Eigen::Map<const RowMatrixXd>(jacobians_.data(), size(), nq_);
   }
 
+  /** @returns true iff every row has witness points (i.e., every row was
+  added with the witness-point overload of Append()). This is trivially true
+  for an empty table. */
+  bool has_witness_points() const {
+    return static_cast<int>(robot_witness_points_.size()) == 3 * size();
+  }
+
+  /** @returns the witness points on the *robot* bodies, one column per row,
+  measured and expressed in the world frame.
+  @throws std::exception unless has_witness_points(). */
+  Eigen::Map<const Eigen::Matrix3Xd> robot_witness_points() const;
+
+  /** @returns the witness points on the *other* bodies, one column per row,
+  measured and expressed in the world frame.
+  @throws std::exception unless has_witness_points(). */
+  Eigen::Map<const Eigen::Matrix3Xd> other_witness_points() const;
+
   /** (Advanced) The mutable flavor of jacobians(). */
   auto mutable_jacobians() {
     using RowMatrixXd =
@@ -119,20 +140,85 @@ class RobotClearance {
   /** Ensures this object has storage for at least `size` rows. */
   void Reserve(int size);
 
-  /** Appends one measurement to this table. */
+  /** Appends one measurement to this table, without witness points (so
+  afterwards, has_witness_points() is false). */
   void Append(multibody::BodyIndex robot_index,
               multibody::BodyIndex other_index,
               RobotCollisionType collision_type, double distance,
               const Eigen::Ref<const Eigen::RowVectorXd>& jacobian);
 
+  /** Appends one measurement to this table, along with its witness points
+  `p_WCr` on the robot body and `p_WCo` on the other body (both measured and
+  expressed in the world frame).
+  @throws std::exception if any rows were previously appended without witness
+  points. */
+  void Append(multibody::BodyIndex robot_index,
+              multibody::BodyIndex other_index,
+              RobotCollisionType collision_type, double distance,
+              const Eigen::Ref<const Eigen::RowVectorXd>& jacobian,
+              const Eigen::Vector3d& p_WCr, const Eigen::Vector3d& p_WCo);
+
  private:
   std::vector<multibody::BodyIndex> robot_indices_;
   std::vector<multibody::BodyIndex> other_indices_;
   std::vector<RobotCollisionType> collision_types_;
   std::vector<double> distances_;
   std::vector<double> jacobians_;  // Stored in row-major order.
+  // The witness points (3 values per row), or empty when they were not given.
+  std::vector<double> robot_witness_points_;
+  std::vector<double> other_witness_points_;
   int nq_{};
 };
 
+/** The clearances of many robot configurations (as computed by
+ CollisionChecker::CalcConfigsRobotClearance()), stacked into one table.
+
+ Each column of the RobotClearance table is stored as one array that holds the
+ rows of all of the configurations, in order; the rows of configuration `k` are
+ the rows `offsets[k]` to `offsets[k + 1] - 1` (inclusive). This allows the
+ results of a large batch of configurations to be passed around (e.g., to
+ Python, where each array becomes one NumPy array) without creating an object
+ per configuration.
+
+ Body indices and collision types are stored as integers, with the same values
+ as multibody::BodyIndex and RobotCollisionType.
+
+ @ingroup planning_collision_checker */
+struct RobotClearanceBatch {
+  /** @returns the number of configurations. */
+  int num_configs() const { return offsets.size() - 1; }
+
+  /** @returns the total number of rows (over all configurations). */
+  int size() const { return distances.size(); }
+
+  /** The start of each configuration's rows, followed by size(); i.e., the
+  number of entries is num_configs() + 1. */
+  Eigen::VectorXi offsets{Eigen::VectorXi::Zero(1)};
+
+  /** The *robot* body index of each row. */
+  Eigen::VectorXi robot_indices;
+
+  /** The *other* body index of each row. */
+  Eigen::VectorXi other_indices;
+
+  /** The RobotCollisionType of each row. */
+  Eigen::VectorXi collision_types;
+
+  /** The distance (`ϕᴼ(R)`) of each row. */
+  Eigen::VectorXd distances;
+
+  /** The distance Jacobian (`Jqᵣ_ϕᴼ(R)`) of each row, with size() rows and
+  `plant.num_positions()` columns, when requested. */
+  std::optional<Eigen::MatrixXd> jacobians;
+
+  /** The witness points on the *robot* bodies, one row per row of the table,
+  measured and expressed in the world frame, when requested. */
+  std::optional<Eigen::MatrixX3d> robot_witness_points;
+
+  /** The witness points on the *other* bodies, one row per row of the table,
+  measured and expressed in the world frame, when requested. */
+  std::optional<Eigen::MatrixX3d> other_witness_points;
+};
+
 }  // namespace planning
 }  // namespace drake
@@ -283,7 +283,10 @@ RobotClearance SceneGraphCollisionChecker::DoCalcContextRobotClearance(
     }
     ddist_dq.noalias() = ddist_dp_BA.transpose() * dp_BA_dq;
 
-    result.Append(robot_index, other_index, collision_type, distance, ddist_dq);
+    const Vector3d& p_WCr = body_A_part_of_robot ? p_WCa : p_WCb;
+    const Vector3d& p_WCo = body_A_part_of_robot ? p_WCb : p_WCa;
+    result.Append(robot_index, other_index, collision_type, distance, ddist_dq,
+                  p_WCr, p_WCo);
   }
   return result;
 }
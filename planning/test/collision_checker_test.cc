@@ -558,6 +558,50 @@ GTEST_TEST(CollisionCheckerTest, RobotClearance) {
   const VectorXd nan =
       VectorXd::Constant(q.size(), std::numeric_limits<double>::quiet_NaN());
   EXPECT_THROW(checker->CalcRobotClearance(nan, 0), std::exception);
+
+  // The batched form stacks the clearances of all configurations, each
+  // matching the single-configuration result.
+  const RobotClearanceBatch batch =
+      checker->CalcConfigsRobotClearance({q, q, q}, 0);
+  ASSERT_EQ(batch.num_configs(), 3);
+  ASSERT_EQ(batch.size(), 3);
+  EXPECT_TRUE(CompareMatrices(batch.offsets, Eigen::Vector4i(0, 1, 2, 3)));
+  for (int k = 0; k < 3; ++k) {
+    EXPECT_EQ(batch.robot_indices[k], int{clearance.robot_indices()[0]});
+    EXPECT_EQ(batch.other_indices[k], int{clearance.other_indices()[0]});
+    EXPECT_EQ(batch.collision_types[k],
+              static_cast<int>(clearance.collision_types()[0]));
+    EXPECT_EQ(batch.distances[k], clearance.distances()[0]);
+  }
+  // The Jacobians are opt-in.
+  EXPECT_FALSE(batch.jacobians.has_value());
+  EXPECT_FALSE(batch.robot_witness_points.has_value());
+  const RobotClearanceBatch with_jacobians =
+      checker->CalcConfigsRobotClearance({q, q}, 0, true);
+  ASSERT_TRUE(with_jacobians.jacobians.has_value());
+  EXPECT_TRUE(CompareMatrices(with_jacobians.jacobians->row(1),
+                              clearance.jacobians().row(0)));
+  // This checker does not report witness points.
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      checker->CalcConfigsRobotClearance({q}, 0, false, true),
+      ".*does not report witness points.*");
+  const RobotClearanceBatch empty = checker->CalcConfigsRobotClearance({}, 0);
+  EXPECT_EQ(empty.num_configs(), 0);
+  EXPECT_EQ(empty.size(), 0);
+  EXPECT_THROW(checker->CalcConfigsRobotClearance({q}, -1), std::exception);
+  EXPECT_THROW(checker->CalcConfigsRobotClearance({q, nan}, 0), std::exception);
+  // Invalid configurations are reported (rather than terminating the program)
+  // when the configurations are evaluated in parallel, too.
+  ASSERT_TRUE(checker->SupportsParallelChecking());
+  std::vector<VectorXd> configs(16, q);
+  configs.back() = nan;
+  DRAKE_EXPECT_THROWS_MESSAGE(checker->CalcConfigsRobotClearance(
+                                  configs, 0, false, false, Parallelism::Max()),
+                              ".*allFinite.*");
+  configs.back() = VectorXd::Zero(q.size() + 1);
+  DRAKE_EXPECT_THROWS_MESSAGE(checker->CalcConfigsRobotClearance(
+                                  configs, 0, false, false, Parallelism::Max()),
+                              ".*num_positions.*");
 }
 
 // Testing framework for the collision checker such that the model contains
@@ -72,6 +72,33 @@ GTEST_TEST(RobotClearanceTest, AppendThrow) {
   EXPECT_NO_THROW(dut.Append(body, body, type, 0.0, dq));
 }
 
+GTEST_TEST(RobotClearanceTest, WitnessPoints) {
+  const int nq = 2;
+  RobotClearance dut(nq);
+  EXPECT_TRUE(dut.has_witness_points());
+  EXPECT_EQ(dut.robot_witness_points().cols(), 0);
+
+  const BodyIndex body{1};
+  const RobotCollisionType type{RobotCollisionType::kSelfCollision};
+  const Eigen::RowVector2d dq(1.0, 2.0);
+  const Eigen::Vector3d p_WCr(1.0, 2.0, 3.0);
+  const Eigen::Vector3d p_WCo(4.0, 5.0, 6.0);
+  dut.Append(body, body, type, 0.0, dq, p_WCr, p_WCo);
+  dut.Append(body, body, type, 1.0, dq, p_WCo, p_WCr);
+  ASSERT_TRUE(dut.has_witness_points());
+  ASSERT_EQ(dut.robot_witness_points().cols(), 2);
+  EXPECT_TRUE(CompareMatrices(dut.robot_witness_points().col(0), p_WCr));
+  EXPECT_TRUE(CompareMatrices(dut.robot_witness_points().col(1), p_WCo));
+  EXPECT_TRUE(CompareMatrices(dut.other_witness_points().col(1), p_WCr));
+
+  // A row without witness points means the table no longer has them.
+  dut.Append(body, body, type, 2.0, dq);
+  EXPECT_FALSE(dut.has_witness_points());
+  EXPECT_THROW(dut.robot_witness_points(), std::exception);
+  EXPECT_THROW(dut.Append(body, body, type, 3.0, dq, p_WCr, p_WCo),
+               std::exception);
+}
+
 }  // namespace
 }  // namespace planning
 }  // namespace drake
@@ -326,6 +326,23 @@ GTEST_TEST(SceneGraphCollisionCheckerTest, ClearanceThreeSpheres) {
   // Increasing q₁ will increase the Seattle-Dallas distance.
   expected_jacobians(2, 1) = 1.0;
   EXPECT_TRUE(CompareMatrices(clearance.jacobians(), expected_jacobians, tol));
+  // The witness points are the closest points on the robot and other spheres,
+  // in the world frame.
+  ASSERT_TRUE(clearance.has_witness_points());
+  Matrix3d expected_robot_witness_points;
+  expected_robot_witness_points.col(0) = Vector3d(3.5, 3.0, 0.0);
+  expected_robot_witness_points.col(1) = Vector3d(3.6, 2.7, 0.0);
+  expected_robot_witness_points.col(2) = Vector3d(-3.8, 2.85, 0.0);
+  Matrix3d expected_other_witness_points;
+  expected_other_witness_points.col(0) = Vector3d(-3.75, 3.0, 0.0);
+  expected_other_witness_points.col(1) = Vector3d(0.8, 0.6, 0.0);
+  expected_other_witness_points.col(2) = Vector3d(-0.8, 0.6, 0.0);
+  EXPECT_TRUE(CompareMatrices(clearance.robot_witness_points(),
+                              expected_robot_witness_points, tol));
+  EXPECT_TRUE(CompareMatrices(clearance.other_witness_points(),
+                              expected_other_witness_points, tol));
+  const Vector3d q_first = q;
+  const RobotClearance first_clearance = clearance;
 
   // Now reposture Seattle to be directly south of Boston (tectonic plates!).
   // The distances will change in the obvious ways; what we care about most is
@@ -361,6 +378,31 @@ GTEST_TEST(SceneGraphCollisionCheckerTest, ClearanceThreeSpheres) {
   // Increasing q₁ will decrease the Seattle-Dallas distance.
   expected_jacobians(2, 1) = -1.0;
   EXPECT_TRUE(CompareMatrices(clearance.jacobians(), expected_jacobians, tol));
+
+  // The batched form stacks both postures' tables.
+  const RobotClearanceBatch batch = dut.CalcConfigsRobotClearance(
+      {q_first, q}, influence, true /* compute_jacobians */,
+      true /* compute_witness_points */);
+  ASSERT_EQ(batch.num_configs(), 2);
+  EXPECT_TRUE(CompareMatrices(batch.offsets, Vector3<int>(0, 3, 6)));
+  EXPECT_EQ(batch.robot_indices[4], int{boston});
+  EXPECT_EQ(batch.other_indices[5], int{dallas});
+  EXPECT_EQ(batch.collision_types[3],
+            static_cast<int>(RobotCollisionType::kSelfCollision));
+  EXPECT_TRUE(CompareMatrices(batch.distances.head(3),
+                              first_clearance.distances(), tol));
+  EXPECT_TRUE(
+      CompareMatrices(batch.distances.tail(3), clearance.distances(), tol));
+  ASSERT_TRUE(batch.jacobians.has_value());
+  EXPECT_TRUE(
+      CompareMatrices(batch.jacobians->bottomRows(3), expected_jacobians, tol));
+  ASSERT_TRUE(batch.robot_witness_points.has_value());
+  ASSERT_TRUE(batch.other_witness_points.has_value());
+  EXPECT_TRUE(CompareMatrices(batch.robot_witness_points->topRows(3),
+                              expected_robot_witness_points.transpose(), tol));
+  EXPECT_TRUE(CompareMatrices(batch.other_witness_points->bottomRows(3),
+                              clearance.other_witness_points().transpose(),
+                              tol));
 }
 
 // Checks RobotClearance when the robot is an arm (only) but inboard of the
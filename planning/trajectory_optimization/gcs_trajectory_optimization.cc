@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include <limits>
+#include <set>
 #include <tuple>
 #include <unordered_map>
 #include <unordered_set>
@@ -1863,6 +1864,28 @@ void GcsTrajectoryOptimization::RemoveSubgraph(const Subgraph& subgraph) {
         "Subgraph {} is not registered with `this`", subgraph.name()));
   }
 
+  // Discard the cached paths that start in, end in, or run through the regions
+  // we are about to remove.
+  std::set<VertexId> removed_ids;
+  for (const Vertex* v : subgraph.vertices_) {
+    removed_ids.insert(v->id());
+  }
+  const auto uses_removed = [&removed_ids](const std::vector<VertexId>& ids) {
+    return std::any_of(ids.begin(), ids.end(), [&](const VertexId& id) {
+      return removed_ids.contains(id);
+    });
+  };
+  for (auto iter = path_cache_.begin(); iter != path_cache_.end();) {
+    std::vector<CachedPath>& paths = iter->second;
+    if (uses_removed(iter->first.first) || uses_removed(iter->first.second)) {
+      paths.clear();
+    }
+    std::erase_if(paths, [&](const CachedPath& path) {
+      return uses_removed(path.regions);
+    });
+    iter = paths.empty() ? path_cache_.erase(iter) : std::next(iter);
+  }
+
   // Remove the underlying edges between subgraphs from the gcs problem.
   for (const std::unique_ptr<EdgesBetweenSubgraphs>& subgraph_edge :
        subgraph_edges_) {
@@ -2057,9 +2080,173 @@ void GcsTrajectoryOptimization::AddContinuityConstraints(int continuity_order) {
 }
 
 std::pair<CompositeTrajectory<double>, solvers::MathematicalProgramResult>
-GcsTrajectoryOptimization::SolvePath(
+GcsTrajectoryOptimization::SolvePath(const Subgraph& source,
+                                     const Subgraph& target,
+                                     const GraphOfConvexSetsOptions& options) {
+  return DoSolvePath(source, target, options, nullptr);
+}
+
+namespace {
+
+// Returns true iff SolvePath() finds the same paths with `a` as with `b`, i.e.,
+// iff they only differ in their parallelism.
+bool SamePathOptions(const GraphOfConvexSetsOptions& a,
+                     const GraphOfConvexSetsOptions& b) {
+  return a.convex_relaxation == b.convex_relaxation &&
+         a.max_rounded_paths == b.max_rounded_paths &&
+         a.preprocessing == b.preprocessing &&
+         a.max_rounding_trials == b.max_rounding_trials &&
+         a.flow_tolerance == b.flow_tolerance &&
+         a.rounding_seed == b.rounding_seed && a.solver == b.solver &&
+         a.restriction_solver == b.restriction_solver &&
+         a.preprocessing_solver == b.preprocessing_solver &&
+         a.solver_options == b.solver_options &&
+         a.restriction_solver_options == b.restriction_solver_options &&
+         a.preprocessing_solver_options == b.preprocessing_solver_options;
+}
+
+// Returns the first edge from `u` to a vertex that satisfies `is_next`, or
+// nullptr if there is none.
+template <typename Predicate>
+const Edge* FindOutgoingEdge(const Vertex& u, const Predicate& is_next) {
+  for (const Edge* e : u.outgoing_edges()) {
+    if (is_next(e->v())) {
+      return e;
+    }
+  }
+  return nullptr;
+}
+
+// Returns true iff `result` has a value for the variables of every vertex
+// along `edges`, i.e., iff it can be used as their initial guess.
+bool CoversPath(const solvers::MathematicalProgramResult& result,
+                const std::vector<const Edge*>& edges) {
+  const auto& index = result.get_decision_variable_index();
+  if (!index.has_value()) {
+    return false;
+  }
+  for (const Edge* e : edges) {
+    for (const Vertex* v : {&e->u(), &e->v()}) {
+      for (int i = 0; i < v->x().size(); ++i) {
+        if (!index->contains(v->x()(i).get_id())) {
+          return false;
+        }
+      }
+    }
+  }
+  return true;
+}
+
+}  // namespace
+
+int GcsTrajectoryOptimization::num_cached_paths() const {
+  int result = 0;
+  for (const auto& [_, paths] : path_cache_) {
+    result += ssize(paths);
+  }
+  return result;
+}
+
+std::pair<CompositeTrajectory<double>, solvers::MathematicalProgramResult>
+GcsTrajectoryOptimization::SolvePathWithCache(
+    const Subgraph& source, const Subgraph& target,
+    const GraphOfConvexSetsOptions& options) {
+  const auto in_subgraph = [this](const Subgraph& subgraph) {
+    return [this, &subgraph](const Vertex& v) {
+      auto iter = vertex_to_subgraph_.find(&v);
+      return iter != vertex_to_subgraph_.end() && iter->second == &subgraph;
+    };
+  };
+
+  // Key the query by the regions that it starts and ends in.
+  std::set<VertexId> start_ids;
+  for (const Vertex* s : source.vertices_) {
+    for (const Edge* e : s->outgoing_edges()) {
+      if (!in_subgraph(source)(e->v())) {
+        start_ids.insert(e->v().id());
+      }
+    }
+  }
+  std::set<VertexId> goal_ids;
+  for (const Vertex* t : target.vertices_) {
+    for (const Edge* e : t->incoming_edges()) {
+      if (!in_subgraph(target)(e->u())) {
+        goal_ids.insert(e->u().id());
+      }
+    }
+  }
+  const PathCacheKey key{{start_ids.begin(), start_ids.end()},
+                         {goal_ids.begin(), goal_ids.end()}};
+
+  auto iter = path_cache_.find(key);
+  if (iter != path_cache_.end()) {
+    std::vector<CachedPath>& paths = iter->second;
+    auto cached = std::find_if(paths.begin(), paths.end(), [&](const auto& p) {
+      return SamePathOptions(p.options, options);
+    });
+    if (cached != paths.end()) {
+      // Connect the cached regions to this query's source and target.
+      std::vector<const Edge*> edges;
+      for (const Vertex* s : source.vertices_) {
+        const Edge* e = FindOutgoingEdge(*s, [&](const Vertex& v) {
+          return cached->regions.empty() ? in_subgraph(target)(v)
+                                         : v.id() == cached->regions.front();
+        });
+        if (e != nullptr) {
+          edges.push_back(e);
+          break;
+        }
+      }
+      for (size_t i = 0; i < cached->regions.size() && !edges.empty(); ++i) {
+        const Edge* e = FindOutgoingEdge(edges.back()->v(), [&](const auto& v) {
+          return i + 1 < cached->regions.size()
+                     ? v.id() == cached->regions[i + 1]
+                     : in_subgraph(target)(v);
+        });
+        if (e == nullptr) {
+          edges.clear();
+        } else {
+          edges.push_back(e);
+        }
+      }
+
+      if (!edges.empty()) {
+        const solvers::MathematicalProgramResult* initial_guess =
+            CoversPath(cached->result, edges) ? &cached->result : nullptr;
+        solvers::MathematicalProgramResult result =
+            gcs_.SolveConvexRestriction(edges, options, initial_guess);
+        if (result.is_success()) {
+          cached->result = result;
+          ++num_path_cache_hits_;
+          return {ReconstructTrajectoryFromSolutionPath(edges, result), result};
+        }
+      }
+      paths.erase(cached);
+      if (paths.empty()) {
+        path_cache_.erase(iter);
+      }
+    }
+  }
+
+  std::vector<const Edge*> path_edges;
+  auto [trajectory, result] = DoSolvePath(source, target, options, &path_edges);
+  if (result.is_success() && !path_edges.empty()) {
+    CachedPath cached;
+    cached.options = options;
+    cached.result = result;
+    for (size_t i = 0; i + 1 < path_edges.size(); ++i) {
+      cached.regions.push_back(path_edges[i]->v().id());
+    }
+    path_cache_[key].push_back(std::move(cached));
+  }
+  return {std::move(trajectory), std::move(result)};
+}
+
+std::pair<CompositeTrajectory<double>, solvers::MathematicalProgramResult>
+GcsTrajectoryOptimization::DoSolvePath(
     const Subgraph& source, const Subgraph& target,
-    const GraphOfConvexSetsOptions& specified_options) {
+    const GraphOfConvexSetsOptions& specified_options,
+    std::vector<const Edge*>* solution_path) {
   // Fill in default options. Note: if these options change, they must also be
   // updated in the method documentation.
   GraphOfConvexSetsOptions options = specified_options;
@@ -2129,6 +2316,9 @@ GcsTrajectoryOptimization::SolvePath(
     path_edges.erase(path_edges.end() - 1);
   }
 
+  if (solution_path != nullptr) {
+    *solution_path = path_edges;
+  }
   return {ReconstructTrajectoryFromSolutionPath(path_edges, result), result};
 }
 
@@ -1257,6 +1257,59 @@ class GcsTrajectoryOptimization final {
       const Subgraph& source, const Subgraph& target,
       const geometry::optimization::GraphOfConvexSetsOptions& options = {});
 
+  /** Formulates and solves the shortest path problem like SolvePath(), but
+  memoizes the rounded path between the regions that `source` and `target` are
+  connected to.
+
+  The cached paths are keyed by the regions that the query starts and ends in,
+  i.e., by the vertices (outside of `source` and `target`) that the vertices of
+  `source` have edges to, and that have edges to the vertices of `target`, as
+  well as by the `options` (but for their parallelism). In particular, the
+  source and target subgraphs themselves need not be the same from one query
+  to the next: a typical use adds a new source and target subgraph for each
+  query, connects them to a fixed set of regions, and removes them with
+  RemoveSubgraph() afterwards.
+
+  The first call for a given key solves the full convex relaxation and rounding
+  via SolvePath() and, on success, stores the regions along the resulting path
+  along with its result. Subsequent calls for the same key skip the relaxation
+  and rounding stages entirely: they only solve the convex restriction along
+  the cached regions (entering them from `source` and leaving them to `target`
+  through the first edges that connect them), using the previous result as the
+  initial guess when it covers all of the path's vertices. If the cached path
+  is no longer connected or that restriction fails (e.g., because costs or
+  constraints were added that make the cached path infeasible), this falls back
+  to SolvePath() and replaces the cache entry.
+
+  This is intended for repeated queries on a fixed set of regions where only
+  the data of the source and target changes (e.g., a family of pick-and-place
+  queries). Note that the cache is not invalidated when regions or edges are
+  added, so the cached path might no longer be the best one available; call
+  ClearPathCache() after modifying the graph to force a full solve. Removing a
+  subgraph with RemoveSubgraph() discards the cached paths that start in, end
+  in, or pass through its regions.
+
+  @param source specifies the source subgraph; see SolvePath().
+  @param target specifies the target subgraph; see SolvePath().
+  @param options include all settings for solving the shortest path problem;
+  see SolvePath() for the defaults that are applied. */
+  std::pair<trajectories::CompositeTrajectory<double>,
+            solvers::MathematicalProgramResult>
+  SolvePathWithCache(
+      const Subgraph& source, const Subgraph& target,
+      const geometry::optimization::GraphOfConvexSetsOptions& options = {});
+
+  /** Discards all rounded paths memoized by SolvePathWithCache(). */
+  void ClearPathCache() { path_cache_.clear(); }
+
+  /** Returns the number of rounded paths currently memoized by
+  SolvePathWithCache(). */
+  int num_cached_paths() const;
+
+  /** Returns the number of calls to SolvePathWithCache() that have been
+  answered by solving the convex restriction along a memoized path. */
+  int num_path_cache_hits() const { return num_path_cache_hits_; }
+
   /** Solves a trajectory optimization problem through specific vertices.
 
   This method allows for targeted optimization by considering only selected
@@ -1364,6 +1417,17 @@ class GcsTrajectoryOptimization final {
   const int num_positions_;
   const std::vector<int> continuous_revolute_joints_;
 
+  // Implements SolvePath(). When `solution_path` is non-null and the solve
+  // succeeds, it is set to the edges of the solution path (excluding any dummy
+  // source or target edges).
+  std::pair<trajectories::CompositeTrajectory<double>,
+            solvers::MathematicalProgramResult>
+  DoSolvePath(
+      const Subgraph& source, const Subgraph& target,
+      const geometry::optimization::GraphOfConvexSetsOptions& options,
+      std::vector<const geometry::optimization::GraphOfConvexSets::Edge*>*
+          solution_path);
+
   trajectories::CompositeTrajectory<double>
   ReconstructTrajectoryFromSolutionPath(
       std::vector<const geometry::optimization::GraphOfConvexSets::Edge*> edges,
@@ -1376,6 +1440,24 @@ class GcsTrajectoryOptimization final {
 
   geometry::optimization::GraphOfConvexSets gcs_;
 
+  // The rounded paths memoized by SolvePathWithCache(), keyed by the sorted ids
+  // of the regions that the query's source is connected to, and of those that
+  // are connected to its target. Each entry stores the ids of the regions along
+  // the path (i.e., without its first and last vertices, which are in the
+  // source and target subgraphs), the options that it was solved with, and the
+  // result of its last successful solve, which is used as the initial guess for
+  // the next one.
+  using PathCacheKey = std::pair<
+      std::vector<geometry::optimization::GraphOfConvexSets::VertexId>,
+      std::vector<geometry::optimization::GraphOfConvexSets::VertexId>>;
+  struct CachedPath {
+    std::vector<geometry::optimization::GraphOfConvexSets::VertexId> regions;
+    geometry::optimization::GraphOfConvexSetsOptions options;
+    solvers::MathematicalProgramResult result;
+  };
+  std::map<PathCacheKey, std::vector<CachedPath>> path_cache_;
+  int num_path_cache_hits_{0};
+
   // Store the subgraphs by reference.
   std::vector<std::unique_ptr<Subgraph>> subgraphs_;
   std::vector<std::unique_ptr<EdgesBetweenSubgraphs>> subgraph_edges_;
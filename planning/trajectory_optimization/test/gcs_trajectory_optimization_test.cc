@@ -1450,6 +1450,124 @@ TEST_F(SimpleEnv2D, BasicShortestPath) {
   EXPECT_TRUE(CompareMatrices(traj.value(traj.end_time()), goal, kTolerance));
 }
 
+TEST_F(SimpleEnv2D, SolvePathWithCache) {
+  const int kDimension = 2;
+  const double kMinimumDuration = 1.0;
+  GcsTrajectoryOptimization gcs(kDimension);
+
+  Vector2d start(0.2, 0.2), goal(4.8, 4.8);
+  auto& regions = gcs.AddRegions(regions_, 1, kMinimumDuration);
+  auto& source = gcs.AddRegions(MakeConvexSets(Point(start)), 0, 0);
+  auto& target = gcs.AddRegions(MakeConvexSets(Point(goal)), 0, 0);
+
+  gcs.AddEdges(source, regions);
+  gcs.AddEdges(regions, target);
+
+  gcs.AddPathLengthCost();
+
+  GraphOfConvexSetsOptions options;
+  options.max_rounded_paths = 3;
+
+  EXPECT_EQ(gcs.num_cached_paths(), 0);
+  auto [expected_traj, expected_result] =
+      gcs.SolvePath(source, target, options);
+  ASSERT_TRUE(expected_result.is_success());
+  // SolvePath() does not populate the cache.
+  EXPECT_EQ(gcs.num_cached_paths(), 0);
+
+  // The first call solves the full problem and memoizes its path.
+  auto [traj, result] = gcs.SolvePathWithCache(source, target, options);
+  ASSERT_TRUE(result.is_success());
+  EXPECT_EQ(gcs.num_cached_paths(), 1);
+  EXPECT_NEAR(result.get_optimal_cost(), expected_result.get_optimal_cost(),
+              kTolerance);
+
+  // The second call only solves the convex restriction along the cached path,
+  // and arrives at the same answer.
+  auto [cached_traj, cached_result] =
+      gcs.SolvePathWithCache(source, target, options);
+  ASSERT_TRUE(cached_result.is_success());
+  EXPECT_EQ(gcs.num_cached_paths(), 1);
+  EXPECT_NEAR(cached_result.get_optimal_cost(), result.get_optimal_cost(),
+              kTolerance);
+  EXPECT_EQ(cached_traj.get_number_of_segments(),
+            traj.get_number_of_segments());
+  EXPECT_TRUE(CompareMatrices(cached_traj.value(cached_traj.start_time()),
+                              start, kTolerance));
+  EXPECT_TRUE(CompareMatrices(cached_traj.value(cached_traj.end_time()), goal,
+                              kTolerance));
+
+  gcs.ClearPathCache();
+  EXPECT_EQ(gcs.num_cached_paths(), 0);
+
+  EXPECT_EQ(gcs.num_path_cache_hits(), 1);
+
+  // Different options are cached separately.
+  GraphOfConvexSetsOptions other_options = options;
+  other_options.max_rounded_paths = 2;
+  gcs.SolvePathWithCache(source, target, options);
+  gcs.SolvePathWithCache(source, target, other_options);
+  EXPECT_EQ(gcs.num_cached_paths(), 2);
+  EXPECT_EQ(gcs.num_path_cache_hits(), 1);
+  gcs.SolvePathWithCache(source, target, other_options);
+  EXPECT_EQ(gcs.num_path_cache_hits(), 2);
+
+  // Removing a subgraph that no cached path uses keeps the cache.
+  auto& other = gcs.AddRegions(MakeConvexSets(Point(goal)), 0, 0);
+  gcs.RemoveSubgraph(other);
+  EXPECT_EQ(gcs.num_cached_paths(), 2);
+
+  // Removing the regions the paths run through clears the cache.
+  gcs.RemoveSubgraph(regions);
+  EXPECT_EQ(gcs.num_cached_paths(), 0);
+}
+
+// Mimics a pick-and-place workflow, where the source and target of each query
+// are added to a fixed set of regions, and removed after the query.
+TEST_F(SimpleEnv2D, SolvePathWithCacheRecreatedSubgraphs) {
+  const int kDimension = 2;
+  const double kMinimumDuration = 1.0;
+  GcsTrajectoryOptimization gcs(kDimension);
+  auto& regions = gcs.AddRegions(regions_, 1, kMinimumDuration);
+  gcs.AddPathLengthCost();
+
+  GraphOfConvexSetsOptions options;
+  options.max_rounded_paths = 3;
+
+  // Both starts are in the same region, as are both goals.
+  const std::vector<std::pair<Vector2d, Vector2d>> queries{
+      {Vector2d(0.2, 0.2), Vector2d(4.8, 4.8)},
+      {Vector2d(0.3, 0.1), Vector2d(4.8, 4.8)}};
+  std::vector<double> costs;
+  for (const auto& [start, goal] : queries) {
+    auto& source = gcs.AddRegions(MakeConvexSets(Point(start)), 0, 0);
+    auto& target = gcs.AddRegions(MakeConvexSets(Point(goal)), 0, 0);
+    gcs.AddEdges(source, regions);
+    gcs.AddEdges(regions, target);
+
+    auto [traj, result] = gcs.SolvePathWithCache(source, target, options);
+    ASSERT_TRUE(result.is_success());
+    EXPECT_TRUE(
+        CompareMatrices(traj.value(traj.start_time()), start, kTolerance));
+    EXPECT_TRUE(CompareMatrices(traj.value(traj.end_time()), goal, kTolerance));
+    costs.push_back(result.get_optimal_cost());
+
+    // The full solve finds the same path.
+    auto [expected_traj, expected_result] =
+        gcs.SolvePath(source, target, options);
+    ASSERT_TRUE(expected_result.is_success());
+    EXPECT_NEAR(result.get_optimal_cost(), expected_result.get_optimal_cost(),
+                kTolerance);
+
+    gcs.RemoveSubgraph(source);
+    gcs.RemoveSubgraph(target);
+    // The cached path only runs through the fixed regions, so it survives.
+    EXPECT_EQ(gcs.num_cached_paths(), 1);
+  }
+  // The second query was answered from the cache.
+  EXPECT_EQ(gcs.num_path_cache_hits(), 1);
+}
+
 TEST_F(SimpleEnv2D, GlobalPathContinuityConstraints) {
   const int kDimension = 2;
   const double kSpeed = 1.0;
@@ -0,0 +1,70 @@
+#include <limits>
+#include <memory>
+#include <vector>
+
+#include "drake/solvers/mathematical_program.h"
+#include "drake/solvers/solve.h"
+#include "drake/solvers/solver_setup_cache.h"
+#include "drake/tools/performance/fixture_common.h"
+
+namespace drake {
+namespace solvers {
+namespace {
+
+constexpr double kInf = std::numeric_limits<double>::infinity();
+
+// The number of programs solved per benchmark iteration.
+constexpr int kNumPrograms = 100;
+
+// Returns many small QPs with the same structure and different data, like
+// those of scoring many grasps: min |x - x_desired|² s.t. |x| ≤ 1 elementwise
+// and one linear inequality.
+std::vector<std::unique_ptr<MathematicalProgram>> MakePrograms(int nx) {
+  std::vector<std::unique_ptr<MathematicalProgram>> result;
+  for (int i = 0; i < kNumPrograms; ++i) {
+    auto prog = std::make_unique<MathematicalProgram>();
+    auto x = prog->NewContinuousVariables(nx);
+    prog->AddQuadraticErrorCost(Eigen::MatrixXd::Identity(nx, nx),
+                                Eigen::VectorXd::Random(nx), x);
+    prog->AddBoundingBoxConstraint(-1, 1, x);
+    prog->AddLinearConstraint(Eigen::RowVectorXd::Ones(nx), -kInf, 0.5, x);
+    result.push_back(std::move(prog));
+  }
+  return result;
+}
+
+// Solves each program with solvers::Solve(), which chooses and sets up a
+// solver every time.
+static void BenchmarkSolve(benchmark::State& state) {  // NOLINT
+  const auto progs = MakePrograms(state.range(0));
+  for (auto _ : state) {
+    for (const auto& prog : progs) {
+      const MathematicalProgramResult result = Solve(*prog);
+      DRAKE_DEMAND(result.is_success());
+    }
+  }
+}
+
+// Solves each program with a SolverSetupCache, optionally reusing the solver's
+// setup across programs.
+static void BenchmarkSolverSetupCache(benchmark::State& state) {  // NOLINT
+  const auto progs = MakePrograms(state.range(0));
+  SolverSetupCache cache(/* reuse_solver_setup = */ state.range(1) != 0);
+  MathematicalProgramResult result;
+  for (auto _ : state) {
+    for (const auto& prog : progs) {
+      cache.Solve(*prog, std::nullopt, std::nullopt, &result);
+      DRAKE_DEMAND(result.is_success());
+    }
+  }
+  state.counters["hit_rate"] = cache.hit_rate();
+}
+
+BENCHMARK(BenchmarkSolve)->Unit(benchmark::kMicrosecond)->Arg(3)->Arg(10);
+BENCHMARK(BenchmarkSolverSetupCache)
+    ->Unit(benchmark::kMicrosecond)
+    ->ArgsProduct({{3, 10}, {0, 1}});
+
+}  // namespace
+}  // namespace solvers
+}  // namespace drake
@@ -1,8 +1,10 @@
 #include "drake/solvers/mathematical_program.h"
 
 #include <algorithm>
+#include <cmath>
 #include <cstddef>
 #include <limits>
+#include <map>
 #include <memory>
 #include <set>
 #include <sstream>
@@ -569,6 +571,189 @@ Binding<QuadraticCost> MathematicalProgram::AddQuadraticCost(
   return AddQuadraticCost(Q, b, 0., vars, is_convex);
 }
 
+vector<Binding<QuadraticCost>> MathematicalProgram::AddSparseQuadraticCost(
+    const Eigen::SparseMatrix<double>& Q,
+    const Eigen::Ref<const Eigen::VectorXd>& b, double c,
+    const Eigen::Ref<const VectorXDecisionVariable>& vars,
+    std::optional<bool> is_convex) {
+  const int num_vars = vars.rows();
+  DRAKE_THROW_UNLESS(Q.rows() == num_vars && Q.cols() == num_vars);
+  DRAKE_THROW_UNLESS(b.rows() == num_vars);
+
+  // Find the groups of variables that are coupled through the nonzeros of Q,
+  // using a union-find over the variables' indices.
+  vector<int> parent(num_vars);
+  for (int i = 0; i < num_vars; ++i) {
+    parent[i] = i;
+  }
+  auto find_root = [&parent](int i) {
+    while (parent[i] != i) {
+      parent[i] = parent[parent[i]];
+      i = parent[i];
+    }
+    return i;
+  };
+  vector<bool> in_hessian(num_vars, false);
+  for (int k = 0; k < Q.outerSize(); ++k) {
+    for (Eigen::SparseMatrix<double>::InnerIterator it(Q, k); it; ++it) {
+      if (it.value() == 0) {
+        continue;
+      }
+      in_hessian[it.row()] = true;
+      in_hessian[it.col()] = true;
+      const int root_row = find_root(it.row());
+      const int root_col = find_root(it.col());
+      // Keep the smallest index as the root, so that the groups are ordered
+      // by their first variable.
+      parent[std::max(root_row, root_col)] = std::min(root_row, root_col);
+    }
+  }
+
+  // Number the groups, and find each variable's position within its group.
+  // The variables without any Hessian terms all go in one last group.
+  vector<int> group(num_vars, -1);
+  vector<int> position(num_vars, -1);
+  vector<vector<int>> group_indices;
+  vector<int> linear_indices;
+  for (int i = 0; i < num_vars; ++i) {
+    if (in_hessian[i]) {
+      const int root = find_root(i);
+      if (root == i) {
+        group[i] = group_indices.size();
+        group_indices.emplace_back();
+      } else {
+        group[i] = group[root];
+      }
+      position[i] = group_indices[group[i]].size();
+      group_indices[group[i]].push_back(i);
+    } else if (b[i] != 0) {
+      linear_indices.push_back(i);
+    }
+  }
+
+  // A group's Hessian is stored densely, so the groups larger than this are
+  // split into one cost per off-diagonal term instead (see below).
+  constexpr int kMaxDenseGroupSize = 100;
+  auto is_large = [&group_indices](int g) {
+    return ssize(group_indices[g]) > kMaxDenseGroupSize;
+  };
+
+  // Accumulate the dense Hessians of the small groups, and the diagonal and
+  // (symmetrized) off-diagonal terms of the large groups.
+  vector<Eigen::MatrixXd> group_Q(group_indices.size());
+  for (int g = 0; g < ssize(group_indices); ++g) {
+    if (!is_large(g)) {
+      const int size = group_indices[g].size();
+      group_Q[g] = Eigen::MatrixXd::Zero(size, size);
+    }
+  }
+  Eigen::VectorXd diagonal = Eigen::VectorXd::Zero(num_vars);
+  vector<std::map<std::pair<int, int>, double>> group_terms(
+      group_indices.size());
+  for (int k = 0; k < Q.outerSize(); ++k) {
+    for (Eigen::SparseMatrix<double>::InnerIterator it(Q, k); it; ++it) {
+      if (it.value() == 0) {
+        continue;
+      }
+      const int g = group[it.row()];
+      if (!is_large(g)) {
+        group_Q[g](position[it.row()], position[it.col()]) += it.value();
+      } else if (it.row() == it.col()) {
+        diagonal[it.row()] += it.value();
+      } else {
+        const auto [i, j] = std::minmax<int>(it.row(), it.col());
+        group_terms[g][{i, j}] += 0.5 * it.value();
+      }
+    }
+  }
+
+  // In the large groups, what remains of each diagonal entry after taking out
+  // the off-diagonal terms of its row.
+  Eigen::VectorXd remainder = diagonal;
+  for (const auto& terms : group_terms) {
+    for (const auto& [ij, q] : terms) {
+      remainder[ij.first] -= std::abs(q);
+      remainder[ij.second] -= std::abs(q);
+    }
+  }
+
+  // Whether a variable of a large group was already added to a term's cost.
+  vector<bool> added_to_term(num_vars, false);
+
+  vector<Binding<QuadraticCost>> result;
+  result.reserve(group_indices.size() + 1);
+  auto add_cost = [&](const vector<int>& indices, const Eigen::MatrixXd& Q_G,
+                      const Eigen::VectorXd& b_G,
+                      std::optional<bool> cost_is_convex) {
+    VectorXDecisionVariable cost_vars(indices.size());
+    for (int j = 0; j < ssize(indices); ++j) {
+      cost_vars[j] = vars[indices[j]];
+    }
+    const double cost_c = result.empty() ? c : 0.0;
+    result.push_back(
+        AddQuadraticCost(Q_G, b_G, cost_c, cost_vars, cost_is_convex));
+  };
+  auto gather_b = [&b](const vector<int>& indices) {
+    Eigen::VectorXd b_G(indices.size());
+    for (int j = 0; j < ssize(indices); ++j) {
+      b_G[j] = b[indices[j]];
+    }
+    return b_G;
+  };
+  for (int g = 0; g < ssize(group_indices); ++g) {
+    const vector<int>& indices = group_indices[g];
+    if (!is_large(g)) {
+      add_cost(indices, group_Q[g], gather_b(indices), is_convex);
+      continue;
+    }
+    // Split the large group into one 2x2 cost per off-diagonal term q, with
+    // the Hessian [|q| q; q |q|] (which is positive semidefinite). This is only
+    // possible when the group's Hessian is diagonally dominant, so that what
+    // remains of each diagonal entry (which, along with the variable's linear
+    // term, we add to the first cost that has the variable) is nonnegative and
+    // every cost is convex. An exactly dominant row can leave a remainder that
+    // is slightly negative due to rounding, so we allow for that (and then
+    // clamp the remainder to zero).
+    constexpr double kTolerance = 1e-12;
+    for (int i : indices) {
+      if (!(remainder[i] >= -kTolerance * std::abs(diagonal[i]))) {
+        throw std::logic_error(fmt::format(
+            "AddSparseQuadraticCost(): The nonzeros of Q couple {} variables, "
+            "which is more than the {} that can use a dense Hessian, but Q is "
+            "not diagonally dominant over them (row {}) so its terms cannot be "
+            "split into convex costs either. Use AddQuadraticCost() with a "
+            "dense Q instead.",
+            indices.size(), kMaxDenseGroupSize, i));
+      }
+    }
+    for (const auto& [ij, q] : group_terms[g]) {
+      const vector<int> term_indices{ij.first, ij.second};
+      Eigen::Matrix2d Q_term{{std::abs(q), q}, {q, std::abs(q)}};
+      Eigen::Vector2d b_term = Eigen::Vector2d::Zero();
+      for (int k = 0; k < 2; ++k) {
+        const int i = term_indices[k];
+        if (!added_to_term[i]) {
+          Q_term(k, k) += std::max(remainder[i], 0.0);
+          b_term[k] = b[i];
+          added_to_term[i] = true;
+        }
+      }
+      add_cost(term_indices, Q_term, b_term, true);
+    }
+  }
+  if (!linear_indices.empty() || (result.empty() && c != 0)) {
+    if (linear_indices.empty()) {
+      // Keep the constant by binding it to some variable.
+      DRAKE_THROW_UNLESS(num_vars > 0);
+      linear_indices.push_back(0);
+    }
+    const int size = linear_indices.size();
+    add_cost(linear_indices, Eigen::MatrixXd::Zero(size, size),
+             gather_b(linear_indices), true);
+  }
+  return result;
+}
+
 Binding<L2NormCost> MathematicalProgram::AddCost(
     const Binding<L2NormCost>& binding) {
   DRAKE_DEMAND(CheckBinding(binding));
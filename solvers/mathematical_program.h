@@ -1113,6 +1113,45 @@ class MathematicalProgram {
       const Eigen::Ref<const VectorXDecisionVariable>& vars,
       std::optional<bool> is_convex = std::nullopt);
 
+  /**
+   * Adds the cost 0.5*x'*Q*x + b'x + c for a sparse Hessian `Q`, without
+   * forming `Q` as a dense matrix (e.g., for the block-diagonal Hessians of
+   * trajectory optimization problems with many thousands of variables).
+   *
+   * The cost is split into one QuadraticCost for each group of variables that
+   * are coupled through the nonzeros of `Q`, each with a dense Hessian over
+   * only those variables. The variables that appear only in `b` are
+   * gathered into one more QuadraticCost whose Hessian is zero. The constant
+   * `c` is added to the first of the returned costs. The sum of the returned
+   * costs equals the requested cost.
+   *
+   * This is efficient when each group of coupled variables is small; a
+   * group's Hessian is stored densely. A group of more than 100 variables
+   * (e.g., from a banded `Q`, which couples all of its variables into one
+   * group) is instead split into one convex cost per off-diagonal term, over
+   * only the two variables of that term. This requires `Q` to be diagonally
+   * dominant over the group (so that each diagonal entry covers the
+   * off-diagonal terms of its row, as in the usual smoothing and
+   * regularization costs); otherwise, an exception is thrown.
+   *
+   * @param is_convex Whether the cost is already known to be convex. If
+   * is_convex=nullopt (the default), then Drake will determine whether each
+   * of the added costs is convex (by checking whether its Hessian is positive
+   * semidefinite or not).
+   * @returns the bindings of the added costs, ordered by the first variable
+   * (in `vars`) of their group. When `Q`, `b`, and `c` are all zero, returns an
+   * empty vector.
+   * @throws std::exception if `Q` is not `vars.size()` square or `b` is not of
+   * size `vars.size()`, or if `c` is nonzero while `vars` is empty.
+   * @throws std::exception if a group of more than 100 variables is not
+   * diagonally dominant.
+   */
+  std::vector<Binding<QuadraticCost>> AddSparseQuadraticCost(
+      const Eigen::SparseMatrix<double>& Q,
+      const Eigen::Ref<const Eigen::VectorXd>& b, double c,
+      const Eigen::Ref<const VectorXDecisionVariable>& vars,
+      std::optional<bool> is_convex = std::nullopt);
+
   /**
    * Adds a cost term of the form w*|x-x_desired|^2.
    */
@@ -1,5 +1,7 @@
 #include "drake/solvers/osqp_solver.h"
 
+#include <algorithm>
+#include <cstring>
 #include <optional>
 #include <unordered_map>
 #include <vector>
@@ -266,8 +268,62 @@ void SetDualSolution(
                                    constraint.evaluator()->num_constraints()));
   }
 }
+
+// Returns true iff `mat` has the given (compressed) sparsity pattern.
+bool HasSparsity(const Eigen::SparseMatrix<OSQPFloat>& mat,
+                 const std::vector<OSQPInt>& outer_indices,
+                 const std::vector<OSQPInt>& inner_indices) {
+  if (static_cast<int>(outer_indices.size()) != mat.cols() + 1 ||
+      static_cast<int>(inner_indices.size()) != mat.nonZeros()) {
+    return false;
+  }
+  return std::equal(outer_indices.begin(), outer_indices.end(),
+                    mat.outerIndexPtr()) &&
+         std::equal(inner_indices.begin(), inner_indices.end(),
+                    mat.innerIndexPtr());
+}
+
+void CopySparsity(const Eigen::SparseMatrix<OSQPFloat>& mat,
+                  std::vector<OSQPInt>* outer_indices,
+                  std::vector<OSQPInt>* inner_indices) {
+  outer_indices->assign(mat.outerIndexPtr(),
+                        mat.outerIndexPtr() + mat.cols() + 1);
+  inner_indices->assign(mat.innerIndexPtr(),
+                        mat.innerIndexPtr() + mat.nonZeros());
+}
 }  // namespace
 
+struct OsqpSolver::Workspace {
+  Workspace() = default;
+  Workspace(const Workspace&) = delete;
+  Workspace& operator=(const Workspace&) = delete;
+  ~Workspace() {
+    if (solver != nullptr) {
+      osqp_cleanup(solver);
+    }
+  }
+
+  // Returns true iff the kept workspace was set up for a problem with the
+  // given structure and settings.
+  bool Matches(const Eigen::SparseMatrix<OSQPFloat>& P,
+               const Eigen::SparseMatrix<OSQPFloat>& A,
+               const OSQPSettings& new_settings) const {
+    return solver != nullptr && A.rows() == num_rows &&
+           HasSparsity(P, P_outer, P_inner) &&
+           HasSparsity(A, A_outer, A_inner) &&
+           std::memcmp(&settings, &new_settings, sizeof(settings)) == 0;
+  }
+
+  OSQPSolver* solver{nullptr};
+  // The structure and settings that `solver` was set up with.
+  OSQPInt num_rows{};
+  std::vector<OSQPInt> P_outer;
+  std::vector<OSQPInt> P_inner;
+  std::vector<OSQPInt> A_outer;
+  std::vector<OSQPInt> A_inner;
+  OSQPSettings settings{};
+};
+
 bool OsqpSolver::is_available() {
   return true;
 }
@@ -312,41 +368,84 @@ void OsqpSolver::DoSolve2(const MathematicalProgram& prog,
     OSQPCscMatrix_free(const_cast<OSQPCscMatrix*>(A));
   });
 
-  // Create the settings, initialized to the upstream defaults.
-  OSQPSettings* settings = OSQPSettings_new();
-  ScopeExit settings_guard([settings]() {
-    OSQPSettings_free(settings);
-  });
-  osqp_set_default_settings(settings);
+  // Create the settings, initialized to the upstream defaults. N.B. We zero
+  // the padding bytes too, so that the settings can be compared bytewise when
+  // reusing the setup.
+  OSQPSettings settings;
+  std::memset(&settings, 0, sizeof(settings));
+  osqp_set_default_settings(&settings);
   // Customize the defaults for Drake.
   // - Default polishing to true, to get an accurate solution.
   // - Disable adaptive rho, for determinism.
-  settings->polishing = 1;
-  settings->adaptive_rho_interval = OSQP_ADAPTIVE_RHO_FIXED;
+  settings.polishing = 1;
+  settings.adaptive_rho_interval = OSQP_ADAPTIVE_RHO_FIXED;
   // Apply the user's additional options (if any).
   options->Respell([](const auto& common, auto* respelled) {
     respelled->emplace("verbose", common.print_to_console ? 1 : 0);
     // OSQP does not support setting the number of threads so we ignore the
     // kMaxThreads option.
   });
-  options->CopyToSerializableStruct(settings);
+  options->CopyToSerializableStruct(&settings);
 
   // If any step fails, it will set the solution_result and skip other steps.
   std::optional<SolutionResult> solution_result;
 
-  // Setup workspace.
+  // When reusing the setup, hold the lock for the rest of the solve.
+  std::unique_lock<std::mutex> lock(mutex_);
+  Workspace* workspace = nullptr;
+  if (reuse_setup_) {
+    if (workspace_ == nullptr) {
+      workspace_ = std::make_shared<Workspace>();
+    }
+    workspace = workspace_.get();
+  } else {
+    lock.unlock();
+  }
+
+  // Setup workspace, or update the kept one.
   OSQPSolver* solver = nullptr;
-  ScopeExit solver_guard([&solver]() {
-    if (solver != nullptr) {
+  ScopeExit solver_guard([&solver, workspace]() {
+    if (solver != nullptr && workspace == nullptr) {
       osqp_cleanup(solver);
     }
   });
-  if (!solution_result) {
-    const OSQPInt osqp_setup_err =
-        osqp_setup(&solver, P, q.data(), A, l.data(), u.data(), m, n, settings);
+  if (workspace != nullptr &&
+      workspace->Matches(P_upper_sparse, A_sparse, settings)) {
+    solver = workspace->solver;
+    solver_details.reused_setup = true;
+    const OSQPInt osqp_update_vec_err =
+        osqp_update_data_vec(solver, q.data(), l.data(), u.data());
+    const OSQPInt osqp_update_mat_err = osqp_update_data_mat(
+        solver, P_upper_sparse.valuePtr(), nullptr, P_upper_sparse.nonZeros(),
+        A_sparse.valuePtr(), nullptr, A_sparse.nonZeros());
+    if (osqp_update_vec_err != 0 || osqp_update_mat_err != 0) {
+      solution_result = SolutionResult::kInvalidInput;
+    }
+  } else {
+    if (workspace != nullptr && workspace->solver != nullptr) {
+      osqp_cleanup(workspace->solver);
+      workspace->solver = nullptr;
+    }
+    ++num_setups_;
+    const OSQPInt osqp_setup_err = osqp_setup(&solver, P, q.data(), A, l.data(),
+                                              u.data(), m, n, &settings);
     if (osqp_setup_err != 0) {
       solution_result = SolutionResult::kInvalidInput;
+    } else if (workspace != nullptr) {
+      workspace->solver = solver;
+      workspace->num_rows = m;
+      CopySparsity(P_upper_sparse, &workspace->P_outer, &workspace->P_inner);
+      CopySparsity(A_sparse, &workspace->A_outer, &workspace->A_inner);
+      std::memcpy(&workspace->settings, &settings, sizeof(settings));
+    }
+  }
+  if (solution_result && workspace != nullptr) {
+    // Don't keep a workspace that is in an unknown state.
+    if (solver != nullptr) {
+      osqp_cleanup(solver);
     }
+    workspace->solver = nullptr;
+    solver = nullptr;
   }
 
   if (!solution_result && initial_guess.array().isFinite().all()) {
@@ -1,5 +1,8 @@
 #pragma once
 
+#include <atomic>
+#include <memory>
+#include <mutex>
 #include <string>
 
 #include "drake/common/drake_copyable.h"
@@ -20,6 +23,10 @@ struct OsqpSolverDetails {
   double primal_res{};
   /// Norm of dual residue.
   double dual_res{};
+  /// Whether this solve reused the OSQP workspace from the prior solve, so
+  /// that only the problem data was updated instead of set up from scratch.
+  /// See OsqpSolver::set_reuse_setup().
+  bool reused_setup{};
   /// Time taken for setup phase (seconds).
   double setup_time{};
   /// Time taken for solve phase (seconds).
@@ -55,6 +62,28 @@ primal and dual variables inside the OSQP solver, regardless of the solver
 status (whether it is optimal, infeasible, unbounded, etc), except when the
 problem has an invalid input. Users should always check the solver status before
 interpreting the returned primal and dual variables.
+
+<h3>Reusing the setup across solves</h3>
+
+By default, each call to Solve() sets up OSQP's workspace (including the
+factorization of its KKT matrix) from scratch. A controller that solves a
+sequence of programs that differ only in their coefficients and bounds (e.g., a
+model-predictive controller whose bindings are updated in place each control
+tick via `UpdateCoefficients()` and `set_bounds()`) can instead ask this solver
+to keep its workspace, by calling set_reuse_setup(). When the next program has
+the same number of variables and linear constraint rows, the same sparsity
+patterns of its cost Hessian and its constraint matrix, and the same solver
+options as the previous one, only the problem data is copied into the kept
+workspace, and OSQP warm starts from the previous solution (unless the solve is
+given an initial guess). Otherwise, the workspace is set up again.
+
+The parameters of such a program are thus its bindings' coefficients and
+bounds. Note that a binding's sparsity pattern changes when one of its
+coefficients changes to or from exactly zero; that case is still solved
+correctly, but with a new setup.
+
+While reuse is enabled, concurrent calls to Solve() on the same instance are
+serialized; use one instance per thread to solve in parallel.
   */
 class OsqpSolver final : public SolverBase {
  public:
@@ -78,10 +107,33 @@ class OsqpSolver final : public SolverBase {
   // A using-declaration adds these methods into our class's Doxygen.
   using SolverBase::Solve;
 
+  /// Sets whether to keep OSQP's workspace from one solve to the next; see
+  /// the class overview. Disabling reuse releases any kept workspace. The
+  /// default is false.
+  void set_reuse_setup(bool reuse_setup);
+
+  /// Returns whether OSQP's workspace is kept from one solve to the next.
+  bool reuse_setup() const;
+
+  /// Returns the number of times that this instance has set up an OSQP
+  /// workspace from scratch.
+  int num_setups() const { return num_setups_; }
+
  private:
+  // The OSQP workspace kept across solves; see set_reuse_setup(). This is only
+  // defined when OSQP is available.
+  struct Workspace;
+
   void DoSolve2(const MathematicalProgram&, const Eigen::VectorXd&,
                 internal::SpecificOptions*,
                 MathematicalProgramResult*) const final;
+
+  // Guards reuse_setup_ and workspace_, and is held throughout a solve that
+  // uses workspace_.
+  mutable std::mutex mutex_;
+  bool reuse_setup_{false};
+  mutable std::shared_ptr<Workspace> workspace_;
+  mutable std::atomic<int> num_setups_{0};
 };
 }  // namespace solvers
 }  // namespace drake
@@ -20,6 +20,19 @@ OsqpSolver::OsqpSolver()
 
 OsqpSolver::~OsqpSolver() = default;
 
+void OsqpSolver::set_reuse_setup(bool reuse_setup) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  reuse_setup_ = reuse_setup;
+  if (!reuse_setup) {
+    workspace_.reset();
+  }
+}
+
+bool OsqpSolver::reuse_setup() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return reuse_setup_;
+}
+
 SolverId OsqpSolver::id() {
   static const never_destroyed<SolverId> singleton{"OSQP"};
   return singleton.access();
@@ -11,6 +11,7 @@
 #include "drake/solvers/choose_best_solver.h"
 #include "drake/solvers/ipopt_solver.h"
 #include "drake/solvers/solver_interface.h"
+#include "drake/solvers/solver_setup_cache.h"
 
 namespace drake {
 namespace solvers {
@@ -77,6 +78,14 @@ std::vector<MathematicalProgramResult> SolveInParallel(
   std::vector<std::unordered_map<SolverId, std::unique_ptr<SolverInterface>>>
       solvers(parallelism.num_threads());
 
+  // Likewise, when the solver must be chosen for a program, the threads cache
+  // the choice by the program's structure, so that the many programs that
+  // typically share a structure don't each have to be inspected anew. (We
+  // don't ask the solvers to reuse their setup, so that the results are the
+  // same as those of Solve().)
+  std::vector<std::unique_ptr<SolverSetupCache>> caches(
+      parallelism.num_threads());
+
   // The worker lambda behaves slightly differently depending on whether we are
   // in the par-for loop or in the single-threaded cleanup pass later on.
   // This is the worker callback for the i'th program.
@@ -87,22 +96,6 @@ std::vector<MathematicalProgramResult> SolveInParallel(
       return;
     }
 
-    // Access (or choose) the required solver.
-    const SolverId solver_id =
-        ((solver_ids != nullptr) && (*solver_ids)[i].has_value())
-            ? *((*solver_ids)[i])
-            : ChooseBestSolver(*progs[i]);
-
-    // Find (or create) the specified solver.
-    auto solver_iter = solvers[thread_num].find(solver_id);
-    if (solver_iter == solvers[thread_num].end()) {
-      // If this thread has not solved this type of program yet, save the solver
-      // for use later.
-      solver_iter = solvers[thread_num].emplace_hint(solver_iter, solver_id,
-                                                     MakeSolver(solver_id));
-    }
-    const SolverInterface& solver = *(solver_iter->second);
-
     // Adjust the solver options to obey `parallelism`. If this solve is part of
     // the par-for, then the solver is only allowed one thread; otherwise
     // (during the serial cleanup pass) it is allowed `parallelism`. Note that
@@ -128,7 +121,27 @@ std::vector<MathematicalProgramResult> SolveInParallel(
     }
 
     // Solve the program.
-    solver.Solve(*(progs[i]), initial_guess, new_options, &(results[i]));
+    if ((solver_ids != nullptr) && (*solver_ids)[i].has_value()) {
+      // Find (or create) the specified solver.
+      const SolverId& solver_id = *((*solver_ids)[i]);
+      auto solver_iter = solvers[thread_num].find(solver_id);
+      if (solver_iter == solvers[thread_num].end()) {
+        // If this thread has not solved this type of program yet, save the
+        // solver for use later.
+        solver_iter = solvers[thread_num].emplace_hint(solver_iter, solver_id,
+                                                       MakeSolver(solver_id));
+      }
+      const SolverInterface& solver = *(solver_iter->second);
+      solver.Solve(*(progs[i]), initial_guess, new_options, &(results[i]));
+    } else {
+      // Choose the solver (or find the one chosen for this structure).
+      if (caches[thread_num] == nullptr) {
+        caches[thread_num] = std::make_unique<SolverSetupCache>(
+            /* reuse_solver_setup = */ false);
+      }
+      caches[thread_num]->Solve(*(progs[i]), initial_guess, new_options,
+                                &(results[i]));
+    }
     result_is_populated[i] = true;
   };
   const auto solve_ith_parallel = [&](const int thread_num, const int64_t i) {
@@ -157,6 +170,7 @@ std::vector<MathematicalProgramResult> SolveInParallel(
   // first worker's cache for the serial solves, below.) The clearing is
   // important in case the solvers hold onto scarce resources (e.g., licenses).
   solvers.resize(1);
+  caches.resize(1);
 
   // Finish solving the programs that couldn't be solved in parallel.
   for (size_t i = 0; i < progs.size(); ++i) {
@@ -0,0 +1,213 @@
+#include "drake/solvers/solver_portfolio.h"
+
+#include <chrono>
+#include <condition_variable>
+#include <exception>
+#include <limits>
+#include <memory>
+#include <utility>
+
+#include "drake/common/drake_assert.h"
+#include "drake/solvers/choose_best_solver.h"
+#include "drake/solvers/ipopt_solver.h"
+#include "drake/solvers/nlopt_solver.h"
+#include "drake/solvers/solver_interface.h"
+
+namespace drake {
+namespace solvers {
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+// The state of one call to SolverPortfolio::Solve(), shared with the solves
+// that are racing (which may outlive the call).
+struct Race {
+  explicit Race(int num_entries) : results(num_entries), errors(num_entries) {}
+
+  std::mutex mutex;
+  std::condition_variable finished;
+  std::vector<MathematicalProgramResult> results;
+  std::vector<std::exception_ptr> errors;
+  // The indices of the finished entries, in the order that they finished.
+  std::vector<int> finish_order;
+  // The first entry to finish successfully, if any.
+  std::optional<int> first_success;
+};
+
+// Returns the entry whose result should be returned from among the finished
+// ones, or nullopt if none has finished without an exception: the successful
+// result with the lowest optimal cost, or else the first to finish.
+std::optional<int> ChooseBest(const Race& race) {
+  std::optional<int> best;
+  double best_cost = std::numeric_limits<double>::infinity();
+  for (const int i : race.finish_order) {
+    if (race.errors[i] != nullptr) {
+      continue;
+    }
+    const MathematicalProgramResult& result = race.results[i];
+    if (!best.has_value()) {
+      best = i;
+    }
+    if (result.is_success() && (!race.results[*best].is_success() ||
+                                result.get_optimal_cost() < best_cost)) {
+      best = i;
+      best_cost = result.get_optimal_cost();
+    }
+  }
+  return best;
+}
+
+// Returns the options that limit each solver (that supports it) to the given
+// number of seconds of wall-clock time.
+SolverOptions MakeTimeLimit(double seconds) {
+  SolverOptions result;
+  result.SetOption(IpoptSolver::id(), "max_wall_time", seconds);
+  result.SetOption(NloptSolver::id(), NloptSolver::MaxTimeName(), seconds);
+  return result;
+}
+
+}  // namespace
+
+SolverPortfolio::SolverPortfolio(std::vector<SolverPortfolioEntry> entries)
+    : entries_(std::move(entries)), statistics_(entries_.size()) {
+  DRAKE_THROW_UNLESS(!entries_.empty());
+}
+
+SolverPortfolio::~SolverPortfolio() {
+  JoinWorkers();
+}
+
+std::vector<SolverPortfolio::Statistics> SolverPortfolio::statistics() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return statistics_;
+}
+
+void SolverPortfolio::JoinWorkers() {
+  for (auto& worker : workers_) {
+    worker.join();
+  }
+  workers_.clear();
+}
+
+MathematicalProgramResult SolverPortfolio::Solve(
+    const MathematicalProgram& prog,
+    const std::optional<Eigen::VectorXd>& initial_guess,
+    std::optional<double> deadline) {
+  JoinWorkers();
+  const int num_entries = entries_.size();
+  const Clock::time_point start = Clock::now();
+  const std::optional<Clock::time_point> end_time =
+      deadline.has_value()
+          ? std::optional<Clock::time_point>(
+                start + std::chrono::duration_cast<Clock::duration>(
+                            std::chrono::duration<double>(*deadline)))
+          : std::nullopt;
+  auto race = std::make_shared<Race>(num_entries);
+  std::shared_ptr<const MathematicalProgram> clone = prog.Clone();
+
+  // Solves the i'th entry, and records its outcome.
+  auto solve_ith = [this, race, clone, initial_guess, deadline](int i) {
+    const SolverPortfolioEntry& entry = entries_[i];
+    // Allow one thread, and no more time than the deadline (for the solvers
+    // that support a time limit), unless the entry's options say otherwise.
+    SolverOptions options = entry.solver_options;
+    SolverOptions one_thread;
+    one_thread.SetOption(CommonSolverOption::kMaxThreads, 1);
+    options.Merge(one_thread);
+    if (deadline.has_value() && *deadline > 0) {
+      options.Merge(MakeTimeLimit(*deadline));
+    }
+    MathematicalProgramResult result;
+    std::exception_ptr error;
+    const Clock::time_point solve_start = Clock::now();
+    try {
+      const std::unique_ptr<SolverInterface> solver =
+          MakeSolver(entry.solver_id);
+      solver->Solve(*clone, initial_guess, options, &result);
+    } catch (...) {
+      error = std::current_exception();
+    }
+    const double elapsed =
+        std::chrono::duration<double>(Clock::now() - solve_start).count();
+    const bool success = (error == nullptr) && result.is_success();
+    {
+      std::lock_guard<std::mutex> lock(mutex_);
+      Statistics& stats = statistics_[i];
+      ++stats.num_finished;
+      stats.num_successes += success ? 1 : 0;
+      stats.num_errors += (error != nullptr) ? 1 : 0;
+      stats.total_time += elapsed;
+    }
+    {
+      std::lock_guard<std::mutex> lock(race->mutex);
+      race->results[i] = std::move(result);
+      race->errors[i] = error;
+      race->finish_order.push_back(i);
+      if (success && !race->first_success.has_value()) {
+        race->first_success = i;
+      }
+    }
+    race->finished.notify_all();
+  };
+
+  // Counts the start of the i'th entry's solve.
+  auto start_ith = [this](int i) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    ++statistics_[i].num_solves;
+  };
+  if (prog.IsThreadSafe()) {
+    for (int i = 0; i < num_entries; ++i) {
+      start_ith(i);
+      workers_.emplace_back(solve_ith, i);
+    }
+  } else {
+    // Try the solvers one at a time.
+    for (int i = 0; i < num_entries; ++i) {
+      start_ith(i);
+      solve_ith(i);
+      if (race->first_success.has_value() ||
+          (end_time.has_value() && Clock::now() >= *end_time)) {
+        break;
+      }
+    }
+  }
+
+  // Wait for a success, or for all of the solves to finish, or until the
+  // deadline; then, for at least one solve to finish.
+  std::unique_lock<std::mutex> lock(race->mutex);
+  auto is_decided = [&race, num_entries]() {
+    return race->first_success.has_value() ||
+           ssize(race->finish_order) == num_entries;
+  };
+  if (end_time.has_value()) {
+    race->finished.wait_until(lock, *end_time, is_decided);
+  } else {
+    race->finished.wait(lock, is_decided);
+  }
+  race->finished.wait(lock, [&race]() {
+    return !race->finish_order.empty();
+  });
+  std::optional<int> winner = race->first_success;
+  if (!winner.has_value()) {
+    winner = ChooseBest(*race);
+  }
+  if (!winner.has_value()) {
+    // Every finished solve threw. Wait for the rest, in case one of them
+    // doesn't.
+    race->finished.wait(lock, [&race, num_entries]() {
+      return ssize(race->finish_order) == num_entries;
+    });
+    winner = ChooseBest(*race);
+    if (!winner.has_value()) {
+      std::rethrow_exception(race->errors[race->finish_order.front()]);
+    }
+  }
+  {
+    std::lock_guard<std::mutex> stats_lock(mutex_);
+    ++statistics_[*winner].num_wins;
+  }
+  return race->results[*winner];
+}
+
+}  // namespace solvers
+}  // namespace drake
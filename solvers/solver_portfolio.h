@@ -0,0 +1,134 @@
+#pragma once
+
+#include <mutex>
+#include <optional>
+#include <thread>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/solvers/mathematical_program.h"
+#include "drake/solvers/mathematical_program_result.h"
+#include "drake/solvers/solver_id.h"
+#include "drake/solvers/solver_options.h"
+
+namespace drake {
+namespace solvers {
+
+/** One of the solvers of a SolverPortfolio, along with the options to use with
+it. */
+struct SolverPortfolioEntry {
+  /** The solver to use. */
+  SolverId solver_id;
+
+  /** The options to use with the solver, in addition to those stored in the
+  program. */
+  SolverOptions solver_options;
+};
+
+/** Solves one program with several solvers concurrently, and returns the
+first acceptable result.
+
+For nonconvex programs, which of several solvers (e.g., SNOPT, IPOPT, or
+NLopt) finishes first, or succeeds at all, can vary a lot from one instance
+of a program to the next. A portfolio races its solvers on separate threads,
+each solving a clone of the program, and returns the result of the first
+solver to succeed. When a deadline is given and no solver has succeeded by
+then, it instead returns the best of the results that have finished (waiting
+for the first one, if none have).
+
+Drake's solvers cannot be interrupted, so the solvers that lose the race are
+not cancelled; they run to completion in the background (each on its own clone
+of the program, so the caller may change or destroy the program as soon as
+Solve() returns). They do not pile up across calls: each call to Solve() first
+waits for the previous call's solves to finish, as does the portfolio's
+destructor. When Solve() is given a deadline, the solvers that support a time
+limit (IPOPT's `max_wall_time` and NLopt's `max_time`) are limited to the
+deadline, so that the losers stop soon after it. Use the other solvers' options
+(e.g., iteration limits) to bound how long they run.
+
+Each solver is allowed one thread (via CommonSolverOption::kMaxThreads), and no
+more time than the deadline (as above), unless its options say otherwise.
+
+Programs that are not thread safe (see MathematicalProgram::IsThreadSafe())
+cannot be raced; for them, the solvers are tried one at a time in order, until
+one succeeds or the deadline has passed.
+
+The portfolio keeps statistics of each solver's races (see statistics()), for
+tuning the list of solvers and their options. */
+class SolverPortfolio {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(SolverPortfolio);
+
+  /** The running totals of one solver's races. */
+  struct Statistics {
+    /** The number of races in which the solver was started. (When the
+    solvers are tried one at a time, those after the first success are not
+    started.) */
+    int num_solves{};
+    /** The number of those solves that have finished, including those that
+    finished after their race was won by another solver. */
+    int num_finished{};
+    /** The number of finished solves that succeeded. */
+    int num_successes{};
+    /** The number of finished solves that threw an exception (e.g., because
+    the solver is not available, or cannot solve the program). */
+    int num_errors{};
+    /** The number of races whose returned result came from this solver. */
+    int num_wins{};
+    /** The total wall-clock time of the finished solves, in seconds. */
+    double total_time{};
+  };
+
+  /** Constructs a portfolio of the given solvers.
+  @pre `entries` is not empty. */
+  explicit SolverPortfolio(std::vector<SolverPortfolioEntry> entries);
+
+  /** Waits for any solves that are still running in the background. */
+  ~SolverPortfolio();
+
+  /** Returns the portfolio's solvers. */
+  const std::vector<SolverPortfolioEntry>& entries() const { return entries_; }
+
+  /** Solves `prog` with all of the portfolio's solvers, and returns the first
+  successful result, or if there is no success within `deadline` seconds, the
+  best result that has finished by then. The best result is the successful one
+  with the lowest optimal cost; or if none were successful, the first to
+  finish. The result's solver id tells which solver won the race.
+
+  Calls to Solve() on the same portfolio must not be concurrent. Each call
+  first waits for the solves of the previous call (if any are still running in
+  the background) to finish.
+
+  @param initial_guess The initial guess for the decision variables; see
+  SolverInterface::Solve().
+  @param deadline The time to wait for a successful result, in seconds, which
+  is also the time limit of the solvers that support one. When nullopt (the
+  default), waits until a solver succeeds or all of them finish.
+  @throws std::exception if every solver threw an exception, by rethrowing
+  that of the first solver to do so. */
+  MathematicalProgramResult Solve(
+      const MathematicalProgram& prog,
+      const std::optional<Eigen::VectorXd>& initial_guess = std::nullopt,
+      std::optional<double> deadline = std::nullopt);
+
+  /** Returns the running totals of each solver's races, in the same order as
+  entries(). The totals include the solves that are still finishing in the
+  background as of when they finish. */
+  std::vector<Statistics> statistics() const;
+
+ private:
+  // Waits for the solves of the previous call to Solve() to finish.
+  void JoinWorkers();
+
+  const std::vector<SolverPortfolioEntry> entries_;
+
+  // Guards statistics_, which the workers update as they finish.
+  mutable std::mutex mutex_;
+  std::vector<Statistics> statistics_;
+
+  // The threads of the solves that have not been joined yet.
+  std::vector<std::thread> workers_;
+};
+
+}  // namespace solvers
+}  // namespace drake
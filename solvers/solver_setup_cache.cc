@@ -0,0 +1,138 @@
+#include "drake/solvers/solver_setup_cache.h"
+
+#include <typeinfo>
+
+#include "drake/common/drake_assert.h"
+#include "drake/solvers/choose_best_solver.h"
+#include "drake/solvers/osqp_solver.h"
+
+namespace drake {
+namespace solvers {
+namespace {
+
+// Appends the sparsity pattern of a dense matrix, as the linear indices of its
+// nonzero entries.
+void AppendPattern(const Eigen::MatrixXd& matrix, std::vector<size_t>* words) {
+  words->push_back(matrix.rows());
+  words->push_back(matrix.cols());
+  for (int i = 0; i < matrix.size(); ++i) {
+    if (matrix.data()[i] != 0) {
+      words->push_back(i);
+    }
+  }
+  words->push_back(matrix.size());
+}
+
+// Appends the sparsity pattern of a sparse matrix, as the row indices of the
+// nonzero entries of each column, followed by their count.
+void AppendPattern(const Eigen::SparseMatrix<double>& matrix,
+                   std::vector<size_t>* words) {
+  words->push_back(matrix.rows());
+  words->push_back(matrix.cols());
+  for (int j = 0; j < matrix.outerSize(); ++j) {
+    size_t count = 0;
+    for (Eigen::SparseMatrix<double>::InnerIterator it(matrix, j); it; ++it) {
+      if (it.value() != 0) {
+        words->push_back(it.row());
+        ++count;
+      }
+    }
+    words->push_back(count);
+  }
+}
+
+}  // namespace
+
+ProgramFingerprint::ProgramFingerprint(const MathematicalProgram& prog) {
+  words_.push_back(prog.num_vars());
+  for (const symbolic::Variable& var : prog.decision_variables()) {
+    words_.push_back(static_cast<size_t>(var.get_type()));
+  }
+  size_t capabilities = 0;
+  for (const ProgramAttribute attribute : prog.required_capabilities()) {
+    capabilities |= size_t{1} << static_cast<int>(attribute);
+  }
+  words_.push_back(capabilities);
+
+  // Appends the kind, size, and variable indices of a binding.
+  auto append_binding = [this, &prog](const auto& binding) {
+    const EvaluatorBase& evaluator = *binding.evaluator();
+    words_.push_back(typeid(evaluator).hash_code());
+    words_.push_back(evaluator.num_outputs());
+    const std::vector<int> indices =
+        prog.FindDecisionVariableIndices(binding.variables());
+    words_.insert(words_.end(), indices.begin(), indices.end());
+    words_.push_back(indices.size());
+  };
+  for (const Binding<Cost>& binding : prog.GetAllCosts()) {
+    append_binding(binding);
+    if (const auto* quadratic =
+            dynamic_cast<const QuadraticCost*>(binding.evaluator().get())) {
+      words_.push_back(quadratic->is_convex());
+      AppendPattern(quadratic->Q(), &words_);
+    }
+  }
+  for (const Binding<Constraint>& binding : prog.GetAllConstraints()) {
+    append_binding(binding);
+    if (const auto* linear =
+            dynamic_cast<const LinearConstraint*>(binding.evaluator().get())) {
+      AppendPattern(linear->get_sparse_A(), &words_);
+    } else if (const auto* quadratic = dynamic_cast<const QuadraticConstraint*>(
+                   binding.evaluator().get())) {
+      words_.push_back(quadratic->is_convex());
+      AppendPattern(quadratic->Q(), &words_);
+    }
+  }
+}
+
+SolverSetupCache::SolverSetupCache(bool reuse_solver_setup)
+    : reuse_solver_setup_(reuse_solver_setup) {}
+
+SolverSetupCache::~SolverSetupCache() = default;
+
+MathematicalProgramResult SolverSetupCache::Solve(
+    const MathematicalProgram& prog,
+    const std::optional<Eigen::VectorXd>& initial_guess,
+    const std::optional<SolverOptions>& solver_options) {
+  MathematicalProgramResult result;
+  this->Solve(prog, initial_guess, solver_options, &result);
+  return result;
+}
+
+void SolverSetupCache::Solve(
+    const MathematicalProgram& prog,
+    const std::optional<Eigen::VectorXd>& initial_guess,
+    const std::optional<SolverOptions>& solver_options,
+    MathematicalProgramResult* result) {
+  DRAKE_THROW_UNLESS(result != nullptr);
+  ProgramFingerprint fingerprint(prog);
+  auto iter = solvers_.find(fingerprint);
+  if (iter != solvers_.end()) {
+    ++num_hits_;
+  } else {
+    std::unique_ptr<SolverInterface> solver =
+        MakeSolver(ChooseBestSolver(prog));
+    if (reuse_solver_setup_) {
+      if (auto* osqp = dynamic_cast<OsqpSolver*>(solver.get())) {
+        osqp->set_reuse_setup(true);
+      }
+    }
+    iter = solvers_.emplace(std::move(fingerprint), std::move(solver)).first;
+    ++num_misses_;
+  }
+  iter->second->Solve(prog, initial_guess, solver_options, result);
+}
+
+double SolverSetupCache::hit_rate() const {
+  const int num_solves = num_hits_ + num_misses_;
+  return num_solves > 0 ? static_cast<double>(num_hits_) / num_solves : 0.0;
+}
+
+void SolverSetupCache::Clear() {
+  solvers_.clear();
+  num_hits_ = 0;
+  num_misses_ = 0;
+}
+
+}  // namespace solvers
+}  // namespace drake
@@ -0,0 +1,131 @@
+#pragma once
+
+#include <cstddef>
+#include <memory>
+#include <optional>
+#include <unordered_map>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/common/hash.h"
+#include "drake/solvers/mathematical_program.h"
+#include "drake/solvers/mathematical_program_result.h"
+#include "drake/solvers/solver_interface.h"
+#include "drake/solvers/solver_options.h"
+
+namespace drake {
+namespace solvers {
+
+/** The structure of a MathematicalProgram, without its numerical data.
+
+Two programs have equal fingerprints when they have the same number and types
+of decision variables; the same kinds of costs and constraints, in the same
+order, each bound to the same decision variable indices; the same sparsity
+patterns of their quadratic Hessians and linear constraint matrices; and the
+same convexity of their quadratic costs and constraints. The values of the
+coefficients and bounds are not part of the fingerprint.
+
+The choice of solver for a program (see ChooseBestSolver()) depends only on
+this structure, so programs with equal fingerprints are solved by the same
+solver. */
+class ProgramFingerprint {
+ public:
+  DRAKE_DEFAULT_COPY_AND_MOVE_AND_ASSIGN(ProgramFingerprint);
+
+  /** Computes the fingerprint of `prog`. */
+  explicit ProgramFingerprint(const MathematicalProgram& prog);
+
+  bool operator==(const ProgramFingerprint&) const = default;
+
+  /** Implements the @ref hash_append concept. */
+  template <class HashAlgorithm>
+  friend void hash_append(HashAlgorithm& hasher,
+                          const ProgramFingerprint& item) noexcept {
+    hash_append_range(hasher, item.words_.begin(), item.words_.end());
+  }
+
+ private:
+  // The structure, flattened into a sequence of words.
+  std::vector<size_t> words_;
+};
+
+/** Solves a stream of programs that share a few structures, reusing the work
+that depends only on a program's structure (see ProgramFingerprint) from one
+solve to the next.
+
+For each distinct structure, the cache chooses a solver once (see
+ChooseBestSolver()), and keeps an instance of it for the later programs with
+the same structure. When `reuse_solver_setup` is true, the instances of the
+solvers that can keep their setup across solves are asked to do so. Currently
+that is only OsqpSolver (see OsqpSolver::set_reuse_setup()), which then skips
+its setup (including the symbolic analysis and factorization of its KKT
+matrix) for a program whose sparsity and options match those of the previous
+program of its structure. OSQP then warm starts from the previous program's
+solution (unless the solve is given an initial guess), so its results can
+differ from those of solvers::Solve() within the solver's tolerances.
+
+This helps with the many small programs of, e.g., inverse kinematics or grasp
+scoring, for which the overhead of choosing and setting up a solver can be as
+large as the solve itself.
+
+The cache is not thread safe; use one per thread. SolveInParallel() does so
+(without reusing the solvers' setup) for the programs whose solver it must
+choose. */
+class SolverSetupCache {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(SolverSetupCache);
+
+  /** Constructs an empty cache.
+  @param reuse_solver_setup Whether the cached solvers keep their setup from
+  one solve to the next. */
+  explicit SolverSetupCache(bool reuse_solver_setup = true);
+
+  ~SolverSetupCache();
+
+  /** Solves `prog` with the solver cached for its structure, choosing one (and
+  adding it to the cache) when there is none yet. The arguments are the same as
+  those of solvers::Solve().
+  @throws std::exception if no solver can solve `prog`. */
+  MathematicalProgramResult Solve(
+      const MathematicalProgram& prog,
+      const std::optional<Eigen::VectorXd>& initial_guess = std::nullopt,
+      const std::optional<SolverOptions>& solver_options = std::nullopt);
+
+  /** Like the other Solve(), but stores the result into `result`, which may be
+  reused from one solve to the next.
+  @pre result != nullptr */
+  void Solve(const MathematicalProgram& prog,
+             const std::optional<Eigen::VectorXd>& initial_guess,
+             const std::optional<SolverOptions>& solver_options,
+             MathematicalProgramResult* result);
+
+  /** Returns the number of solves whose program's structure was already in
+  the cache. */
+  int num_hits() const { return num_hits_; }
+
+  /** Returns the number of solves whose program's structure was added to the
+  cache. */
+  int num_misses() const { return num_misses_; }
+
+  /** Returns num_hits() as a fraction of all solves, or zero when there have
+  been none. */
+  double hit_rate() const;
+
+  /** Returns the number of distinct structures in the cache. */
+  int size() const { return ssize(solvers_); }
+
+  /** Removes all of the cached solvers (along with their setup), and resets
+  the hit and miss counts. */
+  void Clear();
+
+ private:
+  const bool reuse_solver_setup_;
+  std::unordered_map<ProgramFingerprint, std::unique_ptr<SolverInterface>,
+                     DefaultHash>
+      solvers_;
+  int num_hits_{0};
+  int num_misses_{0};
+};
+
+}  // namespace solvers
+}  // namespace drake
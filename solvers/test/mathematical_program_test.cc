@@ -3262,6 +3262,146 @@ GTEST_TEST(TestMathematicalProgram, AddQuadraticCost) {
   EXPECT_TRUE(cost6.evaluator()->is_convex());
 }
 
+GTEST_TEST(TestMathematicalProgram, AddSparseQuadraticCost) {
+  MathematicalProgram prog;
+  auto x = prog.NewContinuousVariables<6>();
+  // Variables 0 and 2 are coupled, variable 4 is alone, and variables 1 and 5
+  // only appear in the linear term.
+  std::vector<Eigen::Triplet<double>> triplets{{0, 0, 2.0}, {0, 2, 1.0},
+                                               {2, 0, 1.0}, {2, 2, 3.0},
+                                               {4, 4, 1.0}, {3, 3, 0.0}};
+  Eigen::SparseMatrix<double> Q(6, 6);
+  Q.setFromTriplets(triplets.begin(), triplets.end());
+  const Eigen::VectorXd b =
+      (Eigen::VectorXd(6) << 1, 2, 0, 0, 0, -1).finished();
+  const auto bindings = prog.AddSparseQuadraticCost(Q, b, 1.5, x);
+  auto expect_variables = [&x](const Binding<QuadraticCost>& binding,
+                               const std::vector<int>& indices) {
+    ASSERT_EQ(binding.variables().size(), ssize(indices));
+    for (int j = 0; j < ssize(indices); ++j) {
+      EXPECT_TRUE(binding.variables()(j).equal_to(x(indices[j])));
+    }
+  };
+  ASSERT_EQ(bindings.size(), 3);
+  EXPECT_EQ(prog.quadratic_costs().size(), 3);
+  expect_variables(bindings[0], {0, 2});
+  EXPECT_TRUE(CompareMatrices(bindings[0].evaluator()->Q(),
+                              Eigen::Matrix2d{{2, 1}, {1, 3}}));
+  EXPECT_EQ(bindings[0].evaluator()->c(), 1.5);
+  EXPECT_TRUE(bindings[0].evaluator()->is_convex());
+  expect_variables(bindings[1], {4});
+  EXPECT_EQ(bindings[1].evaluator()->c(), 0);
+  expect_variables(bindings[2], {1, 5});
+  EXPECT_TRUE(
+      CompareMatrices(bindings[2].evaluator()->Q(), Eigen::Matrix2d::Zero()));
+
+  // The costs sum to the requested cost.
+  const Eigen::VectorXd x_val =
+      (Eigen::VectorXd(6) << 0.5, -1, 2, 7, 3, 4).finished();
+  double total = 0;
+  for (const auto& binding : bindings) {
+    total += prog.EvalBinding(binding, x_val)(0);
+  }
+  EXPECT_NEAR(total, 0.5 * x_val.dot(Q * x_val) + b.dot(x_val) + 1.5, 1e-12);
+
+  // An all-zero cost adds nothing, but a constant alone is kept.
+  EXPECT_TRUE(prog.AddSparseQuadraticCost(Eigen::SparseMatrix<double>(6, 6),
+                                          Eigen::VectorXd::Zero(6), 0, x)
+                  .empty());
+  const auto constant = prog.AddSparseQuadraticCost(
+      Eigen::SparseMatrix<double>(6, 6), Eigen::VectorXd::Zero(6), 2.0, x);
+  ASSERT_EQ(constant.size(), 1);
+  EXPECT_EQ(prog.EvalBinding(constant[0], x_val)(0), 2.0);
+
+  // A nonconvex group is detected.
+  Eigen::SparseMatrix<double> Q_bad(6, 6);
+  Q_bad.insert(3, 3) = -1;
+  EXPECT_FALSE(
+      prog.AddSparseQuadraticCost(Q_bad, Eigen::VectorXd::Zero(6), 0, x)[0]
+          .evaluator()
+          ->is_convex());
+
+  // Mismatched sizes are rejected.
+  EXPECT_THROW(
+      prog.AddSparseQuadraticCost(Eigen::SparseMatrix<double>(5, 6), b, 0, x),
+      std::exception);
+  EXPECT_THROW(prog.AddSparseQuadraticCost(Q, b.head<5>(), 0, x),
+               std::exception);
+}
+
+GTEST_TEST(TestMathematicalProgram, AddSparseQuadraticCostBanded) {
+  // A banded Q couples all of its variables into one group, which is too
+  // large for a dense Hessian, so it is split into one cost per term.
+  const int n = 200;
+  MathematicalProgram prog;
+  auto x = prog.NewContinuousVariables(n);
+  std::vector<Eigen::Triplet<double>> triplets;
+  for (int i = 0; i < n; ++i) {
+    triplets.emplace_back(i, i, 3.0);
+    if (i + 1 < n) {
+      triplets.emplace_back(i, i + 1, -1.0);
+      triplets.emplace_back(i + 1, i, -1.0);
+    }
+  }
+  Eigen::SparseMatrix<double> Q(n, n);
+  Q.setFromTriplets(triplets.begin(), triplets.end());
+  const Eigen::VectorXd b = Eigen::VectorXd::LinSpaced(n, -1, 1);
+  const auto bindings = prog.AddSparseQuadraticCost(Q, b, 0.5, x);
+  ASSERT_EQ(ssize(bindings), n - 1);
+  for (int i = 0; i < n - 1; ++i) {
+    ASSERT_EQ(bindings[i].variables().size(), 2);
+    EXPECT_TRUE(bindings[i].variables()(0).equal_to(x(i)));
+    EXPECT_TRUE(bindings[i].variables()(1).equal_to(x(i + 1)));
+    EXPECT_TRUE(bindings[i].evaluator()->is_convex());
+  }
+
+  // The costs sum to the requested cost.
+  const Eigen::VectorXd x_val = Eigen::VectorXd::LinSpaced(n, 2, -3);
+  double total = 0;
+  for (const auto& binding : bindings) {
+    total += prog.EvalBinding(binding, x_val)(0);
+  }
+  EXPECT_NEAR(total, 0.5 * x_val.dot(Q * x_val) + b.dot(x_val) + 0.5, 1e-9);
+
+  // A banded Q that is exactly diagonally dominant, but whose remainders are
+  // not exactly zero in floating point (e.g., 0.3 - 0.1 - 0.2 < 0), is split
+  // into convex costs.
+  std::vector<Eigen::Triplet<double>> weighted_triplets;
+  for (int i = 0; i + 1 < n; ++i) {
+    const double w = (i % 2 == 0) ? 0.1 : 0.2;
+    weighted_triplets.emplace_back(i, i + 1, -w);
+    weighted_triplets.emplace_back(i + 1, i, -w);
+  }
+  for (int i = 0; i < n; ++i) {
+    const double w_prev = (i == 0) ? 0.0 : ((i - 1) % 2 == 0 ? 0.1 : 0.2);
+    const double w_next = (i + 1 == n) ? 0.0 : (i % 2 == 0 ? 0.1 : 0.2);
+    const double diagonal = (i == 0 || i + 1 == n) ? w_prev + w_next : 0.3;
+    weighted_triplets.emplace_back(i, i, diagonal);
+  }
+  Eigen::SparseMatrix<double> Q_weighted(n, n);
+  Q_weighted.setFromTriplets(weighted_triplets.begin(),
+                             weighted_triplets.end());
+  ASSERT_LT(0.3 - 0.1 - 0.2, 0.0);
+  const auto weighted_bindings =
+      prog.AddSparseQuadraticCost(Q_weighted, b, 0, x);
+  ASSERT_EQ(ssize(weighted_bindings), n - 1);
+  double weighted_total = 0;
+  for (const auto& binding : weighted_bindings) {
+    EXPECT_TRUE(binding.evaluator()->is_convex());
+    EXPECT_GE(binding.evaluator()->Q().diagonal().minCoeff(), 0.0);
+    weighted_total += prog.EvalBinding(binding, x_val)(0);
+  }
+  EXPECT_NEAR(weighted_total,
+              0.5 * x_val.dot(Q_weighted * x_val) + b.dot(x_val), 1e-9);
+
+  // A banded Q that is not diagonally dominant is rejected.
+  Eigen::SparseMatrix<double> Q_bad = Q;
+  Q_bad.coeffRef(n / 2, n / 2) = 1.0;
+  DRAKE_EXPECT_THROWS_MESSAGE(prog.AddSparseQuadraticCost(Q_bad, b, 0, x),
+                              ".*couple 200 variables.*not diagonally "
+                              "dominant.*row 100.*");
+}
+
 void CheckAddedSymbolicQuadraticCostUserFun(const MathematicalProgram& prog,
                                             const Expression& e,
                                             const Binding<Cost>& binding,
@@ -380,6 +380,66 @@ GTEST_TEST(OsqpSolverTest, WarmStartPrimalOnly) {
   }
 }
 
+GTEST_TEST(OsqpSolverTest, ReuseSetup) {
+  OsqpSolver osqp_solver;
+  if (!osqp_solver.available()) {
+    return;
+  }
+  MathematicalProgram prog;
+  auto x = prog.NewContinuousVariables<2>();
+  auto cost = prog.AddQuadraticErrorCost(Eigen::Matrix2d::Identity(),
+                                         Eigen::Vector2d(1, 2), x);
+  auto bounds = prog.AddBoundingBoxConstraint(-1, 1, x);
+  prog.AddLinearConstraint(x(0) + x(1) <= 1.5);
+
+  EXPECT_FALSE(osqp_solver.reuse_setup());
+  osqp_solver.set_reuse_setup(true);
+  EXPECT_TRUE(osqp_solver.reuse_setup());
+  MathematicalProgramResult result;
+  osqp_solver.Solve(prog, {}, {}, &result);
+  EXPECT_TRUE(result.is_success());
+  EXPECT_FALSE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 1);
+
+  // Changing the coefficients and bounds in place reuses the setup, and gives
+  // the same solution as a fresh solver.
+  cost.evaluator()->UpdateCoefficients(2 * Eigen::Matrix2d::Identity(),
+                                       Eigen::Vector2d(-1, 0.5));
+  bounds.evaluator()->set_bounds(Eigen::Vector2d(-2, -2),
+                                 Eigen::Vector2d(0.25, 2));
+  osqp_solver.Solve(prog, {}, {}, &result);
+  EXPECT_TRUE(result.is_success());
+  EXPECT_TRUE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 1);
+  MathematicalProgramResult expected;
+  OsqpSolver().Solve(prog, {}, {}, &expected);
+  EXPECT_TRUE(CompareMatrices(result.get_x_val(), expected.get_x_val(), 1e-5));
+  EXPECT_NEAR(result.get_optimal_cost(), expected.get_optimal_cost(), 1e-5);
+
+  // Changing the options sets up again.
+  SolverOptions solver_options;
+  solver_options.SetOption(osqp_solver.solver_id(), "eps_abs", 1e-6);
+  osqp_solver.Solve(prog, {}, solver_options, &result);
+  EXPECT_FALSE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 2);
+
+  // Changing the program's structure sets up again.
+  prog.AddLinearConstraint(x(0) - x(1) <= 0.5);
+  osqp_solver.Solve(prog, {}, solver_options, &result);
+  EXPECT_TRUE(result.is_success());
+  EXPECT_FALSE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 3);
+  osqp_solver.Solve(prog, {}, solver_options, &result);
+  EXPECT_TRUE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 3);
+
+  // Without reuse, every solve sets up.
+  osqp_solver.set_reuse_setup(false);
+  osqp_solver.Solve(prog, {}, solver_options, &result);
+  EXPECT_FALSE(result.get_solver_details<OsqpSolver>().reused_setup);
+  EXPECT_EQ(osqp_solver.num_setups(), 4);
+}
+
 /* Tests the solver's processing of the verbosity options. With multiple ways
  to request verbosity (common options and solver-specific options), we simply
  apply a smoke test that none of the means causes runtime errors. Note, we
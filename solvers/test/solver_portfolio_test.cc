@@ -0,0 +1,134 @@
+#include "drake/solvers/solver_portfolio.h"
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
+#include "drake/solvers/equality_constrained_qp_solver.h"
+#include "drake/solvers/linear_system_solver.h"
+#include "drake/solvers/nlopt_solver.h"
+
+namespace drake {
+namespace solvers {
+namespace {
+
+// min x'x s.t. x0 + x1 = 1, which only the EqualityConstrainedQPSolver (of
+// the two solvers used here) can solve.
+class SolverPortfolioTest : public ::testing::Test {
+ protected:
+  SolverPortfolioTest() {
+    x_ = prog_.NewContinuousVariables<2>();
+    prog_.AddQuadraticCost(x_(0) * x_(0) + x_(1) * x_(1));
+    prog_.AddLinearEqualityConstraint(x_(0) + x_(1) == 1);
+  }
+
+  MathematicalProgram prog_;
+  VectorX<symbolic::Variable> x_;
+};
+
+TEST_F(SolverPortfolioTest, Solve) {
+  SolverPortfolio dut({{LinearSystemSolver::id(), {}},
+                       {EqualityConstrainedQPSolver::id(), {}}});
+  ASSERT_EQ(dut.entries().size(), 2);
+
+  for (int i = 0; i < 2; ++i) {
+    const MathematicalProgramResult result = dut.Solve(prog_);
+    EXPECT_TRUE(result.is_success());
+    EXPECT_EQ(result.get_solver_id(), EqualityConstrainedQPSolver::id());
+    EXPECT_TRUE(CompareMatrices(result.GetSolution(x_),
+                                Eigen::Vector2d(0.5, 0.5), 1e-12));
+  }
+
+  // The LinearSystemSolver cannot solve a program with a cost. Its solve in
+  // the second race might still be finishing in the background, but the
+  // second race waited for the first race's solve to finish.
+  const std::vector<SolverPortfolio::Statistics> statistics = dut.statistics();
+  ASSERT_EQ(statistics.size(), 2);
+  EXPECT_EQ(statistics[0].num_solves, 2);
+  EXPECT_GE(statistics[0].num_finished, 1);
+  EXPECT_GE(statistics[0].num_errors, 1);
+  EXPECT_EQ(statistics[0].num_successes, 0);
+  EXPECT_EQ(statistics[0].num_wins, 0);
+  EXPECT_EQ(statistics[1].num_solves, 2);
+  EXPECT_EQ(statistics[1].num_finished, 2);
+  EXPECT_EQ(statistics[1].num_successes, 2);
+  EXPECT_EQ(statistics[1].num_errors, 0);
+  EXPECT_EQ(statistics[1].num_wins, 2);
+  EXPECT_GE(statistics[1].total_time, 0.0);
+}
+
+TEST_F(SolverPortfolioTest, Deadline) {
+  SolverPortfolio dut({{EqualityConstrainedQPSolver::id(), {}}});
+  // However short the deadline, the portfolio waits for one result.
+  const MathematicalProgramResult result =
+      dut.Solve(prog_, Eigen::Vector2d(1, 0), 0.0);
+  EXPECT_TRUE(result.is_success());
+  EXPECT_EQ(dut.statistics()[0].num_wins, 1);
+}
+
+TEST_F(SolverPortfolioTest, AllErrors) {
+  SolverPortfolio dut({{LinearSystemSolver::id(), {}}});
+  DRAKE_EXPECT_THROWS_MESSAGE(dut.Solve(prog_),
+                              ".*LinearSystemSolver is unable to solve.*");
+  const std::vector<SolverPortfolio::Statistics> statistics = dut.statistics();
+  EXPECT_EQ(statistics[0].num_finished, 1);
+  EXPECT_EQ(statistics[0].num_errors, 1);
+  EXPECT_EQ(statistics[0].num_wins, 0);
+}
+
+TEST_F(SolverPortfolioTest, NotThreadSafe) {
+  // A program with a cost that is not thread safe (as evaluators are, by
+  // default) is solved by one solver at a time.
+  class UnsafeCost final : public Cost {
+   public:
+    UnsafeCost() : Cost(2) {}
+
+   private:
+    void DoEval(const Eigen::Ref<const Eigen::VectorXd>& x,
+                Eigen::VectorXd* y) const final {
+      *y = Vector1d(x.squaredNorm());
+    }
+    void DoEval(const Eigen::Ref<const AutoDiffVecXd>& x,
+                AutoDiffVecXd* y) const final {
+      *y = Vector1<AutoDiffXd>(x.squaredNorm());
+    }
+    void DoEval(const Eigen::Ref<const VectorX<symbolic::Variable>>& x,
+                VectorX<symbolic::Expression>* y) const final {
+      *y = Vector1<symbolic::Expression>(
+          x.cast<symbolic::Expression>().squaredNorm());
+    }
+  };
+  MathematicalProgram prog;
+  auto x = prog.NewContinuousVariables<2>();
+  prog.AddCost(std::make_shared<UnsafeCost>(), x);
+  ASSERT_FALSE(prog.IsThreadSafe());
+
+  SolverPortfolio dut({{LinearSystemSolver::id(), {}},
+                       {EqualityConstrainedQPSolver::id(), {}}});
+  // Neither solver accepts a generic cost, so the second one is tried after
+  // the first one throws.
+  EXPECT_THROW(dut.Solve(prog), std::exception);
+  const std::vector<SolverPortfolio::Statistics> statistics = dut.statistics();
+  EXPECT_EQ(statistics[0].num_errors, 1);
+  EXPECT_EQ(statistics[1].num_errors, 1);
+
+  // When a solver succeeds, the ones after it are not started.
+  if (NloptSolver::is_available()) {
+    SolverPortfolio nlopt_first(
+        {{NloptSolver::id(), {}}, {LinearSystemSolver::id(), {}}});
+    const MathematicalProgramResult result =
+        nlopt_first.Solve(prog, Eigen::Vector2d(1, 1));
+    EXPECT_TRUE(result.is_success());
+    EXPECT_EQ(result.get_solver_id(), NloptSolver::id());
+    EXPECT_EQ(nlopt_first.statistics()[0].num_solves, 1);
+    EXPECT_EQ(nlopt_first.statistics()[1].num_solves, 0);
+  }
+}
+
+GTEST_TEST(SolverPortfolioConstructorTest, Empty) {
+  EXPECT_THROW(SolverPortfolio({}), std::exception);
+}
+
+}  // namespace
+}  // namespace solvers
+}  // namespace drake
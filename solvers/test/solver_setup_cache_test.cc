@@ -0,0 +1,110 @@
+#include "drake/solvers/solver_setup_cache.h"
+
+#include <limits>
+
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/solvers/choose_best_solver.h"
+#include "drake/solvers/equality_constrained_qp_solver.h"
+#include "drake/solvers/linear_system_solver.h"
+#include "drake/solvers/osqp_solver.h"
+
+namespace drake {
+namespace solvers {
+namespace {
+
+// Returns the program min (x - c)'(x - c) s.t. x0 + x1 = b, optionally with an
+// inequality x0 ≥ 0.
+std::unique_ptr<MathematicalProgram> MakeProgram(const Eigen::Vector2d& c,
+                                                 double b, bool inequality) {
+  auto prog = std::make_unique<MathematicalProgram>();
+  auto x = prog->NewContinuousVariables<2>();
+  prog->AddQuadraticErrorCost(Eigen::Matrix2d::Identity(), c, x);
+  prog->AddLinearEqualityConstraint(Eigen::RowVector2d(1, 1), b, x);
+  if (inequality) {
+    prog->AddLinearConstraint(Eigen::RowVector2d(1, 0), 0,
+                              std::numeric_limits<double>::infinity(), x);
+  }
+  return prog;
+}
+
+GTEST_TEST(ProgramFingerprintTest, Structure) {
+  const auto prog = MakeProgram(Eigen::Vector2d(1, 2), 3, false);
+  // The data of a program is not part of its fingerprint.
+  EXPECT_EQ(ProgramFingerprint(*prog),
+            ProgramFingerprint(*MakeProgram(Eigen::Vector2d(4, 5), 6, false)));
+  EXPECT_EQ(DefaultHash{}(ProgramFingerprint(*prog)),
+            DefaultHash{}(ProgramFingerprint(
+                *MakeProgram(Eigen::Vector2d(4, 5), 6, false))));
+
+  // The kinds of constraints are.
+  EXPECT_FALSE(
+      ProgramFingerprint(*prog) ==
+      ProgramFingerprint(*MakeProgram(Eigen::Vector2d(1, 2), 3, true)));
+
+  // So are the variables they're bound to, and the sparsity of their data.
+  MathematicalProgram other;
+  auto x = other.NewContinuousVariables<2>();
+  other.AddQuadraticErrorCost(Eigen::Matrix2d::Identity(),
+                              Eigen::Vector2d(1, 2), x);
+  other.AddLinearEqualityConstraint(Eigen::RowVector2d(1, 0), 3, x);
+  EXPECT_FALSE(ProgramFingerprint(*prog) == ProgramFingerprint(other));
+}
+
+GTEST_TEST(SolverSetupCacheTest, Solve) {
+  SolverSetupCache dut;
+  EXPECT_EQ(dut.hit_rate(), 0.0);
+  for (int i = 0; i < 4; ++i) {
+    const auto prog = MakeProgram(Eigen::Vector2d(i, 0), 1, false);
+    const MathematicalProgramResult result = dut.Solve(*prog);
+    EXPECT_TRUE(result.is_success());
+    EXPECT_EQ(result.get_solver_id(), EqualityConstrainedQPSolver::id());
+    // The optimum is x = c + (b - c0 - c1) / 2.
+    const double shift = (1.0 - i) / 2;
+    EXPECT_TRUE(CompareMatrices(result.get_x_val(),
+                                Eigen::Vector2d(i + shift, shift), 1e-10));
+  }
+  EXPECT_EQ(dut.num_misses(), 1);
+  EXPECT_EQ(dut.num_hits(), 3);
+  EXPECT_EQ(dut.hit_rate(), 0.75);
+  EXPECT_EQ(dut.size(), 1);
+
+  // A program with another structure needs another solver.
+  MathematicalProgram linear_system;
+  auto x = linear_system.NewContinuousVariables<2>();
+  linear_system.AddLinearEqualityConstraint(Eigen::Matrix2d::Identity(),
+                                            Eigen::Vector2d(1, 2), x);
+  MathematicalProgramResult result;
+  dut.Solve(linear_system, std::nullopt, std::nullopt, &result);
+  EXPECT_EQ(result.get_solver_id(), LinearSystemSolver::id());
+  EXPECT_EQ(dut.num_misses(), 2);
+  EXPECT_EQ(dut.size(), 2);
+
+  dut.Clear();
+  EXPECT_EQ(dut.size(), 0);
+  EXPECT_EQ(dut.num_hits(), 0);
+  EXPECT_EQ(dut.num_misses(), 0);
+}
+
+GTEST_TEST(SolverSetupCacheTest, ReuseOsqpSetup) {
+  const auto first = MakeProgram(Eigen::Vector2d(1, 2), 3, true);
+  if (ChooseBestSolver(*first) != OsqpSolver::id()) {
+    return;
+  }
+  for (const bool reuse : {false, true}) {
+    SolverSetupCache dut(reuse);
+    for (int i = 0; i < 3; ++i) {
+      const auto prog = MakeProgram(Eigen::Vector2d(1 + i, 2), 3, true);
+      const MathematicalProgramResult result = dut.Solve(*prog);
+      ASSERT_TRUE(result.is_success());
+      EXPECT_EQ(result.get_solver_details<OsqpSolver>().reused_setup,
+                reuse && i > 0);
+    }
+    EXPECT_EQ(dut.num_hits(), 2);
+  }
+}
+
+}  // namespace
+}  // namespace solvers
+}  // namespace drake
@@ -0,0 +1,57 @@
+#include "drake/systems/analysis/realtime_step_statistics.h"
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+#include "drake/common/drake_throw.h"
+
+namespace drake {
+namespace systems {
+
+DurationHistogram::DurationHistogram() : bin_counts_(kNumBins, 0) {}
+
+double DurationHistogram::bin_upper_edge(int i) {
+  DRAKE_THROW_UNLESS(0 <= i && i < kNumBins);
+  if (i == kNumBins - 1) {
+    return std::numeric_limits<double>::infinity();
+  }
+  return std::ldexp(1e-6, i);
+}
+
+void DurationHistogram::Add(double seconds) {
+  seconds = std::max(seconds, 0.0);
+  int bin = 0;
+  while (bin < kNumBins - 1 && seconds >= bin_upper_edge(bin)) {
+    ++bin;
+  }
+  ++bin_counts_[bin];
+  ++count_;
+  sum_ += seconds;
+  max_ = std::max(max_, seconds);
+}
+
+void DurationHistogram::Clear() {
+  *this = DurationHistogram();
+}
+
+double DurationHistogram::Quantile(double q) const {
+  DRAKE_THROW_UNLESS(0 <= q && q <= 1);
+  if (count_ == 0) {
+    return 0.0;
+  }
+  // The number of samples at or below the quantile.
+  const int64_t rank =
+      std::max<int64_t>(1, static_cast<int64_t>(std::ceil(q * count_)));
+  int64_t cumulative = 0;
+  for (int i = 0; i < kNumBins; ++i) {
+    cumulative += bin_counts_[i];
+    if (cumulative >= rank) {
+      return std::min(bin_upper_edge(i), max_);
+    }
+  }
+  return max_;
+}
+
+}  // namespace systems
+}  // namespace drake
@@ -0,0 +1,117 @@
+#pragma once
+
+#include <cstdint>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+
+namespace drake {
+namespace systems {
+
+/// A histogram of durations, in seconds, whose bins are spaced
+/// logarithmically. The upper edge of bin 0 is one microsecond, each following
+/// bin's upper edge is twice the previous one, and the last bin (above about 17
+/// seconds) is unbounded.
+class DurationHistogram {
+ public:
+  DRAKE_DEFAULT_COPY_AND_MOVE_AND_ASSIGN(DurationHistogram);
+
+  /// The number of bins.
+  static constexpr int kNumBins = 26;
+
+  /// Constructs an empty histogram.
+  DurationHistogram();
+
+  /// Returns the upper edge of bin `i`, in seconds (infinity for the last
+  /// bin).
+  /// @pre 0 <= i < kNumBins
+  static double bin_upper_edge(int i);
+
+  /// Adds one sample. Negative durations are counted as zero.
+  void Add(double seconds);
+
+  /// Removes all of the samples.
+  void Clear();
+
+  /// Returns the number of samples.
+  int64_t count() const { return count_; }
+
+  /// Returns the mean of the samples, or zero if there are none.
+  double mean() const { return count_ > 0 ? sum_ / count_ : 0.0; }
+
+  /// Returns the largest sample, or zero if there are none.
+  double max() const { return max_; }
+
+  /// Returns an upper bound on the `q`'th quantile of the samples, i.e., the
+  /// upper edge of the bin that contains that quantile (but no more than
+  /// max()), or zero if there are no samples.
+  /// @pre 0 <= q <= 1
+  double Quantile(double q) const;
+
+  /// Returns the number of samples in each bin.
+  const std::vector<int64_t>& bin_counts() const { return bin_counts_; }
+
+ private:
+  std::vector<int64_t> bin_counts_;
+  int64_t count_{0};
+  double sum_{0.0};
+  double max_{0.0};
+};
+
+/// The wall-clock time spent in each phase of the Simulator's steps, in
+/// seconds.
+struct RealtimeStepPhaseTimes {
+  /// Handling unrestricted update events.
+  double unrestricted_update{};
+  /// Handling discrete update events.
+  double discrete_update{};
+  /// Finding the next timed events, and integrating the continuous state
+  /// (including witness function isolation).
+  double integration{};
+  /// Handling publish events, and calling the monitor.
+  double publish{};
+
+  /// Returns the sum of all of the phases.
+  double total() const {
+    return unrestricted_update + discrete_update + integration + publish;
+  }
+};
+
+/// Statistics of how well a Simulator kept up with its target realtime rate,
+/// step by step; see Simulator::get_realtime_step_statistics().
+///
+/// Each step of the simulator is scheduled to start at the wall-clock time
+/// that corresponds to the simulated time at its start, given the target
+/// realtime rate. Its *deadline* is the wall-clock time that corresponds to the
+/// simulated time at its end, i.e., the scheduled start of the next step. A
+/// step that finishes after its deadline has *missed* it, and delays the
+/// following steps. (Steps that do not advance the simulated time have no
+/// deadline.)
+struct RealtimeStepStatistics {
+  /// The number of steps that were paced.
+  int64_t num_steps{};
+
+  /// The number of steps that finished after their deadline.
+  int64_t num_deadline_misses{};
+
+  /// How long after its scheduled time each step started (the jitter of the
+  /// pacing).
+  DurationHistogram start_jitter;
+
+  /// How long each step took, excluding the time spent pacing.
+  DurationHistogram step_latency;
+
+  /// For each missed deadline, how long after it the step finished.
+  DurationHistogram lateness;
+
+  /// The time spent in each phase over all of the steps.
+  RealtimeStepPhaseTimes phase_times;
+
+  /// The time spent in each phase over the steps that missed their deadline,
+  /// which attributes the overruns to the kinds of event handlers (and to the
+  /// integrator) that caused them.
+  RealtimeStepPhaseTimes missed_phase_times;
+};
+
+}  // namespace systems
+}  // namespace drake
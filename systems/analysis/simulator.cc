@@ -334,6 +334,19 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
     // Delay to match target realtime rate if requested and possible.
     PauseIfTooFast();
 
+    // While pacing, time the phases of the step for the realtime statistics.
+    const bool pacing = target_realtime_rate_ > 0;
+    const TimePoint step_start_realtime = pacing ? Clock::now() : TimePoint{};
+    TimePoint phase_start_realtime = step_start_realtime;
+    RealtimeStepPhaseTimes step_phase_times;
+    auto finish_phase = [&](double* phase_time) {
+      if (pacing) {
+        const TimePoint now = Clock::now();
+        *phase_time += (now - phase_start_realtime).count();
+        phase_start_realtime = now;
+      }
+    };
+
     // The general policy here is to do actions in decreasing order of
     // "violence" to the state, i.e. unrestricted -> discrete -> continuous ->
     // publish. The "timed" actions happen before the "per step" ones.
@@ -346,6 +359,7 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
     // Do unrestricted updates first.
     EventStatus accumulated_event_status = HandleUnrestrictedUpdate(
         merged_events_->get_unrestricted_update_events());
+    finish_phase(&step_phase_times.unrestricted_update);
     if (HasEventFailureOrMaybeThrow(accumulated_event_status,
                                     true /*throw on failure*/,
                                     &simulator_status)) {
@@ -355,6 +369,7 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
     // Do restricted (discrete variable) updates next.
     accumulated_event_status.KeepMoreSevere(
         HandleDiscreteUpdate(merged_events_->get_discrete_update_events()));
+    finish_phase(&step_phase_times.discrete_update);
     if (HasEventFailureOrMaybeThrow(accumulated_event_status,
                                     true /*throw on failure*/,
                                     &simulator_status)) {
@@ -408,6 +423,8 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
           IntegrateContinuousState(next_publish_time, next_update_time,
                                    boundary_time, witnessed_events_.get());
 
+      finish_phase(&step_phase_times.integration);
+
       // Update the number of simulation steps taken.
       ++num_steps_taken_;
 
@@ -435,6 +452,7 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
       // Diagram-level Publish event so we handle it similarly.
       if (get_monitor())
         accumulated_event_status.KeepMoreSevere(get_monitor()(*context_));
+      finish_phase(&step_phase_times.publish);
 
       // If any of the publish event handlers failed, stop now.
       if (HasEventFailureOrMaybeThrow(accumulated_event_status,
@@ -444,6 +462,11 @@ SimulatorStatus Simulator<T>::AdvanceTo(const T& boundary_time) {
       }
     }
 
+    if (pacing) {
+      RecordRealtimeStep(ExtractDoubleOrThrow(step_start_time),
+                         step_start_realtime, step_phase_times);
+    }
+
     // Allow for interrupt in Python.
     if (python_monitor_ != nullptr) python_monitor_();
 
@@ -853,17 +876,55 @@ Simulator<T>::IntegrateContinuousState(
   DRAKE_UNREACHABLE();
 }
 
+template <typename T>
+typename Simulator<T>::TimePoint Simulator<T>::GetDesiredRealtime(
+    double simtime) const {
+  const double simtime_passed = simtime - initial_simtime_;
+  return initial_realtime_ + Duration(simtime_passed / target_realtime_rate_);
+}
+
 template <typename T>
 void Simulator<T>::PauseIfTooFast() const {
   if (target_realtime_rate_ <= 0) return;  // Run at full speed.
-  const double simtime_now = ExtractDoubleOrThrow(get_context().get_time());
-  const double simtime_passed = simtime_now - initial_simtime_;
   const TimePoint desired_realtime =
-      initial_realtime_ + Duration(simtime_passed / target_realtime_rate_);
-  // TODO(sherm1): Could add some slop to now() and not sleep if
-  // we are already close enough. But what is a reasonable value?
-  if (desired_realtime > Clock::now())
-    std::this_thread::sleep_until(desired_realtime);
+      GetDesiredRealtime(ExtractDoubleOrThrow(get_context().get_time()));
+  // Sleep until shortly before the desired time (the sleep itself tends to
+  // overshoot), and then busy wait for the rest.
+  const TimePoint sleep_until =
+      desired_realtime - Duration(realtime_busy_wait_time_);
+  if (sleep_until > Clock::now()) std::this_thread::sleep_until(sleep_until);
+  while (Clock::now() < desired_realtime) {
+  }
+}
+
+template <typename T>
+void Simulator<T>::RecordRealtimeStep(
+    double start_simtime, TimePoint start_realtime,
+    const RealtimeStepPhaseTimes& phase_times) {
+  const TimePoint end_realtime = Clock::now();
+  const double end_simtime = ExtractDoubleOrThrow(context_->get_time());
+  RealtimeStepStatistics& stats = realtime_step_statistics_;
+  ++stats.num_steps;
+  stats.start_jitter.Add(
+      (start_realtime - GetDesiredRealtime(start_simtime)).count());
+  stats.step_latency.Add((end_realtime - start_realtime).count());
+  auto accumulate = [&phase_times](RealtimeStepPhaseTimes* total) {
+    total->unrestricted_update += phase_times.unrestricted_update;
+    total->discrete_update += phase_times.discrete_update;
+    total->integration += phase_times.integration;
+    total->publish += phase_times.publish;
+  };
+  accumulate(&stats.phase_times);
+  // A step that doesn't advance time has no deadline.
+  if (end_simtime > start_simtime) {
+    const double lateness =
+        (end_realtime - GetDesiredRealtime(end_simtime)).count();
+    if (lateness > 0) {
+      ++stats.num_deadline_misses;
+      stats.lateness.Add(lateness);
+      accumulate(&stats.missed_phase_times);
+    }
+  }
 }
 
 template <typename T>
@@ -891,6 +952,8 @@ void Simulator<T>::ResetStatistics() {
   num_unrestricted_updates_ = 0;
   num_publishes_ = 0;
 
+  realtime_step_statistics_ = {};
+
   initial_simtime_ = ExtractDoubleOrThrow(get_context().get_time());
   initial_realtime_ = Clock::now();
 }
@@ -16,6 +16,7 @@
 #include "drake/common/extract_double.h"
 #include "drake/common/name_value.h"
 #include "drake/systems/analysis/integrator_base.h"
+#include "drake/systems/analysis/realtime_step_statistics.h"
 #include "drake/systems/analysis/simulator_config.h"
 #include "drake/systems/analysis/simulator_status.h"
 #include "drake/systems/framework/context.h"
@@ -513,6 +514,9 @@ class Simulator {
   /// integration accuracy, using a faster integration method or fixed time
   /// step, or using a simpler model.
   ///
+  /// To tighten the pacing, see set_realtime_busy_wait_time(). To find out how
+  /// closely each step tracked real time, see get_realtime_step_statistics().
+  ///
   /// @param realtime_rate
   ///   Desired rate relative to real time. Set to 1 to track real time, 2 to
   ///   run twice as fast as real time, 0.5 for half speed, etc. Zero or
@@ -527,6 +531,34 @@ class Simulator {
   /// target with set_target_realtime_rate().
   double get_target_realtime_rate() const { return target_realtime_rate_; }
 
+  /// Sets how long (in seconds) the %Simulator busy waits at the end of each
+  /// pause to track its target realtime rate, instead of sleeping. A thread
+  /// that sleeps typically wakes up late, by up to the granularity of the
+  /// operating system's scheduler; so for tighter pacing (at the cost of a
+  /// busy core), the %Simulator can sleep until this long before a step is due,
+  /// and then busy wait for the rest. Zero (the default) sleeps for the
+  /// whole pause. Negative values are treated as zero.
+  /// @see set_target_realtime_rate(), get_realtime_step_statistics()
+  void set_realtime_busy_wait_time(double busy_wait_time) {
+    realtime_busy_wait_time_ = std::max(busy_wait_time, 0.);
+  }
+
+  /// Returns how long the %Simulator busy waits at the end of each pause; see
+  /// set_realtime_busy_wait_time().
+  double get_realtime_busy_wait_time() const {
+    return realtime_busy_wait_time_;
+  }
+
+  /// Returns the step-by-step statistics of how well the %Simulator has kept
+  /// up with its target realtime rate (the jitter and latency of its steps, and
+  /// the deadlines that they missed) since the last Initialize() or
+  /// ResetStatistics() call. The statistics are only recorded while the target
+  /// realtime rate is positive.
+  /// @see set_target_realtime_rate(), PrintSimulatorStatistics()
+  const RealtimeStepStatistics& get_realtime_step_statistics() const {
+    return realtime_step_statistics_;
+  }
+
   /// Return the rate that simulated time has progressed relative to real time.
   /// A return of 1 means the simulation just matched real
   /// time, 2 means the simulation was twice as fast as real time, 0.5 means
@@ -789,10 +821,19 @@ class Simulator {
   using Duration = std::chrono::duration<double>;
   using TimePoint = std::chrono::time_point<Clock, Duration>;
 
+  // Returns the real time that corresponds to the given simulated time, given
+  // the target realtime rate.
+  TimePoint GetDesiredRealtime(double simtime) const;
+
   // If the simulated time in the context is ahead of real time, pause long
   // enough to let real time catch up (approximately).
   void PauseIfTooFast() const;
 
+  // Records the realtime statistics of a step that started at the given
+  // simulated and real times, and has just finished.
+  void RecordRealtimeStep(double start_simtime, TimePoint start_realtime,
+                          const RealtimeStepPhaseTimes& phase_times);
+
   // A pointer to the integrator.
   std::unique_ptr<IntegratorBase<T>> integrator_;
 
@@ -838,6 +879,13 @@ class Simulator {
   // Slow down to this rate if possible (user settable).
   double target_realtime_rate_{SimulatorConfig{}.target_realtime_rate};
 
+  // The last part of each pause to busy wait instead of sleeping (user
+  // settable).
+  double realtime_busy_wait_time_{0.0};
+
+  // The statistics of the steps paced since the last statistics reset.
+  RealtimeStepStatistics realtime_step_statistics_;
+
   // These are recorded at initialization or statistics reset.
   double initial_simtime_{nan()};  // Simulated time at start of period.
   TimePoint initial_realtime_;     // Real time at start of period.
@@ -51,6 +51,34 @@ void PrintSimulatorStatistics(const Simulator<T>& simulator) {
   fmt::print("Number of \"unrestricted\" updates = {:d}\n",
              simulator.get_num_unrestricted_updates());
 
+  const RealtimeStepStatistics& realtime =
+      simulator.get_realtime_step_statistics();
+  if (realtime.num_steps > 0) {
+    // Print the pacing statistics, in microseconds.
+    auto print_histogram = [](const char* name,
+                              const DurationHistogram& histogram) {
+      fmt::print("{} (mean, p99, max) = {:.1f}, {:.1f}, {:.1f} us\n", name,
+                 histogram.mean() * 1e6, histogram.Quantile(0.99) * 1e6,
+                 histogram.max() * 1e6);
+    };
+    fmt::print("\nStats for pacing to the target realtime rate of {}:\n",
+               simulator.get_target_realtime_rate());
+    fmt::print("Number of paced steps = {:d}\n", realtime.num_steps);
+    fmt::print("Number of missed deadlines = {:d}\n",
+               realtime.num_deadline_misses);
+    print_histogram("Step latency", realtime.step_latency);
+    print_histogram("Step start jitter", realtime.start_jitter);
+    if (realtime.num_deadline_misses > 0) {
+      print_histogram("Lateness of missed deadlines", realtime.lateness);
+      const RealtimeStepPhaseTimes& missed = realtime.missed_phase_times;
+      fmt::print(
+          "Time in missed steps (unrestricted, discrete, integration, "
+          "publish) = {:.6g}, {:.6g}, {:.6g}, {:.6g} s\n",
+          missed.unrestricted_update, missed.discrete_update,
+          missed.integration, missed.publish);
+    }
+  }
+
   if (integrator.get_num_steps_taken() == 0) {
     fmt::print(
         "\nNote: the following integrator took zero steps. The "
@@ -0,0 +1,73 @@
+#include "drake/systems/analysis/realtime_step_statistics.h"
+
+#include <limits>
+
+#include <gtest/gtest.h>
+
+namespace drake {
+namespace systems {
+namespace {
+
+GTEST_TEST(DurationHistogramTest, Empty) {
+  const DurationHistogram dut;
+  EXPECT_EQ(dut.count(), 0);
+  EXPECT_EQ(dut.mean(), 0.0);
+  EXPECT_EQ(dut.max(), 0.0);
+  EXPECT_EQ(dut.Quantile(0.99), 0.0);
+  EXPECT_EQ(dut.bin_counts().size(), DurationHistogram::kNumBins);
+}
+
+GTEST_TEST(DurationHistogramTest, BinEdges) {
+  EXPECT_EQ(DurationHistogram::bin_upper_edge(0), 1e-6);
+  EXPECT_EQ(DurationHistogram::bin_upper_edge(1), 2e-6);
+  EXPECT_EQ(DurationHistogram::bin_upper_edge(10), 1024e-6);
+  EXPECT_EQ(DurationHistogram::bin_upper_edge(DurationHistogram::kNumBins - 1),
+            std::numeric_limits<double>::infinity());
+  EXPECT_THROW(DurationHistogram::bin_upper_edge(-1), std::exception);
+  EXPECT_THROW(DurationHistogram::bin_upper_edge(DurationHistogram::kNumBins),
+               std::exception);
+}
+
+GTEST_TEST(DurationHistogramTest, Add) {
+  DurationHistogram dut;
+  // 98 samples of 0.5 µs, one of 3 µs, and one of 100 s.
+  for (int i = 0; i < 98; ++i) {
+    dut.Add(0.5e-6);
+  }
+  dut.Add(3e-6);
+  dut.Add(100.0);
+  EXPECT_EQ(dut.count(), 100);
+  EXPECT_EQ(dut.max(), 100.0);
+  EXPECT_NEAR(dut.mean(), (98 * 0.5e-6 + 3e-6 + 100.0) / 100, 1e-15);
+  EXPECT_EQ(dut.bin_counts()[0], 98);
+  EXPECT_EQ(dut.bin_counts()[2], 1);
+  EXPECT_EQ(dut.bin_counts()[DurationHistogram::kNumBins - 1], 1);
+
+  // Quantiles are reported as the upper edge of their bin, capped at max().
+  EXPECT_EQ(dut.Quantile(0.0), 1e-6);
+  EXPECT_EQ(dut.Quantile(0.5), 1e-6);
+  EXPECT_EQ(dut.Quantile(0.99), 4e-6);
+  EXPECT_EQ(dut.Quantile(1.0), 100.0);
+  EXPECT_THROW(dut.Quantile(1.5), std::exception);
+
+  // Negative durations count as zero.
+  dut.Add(-1.0);
+  EXPECT_EQ(dut.bin_counts()[0], 99);
+
+  dut.Clear();
+  EXPECT_EQ(dut.count(), 0);
+  EXPECT_EQ(dut.max(), 0.0);
+  EXPECT_EQ(dut.bin_counts()[0], 0);
+}
+
+GTEST_TEST(RealtimeStepPhaseTimesTest, Total) {
+  const RealtimeStepPhaseTimes dut{.unrestricted_update = 1.0,
+                                   .discrete_update = 2.0,
+                                   .integration = 3.0,
+                                   .publish = 4.0};
+  EXPECT_EQ(dut.total(), 10.0);
+}
+
+}  // namespace
+}  // namespace systems
+}  // namespace drake
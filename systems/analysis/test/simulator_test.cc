@@ -1,5 +1,6 @@
 #include "drake/systems/analysis/simulator.h"
 
+#include <chrono>
 #include <cmath>
 #include <complex>
 #include <functional>
@@ -8,6 +9,7 @@
 #include <map>
 #include <memory>
 #include <string>
+#include <thread>
 #include <tuple>
 #include <utility>
 #include <vector>
@@ -1009,6 +1011,51 @@ GTEST_TEST(SimulatorTest, RealtimeRate) {
   EXPECT_TRUE(simulator.get_actual_realtime_rate() <= 5.1);
 }
 
+// Checks the step statistics that are recorded while pacing to real time.
+GTEST_TEST(SimulatorTest, RealtimeStepStatistics) {
+  analysis_test::MySpringMassSystem<double> spring_mass(1.0, 1.0, 0.0);
+  Simulator<double> simulator(spring_mass);
+  simulator.get_mutable_integrator().set_maximum_step_size(0.001);
+  EXPECT_EQ(simulator.get_realtime_busy_wait_time(), 0.0);
+  simulator.set_realtime_busy_wait_time(-1.0);
+  EXPECT_EQ(simulator.get_realtime_busy_wait_time(), 0.0);
+  simulator.set_realtime_busy_wait_time(1e-4);
+  EXPECT_EQ(simulator.get_realtime_busy_wait_time(), 1e-4);
+
+  // Nothing is recorded at full speed.
+  simulator.Initialize();
+  simulator.AdvanceTo(0.01);
+  EXPECT_EQ(simulator.get_realtime_step_statistics().num_steps, 0);
+
+  // A monitor that stalls one step makes it miss its deadline, and the
+  // overrun is attributed to the publish phase.
+  bool stalled = false;
+  simulator.set_monitor([&stalled](const Context<double>&) {
+    if (!stalled) {
+      std::this_thread::sleep_for(std::chrono::milliseconds(5));
+      stalled = true;
+    }
+    return EventStatus::Succeeded();
+  });
+  simulator.set_target_realtime_rate(1.0);
+  simulator.Initialize();
+  simulator.AdvanceTo(0.05);
+  const RealtimeStepStatistics& stats =
+      simulator.get_realtime_step_statistics();
+  EXPECT_GT(stats.num_steps, 0);
+  EXPECT_EQ(stats.step_latency.count(), stats.num_steps);
+  EXPECT_EQ(stats.start_jitter.count(), stats.num_steps);
+  EXPECT_GE(stats.num_deadline_misses, 1);
+  EXPECT_EQ(stats.lateness.count(), stats.num_deadline_misses);
+  EXPECT_GE(stats.step_latency.max(), 5e-3);
+  EXPECT_GE(stats.missed_phase_times.publish, 5e-3);
+  EXPECT_GE(stats.phase_times.total(), stats.missed_phase_times.total());
+
+  simulator.ResetStatistics();
+  EXPECT_EQ(simulator.get_realtime_step_statistics().num_steps, 0);
+  EXPECT_EQ(simulator.get_realtime_step_statistics().step_latency.count(), 0);
+}
+
 // Repeat the SpringMassNoSample test but now the continuous steps are
 // interrupted by a discrete sample every 1/30 second. The step size doesn't
 // divide that evenly so we should get some step size modification here.
@@ -47,9 +47,17 @@ void CacheEntry::Calc(const ContextBase& context, AbstractValue* value) const {
   DRAKE_ASSERT_VOID(owning_system_->ValidateContext(context));
   DRAKE_ASSERT_VOID(CheckValidAbstractValue(context, *value));
 
+  const internal::SystemProfileScope profile_scope(
+      owning_system_, SystemProfileKind::kCacheEntry, cache_index_,
+      &description_);
   value_producer_.Calc(context, value);
 }
 
+void CacheEntry::RecordProfiledEval(bool hit) const {
+  SystemProfiler::RecordCacheEval(owning_system_, cache_index_, description_,
+                                  hit);
+}
+
 void CacheEntry::CheckValidAbstractValue(const ContextBase& context,
                                          const AbstractValue& proposed) const {
   const CacheEntryValue& cache_value = get_cache_entry_value(context);
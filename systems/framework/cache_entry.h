@@ -10,6 +10,7 @@
 #include "drake/common/value.h"
 #include "drake/systems/framework/context_base.h"
 #include "drake/systems/framework/framework_common.h"
+#include "drake/systems/framework/system_profiler.h"
 #include "drake/systems/framework/value_producer.h"
 
 namespace drake {
@@ -149,7 +150,11 @@ class CacheEntry {
   // called *a lot*.
   const AbstractValue& EvalAbstract(const ContextBase& context) const {
     const CacheEntryValue& cache_value = get_cache_entry_value(context);
-    if (cache_value.needs_recomputation()) UpdateValue(context);
+    if (cache_value.needs_recomputation()) {
+      UpdateValue(context);
+    } else if (internal::active_system_profiler() != nullptr) [[unlikely]] {
+      RecordProfiledEval(/* hit = */ true);
+    }
     return cache_value.get_abstract_value();
   }
 
@@ -300,11 +305,17 @@ class CacheEntry {
     CacheEntryValue& mutable_cache_value =
         get_mutable_cache_entry_value(context);
     AbstractValue& value = mutable_cache_value.GetMutableAbstractValueOrThrow();
+    if (internal::active_system_profiler() != nullptr) [[unlikely]] {
+      RecordProfiledEval(/* hit = */ false);
+    }
     // If Calc() throws a recoverable exception, the cache remains out of date.
     Calc(context, &value);
     mutable_cache_value.mark_up_to_date();
   }
 
+  // Records an evaluation of this cache entry with the active SystemProfiler.
+  void RecordProfiledEval(bool hit) const;
+
   // The value was unexpectedly out of date. Issue a helpful message.
   void ThrowOutOfDate(const char* api) const {
     throw std::logic_error(FormatName(api) + "value out of date.");
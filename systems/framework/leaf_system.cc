@@ -6,6 +6,7 @@
 #include "absl/container/inlined_vector.h"
 
 #include "drake/common/pointer_cast.h"
+#include "drake/systems/framework/system_profiler.h"
 #include "drake/systems/framework/system_symbolic_inspector.h"
 #include "drake/systems/framework/value_checker.h"
 
@@ -812,6 +813,8 @@ EventStatus LeafSystem<T>::DispatchPublishHandler(
       dynamic_cast<const LeafEventCollection<PublishEvent<T>>&>(events);
   // This function shouldn't have been called if no publish events.
   DRAKE_DEMAND(leaf_events.HasEvents());
+  const internal::SystemProfileScope profile_scope(this,
+                                                   SystemProfileKind::kPublish);
 
   EventStatus overall_status = EventStatus::DidNothing();
   for (const PublishEvent<T>* event : leaf_events.get_events()) {
@@ -833,6 +836,8 @@ EventStatus LeafSystem<T>::DispatchDiscreteVariableUpdateHandler(
       dynamic_cast<const LeafEventCollection<DiscreteUpdateEvent<T>>&>(events);
   // This function shouldn't have been called if no discrete update events.
   DRAKE_DEMAND(leaf_events.HasEvents());
+  const internal::SystemProfileScope profile_scope(
+      this, SystemProfileKind::kDiscreteUpdate);
 
   // Must initialize the output argument with current discrete state contents.
   discrete_state->SetFrom(context.get_discrete_state());
@@ -868,6 +873,8 @@ EventStatus LeafSystem<T>::DispatchUnrestrictedUpdateHandler(
           events);
   // This function shouldn't have been called if no unrestricted update events.
   DRAKE_DEMAND(leaf_events.HasEvents());
+  const internal::SystemProfileScope profile_scope(
+      this, SystemProfileKind::kUnrestrictedUpdate);
 
   // Must initialize the output argument with current state contents.
   // TODO(sherm1) Shouldn't require preloading of the output state; better to
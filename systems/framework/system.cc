@@ -9,6 +9,7 @@
 
 #include "drake/common/text_logging.h"
 #include "drake/common/unused.h"
+#include "drake/systems/framework/system_profiler.h"
 #include "drake/systems/framework/system_visitor.h"
 
 namespace drake {
@@ -274,6 +275,8 @@ void System<T>::CalcTimeDerivatives(const Context<T>& context,
   DRAKE_DEMAND(derivatives != nullptr);
   ValidateContext(context);
   ValidateCreatedForThisSystem(derivatives);
+  const internal::SystemProfileScope profile_scope(
+      this, SystemProfileKind::kTimeDerivatives);
   DoCalcTimeDerivatives(context, derivatives);
 }
 
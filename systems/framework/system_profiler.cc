@@ -0,0 +1,277 @@
+#include "drake/systems/framework/system_profiler.h"
+
+#include <algorithm>
+#include <map>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+#include <tuple>
+#include <utility>
+
+#include <nlohmann/json.hpp>
+
+#include "drake/common/drake_assert.h"
+#include "drake/common/drake_throw.h"
+#include "drake/common/never_destroyed.h"
+
+namespace drake {
+namespace systems {
+namespace internal {
+
+std::atomic<SystemProfiler*> g_active_system_profiler{nullptr};
+
+namespace {
+
+// The innermost active scope on this thread, if any.
+thread_local SystemProfileScope* g_innermost_scope{nullptr};
+
+// Guards changes to g_active_system_profiler, and the recording of
+// computations with the active profiler, so that a profiler is never used
+// after it has been stopped.
+std::mutex& activation_mutex() {
+  static never_destroyed<std::mutex> mutex;
+  return mutex.access();
+}
+
+}  // namespace
+
+void SystemProfileScope::Begin(const SystemMessageInterface* system,
+                               SystemProfileKind kind, int index,
+                               const std::string* name) {
+  system_ = system;
+  kind_ = kind;
+  index_ = index;
+  name_ = name;
+  parent_ = g_innermost_scope;
+  g_innermost_scope = this;
+  start_ = std::chrono::steady_clock::now();
+}
+
+void SystemProfileScope::End() {
+  const auto end = std::chrono::steady_clock::now();
+  DRAKE_ASSERT(g_innermost_scope == this);
+  g_innermost_scope = parent_;
+  if (parent_ != nullptr) {
+    parent_->child_time_ += std::chrono::duration<double>(end - start_).count();
+  }
+  std::lock_guard<std::mutex> lock(activation_mutex());
+  // The profiler might have been stopped (and destroyed) since Begin().
+  if (active_system_profiler() == profiler_) {
+    profiler_->RecordCall(*this, end);
+  }
+}
+
+}  // namespace internal
+
+std::string to_string(SystemProfileKind kind) {
+  switch (kind) {
+    case SystemProfileKind::kCacheEntry:
+      return "cache_entry";
+    case SystemProfileKind::kTimeDerivatives:
+      return "time_derivatives";
+    case SystemProfileKind::kPublish:
+      return "publish";
+    case SystemProfileKind::kDiscreteUpdate:
+      return "discrete_update";
+    case SystemProfileKind::kUnrestrictedUpdate:
+      return "unrestricted_update";
+  }
+  DRAKE_UNREACHABLE();
+}
+
+struct SystemProfiler::Impl {
+  using Clock = std::chrono::steady_clock;
+
+  // Identifies a computation: its System, kind, and index.
+  using Key = std::tuple<const internal::SystemMessageInterface*,
+                         SystemProfileKind, int>;
+
+  struct TraceEvent {
+    int entry_index{};
+    std::thread::id thread;
+    Clock::time_point start;
+    double duration{};
+  };
+
+  explicit Impl(int max_trace_events_in)
+      : max_trace_events(max_trace_events_in), origin(Clock::now()) {}
+
+  // Returns the index of the entry for the given computation, adding it if
+  // necessary.
+  // @pre mutex is locked.
+  int FindOrAddEntry(const internal::SystemMessageInterface* system,
+                     SystemProfileKind kind, int index,
+                     const std::string* name);
+
+  const int max_trace_events;
+
+  mutable std::mutex mutex;
+  std::map<Key, int> entry_indices;
+  std::vector<SystemProfileEntry> entries;
+  std::vector<TraceEvent> trace_events;
+  int64_t num_dropped_trace_events{};
+  Clock::time_point origin;
+  // When this profiler was last started. Only the scopes that began after
+  // then are recorded.
+  // @note Guarded by activation_mutex(), not by mutex.
+  Clock::time_point start_time;
+};
+
+SystemProfiler::SystemProfiler(int max_trace_events) {
+  DRAKE_THROW_UNLESS(max_trace_events >= 0);
+  impl_ = std::make_unique<Impl>(max_trace_events);
+}
+
+SystemProfiler::~SystemProfiler() {
+  Stop();
+}
+
+void SystemProfiler::Start() {
+  std::lock_guard<std::mutex> lock(internal::activation_mutex());
+  SystemProfiler* const active = internal::active_system_profiler();
+  if (active == this) {
+    return;
+  }
+  if (active != nullptr) {
+    throw std::logic_error(
+        "SystemProfiler::Start(): another SystemProfiler is already active");
+  }
+  impl_->start_time = Impl::Clock::now();
+  internal::g_active_system_profiler.store(this);
+}
+
+void SystemProfiler::Stop() {
+  std::lock_guard<std::mutex> lock(internal::activation_mutex());
+  if (internal::active_system_profiler() == this) {
+    internal::g_active_system_profiler.store(nullptr);
+  }
+}
+
+bool SystemProfiler::is_active() const {
+  return internal::active_system_profiler() == this;
+}
+
+std::vector<SystemProfileEntry> SystemProfiler::GetEntries() const {
+  std::vector<SystemProfileEntry> result;
+  {
+    std::lock_guard<std::mutex> lock(impl_->mutex);
+    result = impl_->entries;
+  }
+  std::stable_sort(
+      result.begin(), result.end(),
+      [](const SystemProfileEntry& a, const SystemProfileEntry& b) {
+        return a.self_time > b.self_time;
+      });
+  return result;
+}
+
+int64_t SystemProfiler::num_trace_events() const {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  return impl_->trace_events.size();
+}
+
+int64_t SystemProfiler::num_dropped_trace_events() const {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  return impl_->num_dropped_trace_events;
+}
+
+std::string SystemProfiler::ToChromeTraceJson() const {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  // Number the threads in order of their first event.
+  std::map<std::thread::id, int> thread_numbers;
+  nlohmann::json events = nlohmann::json::array();
+  for (const Impl::TraceEvent& event : impl_->trace_events) {
+    const SystemProfileEntry& entry = impl_->entries[event.entry_index];
+    const int tid = thread_numbers.emplace(event.thread, thread_numbers.size())
+                        .first->second;
+    nlohmann::json json_event;
+    json_event["name"] =
+        entry.system_pathname + ":" +
+        (entry.name.empty() ? to_string(entry.kind) : entry.name);
+    json_event["cat"] = to_string(entry.kind);
+    json_event["ph"] = "X";
+    // Trace-event times are in microseconds.
+    json_event["ts"] =
+        std::chrono::duration<double, std::micro>(event.start - impl_->origin)
+            .count();
+    json_event["dur"] = event.duration * 1e6;
+    json_event["pid"] = 0;
+    json_event["tid"] = tid;
+    json_event["args"] = {{"system_type", entry.system_type}};
+    events.push_back(std::move(json_event));
+  }
+  nlohmann::json result;
+  result["traceEvents"] = std::move(events);
+  result["displayTimeUnit"] = "ms";
+  return result.dump();
+}
+
+void SystemProfiler::Reset() {
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  impl_->entry_indices.clear();
+  impl_->entries.clear();
+  impl_->trace_events.clear();
+  impl_->num_dropped_trace_events = 0;
+  impl_->origin = Impl::Clock::now();
+}
+
+int SystemProfiler::Impl::FindOrAddEntry(
+    const internal::SystemMessageInterface* system, SystemProfileKind kind,
+    int index, const std::string* name) {
+  const auto [iter, inserted] =
+      entry_indices.emplace(Key{system, kind, index}, entries.size());
+  if (inserted) {
+    SystemProfileEntry& entry = entries.emplace_back();
+    entry.system_pathname = system->GetSystemPathname();
+    entry.system_type = system->GetSystemType();
+    entry.kind = kind;
+    if (name != nullptr) entry.name = *name;
+  }
+  return iter->second;
+}
+
+void SystemProfiler::RecordCall(const internal::SystemProfileScope& scope,
+                                std::chrono::steady_clock::time_point end) {
+  if (scope.start_ < impl_->start_time) {
+    // The scope began while this profiler was inactive (or before it even
+    // existed, if it reuses the address of a destroyed one).
+    return;
+  }
+  const double duration =
+      std::chrono::duration<double>(end - scope.start_).count();
+  std::lock_guard<std::mutex> lock(impl_->mutex);
+  const int entry_index = impl_->FindOrAddEntry(scope.system_, scope.kind_,
+                                                scope.index_, scope.name_);
+  SystemProfileEntry& entry = impl_->entries[entry_index];
+  ++entry.num_calls;
+  entry.total_time += duration;
+  entry.self_time += std::max(duration - scope.child_time_, 0.0);
+  entry.max_time = std::max(entry.max_time, duration);
+  if (static_cast<int>(impl_->trace_events.size()) < impl_->max_trace_events) {
+    impl_->trace_events.push_back(
+        Impl::TraceEvent{.entry_index = entry_index,
+                         .thread = std::this_thread::get_id(),
+                         .start = scope.start_,
+                         .duration = duration});
+  } else {
+    ++impl_->num_dropped_trace_events;
+  }
+}
+
+void SystemProfiler::RecordCacheEval(
+    const internal::SystemMessageInterface* system, int cache_index,
+    const std::string& description, bool hit) {
+  std::lock_guard<std::mutex> activation_lock(internal::activation_mutex());
+  SystemProfiler* const profiler = internal::active_system_profiler();
+  if (profiler == nullptr) {
+    return;
+  }
+  Impl& impl = *profiler->impl_;
+  std::lock_guard<std::mutex> lock(impl.mutex);
+  SystemProfileEntry& entry = impl.entries[impl.FindOrAddEntry(
+      system, SystemProfileKind::kCacheEntry, cache_index, &description)];
+  ++(hit ? entry.num_cache_hits : entry.num_cache_misses);
+}
+
+}  // namespace systems
+}  // namespace drake
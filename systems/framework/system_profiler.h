@@ -0,0 +1,235 @@
+#pragma once
+
+#include <atomic>
+#include <chrono>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "drake/common/drake_copyable.h"
+#include "drake/systems/framework/framework_common.h"
+
+namespace drake {
+namespace systems {
+
+class SystemProfiler;
+
+/** The kinds of System computations that are timed by a SystemProfiler. */
+enum class SystemProfileKind {
+  /** Calculating the value of a cache entry, which includes the cache entry of
+  each LeafSystem output port. */
+  kCacheEntry,
+  /** Calculating time derivatives. For a Diagram, this includes the time spent
+  in its subsystems. */
+  kTimeDerivatives,
+  /** Handling publish events. */
+  kPublish,
+  /** Handling discrete update events. */
+  kDiscreteUpdate,
+  /** Handling unrestricted update events. */
+  kUnrestrictedUpdate,
+};
+
+/** Returns a short name for the given `kind`, e.g., "cache_entry". */
+std::string to_string(SystemProfileKind kind);
+
+/** The statistics that a SystemProfiler has recorded for one computation (one
+cache entry, or one kind of event handler) of one System. All times are
+wall-clock times in seconds. */
+struct SystemProfileEntry {
+  /** The full path name of the System, as returned by
+  SystemBase::GetSystemPathname(). */
+  std::string system_pathname;
+
+  /** The type of the System, as returned by SystemBase::GetSystemType(). */
+  std::string system_type;
+
+  /** The kind of computation. */
+  SystemProfileKind kind{SystemProfileKind::kCacheEntry};
+
+  /** The description of the cache entry (for kCacheEntry), or empty. */
+  std::string name;
+
+  /** The number of times that the computation was performed. */
+  int64_t num_calls{};
+
+  /** The total time spent in the computation, including the time spent in the
+  computations that it triggered (e.g., the evaluation of its inputs). */
+  double total_time{};
+
+  /** The time spent in the computation itself, i.e., total_time less the time
+  spent in the other profiled computations that it triggered. */
+  double self_time{};
+
+  /** The longest time spent in any one call of the computation. */
+  double max_time{};
+
+  /** For a cache entry, the number of evaluations that found its value up to
+  date. */
+  int64_t num_cache_hits{};
+
+  /** For a cache entry, the number of evaluations that had to recompute its
+  value. */
+  int64_t num_cache_misses{};
+
+  /** Returns the fraction of the cache entry's evaluations that found its value
+  up to date, or zero if it has not been evaluated. */
+  double cache_hit_rate() const {
+    const int64_t num_evals = num_cache_hits + num_cache_misses;
+    return num_evals > 0 ? static_cast<double>(num_cache_hits) / num_evals
+                         : 0.0;
+  }
+};
+
+namespace internal {
+
+/* The active profiler, or nullptr when profiling is off. Every instrumented
+call loads this pointer, so it must stay cheap to read. */
+extern std::atomic<SystemProfiler*> g_active_system_profiler;
+
+/* Returns the active profiler, or nullptr when profiling is off. */
+inline SystemProfiler* active_system_profiler() {
+  return g_active_system_profiler.load(std::memory_order_relaxed);
+}
+
+/* Times a System computation, for the lifetime of this object, if a
+SystemProfiler is active when it is created. Scopes on the same thread must be
+nested (as they are when they're local variables).
+
+The computation is only recorded if the same profiler is still active when the
+scope ends; End() checks this while holding the lock that Start() and Stop()
+take, so a profiler that is stopped (or destroyed) while scopes are open is
+never used by them. */
+class SystemProfileScope {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(SystemProfileScope);
+
+  /* Begins timing the computation of the given kind by `system`. The `index`
+  (e.g., the cache index) and `name` distinguish computations of the same kind;
+  `name` must outlive this object. */
+  SystemProfileScope(const SystemMessageInterface* system,
+                     SystemProfileKind kind, int index = -1,
+                     const std::string* name = nullptr)
+      : profiler_(active_system_profiler()) {
+    if (profiler_ != nullptr) Begin(system, kind, index, name);
+  }
+
+  ~SystemProfileScope() {
+    if (profiler_ != nullptr) End();
+  }
+
+ private:
+  friend class systems::SystemProfiler;
+
+  void Begin(const SystemMessageInterface* system, SystemProfileKind kind,
+             int index, const std::string* name);
+  void End();
+
+  SystemProfiler* const profiler_;
+  const SystemMessageInterface* system_{};
+  SystemProfileKind kind_{};
+  int index_{};
+  const std::string* name_{};
+  std::chrono::steady_clock::time_point start_;
+  // The time spent in the profiled computations nested inside this one.
+  double child_time_{};
+  // The enclosing scope on this thread, if any.
+  SystemProfileScope* parent_{};
+};
+
+}  // namespace internal
+
+/** Records where the time goes as Systems are evaluated, e.g., during
+Simulator::AdvanceTo(): for each System, the number of calls, and the
+cumulative and maximum wall-clock time, of each of its cache entry
+calculations (including those of its output ports), time derivative
+calculations, and event handlers, as well as the hit rates of its cache
+entries. It also records a timeline of the computations that can be exported
+to the Chrome trace-event format, for viewing in `chrome://tracing` or
+Perfetto.
+
+Profiling is opt-in: nothing is recorded until Start() is called, and while
+no profiler is active the instrumentation costs one atomic load per
+computation. At most one profiler can be active at a time; it records the
+computations of all Systems on all threads. A profiler may be stopped (or
+destroyed) while computations are in progress on other threads; those that
+end afterwards are not recorded.
+
+@code
+SystemProfiler profiler;
+profiler.Start();
+simulator.AdvanceTo(1.0);
+profiler.Stop();
+for (const SystemProfileEntry& entry : profiler.GetEntries()) { ... }
+@endcode
+
+The profiler identifies Systems by their address, so Reset() it before
+profiling new Systems that might reuse the addresses of deleted ones.
+
+Because timing adds overhead to every computation, profiled times overstate
+the cost of very cheap computations. */
+class SystemProfiler {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(SystemProfiler);
+
+  /** Constructs an inactive profiler that records up to `max_trace_events`
+  computations in its timeline (see ToChromeTraceJson()); later ones are
+  still counted in GetEntries(), but are dropped from the timeline.
+  @throws std::exception if max_trace_events is negative. */
+  explicit SystemProfiler(int max_trace_events = 100'000);
+
+  /** Stops this profiler, if it is active. */
+  ~SystemProfiler();
+
+  /** Makes this the active profiler, so that it records System computations
+  until Stop() is called. Does nothing if this profiler is already active.
+  @throws std::exception if another profiler is active. */
+  void Start();
+
+  /** Stops recording. Does nothing if this profiler is not active. */
+  void Stop();
+
+  /** Returns true iff this is the active profiler. */
+  bool is_active() const;
+
+  /** Returns the recorded statistics, in decreasing order of self_time. */
+  std::vector<SystemProfileEntry> GetEntries() const;
+
+  /** Returns the number of computations in the timeline. */
+  int64_t num_trace_events() const;
+
+  /** Returns the number of computations that were dropped from the timeline
+  because it was full. */
+  int64_t num_dropped_trace_events() const;
+
+  /** Returns the timeline of the recorded computations as a Chrome trace-event
+  JSON document, with one complete ("X") event per computation. */
+  std::string ToChromeTraceJson() const;
+
+  /** Discards everything that has been recorded. */
+  void Reset();
+
+ private:
+  friend class internal::SystemProfileScope;
+  friend class CacheEntry;
+
+  // The recorded data, and the mutex that guards it.
+  struct Impl;
+
+  // Records a call that ended at `end`, unless the scope began before this
+  // profiler was last started.
+  // @pre This is the active profiler, and the activation lock is held.
+  void RecordCall(const internal::SystemProfileScope& scope,
+                  std::chrono::steady_clock::time_point end);
+
+  // Records an evaluation of a cache entry with the active profiler, if any.
+  static void RecordCacheEval(const internal::SystemMessageInterface* system,
+                              int cache_index, const std::string& description,
+                              bool hit);
+
+  std::unique_ptr<Impl> impl_;
+};
+
+}  // namespace systems
+}  // namespace drake
@@ -0,0 +1,208 @@
+#include "drake/systems/framework/system_profiler.h"
+
+#include <algorithm>
+#include <memory>
+
+#include <gmock/gmock.h>
+#include <gtest/gtest.h>
+
+#include "drake/common/test_utilities/expect_throws_message.h"
+#include "drake/systems/framework/leaf_system.h"
+
+namespace drake {
+namespace systems {
+namespace {
+
+using ::testing::HasSubstr;
+
+// A system whose output port `z` evaluates its output port `y`, and that has
+// forced publish and discrete update events.
+class ProfiledSystem final : public LeafSystem<double> {
+ public:
+  DRAKE_NO_COPY_NO_MOVE_NO_ASSIGN(ProfiledSystem);
+
+  ProfiledSystem() {
+    this->set_name("profiled");
+    this->DeclareDiscreteState(1);
+    y_ = &this->DeclareVectorOutputPort("y", 1, &ProfiledSystem::CalcY);
+    this->DeclareVectorOutputPort("z", 1, &ProfiledSystem::CalcZ);
+    this->DeclareForcedPublishEvent(&ProfiledSystem::Publish);
+    this->DeclareForcedDiscreteUpdateEvent(&ProfiledSystem::Update);
+  }
+
+ private:
+  void CalcY(const Context<double>&, BasicVector<double>* y) const {
+    y->SetAtIndex(0, 1.0);
+  }
+
+  void CalcZ(const Context<double>& context, BasicVector<double>* z) const {
+    z->SetAtIndex(0, 2.0 * y_->Eval(context)[0]);
+  }
+
+  EventStatus Publish(const Context<double>&) const {
+    return EventStatus::Succeeded();
+  }
+
+  EventStatus Update(const Context<double>&, DiscreteValues<double>*) const {
+    return EventStatus::Succeeded();
+  }
+
+  const OutputPort<double>* y_{};
+};
+
+// Returns the entry for the given kind and name.
+const SystemProfileEntry& FindEntry(
+    const std::vector<SystemProfileEntry>& entries, SystemProfileKind kind,
+    const std::string& name = {}) {
+  auto iter = std::find_if(entries.begin(), entries.end(),
+                           [&](const SystemProfileEntry& entry) {
+                             return entry.kind == kind && entry.name == name;
+                           });
+  DRAKE_DEMAND(iter != entries.end());
+  return *iter;
+}
+
+GTEST_TEST(SystemProfilerTest, KindNames) {
+  EXPECT_EQ(to_string(SystemProfileKind::kCacheEntry), "cache_entry");
+  EXPECT_EQ(to_string(SystemProfileKind::kTimeDerivatives), "time_derivatives");
+  EXPECT_EQ(to_string(SystemProfileKind::kPublish), "publish");
+  EXPECT_EQ(to_string(SystemProfileKind::kDiscreteUpdate), "discrete_update");
+  EXPECT_EQ(to_string(SystemProfileKind::kUnrestrictedUpdate),
+            "unrestricted_update");
+}
+
+GTEST_TEST(SystemProfilerTest, Record) {
+  ProfiledSystem system;
+  auto context = system.CreateDefaultContext();
+
+  SystemProfiler dut;
+  EXPECT_FALSE(dut.is_active());
+  // Nothing is recorded before Start().
+  system.get_output_port(1).Eval(*context);
+  EXPECT_TRUE(dut.GetEntries().empty());
+
+  context->SetTime(1.0);  // Invalidate the outputs.
+  dut.Start();
+  EXPECT_TRUE(dut.is_active());
+  // Evaluating z evaluates y; evaluating y again is a cache hit.
+  system.get_output_port(1).Eval(*context);
+  system.get_output_port(0).Eval(*context);
+  system.ForcedPublish(*context);
+  auto discrete_state = system.AllocateDiscreteVariables();
+  system.CalcForcedDiscreteVariableUpdate(*context, discrete_state.get());
+  dut.Stop();
+  EXPECT_FALSE(dut.is_active());
+
+  // Nothing is recorded after Stop().
+  context->SetTime(2.0);
+  system.get_output_port(1).Eval(*context);
+
+  const std::vector<SystemProfileEntry> entries = dut.GetEntries();
+  ASSERT_EQ(entries.size(), 4);
+  for (int i = 0; i + 1 < ssize(entries); ++i) {
+    EXPECT_GE(entries[i].self_time, entries[i + 1].self_time);
+  }
+
+  const SystemProfileEntry& y = FindEntry(
+      entries, SystemProfileKind::kCacheEntry, "output port 0(y) cache");
+  EXPECT_EQ(y.system_pathname, "::profiled");
+  EXPECT_THAT(y.system_type, HasSubstr("ProfiledSystem"));
+  EXPECT_EQ(y.num_calls, 1);
+  EXPECT_EQ(y.num_cache_misses, 1);
+  EXPECT_EQ(y.num_cache_hits, 1);
+  EXPECT_EQ(y.cache_hit_rate(), 0.5);
+  EXPECT_GE(y.total_time, y.max_time);
+  EXPECT_EQ(y.total_time, y.self_time);
+
+  const SystemProfileEntry& z = FindEntry(
+      entries, SystemProfileKind::kCacheEntry, "output port 1(z) cache");
+  EXPECT_EQ(z.num_calls, 1);
+  EXPECT_EQ(z.num_cache_misses, 1);
+  EXPECT_EQ(z.num_cache_hits, 0);
+  // The time spent calculating y is excluded from z's self time.
+  EXPECT_GE(z.total_time, y.total_time);
+  EXPECT_LE(z.self_time, z.total_time - y.total_time + 1e-12);
+
+  EXPECT_EQ(FindEntry(entries, SystemProfileKind::kPublish).num_calls, 1);
+  EXPECT_EQ(FindEntry(entries, SystemProfileKind::kDiscreteUpdate).num_calls,
+            1);
+
+  EXPECT_EQ(dut.num_trace_events(), 4);
+  EXPECT_EQ(dut.num_dropped_trace_events(), 0);
+  const std::string json = dut.ToChromeTraceJson();
+  EXPECT_THAT(json, HasSubstr("\"traceEvents\""));
+  EXPECT_THAT(json, HasSubstr("\"ph\":\"X\""));
+  EXPECT_THAT(json, HasSubstr("\"::profiled:output port 0(y) cache\""));
+  EXPECT_THAT(json, HasSubstr("\"::profiled:publish\""));
+
+  dut.Reset();
+  EXPECT_TRUE(dut.GetEntries().empty());
+  EXPECT_EQ(dut.num_trace_events(), 0);
+}
+
+GTEST_TEST(SystemProfilerTest, TraceLimit) {
+  ProfiledSystem system;
+  auto context = system.CreateDefaultContext();
+  SystemProfiler dut(/* max_trace_events = */ 1);
+  dut.Start();
+  system.get_output_port(1).Eval(*context);
+  dut.Stop();
+  EXPECT_EQ(dut.num_trace_events(), 1);
+  EXPECT_EQ(dut.num_dropped_trace_events(), 1);
+  EXPECT_EQ(dut.GetEntries().size(), 2);
+
+  EXPECT_THROW(SystemProfiler(-1), std::exception);
+}
+
+GTEST_TEST(SystemProfilerTest, OneActiveProfiler) {
+  SystemProfiler first;
+  SystemProfiler second;
+  first.Start();
+  first.Start();  // No-op.
+  DRAKE_EXPECT_THROWS_MESSAGE(second.Start(), ".*already active.*");
+  first.Stop();
+  second.Start();
+  EXPECT_TRUE(second.is_active());
+  second.Stop();
+
+  // Destroying an active profiler deactivates it.
+  {
+    SystemProfiler third;
+    third.Start();
+  }
+  first.Start();
+  EXPECT_TRUE(first.is_active());
+  first.Stop();
+}
+
+GTEST_TEST(SystemProfilerTest, DestroyedWhileScopeIsOpen) {
+  ProfiledSystem system;
+  auto first = std::make_unique<SystemProfiler>();
+  SystemProfiler second;
+  first->Start();
+  {
+    const internal::SystemProfileScope scope(&system,
+                                             SystemProfileKind::kPublish);
+    // The scope must not use the first profiler once it's destroyed, nor
+    // record into the profiler that is active when it ends.
+    first.reset();
+    second.Start();
+  }
+  second.Stop();
+  EXPECT_TRUE(second.GetEntries().empty());
+
+  // Likewise for a scope that began before its profiler was restarted.
+  second.Start();
+  {
+    const internal::SystemProfileScope scope(&system,
+                                             SystemProfileKind::kPublish);
+    second.Stop();
+    second.Start();
+  }
+  second.Stop();
+  EXPECT_TRUE(second.GetEntries().empty());
+}
+
+}  // namespace
+}  // namespace systems
+}  // namespace drake
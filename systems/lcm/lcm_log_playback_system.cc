@@ -10,9 +10,13 @@ namespace drake {
 namespace systems {
 namespace lcm {
 
-LcmLogPlaybackSystem::LcmLogPlaybackSystem(drake::lcm::DrakeLcmLog* log)
+LcmLogPlaybackSystem::LcmLogPlaybackSystem(drake::lcm::DrakeLcmLog* log,
+                                           std::optional<double> start_time)
     : log_(log) {
   DRAKE_THROW_UNLESS(log != nullptr);
+  if (start_time.has_value()) {
+    log_->SeekToTime(*start_time);
+  }
 }
 
 LcmLogPlaybackSystem::~LcmLogPlaybackSystem() {}
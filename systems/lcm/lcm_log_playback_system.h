@@ -1,5 +1,7 @@
 #pragma once
 
+#include <optional>
+
 #include "drake/common/drake_copyable.h"
 #include "drake/lcm/drake_lcm_log.h"
 #include "drake/systems/framework/leaf_system.h"
@@ -24,8 +26,15 @@ class LcmLogPlaybackSystem : public LeafSystem<double> {
    * Constructs a playback system that advances the given @p log.
    *
    * @param log non-null pointer that is aliased and retained by this object.
+   * @param start_time (optional) if given, playback starts at the first message
+   * logged at or after this time (see DrakeLcmLog::SeekToTime()), instead of
+   * at the log's current cursor. Since messages are dispatched when the
+   * simulation time reaches their timestamps, the simulation's initial time
+   * should typically be set to `start_time` as well.
    */
-  explicit LcmLogPlaybackSystem(drake::lcm::DrakeLcmLog* log);
+  explicit LcmLogPlaybackSystem(
+      drake::lcm::DrakeLcmLog* log,
+      std::optional<double> start_time = std::nullopt);
 
   ~LcmLogPlaybackSystem() override;
 
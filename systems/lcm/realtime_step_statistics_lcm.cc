@@ -0,0 +1,49 @@
+#include "drake/systems/lcm/realtime_step_statistics_lcm.h"
+
+#include <cmath>
+
+#include "drake/common/drake_throw.h"
+#include "drake/lcmt_realtime_step_statistics.hpp"
+
+namespace drake {
+namespace systems {
+namespace lcm {
+
+void PublishRealtimeStepStatistics(const RealtimeStepStatistics& statistics,
+                                   double time, const std::string& channel,
+                                   drake::lcm::DrakeLcmInterface* lcm) {
+  DRAKE_THROW_UNLESS(lcm != nullptr);
+  lcmt_realtime_step_statistics message{};
+  message.utime = static_cast<int64_t>(std::round(time * 1e6));
+  message.num_steps = statistics.num_steps;
+  message.num_deadline_misses = statistics.num_deadline_misses;
+
+  message.step_latency_mean = statistics.step_latency.mean();
+  message.step_latency_p99 = statistics.step_latency.Quantile(0.99);
+  message.step_latency_max = statistics.step_latency.max();
+  message.start_jitter_mean = statistics.start_jitter.mean();
+  message.start_jitter_p99 = statistics.start_jitter.Quantile(0.99);
+  message.start_jitter_max = statistics.start_jitter.max();
+  message.lateness_mean = statistics.lateness.mean();
+  message.lateness_p99 = statistics.lateness.Quantile(0.99);
+  message.lateness_max = statistics.lateness.max();
+
+  const RealtimeStepPhaseTimes& missed = statistics.missed_phase_times;
+  message.missed_unrestricted_update_time = missed.unrestricted_update;
+  message.missed_discrete_update_time = missed.discrete_update;
+  message.missed_integration_time = missed.integration;
+  message.missed_publish_time = missed.publish;
+
+  message.num_bins = DurationHistogram::kNumBins;
+  for (int i = 0; i < DurationHistogram::kNumBins; ++i) {
+    message.bin_upper_edges.push_back(DurationHistogram::bin_upper_edge(i));
+  }
+  message.step_latency_counts = statistics.step_latency.bin_counts();
+  message.lateness_counts = statistics.lateness.bin_counts();
+
+  drake::lcm::Publish(lcm, channel, message, time);
+}
+
+}  // namespace lcm
+}  // namespace systems
+}  // namespace drake
@@ -0,0 +1,30 @@
+#pragma once
+
+#include <string>
+
+#include "drake/lcm/drake_lcm_interface.h"
+#include "drake/systems/analysis/realtime_step_statistics.h"
+
+namespace drake {
+namespace systems {
+namespace lcm {
+
+/// Publishes the given realtime step statistics (e.g., those of
+/// Simulator::get_realtime_step_statistics()) as an
+/// `lcmt_realtime_step_statistics` message on the given channel, so that the
+/// pacing of a realtime simulation can be monitored while it runs, e.g., from a
+/// Simulator monitor.
+///
+/// @param statistics the statistics to publish.
+/// @param time the (simulated) time of the statistics, in seconds; it sets the
+///   message's `utime`.
+/// @param channel the LCM channel on which to publish.
+/// @param lcm the LCM interface on which to publish.
+/// @pre lcm != nullptr
+void PublishRealtimeStepStatistics(const RealtimeStepStatistics& statistics,
+                                   double time, const std::string& channel,
+                                   drake::lcm::DrakeLcmInterface* lcm);
+
+}  // namespace lcm
+}  // namespace systems
+}  // namespace drake
@@ -196,6 +196,28 @@ GTEST_TEST(TestLcmLogPlayback, TestLcmLogPlayback) {
   CheckLog();
 }
 
+// Plays back the same log as above, but starting part way through it.
+GTEST_TEST(TestLcmLogPlayback, StartTime) {
+  GenerateLog();
+  drake::lcm::DrakeLcmLog r_log("test.log", false);
+
+  DiagramBuilder<double> builder;
+  builder.AddSystem<LcmLogPlaybackSystem>(&r_log, 0.25);
+  auto sub = builder.AddSystem(
+      LcmSubscriberSystem::Make<lcmt_drake_signal>("Ch1", &r_log));
+  auto printer = builder.AddSystem<DummySys>();
+  builder.Connect(sub->get_output_port(), printer->get_input_port(0));
+  auto diagram = builder.Build();
+
+  Simulator<double> sim(*diagram);
+  sim.get_mutable_context().SetTime(0.25);
+  sim.AdvanceTo(0.5);
+
+  // The message at t = 0.22 was skipped.
+  CheckLog({0.3, 0.4}, {6, 7}, "Ch1", printer->get_received_msgs(),
+           printer->get_received_times());
+}
+
 }  // namespace
 }  // namespace lcm
 }  // namespace systems
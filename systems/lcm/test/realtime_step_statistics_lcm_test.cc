@@ -0,0 +1,52 @@
+#include "drake/systems/lcm/realtime_step_statistics_lcm.h"
+
+#include <gtest/gtest.h>
+
+#include "drake/lcm/drake_lcm.h"
+#include "drake/lcmt_realtime_step_statistics.hpp"
+
+namespace drake {
+namespace systems {
+namespace lcm {
+namespace {
+
+GTEST_TEST(RealtimeStepStatisticsLcmTest, Publish) {
+  RealtimeStepStatistics statistics;
+  statistics.num_steps = 3;
+  statistics.num_deadline_misses = 1;
+  statistics.step_latency.Add(0.5e-6);
+  statistics.step_latency.Add(0.5e-6);
+  statistics.step_latency.Add(3e-3);
+  statistics.lateness.Add(2e-3);
+  statistics.missed_phase_times.publish = 3e-3;
+
+  const std::string channel = "REALTIME_STEP_STATISTICS";
+  drake::lcm::DrakeLcm lcm;
+  drake::lcm::Subscriber<lcmt_realtime_step_statistics> subscriber(&lcm,
+                                                                   channel);
+  PublishRealtimeStepStatistics(statistics, 1.5, channel, &lcm);
+  lcm.HandleSubscriptions(0);
+  ASSERT_EQ(subscriber.count(), 1);
+
+  const lcmt_realtime_step_statistics& message = subscriber.message();
+  EXPECT_EQ(message.utime, 1500000);
+  EXPECT_EQ(message.num_steps, 3);
+  EXPECT_EQ(message.num_deadline_misses, 1);
+  EXPECT_EQ(message.step_latency_max, 3e-3);
+  EXPECT_EQ(message.step_latency_mean, statistics.step_latency.mean());
+  EXPECT_EQ(message.lateness_max, 2e-3);
+  EXPECT_EQ(message.missed_publish_time, 3e-3);
+  ASSERT_EQ(message.num_bins, DurationHistogram::kNumBins);
+  EXPECT_EQ(message.bin_upper_edges[0], 1e-6);
+  EXPECT_EQ(message.step_latency_counts[0], 2);
+  EXPECT_EQ(message.step_latency_counts, statistics.step_latency.bin_counts());
+  EXPECT_EQ(message.lateness_counts, statistics.lateness.bin_counts());
+
+  EXPECT_THROW(PublishRealtimeStepStatistics(statistics, 0.0, channel, nullptr),
+               std::exception);
+}
+
+}  // namespace
+}  // namespace lcm
+}  // namespace systems
+}  // namespace drake
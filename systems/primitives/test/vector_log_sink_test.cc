@@ -186,6 +186,47 @@ GTEST_TEST(TestVectorLogSink, NoForcedPublish) {
   EXPECT_EQ(log.num_samples(), 0);
 }
 
+// Test chunked storage and decimation.
+GTEST_TEST(TestVectorLogSink, ChunkedAndDecimated) {
+  DiagramBuilder<double> builder;
+  auto system = builder.AddSystem<ConstantVectorSource<double>>(2.0);
+  auto logger = builder.AddSystem<VectorLogSink<double>>(
+      1, TriggerTypeSet({TriggerType::kForced}), 0.0,
+      VectorLogParams{.chunk_size = 2}, 3 /* decimation */);
+  builder.Connect(system->get_output_port(), logger->get_input_port());
+  EXPECT_EQ(logger->get_log_params().chunk_size, 2);
+  EXPECT_EQ(logger->get_decimation(), 3);
+  auto diagram = builder.Build();
+
+  auto context = diagram->CreateDefaultContext();
+  for (int i = 0; i < 10; ++i) {
+    context->SetTime(i);
+    diagram->ForcedPublish(*context);
+  }
+  const auto& log = logger->FindLog(*context);
+  EXPECT_TRUE(log.is_chunked());
+  EXPECT_EQ(log.num_samples(), 4);
+  EXPECT_EQ(log.num_chunks(), 2);
+  EXPECT_TRUE(CompareMatrices(log.sample_times(0.0, 10.0),
+                              Eigen::Vector4d(0.0, 3.0, 6.0, 9.0)));
+  EXPECT_TRUE(CompareMatrices(log.CopySampleTimes(),
+                              Eigen::Vector4d(0.0, 3.0, 6.0, 9.0)));
+
+  // Clearing the log restarts the decimation, so the next event is logged.
+  logger->FindMutableLog(context.get()).Clear();
+  for (int i = 10; i < 14; ++i) {
+    context->SetTime(i);
+    diagram->ForcedPublish(*context);
+  }
+  EXPECT_TRUE(
+      CompareMatrices(log.CopySampleTimes(), Eigen::Vector2d(10.0, 13.0)));
+
+  DRAKE_EXPECT_THROWS_MESSAGE(
+      VectorLogSink<double>(1, TriggerTypeSet({TriggerType::kForced}), 0.0,
+                            VectorLogParams{}, 0),
+      ".*decimation >= 1.*");
+}
+
 GTEST_TEST(TestVectorLogSink, ScalarConversion) {
   VectorLogSink<double> dut_per_step_publish(2);
   VectorLogSink<double> dut_forced_publish(2, {TriggerType::kForced});
@@ -201,6 +242,14 @@ GTEST_TEST(TestVectorLogSink, ScalarConversion) {
       EXPECT_EQ(converted.get_input_port().size(), 2);
     }));
   }
+
+  // The storage options and decimation are preserved.
+  VectorLogSink<double> dut_chunked(2, {TriggerType::kForced}, 0.0,
+                                    VectorLogParams{.chunk_size = 10}, 2);
+  EXPECT_TRUE(is_autodiffxd_convertible(dut_chunked, [](const auto& converted) {
+    EXPECT_EQ(converted.get_log_params().chunk_size, 10);
+    EXPECT_EQ(converted.get_decimation(), 2);
+  }));
 }
 
 GTEST_TEST(TestVectorLogSink, DiagramToAutoDiff) {
@@ -1,13 +1,25 @@
 #include "drake/systems/primitives/vector_log.h"
 
+#include <memory>
 #include <utility>
 
 #include <gtest/gtest.h>
 
 #include "drake/common/default_scalars.h"
+#include "drake/common/test_utilities/eigen_matrix_compare.h"
+#include "drake/common/test_utilities/expect_throws_message.h"
 
 namespace drake {
 namespace systems {
+
+class VectorLogTester {
+ public:
+  static const internal::VectorLogSpillFile* spill_file(
+      const VectorLog<double>& log) {
+    return log.spill_file_.get();
+  }
+};
+
 namespace {
 
 template <typename T>
@@ -66,6 +78,130 @@ TYPED_TEST(VectorLogFixture, GrowLog) {
   EXPECT_EQ(log.data()(2, goal_size - 1), 3.3);
 }
 
+TYPED_TEST(VectorLogFixture, Chunked) {
+  using T = TypeParam;
+  VectorLog<T> log(2, VectorLogParams{.chunk_size = 3});
+  EXPECT_TRUE(log.is_chunked());
+  EXPECT_EQ(log.num_chunks(), 0);
+  for (int k = 0; k < 7; ++k) {
+    log.AddData(1.0 * k, Vector2<T>(1.0 * k, -1.0 * k));
+  }
+  EXPECT_EQ(log.num_samples(), 7);
+  ASSERT_EQ(log.num_chunks(), 3);
+
+  // The chunks are views of the samples, with a partial last chunk.
+  EXPECT_EQ(log.get_chunk_sample_times(1).size(), 3);
+  EXPECT_EQ(log.get_chunk_sample_times(1)[0], 3.0);
+  EXPECT_EQ(log.get_chunk_data(1).cols(), 3);
+  EXPECT_EQ(log.get_chunk_data(1)(1, 2), -5.0);
+  EXPECT_EQ(log.get_chunk_sample_times(2).size(), 1);
+  EXPECT_EQ(log.get_chunk_data(2)(0, 0), 6.0);
+  EXPECT_THROW(log.get_chunk_data(3), std::exception);
+
+  // Windowed queries span chunks, and include both endpoints.
+  const VectorX<T> times = log.sample_times(1.0, 4.0);
+  ASSERT_EQ(times.size(), 4);
+  EXPECT_EQ(times[0], 1.0);
+  EXPECT_EQ(times[3], 4.0);
+  const MatrixX<T> data = log.data(1.0, 4.0);
+  ASSERT_EQ(data.cols(), 4);
+  EXPECT_EQ(data(1, 3), -4.0);
+  EXPECT_EQ(log.data(10.0, 20.0).cols(), 0);
+
+  // The contiguous accessors are not available, but the copies are.
+  DRAKE_EXPECT_THROWS_MESSAGE(log.data(), ".*chunked storage.*");
+  DRAKE_EXPECT_THROWS_MESSAGE(log.sample_times(), ".*chunked storage.*");
+  const VectorX<T> all_times = log.CopySampleTimes();
+  ASSERT_EQ(all_times.size(), 7);
+  EXPECT_EQ(all_times[6], 6.0);
+  const MatrixX<T> all_data = log.CopyData();
+  ASSERT_EQ(all_data.cols(), 7);
+  EXPECT_EQ(all_data(1, 4), -4.0);
+
+  // Copies share the full chunks, but not the current one.
+  VectorLog<T> copy = log;
+  log.Clear();
+  EXPECT_EQ(log.num_chunks(), 0);
+  copy.AddData(7.0, Vector2<T>(7.0, -7.0));
+  EXPECT_EQ(copy.num_samples(), 8);
+  EXPECT_EQ(copy.data(0.0, 100.0).cols(), 8);
+}
+
+TYPED_TEST(VectorLogFixture, ContiguousWindows) {
+  auto& log = this->log_;
+  auto& record = this->record_;
+  EXPECT_FALSE(log.is_chunked());
+  EXPECT_EQ(log.num_chunks(), 0);
+  for (int k = 0; k < 5; ++k) {
+    log.AddData(1.0 * k, record);
+  }
+  EXPECT_EQ(log.num_chunks(), 1);
+  EXPECT_EQ(log.get_chunk_data(0).cols(), 5);
+  EXPECT_EQ(log.sample_times(2.5, 10.0).size(), 2);
+  EXPECT_EQ(log.data(2.5, 10.0).cols(), 2);
+  ASSERT_EQ(log.CopySampleTimes().size(), 5);
+  EXPECT_EQ(log.CopySampleTimes()[4], 4.0);
+  ASSERT_EQ(log.CopyData().cols(), 5);
+  EXPECT_EQ(log.CopyData()(2, 4), 3.3);
+}
+
+GTEST_TEST(VectorLogTest, Spill) {
+  // Keep at most two chunks in memory.
+  const VectorLogParams params{.chunk_size = 100,
+                               .memory_limit_bytes = 2 * 100 * 4 * 8};
+  VectorLog<double> log(3, params);
+  for (int k = 0; k < 1000; ++k) {
+    log.AddData(k, Eigen::Vector3d(k, 2 * k, 3 * k));
+  }
+  ASSERT_EQ(log.num_chunks(), 10);
+  for (int i = 0; i < log.num_chunks(); ++i) {
+    EXPECT_EQ(log.get_chunk_sample_times(i)[0], 100.0 * i);
+    EXPECT_EQ(log.get_chunk_data(i)(2, 99), 3.0 * (100 * i + 99));
+  }
+  const Eigen::MatrixXd data = log.data(450.0, 549.0);
+  ASSERT_EQ(data.cols(), 100);
+  EXPECT_TRUE(CompareMatrices(data.col(0), Eigen::Vector3d(450, 900, 1350)));
+
+  // A copy shares the spilled chunks, which outlive the original.
+  auto copy = std::make_unique<VectorLog<double>>(log);
+  log = VectorLog<double>(3);
+  EXPECT_EQ(copy->get_chunk_data(9)(0, 0), 900.0);
+}
+
+GTEST_TEST(VectorLogTest, SpillAfterClear) {
+  const VectorLogParams params{.chunk_size = 100,
+                               .memory_limit_bytes = 2 * 100 * 4 * 8};
+  VectorLog<double> log(3, params);
+  auto fill = [&log]() {
+    for (int k = 0; k < 1000; ++k) {
+      log.AddData(k, Eigen::Vector3d(k, 2 * k, 3 * k));
+    }
+  };
+  fill();
+  const internal::VectorLogSpillFile* first = VectorLogTester::spill_file(log);
+  ASSERT_NE(first, nullptr);
+
+  // A copy keeps using the first spill file after the original is cleared.
+  const VectorLog<double> copy(log);
+  log.Clear();
+  EXPECT_EQ(VectorLogTester::spill_file(log), nullptr);
+  EXPECT_EQ(VectorLogTester::spill_file(copy), first);
+
+  // Refilling the cleared log spills to a fresh file, rather than appending to
+  // the first one.
+  fill();
+  const internal::VectorLogSpillFile* second = VectorLogTester::spill_file(log);
+  ASSERT_NE(second, nullptr);
+  EXPECT_NE(second, first);
+  EXPECT_EQ(log.get_chunk_data(9)(2, 99), 3.0 * 999);
+  EXPECT_EQ(copy.get_chunk_data(9)(2, 99), 3.0 * 999);
+}
+
+GTEST_TEST(VectorLogTest, BadParams) {
+  EXPECT_THROW(VectorLog<double>(3, VectorLogParams{.chunk_size = -1}),
+               std::exception);
+}
+
 }  // namespace
 }  // namespace systems
 }  // namespace drake
@@ -1,21 +1,105 @@
 #include "drake/systems/primitives/vector_log.h"
 
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <unistd.h>
+
+#include <atomic>
+#include <limits>
+#include <stdexcept>
+#include <type_traits>
+
+#include <fmt/format.h>
+
 #include "drake/common/default_scalars.h"
 #include "drake/common/drake_assert.h"
+#include "drake/common/extract_double.h"
+#include "drake/common/temp_directory.h"
 
 namespace drake {
 namespace systems {
+namespace internal {
+
+// An anonymous file that holds the spilled chunks of a VectorLog (and its
+// copies). The file is unlinked as soon as it is created; its storage lives on
+// until the descriptor and all mappings of it are closed.
+class VectorLogSpillFile {
+ public:
+  explicit VectorLogSpillFile(const std::string& directory) {
+    std::string pattern = (directory.empty() ? temp_directory() : directory) +
+                          "/vector_log_XXXXXX";
+    fd_ = ::mkstemp(pattern.data());
+    if (fd_ < 0) {
+      throw std::runtime_error(fmt::format(
+          "VectorLog: could not create a spill file in {}", pattern));
+    }
+    ::unlink(pattern.c_str());
+  }
+
+  ~VectorLogSpillFile() { ::close(fd_); }
+
+  // Appends the given arrays to the file as one page-aligned region, and
+  // returns a read-only mapping of that region.
+  std::shared_ptr<const void> Append(const double* first, int64_t first_size,
+                                     const double* second,
+                                     int64_t second_size) {
+    const int64_t page_size = ::sysconf(_SC_PAGESIZE);
+    const int64_t num_bytes = (first_size + second_size) * sizeof(double);
+    const int64_t region_size =
+        (num_bytes + page_size - 1) / page_size * page_size;
+    const int64_t offset = next_offset_.fetch_add(region_size);
+    WriteAll(first, first_size * sizeof(double), offset);
+    WriteAll(second, second_size * sizeof(double),
+             offset + first_size * sizeof(double));
+    void* mapped =
+        ::mmap(nullptr, region_size, PROT_READ, MAP_SHARED, fd_, offset);
+    if (mapped == MAP_FAILED) {
+      throw std::runtime_error("VectorLog: could not map a spilled chunk");
+    }
+    return std::shared_ptr<const void>(mapped, [region_size](const void* p) {
+      ::munmap(const_cast<void*>(p), region_size);
+    });
+  }
+
+ private:
+  void WriteAll(const double* data, int64_t num_bytes, int64_t offset) {
+    const char* bytes = reinterpret_cast<const char*>(data);
+    while (num_bytes > 0) {
+      const ssize_t written = ::pwrite(fd_, bytes, num_bytes, offset);
+      if (written <= 0) {
+        throw std::runtime_error("VectorLog: could not write a spilled chunk");
+      }
+      bytes += written;
+      num_bytes -= written;
+      offset += written;
+    }
+  }
+
+  int fd_{-1};
+  // Copies of a log share this file, so regions are claimed atomically.
+  std::atomic<int64_t> next_offset_{0};
+};
+
+}  // namespace internal
 
 template <typename T>
 VectorLog<T>::VectorLog(int input_size)
-    : sample_times_(kDefaultCapacity), data_(input_size, kDefaultCapacity) {
+    : VectorLog(input_size, VectorLogParams{}) {}
+
+template <typename T>
+VectorLog<T>::VectorLog(int input_size, const VectorLogParams& params)
+    : params_(params) {
+  DRAKE_THROW_UNLESS(params.chunk_size >= 0);
+  const int64_t capacity = is_chunked() ? params.chunk_size : kDefaultCapacity;
+  sample_times_.resize(capacity);
+  data_.resize(input_size, capacity);
   DRAKE_ASSERT_VOID(CheckInvariants());
 }
 
 template <typename T>
 void VectorLog<T>::Reserve(int64_t capacity) {
   DRAKE_ASSERT_VOID(CheckInvariants());
-  if (capacity > sample_times_.size()) {
+  if (!is_chunked() && capacity > sample_times_.size()) {
     sample_times_.conservativeResize(capacity);
     data_.conservativeResize(Eigen::NoChange, capacity);
   }
@@ -25,26 +109,191 @@ void VectorLog<T>::Reserve(int64_t capacity) {
 template <typename T>
 void VectorLog<T>::AddData(const T& time, const VectorX<T>& sample) {
   DRAKE_ASSERT_VOID(CheckInvariants());
-  // If the new size exceeds the current allocation, then do a conservative
-  // resize (ouch!). Clients can avoid this if necessary by calling Reserve()
-  // ahead of time.
-  if (num_samples_ + 1 > sample_times_.size()) {
+  int64_t column = num_samples_;
+  if (is_chunked()) {
+    column -= static_cast<int64_t>(full_chunks_.size()) * params_.chunk_size;
+    if (column == params_.chunk_size) {
+      SealChunk();
+      column = 0;
+    }
+  } else if (num_samples_ + 1 > sample_times_.size()) {
+    // If the new size exceeds the current allocation, then do a conservative
+    // resize (ouch!). Clients can avoid this if necessary by calling Reserve()
+    // ahead of time.
     Reserve(sample_times_.size() * 2);
   }
 
   // Record time and input to the num_samples position.
-  sample_times_(int64_t{num_samples_}) = time;
-  data_.col(int64_t{num_samples_}) = sample;
+  sample_times_(column) = time;
+  data_.col(column) = sample;
 
   // Update the count.
   ++num_samples_;
   DRAKE_ASSERT_VOID(CheckInvariants());
 }
 
+template <typename T>
+void VectorLog<T>::SealChunk() {
+  const int rows = data_.rows();
+  const int cols = params_.chunk_size;
+  auto chunk = std::make_shared<Chunk>();
+  chunk->min_time = std::numeric_limits<double>::quiet_NaN();
+  chunk->max_time = std::numeric_limits<double>::quiet_NaN();
+  if constexpr (std::is_same_v<T, double>) {
+    chunk->min_time = sample_times_.minCoeff();
+    chunk->max_time = sample_times_.maxCoeff();
+  }
+  const int64_t chunk_bytes = int64_t{rows + 1} * cols * sizeof(T);
+  if constexpr (std::is_same_v<T, double>) {
+    if (params_.memory_limit_bytes >= 0 &&
+        full_chunks_bytes_ + chunk_bytes > params_.memory_limit_bytes) {
+      if (spill_file_ == nullptr) {
+        spill_file_ = std::make_shared<internal::VectorLogSpillFile>(
+            params_.spill_directory);
+      }
+      chunk->mapping = spill_file_->Append(sample_times_.data(), cols,
+                                           data_.data(), int64_t{rows} * cols);
+      chunk->sample_times_ptr =
+          static_cast<const double*>(chunk->mapping.get());
+      chunk->data_ptr = chunk->sample_times_ptr + cols;
+      // The current chunk's storage is reused for the next chunk.
+      full_chunks_.push_back(std::move(chunk));
+      return;
+    }
+  }
+  // Hand over the current chunk's storage, rather than copying it.
+  chunk->sample_times = std::move(sample_times_);
+  chunk->data = std::move(data_);
+  chunk->sample_times_ptr = chunk->sample_times.data();
+  chunk->data_ptr = chunk->data.data();
+  full_chunks_bytes_ += chunk_bytes;
+  sample_times_.resize(cols);
+  data_.resize(rows, cols);
+  full_chunks_.push_back(std::move(chunk));
+}
+
+template <typename T>
+int VectorLog<T>::num_chunks() const {
+  if (!is_chunked()) {
+    return (num_samples_ > 0) ? 1 : 0;
+  }
+  const int64_t chunk_size = params_.chunk_size;
+  return static_cast<int>((num_samples_ + chunk_size - 1) / chunk_size);
+}
+
+template <typename T>
+Eigen::Map<const VectorX<T>> VectorLog<T>::get_chunk_sample_times(int i) const {
+  DRAKE_THROW_UNLESS(0 <= i && i < num_chunks());
+  if (i < static_cast<int>(full_chunks_.size())) {
+    return Eigen::Map<const VectorX<T>>(full_chunks_[i]->sample_times_ptr,
+                                        params_.chunk_size);
+  }
+  const int64_t size = num_samples_ - int64_t{i} * params_.chunk_size;
+  return Eigen::Map<const VectorX<T>>(sample_times_.data(), size);
+}
+
+template <typename T>
+Eigen::Map<const MatrixX<T>> VectorLog<T>::get_chunk_data(int i) const {
+  DRAKE_THROW_UNLESS(0 <= i && i < num_chunks());
+  if (i < static_cast<int>(full_chunks_.size())) {
+    return Eigen::Map<const MatrixX<T>>(full_chunks_[i]->data_ptr, data_.rows(),
+                                        params_.chunk_size);
+  }
+  const int64_t size = num_samples_ - int64_t{i} * params_.chunk_size;
+  return Eigen::Map<const MatrixX<T>>(data_.data(), data_.rows(), size);
+}
+
+template <typename T>
+template <typename Visitor>
+void VectorLog<T>::VisitWindow(double t_start, double t_end,
+                               Visitor visit) const {
+  for (int i = 0; i < num_chunks(); ++i) {
+    if (i < static_cast<int>(full_chunks_.size())) {
+      // Skip chunks that are entirely outside of the window. (When the range
+      // is unknown, the comparisons are false.)
+      const Chunk& chunk = *full_chunks_[i];
+      if (chunk.max_time < t_start || chunk.min_time > t_end) {
+        continue;
+      }
+    }
+    const Eigen::Map<const VectorX<T>> times = get_chunk_sample_times(i);
+    const Eigen::Map<const MatrixX<T>> data = get_chunk_data(i);
+    for (int j = 0; j < times.size(); ++j) {
+      const double time = ExtractDoubleOrThrow(times[j]);
+      if (t_start <= time && time <= t_end) {
+        visit(times[j], data.col(j));
+      }
+    }
+  }
+}
+
+template <typename T>
+VectorX<T> VectorLog<T>::CopySampleTimes() const {
+  VectorX<T> result(num_samples());
+  int64_t column = 0;
+  for (int i = 0; i < num_chunks(); ++i) {
+    const Eigen::Map<const VectorX<T>> times = get_chunk_sample_times(i);
+    result.segment(column, times.size()) = times;
+    column += times.size();
+  }
+  return result;
+}
+
+template <typename T>
+MatrixX<T> VectorLog<T>::CopyData() const {
+  MatrixX<T> result(data_.rows(), num_samples());
+  int64_t column = 0;
+  for (int i = 0; i < num_chunks(); ++i) {
+    const Eigen::Map<const MatrixX<T>> data = get_chunk_data(i);
+    result.middleCols(column, data.cols()) = data;
+    column += data.cols();
+  }
+  return result;
+}
+
+template <typename T>
+VectorX<T> VectorLog<T>::sample_times(double t_start, double t_end) const {
+  std::vector<T> result;
+  VisitWindow(t_start, t_end, [&result](const T& time, const auto&) {
+    result.push_back(time);
+  });
+  return Eigen::Map<const VectorX<T>>(result.data(), result.size());
+}
+
+template <typename T>
+MatrixX<T> VectorLog<T>::data(double t_start, double t_end) const {
+  int64_t count = 0;
+  VisitWindow(t_start, t_end, [&count](const T&, const auto&) {
+    ++count;
+  });
+  MatrixX<T> result(data_.rows(), count);
+  int64_t column = 0;
+  VisitWindow(t_start, t_end, [&result, &column](const T&, const auto& col) {
+    result.col(column++) = col;
+  });
+  return result;
+}
+
+template <typename T>
+void VectorLog<T>::ThrowIfChunked(const char* func) const {
+  if (is_chunked()) {
+    throw std::logic_error(fmt::format(
+        "VectorLog::{}() is not available with chunked storage; use "
+        "CopySampleTimes(), CopyData(), the windowed overloads, or the chunk "
+        "views instead",
+        func));
+  }
+}
+
 template <typename T>
 void VectorLog<T>::CheckInvariants() const {
   DRAKE_DEMAND(sample_times_.size() == data_.cols());
-  DRAKE_DEMAND(num_samples_ <= sample_times_.size());
+  if (is_chunked()) {
+    DRAKE_DEMAND(num_samples_ <= static_cast<int64_t>(full_chunks_.size() + 1) *
+                                     params_.chunk_size);
+  } else {
+    DRAKE_DEMAND(num_samples_ <= sample_times_.size());
+  }
 }
 
 }  // namespace systems
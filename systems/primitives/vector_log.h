@@ -1,12 +1,57 @@
 #pragma once
 
+#include <memory>
+#include <string>
+#include <vector>
+
 #include "drake/common/drake_copyable.h"
 #include "drake/common/eigen_types.h"
+#include "drake/common/name_value.h"
 #include "drake/common/reset_after_move.h"
 
 namespace drake {
 namespace systems {
 
+#ifndef DRAKE_DOXYGEN_CXX
+namespace internal {
+class VectorLogSpillFile;
+}  // namespace internal
+#endif
+
+/**
+ Storage options for a VectorLog. The default values select contiguous
+ storage, which is appropriate unless the log will hold a very large number of
+ samples.
+ */
+struct VectorLogParams {
+  /** Passes this object to an Archive.
+   Refer to @ref yaml_serialization "YAML Serialization" for background. */
+  template <typename Archive>
+  void Serialize(Archive* a) {
+    a->Visit(DRAKE_NVP(chunk_size));
+    a->Visit(DRAKE_NVP(memory_limit_bytes));
+    a->Visit(DRAKE_NVP(spill_directory));
+  }
+
+  /** When positive, the log stores its samples in a sequence of chunks of
+   this many samples each (rather than in one contiguous matrix), so that
+   adding samples never copies the previously logged data. Full chunks are
+   immutable, so copying a chunked log does not copy them either. */
+  int chunk_size{0};
+
+  /** (Chunked storage only.) When non-negative, once the full chunks held in
+   memory would exceed this many bytes, each additional full chunk is written
+   to a file in `spill_directory` and memory-mapped (read-only), so that the
+   operating system may page it out. This option is only supported when the
+   scalar type is `double`; for other scalar types it is ignored. */
+  int64_t memory_limit_bytes{-1};
+
+  /** The directory for spilled chunks, or empty to use temp_directory(). The
+   file is deleted from the directory as soon as it is created, so it never
+   outlives the log (or a crash). */
+  std::string spill_directory;
+};
+
 /**
  This utility class serves as an in-memory cache of time-dependent vector
  values. Note that this is a standalone class, not a Drake System. It is
@@ -40,6 +85,19 @@ class VectorLog {
    */
   explicit VectorLog(int input_size);
 
+  /** Constructs the vector log with the given storage options.
+   @param input_size                Dimension of the per-time step data set.
+   @param params                    The storage options.
+   @throws std::exception if `params.chunk_size` is negative. */
+  VectorLog(int input_size, const VectorLogParams& params);
+
+  /** Returns the storage options. */
+  const VectorLogParams& get_params() const { return params_; }
+
+  /** Returns true iff this log uses chunked storage; see
+   VectorLogParams::chunk_size. */
+  bool is_chunked() const { return params_.chunk_size > 0; }
+
   /** Reports the size of the log's input vector. */
   int64_t get_input_size() const { return data_.rows(); }
 
@@ -48,8 +106,10 @@ class VectorLog {
 
   // The return type here must be a VectorBlock because only the leading
   // part of the sample_times_ vector contains meaningful data.
-  /** Accesses the logged time stamps. */
+  /** Accesses the logged time stamps.
+   @throws std::exception if is_chunked(); use CopySampleTimes() instead. */
   Eigen::VectorBlock<const VectorX<T>> sample_times() const {
+    ThrowIfChunked(__func__);
     return const_cast<const VectorX<T>&>(sample_times_).head(num_samples_);
   }
 
@@ -57,16 +117,59 @@ class VectorLog {
 
    The InnerPanel parameter of the return type indicates that the compiler can
    assume aligned access to the data.
+   @throws std::exception if is_chunked(); use CopyData() instead.
    */
   Eigen::Block<const MatrixX<T>, Eigen::Dynamic, Eigen::Dynamic,
                true /* InnerPanel */>
   data() const {
+    ThrowIfChunked(__func__);
     return data_.leftCols(num_samples_);
   }
 
+  /** Returns a copy of all of the logged time stamps, in order of insertion.
+   Unlike sample_times(), this is available with any storage; with chunked
+   storage, the chunks are concatenated. */
+  VectorX<T> CopySampleTimes() const;
+
+  /** Returns a copy of all of the logged data, with one column per sample in
+   order of insertion. Unlike data(), this is available with any storage; with
+   chunked storage, the chunks are concatenated. */
+  MatrixX<T> CopyData() const;
+
+  /** Returns a copy of the time stamps of the samples whose times lie within
+   the closed interval [t_start, t_end], in order of insertion. With chunked
+   storage, chunks whose sample times all lie outside the interval are skipped
+   without being read. */
+  VectorX<T> sample_times(double t_start, double t_end) const;
+
+  /** Returns a copy of the data of the samples whose times lie within the
+   closed interval [t_start, t_end], in order of insertion (i.e., the columns
+   that correspond to sample_times(t_start, t_end)). */
+  MatrixX<T> data(double t_start, double t_end) const;
+
+  /** Returns the number of chunks that hold the samples. With chunked storage,
+   this is ceil(num_samples() / chunk_size). With contiguous storage, all of
+   the samples are in one chunk (or none, when the log is empty). */
+  int num_chunks() const;
+
+  /** Returns a view of the time stamps of the `i`th chunk's samples, without
+   copying them. For a full chunk, the view remains valid until the log is
+   cleared or destroyed. For the last chunk (which might still be filling, and
+   which is the only chunk with contiguous storage), it remains valid only
+   until more samples are added.
+   @throws std::exception unless 0 <= i < num_chunks() */
+  Eigen::Map<const VectorX<T>> get_chunk_sample_times(int i) const;
+
+  /** Returns a view of the `i`th chunk's data, with one column per sample,
+   without copying it. The view's lifetime is the same as for
+   get_chunk_sample_times().
+   @throws std::exception unless 0 <= i < num_chunks() */
+  Eigen::Map<const MatrixX<T>> get_chunk_data(int i) const;
+
   /**
    Reserve storage for at least `capacity` samples. At construction, there will
-   be at least `kDefaultCapacity`; use this method to reserve more.
+   be at least `kDefaultCapacity`; use this method to reserve more. With chunked
+   storage this does nothing, because chunks are allocated as needed.
    */
   void Reserve(int64_t capacity);
 
@@ -76,6 +179,12 @@ class VectorLog {
     // Resetting num_samples_ is sufficient to have all future writes and
     // reads re-initialized to the beginning of the data.
     num_samples_ = 0;
+    full_chunks_.clear();
+    full_chunks_bytes_ = 0;
+    // Start a new spill file, so that the space of the spilled chunks is freed
+    // (once no copies of this log use them anymore), instead of the file
+    // growing with each refill.
+    spill_file_.reset();
     DRAKE_ASSERT_VOID(CheckInvariants());
   }
 
@@ -89,11 +198,45 @@ class VectorLog {
   void AddData(const T& time, const VectorX<T>& sample);
 
  private:
+  friend class VectorLogTester;
+
+  // A full chunk of samples. Full chunks are never modified, so they are
+  // shared among copies of the log.
+  struct Chunk {
+    // The samples, when the chunk is held in memory.
+    VectorX<T> sample_times;
+    MatrixX<T> data;
+    // The mapped file region that holds the samples, when the chunk has been
+    // spilled to disk.
+    std::shared_ptr<const void> mapping;
+    // The chunk's samples (either in memory or in the mapping).
+    const T* sample_times_ptr{};
+    const T* data_ptr{};
+    // The range of the sample times, used to skip chunks in windowed queries.
+    // These are NaN when they are unknown (i.e., when T is not double).
+    double min_time{};
+    double max_time{};
+  };
+
+  void ThrowIfChunked(const char* func) const;
   void CheckInvariants() const;
+  // Moves the (full) current chunk into full_chunks_.
+  void SealChunk();
+  // Calls visit(chunk, column) for each sample in [t_start, t_end].
+  template <typename Visitor>
+  void VisitWindow(double t_start, double t_end, Visitor visit) const;
 
+  VectorLogParams params_;
   reset_after_move<int64_t> num_samples_{0};
+  // With contiguous storage, these hold all of the samples. With chunked
+  // storage, they are the current (partially filled) chunk.
   VectorX<T> sample_times_;
   MatrixX<T> data_;
+  // With chunked storage, the full chunks in order.
+  std::vector<std::shared_ptr<const Chunk>> full_chunks_;
+  // The total size of the full chunks that are held in memory.
+  int64_t full_chunks_bytes_{0};
+  std::shared_ptr<internal::VectorLogSpillFile> spill_file_;
 };
 }  // namespace systems
 }  // namespace drake
@@ -23,11 +23,23 @@ template <typename T>
 VectorLogSink<T>::VectorLogSink(int input_size,
                                 const TriggerTypeSet& publish_triggers,
                                 double publish_period)
+    : VectorLogSink<T>(input_size, publish_triggers, publish_period,
+                       VectorLogParams{}) {}
+
+template <typename T>
+VectorLogSink<T>::VectorLogSink(int input_size,
+                                const TriggerTypeSet& publish_triggers,
+                                double publish_period,
+                                const VectorLogParams& log_params,
+                                int decimation)
     : LeafSystem<T>(SystemTypeTag<VectorLogSink>{}),
       publish_triggers_(publish_triggers),
-      publish_period_(publish_period) {
+      publish_period_(publish_period),
+      log_params_(log_params),
+      decimation_(decimation) {
   DRAKE_DEMAND(publish_period >= 0.0);
   DRAKE_DEMAND(!publish_triggers.empty());
+  DRAKE_THROW_UNLESS(decimation >= 1);
 
   // This cache entry just maintains log storage. It is only ever updated
   // by WriteToLog(). This declaration of the cache entry invokes no
@@ -35,7 +47,9 @@ VectorLogSink<T>::VectorLogSink(int input_size,
   log_cache_index_ =
       this->DeclareCacheEntry(
               "log",
-              ValueProducer(VectorLog<T>(input_size), &ValueProducer::NoopCalc),
+              ValueProducer(
+                  LogStorage{.log = VectorLog<T>(input_size, log_params)},
+                  &ValueProducer::NoopCalc),
               {this->nothing_ticket()})
           .cache_index();
 
@@ -74,7 +88,8 @@ template <typename T>
 template <typename U>
 VectorLogSink<T>::VectorLogSink(const VectorLogSink<U>& other)
     : VectorLogSink<T>(other.get_input_port().size(), other.publish_triggers_,
-                       other.publish_period_) {}
+                       other.publish_period_, other.log_params_,
+                       other.decimation_) {}
 
 template <typename T>
 const VectorLog<T>& VectorLogSink<T>::GetLog(const Context<T>& context) const {
@@ -105,13 +120,24 @@ VectorLog<T>& VectorLogSink<T>::GetLogFromCache(
   this->ValidateContext(context);
   CacheEntryValue& value = this->get_cache_entry(log_cache_index_)
                                .get_mutable_cache_entry_value(context);
-  return value.GetMutableValueOrThrow<VectorLog<T>>();
+  return value.GetMutableValueOrThrow<LogStorage>().log;
 }
 
 template <typename T>
 EventStatus VectorLogSink<T>::WriteToLog(const Context<T>& context) const {
-  GetLogFromCache(context).AddData(context.get_time(),
-                                   this->get_input_port().Eval(context));
+  this->ValidateContext(context);
+  LogStorage& storage = this->get_cache_entry(log_cache_index_)
+                            .get_mutable_cache_entry_value(context)
+                            .template GetMutableValueOrThrow<LogStorage>();
+  // An empty log (e.g., one that was just cleared) always takes the next
+  // sample, so that decimation restarts from it.
+  if (storage.log.num_samples() == 0) {
+    storage.num_events = 0;
+  }
+  if (storage.num_events++ % decimation_ == 0) {
+    storage.log.AddData(context.get_time(),
+                        this->get_input_port().Eval(context));
+  }
   return EventStatus::Succeeded();
 }
 
@@ -24,7 +24,10 @@ namespace systems {
 ///
 /// The stored log (a VectorLog) holds a large, Eigen matrix for data storage,
 /// where each column corresponds to a data point. The VectorLogSink saves a
-/// data point and the context time whenever it samples its input.
+/// data point and the context time whenever it samples its input. For long
+/// simulations, the log can instead use chunked storage (optionally spilling
+/// to disk), and the sink can keep only every Nth sample; see the
+/// VectorLogParams constructor overload.
 ///
 /// @warning The logged data MUST NOT be used to modify the behavior of a
 /// simulation. In technical terms, the log is not stored as System State, so
@@ -95,6 +98,36 @@ class VectorLogSink final : public LeafSystem<T> {
   VectorLogSink(int input_size, const TriggerTypeSet& publish_triggers,
                 double publish_period = 0.0);
 
+  /// Constructs the vector log sink with a specified set of publish triggers,
+  /// log storage options, and decimation.
+  ///
+  /// @param input_size Dimension of the (single) input port. This corresponds
+  /// to the number of rows of the data matrix.
+  /// @param publish_triggers Set of triggers that determine when messages will
+  /// be published. Supported TriggerTypes are {kForced, kPeriodic, kPerStep}.
+  /// Will throw an error if empty or if unsupported types are provided.
+  /// @param publish_period Period that messages will be published.
+  /// publish_period should only be non-zero if one of the publish_triggers is
+  /// kPeriodic.
+  /// @param log_params The storage options for each context's VectorLog,
+  /// e.g., to use chunked storage for a long simulation.
+  /// @param decimation Only every `decimation`th publish event (starting with
+  /// the first, and starting over whenever the log is empty, e.g., after
+  /// VectorLog::Clear()) adds a sample to the log.
+  /// @pre publish_period is non-negative.
+  /// @pre publish_period > 0 if and only if publish_triggers contains
+  /// kPeriodic.
+  /// @throws std::exception if decimation < 1.
+  VectorLogSink(int input_size, const TriggerTypeSet& publish_triggers,
+                double publish_period, const VectorLogParams& log_params,
+                int decimation = 1);
+
+  /// Returns the storage options for the logs.
+  const VectorLogParams& get_log_params() const { return log_params_; }
+
+  /// Returns the decimation; see the constructor.
+  int get_decimation() const { return decimation_; }
+
   /// Scalar-converting copy constructor. See @ref system_scalar_conversion.
   template <typename U>
   explicit VectorLogSink(const VectorLogSink<U>&);
@@ -125,9 +158,18 @@ class VectorLogSink final : public LeafSystem<T> {
   // @throws std::exception if context was not created for this system.
   VectorLog<T>& GetLogFromCache(const Context<T>& context) const;
 
+  // The per-context storage: the log, and the number of publish events seen
+  // since the log was last empty (which is used for decimation).
+  struct LogStorage {
+    VectorLog<T> log;
+    int64_t num_events{0};
+  };
+
   // Remember trigger details for use in scalar conversion.
   TriggerTypeSet publish_triggers_;
   double publish_period_{};
+  VectorLogParams log_params_;
+  int decimation_{1};
 
   // Logging is done in this event handler.
   EventStatus WriteToLog(const Context<T>& context) const;
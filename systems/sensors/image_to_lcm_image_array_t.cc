@@ -1,13 +1,18 @@
 #include "drake/systems/sensors/image_to_lcm_image_array_t.h"
 
 #include <stdexcept>
+#include <vector>
 
+#include <common_robotics_utilities/parallelism.hpp>
 #include <zlib.h>
 
 #include "drake/lcmt_image.hpp"
 #include "drake/lcmt_image_array.hpp"
 #include "drake/systems/sensors/lcm_image_traits.h"
 
+using common_robotics_utilities::parallelism::DegreeOfParallelism;
+using common_robotics_utilities::parallelism::ParallelForBackend;
+using common_robotics_utilities::parallelism::StaticParallelForIndexLoop;
 using std::string;
 
 namespace drake {
@@ -23,10 +28,11 @@ void Compress(const Image<kPixelType>& image, lcmt_image* msg) {
   msg->compression_method = lcmt_image::COMPRESSION_METHOD_ZLIB;
 
   const int source_size = image.width() * image.height() * image.kPixelSize;
-  // The destination buf_size must be slightly larger than the source size.
-  // http://refspecs.linuxbase.org/LSB_3.0.0/LSB-PDA/LSB-PDA/zlib-compress2-1.html
+  // The destination buf_size must be at least zlib's bound on the compressed
+  // size. (When reusing a prior message, `dest` usually already has enough
+  // capacity, so the resize does not allocate.)
   std::vector<uint8_t>& dest = msg->data;
-  size_t dest_size = source_size * 1.001 + 12;
+  uLongf dest_size = compressBound(source_size);
   dest.resize(dest_size);
 
   auto compress_status = compress2(
@@ -127,8 +133,9 @@ void PackImageToLcmImageT(const AbstractValue& untyped_image,
 
 }  // namespace
 
-ImageToLcmImageArrayT::ImageToLcmImageArrayT(bool do_compress)
-    : do_compress_(do_compress) {
+ImageToLcmImageArrayT::ImageToLcmImageArrayT(bool do_compress,
+                                             Parallelism parallelize)
+    : do_compress_(do_compress), parallelize_(parallelize) {
   image_array_t_msg_output_port_index_ =
       DeclareAbstractOutputPort(kUseDefaultName,
                                 &ImageToLcmImageArrayT::CalcImageArray)
@@ -138,8 +145,9 @@ ImageToLcmImageArrayT::ImageToLcmImageArrayT(bool do_compress)
 ImageToLcmImageArrayT::ImageToLcmImageArrayT(const string& color_frame_name,
                                              const string& depth_frame_name,
                                              const string& label_frame_name,
-                                             bool do_compress)
-    : do_compress_(do_compress) {
+                                             bool do_compress,
+                                             Parallelism parallelize)
+    : do_compress_(do_compress), parallelize_(parallelize) {
   color_image_input_port_index_ =
       DeclareImageInputPort<PixelType::kRgba8U>(color_frame_name).get_index();
   depth_image_input_port_index_ =
@@ -192,17 +200,23 @@ void ImageToLcmImageArrayT::CalcImageArray(
   const int num_inputs = num_input_ports();
   msg->num_images = num_inputs;
   msg->images.resize(num_inputs);
+  // Evaluate the inputs on this thread; only the packing (which dominates
+  // the cost, especially when compressing) is done in parallel.
+  std::vector<const AbstractValue*> values(num_inputs);
   for (int i = 0; i < num_inputs; i++) {
-    const std::string& name = this->get_input_port(i).get_name();
-    const PixelType& type = input_port_pixel_type_[i];
-    const auto& value =
-        this->get_input_port(i).template Eval<AbstractValue>(context);
+    values[i] = &this->get_input_port(i).template Eval<AbstractValue>(context);
     lcmt_image& packed = msg->images.at(i);
     packed.header = {};
     packed.header.utime = utime;
-    packed.header.frame_name = name;
-    PackImageToLcmImageT(value, type, &packed, do_compress_);
+    packed.header.frame_name = this->get_input_port(i).get_name();
   }
+  const auto pack = [&](const int, const int64_t i) {
+    PackImageToLcmImageT(*values[i], input_port_pixel_type_[i], &msg->images[i],
+                         do_compress_);
+  };
+  StaticParallelForIndexLoop(DegreeOfParallelism(parallelize_.num_threads()), 0,
+                             num_inputs, pack,
+                             ParallelForBackend::BEST_AVAILABLE);
 }
 
 }  // namespace sensors
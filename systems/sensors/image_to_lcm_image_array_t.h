@@ -4,6 +4,7 @@
 #include <vector>
 
 #include "drake/common/drake_copyable.h"
+#include "drake/common/parallelism.h"
 #include "drake/lcmt_image_array.hpp"
 #include "drake/systems/framework/leaf_system.h"
 #include "drake/systems/sensors/image.h"
@@ -42,7 +43,13 @@ class ImageToLcmImageArrayT : public systems::LeafSystem<double> {
 
   /// Constructs an empty system with no input ports.
   /// After construction, use DeclareImageInputPort() to add inputs.
-  explicit ImageToLcmImageArrayT(bool do_compress = false);
+  ///
+  /// @param do_compress When true, zlib compression will be performed. The
+  /// default is false.
+  /// @param parallelize The parallelism used to pack (and compress) the input
+  /// images, one image per thread. The default is no parallelism.
+  explicit ImageToLcmImageArrayT(bool do_compress = false,
+                                 Parallelism parallelize = false);
 
   /// An %ImageToLcmImageArrayT constructor.  Declares three input ports --
   /// one color image, one depth image, and one label image.
@@ -52,10 +59,13 @@ class ImageToLcmImageArrayT : public systems::LeafSystem<double> {
   /// @param label_frame_name The frame name used for label image.
   /// @param do_compress When true, zlib compression will be performed. The
   /// default is false.
+  /// @param parallelize The parallelism used to pack (and compress) the input
+  /// images, one image per thread. The default is no parallelism.
   ImageToLcmImageArrayT(const std::string& color_frame_name,
                         const std::string& depth_frame_name,
                         const std::string& label_frame_name,
-                        bool do_compress = false);
+                        bool do_compress = false,
+                        Parallelism parallelize = false);
 
   /// Returns the input port containing a color image.
   /// Note: Only valid if the color/depth/label constructor is used.
@@ -90,6 +100,7 @@ class ImageToLcmImageArrayT : public systems::LeafSystem<double> {
 
   std::vector<PixelType> input_port_pixel_type_{};
   const bool do_compress_;
+  const Parallelism parallelize_;
 };
 
 }  // namespace sensors
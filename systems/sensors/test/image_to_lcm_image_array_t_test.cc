@@ -114,6 +114,41 @@ GTEST_TEST(ImageToLcmImageArrayT, ValidTest) {
          lcmt_image::COMPRESSION_METHOD_NOT_COMPRESSED);
 }
 
+// Packing the images in parallel gives the same message as packing them one
+// at a time.
+GTEST_TEST(ImageToLcmImageArrayT, Parallel) {
+  ImageRgba8U color_image(kImageWidth, kImageHeight);
+  ImageDepth32F depth_image(kImageWidth, kImageHeight);
+  ImageLabel16I label_image(kImageWidth, kImageHeight);
+  for (int v = 0; v < kImageHeight; ++v) {
+    for (int u = 0; u < kImageWidth; ++u) {
+      color_image.at(u, v)[0] = u + v;
+      depth_image.at(u, v)[0] = 0.5 * u + v;
+      label_image.at(u, v)[0] = u * v;
+    }
+  }
+
+  for (const bool do_compress : {false, true}) {
+    ImageToLcmImageArrayT serial(kColorFrameName, kDepthFrameName,
+                                 kLabelFrameName, do_compress);
+    ImageToLcmImageArrayT parallel(kColorFrameName, kDepthFrameName,
+                                   kLabelFrameName, do_compress,
+                                   Parallelism(2));
+    const lcmt_image_array expected =
+        SetUpInputAndOutput(&serial, color_image, depth_image, label_image);
+    const lcmt_image_array actual =
+        SetUpInputAndOutput(&parallel, color_image, depth_image, label_image);
+    ASSERT_EQ(actual.num_images, 3);
+    for (int i = 0; i < 3; ++i) {
+      EXPECT_EQ(actual.images[i].header.frame_name,
+                expected.images[i].header.frame_name);
+      EXPECT_EQ(actual.images[i].compression_method,
+                expected.images[i].compression_method);
+      EXPECT_EQ(actual.images[i].data, expected.images[i].data);
+    }
+  }
+}
+
 }  // namespace
 }  // namespace sensors
 }  // namespace systems